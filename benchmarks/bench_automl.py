@@ -0,0 +1,44 @@
+"""End-to-end benchmarks of AutoMLSearch on the demo datasets and on synthetic data."""
+from .datasets import make_data
+
+from evalml.automl import AutoMLSearch
+from evalml.demos import load_churn, load_fraud
+
+
+class DemoSearchSuite:
+    """Searches the first batches of pipelines on the fraud and churn demos."""
+    params = (['fraud', 'churn'], [1, 3])
+    param_names = ['dataset', 'max_batches']
+    timeout = 1800
+    number = 1
+    repeat = 1
+
+    def setup(self, dataset, max_batches):
+        if dataset == 'fraud':
+            self.X, self.y = load_fraud(n_rows=10000, verbose=False)
+        else:
+            self.X, self.y = load_churn(verbose=False)
+
+    def time_search(self, dataset, max_batches):
+        automl = AutoMLSearch(problem_type='binary', _max_batches=max_batches, n_jobs=1)
+        automl.search(self.X, self.y, show_iteration_plot=False)
+
+    def peakmem_search(self, dataset, max_batches):
+        automl = AutoMLSearch(problem_type='binary', _max_batches=max_batches, n_jobs=1)
+        automl.search(self.X, self.y, show_iteration_plot=False)
+
+
+class SyntheticSearchSuite:
+    """Searches the baseline and first batch of pipelines on synthetic data of increasing size."""
+    params = (['binary', 'multiclass', 'regression'], [1000, 10000, 100000])
+    param_names = ['problem_type', 'rows']
+    timeout = 1800
+    number = 1
+    repeat = 1
+
+    def setup(self, problem_type, rows):
+        self.X, self.y = make_data(rows, 20, 10, problem_type=problem_type)
+
+    def time_search(self, problem_type, rows):
+        automl = AutoMLSearch(problem_type=problem_type, _max_batches=1, n_jobs=1)
+        automl.search(self.X, self.y, data_checks='disabled', show_iteration_plot=False)
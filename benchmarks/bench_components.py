@@ -0,0 +1,129 @@
+"""Benchmarks of fitting and applying each component on its own."""
+from .datasets import (
+    CARDINALITIES,
+    COLUMNS,
+    ROWS,
+    make_data,
+    make_datetime_data
+)
+
+from evalml.pipelines.components import (
+    DateTimeFeaturizer,
+    DropNullColumns,
+    ElasticNetClassifier,
+    ExtraTreesClassifier,
+    Imputer,
+    LightGBMClassifier,
+    LogisticRegressionClassifier,
+    OneHotEncoder,
+    PerColumnImputer,
+    RandomForestClassifier,
+    RFClassifierSelectFromModel,
+    SimpleImputer,
+    StandardScaler,
+    XGBoostClassifier
+)
+from evalml.pipelines.components.utils import (
+    all_components,
+    handle_component_class
+)
+
+
+class TransformerSuite:
+    """Fits and applies the transformers which handle mixed numeric and categorical data."""
+    params = (['Imputer', 'Simple Imputer', 'Per Column Imputer', 'One Hot Encoder', 'Drop Null Columns Transformer'],
+              ROWS, COLUMNS, CARDINALITIES)
+    param_names = ['component', 'rows', 'columns', 'cardinality']
+    timeout = 300
+    _components = {component.name: component
+                   for component in [Imputer, SimpleImputer, PerColumnImputer, OneHotEncoder, DropNullColumns]}
+
+    def setup(self, component, rows, columns, cardinality):
+        # the one hot encoder doesn't accept missing values
+        missing_fraction = 0 if component == 'One Hot Encoder' else 0.05
+        self.X, self.y = make_data(rows, columns, cardinality, missing_fraction=missing_fraction)
+        if component == 'Simple Imputer':
+            # the simple imputer's default strategy only handles numeric columns
+            self.X = self.X.select_dtypes('number')
+        self.component_class = self._components[component]
+        self.fitted = self.component_class().fit(self.X, self.y)
+
+    def time_fit(self, component, rows, columns, cardinality):
+        self.component_class().fit(self.X, self.y)
+
+    def time_transform(self, component, rows, columns, cardinality):
+        self.fitted.transform(self.X)
+
+    def peakmem_fit_transform(self, component, rows, columns, cardinality):
+        self.component_class().fit_transform(self.X, self.y)
+
+
+class NumericTransformerSuite:
+    """Fits and applies the transformers which need numeric data without missing values."""
+    params = (['Standard Scaler', 'RF Classifier Select From Model'], ROWS, COLUMNS)
+    param_names = ['component', 'rows', 'columns']
+    timeout = 300
+    _components = {component.name: component for component in [StandardScaler, RFClassifierSelectFromModel]}
+
+    def setup(self, component, rows, columns):
+        X, self.y = make_data(rows, columns, 2, missing_fraction=0)
+        self.X = X.select_dtypes('number')
+        self.component_class = self._components[component]
+        self.fitted = self.component_class().fit(self.X, self.y)
+
+    def time_fit(self, component, rows, columns):
+        self.component_class().fit(self.X, self.y)
+
+    def time_transform(self, component, rows, columns):
+        self.fitted.transform(self.X)
+
+
+class DateTimeFeaturizerSuite:
+    params = (ROWS, COLUMNS)
+    param_names = ['rows', 'columns']
+
+    def setup(self, rows, columns):
+        self.X = make_datetime_data(rows, columns)
+        self.fitted = DateTimeFeaturizer().fit(self.X)
+
+    def time_fit(self, rows, columns):
+        DateTimeFeaturizer().fit(self.X)
+
+    def time_transform(self, rows, columns):
+        self.fitted.transform(self.X)
+
+
+class EstimatorSuite:
+    """Fits each classifier used by automl on encoded data, and predicts with it."""
+    params = (['Logistic Regression Classifier', 'Elastic Net Classifier', 'Random Forest Classifier',
+               'Extra Trees Classifier', 'XGBoost Classifier', 'LightGBM Classifier'], ROWS, COLUMNS)
+    param_names = ['estimator', 'rows', 'columns']
+    timeout = 600
+    _estimators = {estimator.name: estimator
+                   for estimator in [LogisticRegressionClassifier, ElasticNetClassifier, RandomForestClassifier,
+                                     ExtraTreesClassifier, XGBoostClassifier, LightGBMClassifier]}
+
+    def setup(self, estimator, rows, columns):
+        X, self.y = make_data(rows, columns, 10)
+        self.X = OneHotEncoder().fit_transform(Imputer().fit_transform(X, self.y))
+        self.estimator_class = self._estimators[estimator]
+        self.fitted = self.estimator_class(n_jobs=1).fit(self.X, self.y)
+
+    def time_fit(self, estimator, rows, columns):
+        self.estimator_class(n_jobs=1).fit(self.X, self.y)
+
+    def time_predict(self, estimator, rows, columns):
+        self.fitted.predict(self.X)
+
+    def time_predict_proba(self, estimator, rows, columns):
+        self.fitted.predict_proba(self.X)
+
+
+class ComponentLookupSuite:
+    """Looks components up by name, as pipelines do for each component in their graph when they're instantiated."""
+
+    def time_handle_component_class(self):
+        handle_component_class('Random Forest Classifier')
+
+    def time_all_components(self):
+        all_components()
@@ -0,0 +1,17 @@
+"""Benchmarks of the data checks run before a search."""
+from .datasets import CARDINALITIES, COLUMNS, ROWS, make_data
+
+from evalml.data_checks import DefaultDataChecks
+
+
+class DefaultDataChecksSuite:
+    params = (['binary', 'regression'], ROWS, COLUMNS, CARDINALITIES)
+    param_names = ['problem_type', 'rows', 'columns', 'cardinality']
+    timeout = 300
+
+    def setup(self, problem_type, rows, columns, cardinality):
+        self.X, self.y = make_data(rows, columns, cardinality, problem_type=problem_type)
+        self.data_checks = DefaultDataChecks(problem_type=problem_type)
+
+    def time_validate(self, problem_type, rows, columns, cardinality):
+        self.data_checks.validate(self.X, self.y)
@@ -0,0 +1,11 @@
+"""Benchmarks of how long importing evalml takes in a new process."""
+
+
+class ImportSuite:
+    """Imports evalml, and the parts of evalml which are imported the first time they're used."""
+    params = ['evalml', 'evalml.pipelines', 'evalml.automl', 'evalml.model_understanding', 'evalml.demos']
+    param_names = ['module']
+    repeat = 5
+
+    def timeraw_import(self, module):
+        return f"import {module}"
@@ -0,0 +1,59 @@
+"""Benchmarks of scoring objectives and optimizing binary classification thresholds."""
+from .bench_pipelines import PipelinePredictSuite
+from .datasets import make_data, make_predictions
+
+from evalml.objectives import get_core_objectives, get_objective
+from evalml.problem_types import ProblemTypes
+
+
+class ObjectiveSuite:
+    """Scores each core objective on its own."""
+    params = ([objective.name for problem_type in ProblemTypes for objective in get_core_objectives(problem_type)],
+              [10000, 1000000])
+    param_names = ['objective', 'rows']
+
+    def setup(self, objective, rows):
+        self.objective = get_objective(objective, return_instance=True)
+        y_true, y_pred, y_pred_proba = make_predictions(rows, problem_type=self.objective.problem_type.value)
+        self.y_true = y_true
+        self.y_pred = y_pred_proba if self.objective.score_needs_proba else y_pred
+
+    def time_score(self, objective, rows):
+        self.objective.score(self.y_true, self.y_pred)
+
+
+class ScoreAllObjectivesSuite:
+    """Scores all core objectives of a problem type at once, as AutoMLSearch does for every fold."""
+    params = (['binary', 'multiclass', 'regression'], [10000, 1000000])
+    param_names = ['problem_type', 'rows']
+
+    def setup(self, problem_type, rows):
+        self.objectives = get_core_objectives(problem_type)
+        self.pipeline = PipelinePredictSuite._pipelines[problem_type]({})
+        self.y_true, self.y_pred, self.y_pred_proba = make_predictions(rows, problem_type=problem_type)
+
+    def time_score_all_objectives(self, problem_type, rows):
+        self.pipeline._score_all_objectives(None, self.y_true, self.y_pred, self.y_pred_proba, self.objectives)
+
+
+class OptimizeThresholdSuite:
+    params = (['F1', 'Balanced Accuracy Binary', 'MCC Binary', 'Fraud Cost'], [10000, 1000000])
+    param_names = ['objective', 'rows']
+
+    def setup(self, objective, rows):
+        self.objective = get_objective(objective, return_instance=True)
+        self.y_true, _, self.y_pred_proba = make_predictions(rows)
+        self.X = None
+        if objective == 'Fraud Cost':
+            X, _ = make_data(rows, 2, 10)
+            self.X = X.rename(columns={'numeric_0': 'amount'})
+
+    def time_optimize_threshold(self, objective, rows):
+        self.objective.optimize_threshold(self.y_pred_proba, self.y_true, X=self.X)
+
+
+class GetObjectiveSuite:
+    """Looks an objective up by name, as scoring does for each objective."""
+
+    def time_get_objective(self):
+        get_objective('Log Loss Binary')
@@ -0,0 +1,174 @@
+"""Benchmarks of the prediction latency of fitted pipelines."""
+import os
+import tempfile
+
+from .datasets import CARDINALITIES, COLUMNS, make_data
+
+from evalml.pipelines import (
+    BinaryClassificationPipeline,
+    MulticlassClassificationPipeline,
+    ParallelPredictor,
+    PipelineBase,
+    RegressionPipeline
+)
+
+
+class LogisticRegressionBinaryPipeline(BinaryClassificationPipeline):
+    component_graph = ['Imputer', 'One Hot Encoder', 'Standard Scaler', 'Logistic Regression Classifier']
+
+
+class RandomForestMulticlassPipeline(MulticlassClassificationPipeline):
+    component_graph = ['Imputer', 'One Hot Encoder', 'Random Forest Classifier']
+
+
+class RandomForestRegressionPipeline(RegressionPipeline):
+    component_graph = ['Imputer', 'One Hot Encoder', 'Random Forest Regressor']
+
+
+class XGBoostBinaryPipeline(BinaryClassificationPipeline):
+    component_graph = ['Imputer', 'One Hot Encoder', 'XGBoost Classifier']
+
+
+class LightGBMBinaryPipeline(BinaryClassificationPipeline):
+    component_graph = ['Imputer', 'One Hot Encoder', 'LightGBM Classifier']
+
+
+class PipelinePredictSuite:
+    """Predicts with pipelines fit on 10,000 rows, on batches of increasing size."""
+    params = (['binary', 'multiclass', 'regression'], [1, 100, 10000], COLUMNS, CARDINALITIES)
+    param_names = ['problem_type', 'batch_rows', 'columns', 'cardinality']
+    timeout = 300
+    _pipelines = {'binary': LogisticRegressionBinaryPipeline,
+                  'multiclass': RandomForestMulticlassPipeline,
+                  'regression': RandomForestRegressionPipeline}
+
+    def setup(self, problem_type, batch_rows, columns, cardinality):
+        X, y = make_data(10000, columns, cardinality, problem_type=problem_type)
+        self.pipeline = self._pipelines[problem_type]({}).fit(X, y)
+        self.compiled = self.pipeline.compile()
+        self.X = X.iloc[:batch_rows]
+
+    def time_predict(self, problem_type, batch_rows, columns, cardinality):
+        self.pipeline.predict(self.X)
+
+    def time_predict_proba(self, problem_type, batch_rows, columns, cardinality):
+        if problem_type == 'regression':
+            raise NotImplementedError
+        self.pipeline.predict_proba(self.X)
+
+    def time_compute_estimator_features(self, problem_type, batch_rows, columns, cardinality):
+        self.pipeline.compute_estimator_features(self.X)
+
+    def time_compiled_predict(self, problem_type, batch_rows, columns, cardinality):
+        self.compiled.predict(self.X)
+
+    def time_compiled_predict_proba(self, problem_type, batch_rows, columns, cardinality):
+        if problem_type == 'regression':
+            raise NotImplementedError
+        self.compiled.predict_proba(self.X)
+
+
+class PredictOneSuite:
+    """Predicts single records with binary pipelines fit on 10,000 rows."""
+    params = (['Logistic Regression Classifier', 'XGBoost Classifier', 'LightGBM Classifier'], COLUMNS)
+    param_names = ['estimator', 'columns']
+    timeout = 300
+    _pipelines = {'Logistic Regression Classifier': LogisticRegressionBinaryPipeline,
+                  'XGBoost Classifier': XGBoostBinaryPipeline,
+                  'LightGBM Classifier': LightGBMBinaryPipeline}
+
+    def setup(self, estimator, columns):
+        X, y = make_data(10000, columns, 10, problem_type='binary')
+        self.pipeline = self._pipelines[estimator]({}).fit(X, y)
+        self.record = X.iloc[0].to_dict()
+        self.pipeline.predict_one(self.record)
+
+    def time_predict_one(self, estimator, columns):
+        self.pipeline.predict_one(self.record)
+
+    def time_predict_proba_one(self, estimator, columns):
+        self.pipeline.predict_proba_one(self.record)
+
+
+class PredictBatchesSuite:
+    """Predicts a CSV file of 200,000 rows chunk by chunk, writing the probability estimates to another CSV file."""
+    params = ([10000, 50000], [False, True])
+    param_names = ['chunk_rows', 'prefetch']
+    timeout = 600
+
+    def setup(self, chunk_rows, prefetch):
+        X, y = make_data(10000, 20, 10)
+        self.pipeline = LogisticRegressionBinaryPipeline({}).fit(X, y)
+        self.directory = tempfile.TemporaryDirectory()
+        self.source = os.path.join(self.directory.name, 'data.csv')
+        self.output = os.path.join(self.directory.name, 'predictions.csv')
+        make_data(200000, 20, 10, random_state=1)[0].to_csv(self.source, index=False)
+
+    def teardown(self, chunk_rows, prefetch):
+        self.directory.cleanup()
+
+    def time_predict_batches(self, chunk_rows, prefetch):
+        self.pipeline.predict_batches(self.source, self.output, chunk_rows=chunk_rows, method='predict_proba', prefetch=prefetch)
+
+    def peakmem_predict_batches(self, chunk_rows, prefetch):
+        self.pipeline.predict_batches(self.source, self.output, chunk_rows=chunk_rows, method='predict_proba', prefetch=prefetch)
+
+
+class ParallelPredictSuite:
+    """Predicts 200,000 rows with a ParallelPredictor, after its workers have started."""
+    params = [1, 2, 4]
+    param_names = ['n_workers']
+    timeout = 600
+
+    def setup(self, n_workers):
+        X, y = make_data(10000, 20, 10)
+        self.predictor = ParallelPredictor(LogisticRegressionBinaryPipeline({}).fit(X, y), n_workers=n_workers)
+        self.X = make_data(200000, 20, 10, random_state=1)[0]
+        self.predictor.predict_proba(self.X.iloc[:n_workers * 1000])
+
+    def teardown(self, n_workers):
+        self.predictor.close()
+
+    def time_predict_proba(self, n_workers):
+        self.predictor.predict_proba(self.X)
+
+
+class PipelineLoadSuite:
+    """Loads a fitted random forest pipeline saved with pickle, and as an artifact directory and zip file."""
+    params = ['pipeline.pkl', 'pipeline', 'pipeline.zip']
+    param_names = ['path']
+
+    def setup(self, path):
+        X, y = make_data(10000, 20, 10, problem_type='multiclass')
+        pipeline = RandomForestMulticlassPipeline({}).fit(X, y)
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, path)
+        if path.endswith('.pkl'):
+            pipeline.save(self.path)
+        else:
+            pipeline.save_artifact(self.path)
+
+    def teardown(self, path):
+        self.directory.cleanup()
+
+    def time_load(self, path):
+        if self.path.endswith('.pkl'):
+            PipelineBase.load(self.path)
+        else:
+            PipelineBase.load_artifact(self.path)
+
+
+class PipelineFitSuite:
+    params = (['binary', 'multiclass', 'regression'], [1000, 10000, 100000], COLUMNS)
+    param_names = ['problem_type', 'rows', 'columns']
+    timeout = 600
+
+    def setup(self, problem_type, rows, columns):
+        self.X, self.y = make_data(rows, columns, 10, problem_type=problem_type)
+        self.pipeline_class = PipelinePredictSuite._pipelines[problem_type]
+
+    def time_fit(self, problem_type, rows, columns):
+        self.pipeline_class({}).fit(self.X, self.y)
+
+    def peakmem_fit(self, problem_type, rows, columns):
+        self.pipeline_class({}).fit(self.X, self.y)
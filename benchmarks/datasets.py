@@ -0,0 +1,96 @@
+"""Synthetic datasets used by the benchmarks."""
+import numpy as np
+import pandas as pd
+
+# the sizes each benchmark is parametrized over
+ROWS = [1000, 10000, 100000]
+COLUMNS = [10, 100]
+CARDINALITIES = [10, 1000]
+
+
+def make_data(n_rows, n_columns, cardinality, problem_type='binary', missing_fraction=0.05, random_state=0):
+    """Generates a dataset with a mix of numeric and categorical columns.
+
+    Half of the columns are numeric and half are categorical, with a fraction of the values of every column missing.
+
+    Arguments:
+        n_rows (int): the number of rows.
+        n_columns (int): the number of columns.
+        cardinality (int): the number of distinct values of each categorical column.
+        problem_type (str): 'binary', 'multiclass' or 'regression'. Defaults to 'binary'.
+        missing_fraction (float): the fraction of the values of each column which are missing. Defaults to 0.05.
+        random_state (int): seed for the random values. Defaults to 0.
+
+    Returns:
+        pd.DataFrame, pd.Series: X, y
+    """
+    rng = np.random.RandomState(random_state)
+    n_numeric = n_columns - n_columns // 2
+    columns = {}
+    for i in range(n_numeric):
+        values = rng.normal(size=n_rows)
+        values[rng.rand(n_rows) < missing_fraction] = np.nan
+        columns[f'numeric_{i}'] = values
+    categories = np.array([f'category_{i}' for i in range(cardinality)], dtype=object)
+    for i in range(n_columns - n_numeric):
+        values = categories[rng.randint(0, cardinality, size=n_rows)]
+        values[rng.rand(n_rows) < missing_fraction] = np.nan
+        columns[f'categorical_{i}'] = pd.Series(values, dtype='category')
+    X = pd.DataFrame(columns)
+
+    signal = np.nan_to_num(X[f'numeric_{0}'].values) + rng.normal(scale=0.5, size=n_rows)
+    if problem_type == 'binary':
+        y = pd.Series((signal > 0).astype(int))
+    elif problem_type == 'multiclass':
+        y = pd.Series(np.digitize(signal, [-0.5, 0.5]))
+    elif problem_type == 'regression':
+        y = pd.Series(signal)
+    else:
+        raise ValueError(f"problem_type must be one of 'binary', 'multiclass' or 'regression'. Received {problem_type} instead")
+    return X, y
+
+
+def make_datetime_data(n_rows, n_columns, random_state=0):
+    """Generates a dataset of datetime columns.
+
+    Arguments:
+        n_rows (int): the number of rows.
+        n_columns (int): the number of columns.
+        random_state (int): seed for the random values. Defaults to 0.
+
+    Returns:
+        pd.DataFrame: X
+    """
+    rng = np.random.RandomState(random_state)
+    start = pd.Timestamp('2000-01-01').value
+    end = pd.Timestamp('2020-01-01').value
+    return pd.DataFrame({f'datetime_{i}': pd.to_datetime(rng.randint(start // 10 ** 9, end // 10 ** 9, size=n_rows), unit='s')
+                         for i in range(n_columns)})
+
+
+def make_predictions(n_rows, problem_type='binary', n_classes=3, random_state=0):
+    """Generates targets and predictions to score objectives on.
+
+    Arguments:
+        n_rows (int): the number of rows.
+        problem_type (str): 'binary', 'multiclass' or 'regression'. Defaults to 'binary'.
+        n_classes (int): the number of classes of multiclass targets. Defaults to 3.
+        random_state (int): seed for the random values. Defaults to 0.
+
+    Returns:
+        pd.Series, pd.Series, pd.Series or pd.DataFrame: the targets, the predictions and the predicted probabilities,
+            which are None for regression.
+    """
+    rng = np.random.RandomState(random_state)
+    if problem_type == 'regression':
+        y_true = pd.Series(rng.normal(size=n_rows))
+        return y_true, y_true + rng.normal(scale=0.5, size=n_rows), None
+    n_classes = 2 if problem_type == 'binary' else n_classes
+    y_true = pd.Series(rng.randint(0, n_classes, size=n_rows))
+    proba = rng.dirichlet(np.ones(n_classes), size=n_rows)
+    # make the predictions better than chance
+    proba[np.arange(n_rows), y_true] += 0.5
+    proba /= proba.sum(axis=1, keepdims=True)
+    y_pred = pd.Series(proba.argmax(axis=1))
+    y_pred_proba = pd.Series(proba[:, 1]) if problem_type == 'binary' else pd.DataFrame(proba)
+    return y_true, y_pred, y_pred_proba
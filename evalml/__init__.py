@@ -1,9 +1,9 @@
+import importlib
 import warnings
 
 # hack to prevent warnings from skopt
 # must import sklearn first
 import sklearn
-import evalml.demos
 import evalml.model_family
 import evalml.objectives
 import evalml.pipelines
@@ -11,7 +11,6 @@ import evalml.preprocessing
 import evalml.problem_types
 import evalml.utils
 import evalml.data_checks
-from evalml.automl import AutoMLSearch
 from evalml.utils import print_info
 with warnings.catch_warnings():
     warnings.simplefilter("ignore", FutureWarning)
@@ -22,3 +21,20 @@ warnings.filterwarnings("ignore", category=DeprecationWarning)
 
 
 __version__ = '0.14.1'
+
+# subpackages which import slowly and aren't needed to load a pipeline and predict with it, so that they're only
+# imported the first time they're used
+_LAZY_SUBPACKAGES = ['automl', 'demos', 'model_understanding', 'tuners']
+_LAZY_ATTRIBUTES = {'AutoMLSearch': 'automl'}
+
+
+def __getattr__(name):
+    if name in _LAZY_SUBPACKAGES:
+        return importlib.import_module(f'evalml.{name}')
+    if name in _LAZY_ATTRIBUTES:
+        return getattr(importlib.import_module(f'evalml.{_LAZY_ATTRIBUTES[name]}'), name)
+    raise AttributeError(f"module 'evalml' has no attribute '{name}'")
+
+
+def __dir__():
+    return sorted(list(globals()) + _LAZY_SUBPACKAGES + list(_LAZY_ATTRIBUTES))
@@ -1,3 +1,7 @@
 from .automl_search import AutoMLSearch
 from .utils import get_default_primary_search_objective
 from .data_splitters import TrainingValidationSplit
+from .engine import EngineBase, SequentialEngine, ThreadPoolEngine, ProcessPoolEngine, QueueEngine
+from .pruning_policies import PruningPolicyBase, MedianPruningPolicy, VarianceBoundPruningPolicy
+from .cost_model import RuntimeCostModel
+from .journal import ResultsJournal
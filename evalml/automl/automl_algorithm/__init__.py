@@ -1,2 +1,3 @@
 from .automl_algorithm import AutoMLAlgorithm, AutoMLAlgorithmException
 from .iterative_algorithm import IterativeAlgorithm
+from .successive_halving_algorithm import SuccessiveHalvingAlgorithm
@@ -1,7 +1,14 @@
+import inspect
 from abc import ABC, abstractmethod
 
-from evalml.tuners import SKOptTuner
+import pandas as pd
+
+from evalml.pipelines.components.utils import handle_component_class
+from evalml.tuners import ParameterError, SKOptTuner
 from evalml.utils import get_random_state
+from evalml.utils.logger import get_logger
+
+logger = get_logger(__file__)
 
 
 class AutoMLAlgorithmException(Exception):
@@ -11,6 +18,8 @@ class AutoMLAlgorithmException(Exception):
 
 class AutoMLAlgorithm(ABC):
     """Base class for the automl algorithms which power evalml."""
+    n_jobs = -1
+    number_features = None
 
     def __init__(self,
                  allowed_pipelines=None,
@@ -36,6 +45,9 @@ class AutoMLAlgorithm(ABC):
             self._tuners[p.name] = self._tuner_class(p.hyperparameters, random_state=self.random_state)
         self._pipeline_number = 0
         self._batch_number = 0
+        # the budget of each pipeline of the latest batch, keyed by id. Each pipeline is kept with its budget, so that its
+        # id can't be reused by a pipeline created later while the budget is recorded
+        self._budgets = {}
 
     @abstractmethod
     def next_batch(self):
@@ -45,14 +57,86 @@ class AutoMLAlgorithm(ABC):
             list(PipelineBase): a list of instances of PipelineBase subclasses, ready to be trained and evaluated.
         """
 
-    def add_result(self, score_to_minimize, pipeline):
-        """Register results from evaluating a pipeline
+    def add_result(self, score_to_minimize, pipeline, budget=None):
+        """Register results from evaluating a pipeline. Only results on all of the data are added to the tuners.
 
         Arguments:
             score_to_minimize (float): The score obtained by this pipeline on the primary objective, converted so that lower values indicate better pipelines.
             pipeline (PipelineBase): The trained pipeline object which was used to compute the score.
+            budget (float): The fraction of the training rows the pipeline was evaluated on, which is less than get_budget
+                returned if the search downsized the pipeline to finish in time. Defaults to None, for the budget returned by get_budget.
+        """
+        if budget is None:
+            budget = self.get_budget(pipeline)
+        if budget == 1.0:
+            self._tuners[pipeline.name].add(pipeline.parameters, score_to_minimize)
+
+    def warm_start(self, previous_results):
+        """Seeds the tuners with the results of pipelines evaluated by a previous search, before any batch is proposed.
+
+        Results for pipelines which aren't allowed in this search, with nan scores, or with parameters which don't fit
+        the hyperparameter ranges of this search are ignored.
+
+        Arguments:
+            previous_results (list(tuple)): (pipeline name, parameters, score to minimize) for each previous result.
+
+        Returns:
+            int: the number of results added to the tuners.
+        """
+        n_added = 0
+        for pipeline_name, parameters, score_to_minimize in previous_results:
+            if pipeline_name not in self._tuners or pd.isnull(score_to_minimize):
+                continue
+            try:
+                self._tuners[pipeline_name].add(parameters, score_to_minimize)
+            except (TypeError, ValueError, ParameterError) as e:
+                logger.debug(f"Ignoring previous result for {pipeline_name} with parameters {parameters}: {e}")
+                continue
+            n_added += 1
+        return n_added
+
+    def get_budget(self, pipeline):
+        """Returns the fraction of the training data a pipeline from the latest batch should be evaluated on.
+
+        Arguments:
+            pipeline (PipelineBase): a pipeline returned by next_batch.
+
+        Returns:
+            float: the fraction of the rows of the training data to evaluate the pipeline on. Pipelines which were not in the latest batch get 1.0.
         """
-        self._tuners[pipeline.name].add(pipeline.parameters, score_to_minimize)
+        pipeline_and_budget = self._budgets.get(id(pipeline))
+        if pipeline_and_budget is None or pipeline_and_budget[0] is not pipeline:
+            return 1.0
+        return pipeline_and_budget[1]
+
+    def clear_budgets(self):
+        """Forgets the budgets of the latest batch, so that every pipeline gets a budget of 1.0. Called when the search ends."""
+        self._budgets = {}
+
+    def _set_budgets(self, pipelines, budget):
+        """Records the budget of each pipeline of the latest batch, replacing the budgets of the previous batch."""
+        self._budgets = {id(pipeline): (pipeline, budget) for pipeline in pipelines}
+
+    def _in_latest_batch(self, pipeline):
+        """Returns True if the pipeline was proposed in the latest batch and its budget is still recorded."""
+        pipeline_and_budget = self._budgets.get(id(pipeline))
+        return pipeline_and_budget is not None and pipeline_and_budget[0] is pipeline
+
+    def _transform_parameters(self, pipeline_class, proposed_parameters):
+        """Given a pipeline parameters dict, make sure n_jobs and number_features are set."""
+        parameters = {}
+        component_graph = [handle_component_class(c) for c in pipeline_class.component_graph]
+        for component_class in component_graph:
+            component_parameters = proposed_parameters.get(component_class.name, {})
+            init_params = inspect.signature(component_class.__init__).parameters
+
+            # Inspects each component and adds the following parameters when needed
+            if 'n_jobs' in init_params:
+                component_parameters['n_jobs'] = self.n_jobs
+            if 'number_features' in init_params:
+                component_parameters['number_features'] = self.number_features
+            parameters[component_class.name] = component_parameters
+        return parameters
 
     @property
     def pipeline_number(self):
@@ -1,9 +1,9 @@
-import inspect
+import math
 from operator import itemgetter
 
-from .automl_algorithm import AutoMLAlgorithm, AutoMLAlgorithmException
+import numpy as np
 
-from evalml.pipelines.components.utils import handle_component_class
+from .automl_algorithm import AutoMLAlgorithm, AutoMLAlgorithmException
 
 
 class IterativeAlgorithm(AutoMLAlgorithm):
@@ -16,9 +16,16 @@ class IterativeAlgorithm(AutoMLAlgorithm):
                  random_state=0,
                  pipelines_per_batch=5,
                  n_jobs=-1,  # TODO remove
-                 number_features=None):  # TODO remove
+                 number_features=None,  # TODO remove
+                 sample_budgets=None,
+                 n_promoted=3):
         """An automl algorithm which first fits a base round of pipelines with default parameters, then does a round of parameter tuning on each pipeline in order of performance.
 
+        With sample_budgets, the base round is first evaluated on subsamples of increasing size. After each subsample, the
+        better half of the pipelines, but at least n_promoted of them, are evaluated again on the next larger subsample,
+        and the survivors are finally evaluated on all of the data. Only the pipelines evaluated on all of the data are
+        tuned afterwards, and only results on all of the data are reported to the tuners.
+
         Arguments:
             allowed_pipelines (list(class)): A list of PipelineBase subclasses indicating the pipelines allowed in the search. The default of None indicates all pipelines for this problem type are allowed.
             max_iterations (int): The maximum number of iterations to be evaluated.
@@ -27,7 +34,15 @@ class IterativeAlgorithm(AutoMLAlgorithm):
             pipelines_per_batch (int): the number of pipelines to be evaluated in each batch, after the first batch.
             n_jobs (int or None): Non-negative integer describing level of parallelism used for pipelines.
             number_features (int): The number of columns in the input features.
+            sample_budgets (list(float)): increasing fractions of the training rows to evaluate the base round of pipelines on before
+                evaluating them on all of the data. Each must be greater than 0 and less than 1. Defaults to None, which evaluates the base round on all of the data.
+            n_promoted (int): the smallest number of pipelines evaluated again on each larger subsample. Must be positive. Defaults to 3.
         """
+        sample_budgets = list(sample_budgets or [])
+        if any(not 0 < budget < 1 for budget in sample_budgets) or sample_budgets != sorted(set(sample_budgets)):
+            raise ValueError(f"sample_budgets must be increasing fractions greater than 0 and less than 1. Received {sample_budgets} instead")
+        if n_promoted < 1:
+            raise ValueError(f"n_promoted must be positive. Received {n_promoted} instead")
         super().__init__(allowed_pipelines=allowed_pipelines,
                          max_iterations=max_iterations,
                          tuner_class=tuner_class,
@@ -35,7 +50,12 @@ class IterativeAlgorithm(AutoMLAlgorithm):
         self.pipelines_per_batch = pipelines_per_batch
         self.n_jobs = n_jobs
         self.number_features = number_features
+        self.sample_budgets = sample_budgets
+        self.n_promoted = n_promoted
         self._first_batch_results = []
+        # the base round takes one batch for each subsample and one for all of the data
+        self._n_base_batches = len(sample_budgets) + 1
+        self._rung_results = []
 
     def next_batch(self):
         """Get the next batch of pipelines to evaluate
@@ -43,48 +63,59 @@ class IterativeAlgorithm(AutoMLAlgorithm):
         Returns:
             list(PipelineBase): a list of instances of PipelineBase subclasses, ready to be trained and evaluated.
         """
-        if self._batch_number == 1:
+        if 0 < self._batch_number < self._n_base_batches and len(self._rung_results) == 0:
+            raise AutoMLAlgorithmException('No results were reported from the previous batch')
+        if self._batch_number == self._n_base_batches:
             if len(self._first_batch_results) == 0:
                 raise AutoMLAlgorithmException('No results were reported from the first batch')
-            self._first_batch_results = sorted(self._first_batch_results, key=itemgetter(0))
+            self._first_batch_results = sorted(self._first_batch_results, key=itemgetter(0, 1))
 
         next_batch = []
         if self._batch_number == 0:
             next_batch = [pipeline_class(parameters=self._transform_parameters(pipeline_class, {}))
                           for pipeline_class in self.allowed_pipelines]
+        elif self._batch_number < self._n_base_batches:
+            next_batch = self._promote()
         else:
-            idx = (self._batch_number - 1) % len(self._first_batch_results)
-            pipeline_class = self._first_batch_results[idx][1]
+            idx = (self._batch_number - self._n_base_batches) % len(self._first_batch_results)
+            pipeline_class = self._first_batch_results[idx][2]
             for i in range(self.pipelines_per_batch):
                 proposed_parameters = self._tuners[pipeline_class.name].propose()
                 next_batch.append(pipeline_class(parameters=self._transform_parameters(pipeline_class, proposed_parameters)))
+        if self._batch_number < self._n_base_batches:
+            self._set_budgets(next_batch, (self.sample_budgets + [1.0])[self._batch_number])
+        else:
+            self.clear_budgets()
+        self._rung_results = []
         self._pipeline_number += len(next_batch)
         self._batch_number += 1
         return next_batch
 
-    def add_result(self, score_to_minimize, pipeline):
-        """Register results from evaluating a pipeline
+    def _promote(self):
+        """Returns new instances of the best pipelines evaluated on the previous subsample."""
+        n_promoted = max(min(self.n_promoted, len(self._rung_results)), int(math.ceil(len(self._rung_results) / 2)))
+        # downsized and then nan scores are ranked last, and ties keep the order in which the results were reported
+        scores = np.array([score for score, _, _ in self._rung_results], dtype=float)
+        downsized = [downsized for _, _, downsized in self._rung_results]
+        order = np.lexsort((np.where(np.isnan(scores), np.inf, scores), downsized))
+        return [self._rung_results[i][1].__class__(parameters=self._rung_results[i][1].parameters)
+                for i in order[:n_promoted]]
+
+    def add_result(self, score_to_minimize, pipeline, budget=None):
+        """Register results from evaluating a pipeline. Only results on all of the data are added to the tuners.
 
         Arguments:
             score_to_minimize (float): The score obtained by this pipeline on the primary objective, converted so that lower values indicate better pipelines.
             pipeline (PipelineBase): The trained pipeline object which was used to compute the score.
+            budget (float): The fraction of the training rows the pipeline was evaluated on, which is less than get_budget
+                returned if the search downsized the pipeline to finish in time. Defaults to None, for the budget returned by get_budget.
         """
-        super().add_result(score_to_minimize, pipeline)
-        if self.batch_number == 1:
-            self._first_batch_results.append((score_to_minimize, pipeline.__class__))
-
-    def _transform_parameters(self, pipeline_class, proposed_parameters):
-        """Given a pipeline parameters dict, make sure n_jobs and number_features are set."""
-        parameters = {}
-        component_graph = [handle_component_class(c) for c in pipeline_class.component_graph]
-        for component_class in component_graph:
-            component_parameters = proposed_parameters.get(component_class.name, {})
-            init_params = inspect.signature(component_class.__init__).parameters
-
-            # Inspects each component and adds the following parameters when needed
-            if 'n_jobs' in init_params:
-                component_parameters['n_jobs'] = self.n_jobs
-            if 'number_features' in init_params:
-                component_parameters['number_features'] = self.number_features
-            parameters[component_class.name] = component_parameters
-        return parameters
+        if budget is None:
+            budget = self.get_budget(pipeline)
+        super().add_result(score_to_minimize, pipeline, budget)
+        # scores on fewer rows than the batch was evaluated on aren't comparable, so they're ranked after the rest of the batch
+        downsized = budget < self.get_budget(pipeline)
+        if self._in_latest_batch(pipeline):
+            self._rung_results.append((score_to_minimize, pipeline, downsized))
+        if self.batch_number == self._n_base_batches:
+            self._first_batch_results.append((downsized, score_to_minimize, pipeline.__class__))
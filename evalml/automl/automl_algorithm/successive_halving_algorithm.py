@@ -0,0 +1,133 @@
+import math
+
+import numpy as np
+
+from .automl_algorithm import AutoMLAlgorithm, AutoMLAlgorithmException
+
+
+class SuccessiveHalvingAlgorithm(AutoMLAlgorithm):
+    """An automl algorithm which evaluates many pipelines on small subsamples of the data, and repeatedly promotes the best fraction of them to larger subsamples until the survivors are evaluated on all of the data."""
+
+    def __init__(self,
+                 allowed_pipelines=None,
+                 max_iterations=None,
+                 tuner_class=None,
+                 random_state=0,
+                 eta=3,
+                 min_budget=1 / 9,
+                 hyperband=False,
+                 n_jobs=-1,
+                 number_features=None):
+        """An automl algorithm which evaluates many pipelines on small subsamples of the data, and repeatedly promotes the best fraction of them to larger subsamples until the survivors are evaluated on all of the data.
+
+        Each bracket of successive halving starts with a batch of pipelines evaluated at a budget of min_budget, the fraction
+        of the training rows used. After each batch, the best 1/eta of the pipelines are evaluated again on eta times as many
+        rows, until the budget reaches 1.0. The first bracket evaluates every allowed pipeline with its default parameters,
+        and the remaining pipelines of each bracket are proposed by the tuners, cycling through the allowed pipelines. Only
+        results on all of the data are reported to the tuners.
+
+        With hyperband, successive brackets trade off the number of pipelines against their initial budget: the first
+        bracket starts at min_budget, and each later bracket starts eta times higher with fewer pipelines, until a bracket
+        evaluates all of its pipelines on all of the data. The cycle then starts over.
+
+        Arguments:
+            allowed_pipelines (list(class)): A list of PipelineBase subclasses indicating the pipelines allowed in the search. The default of None indicates all pipelines for this problem type are allowed.
+            max_iterations (int): The maximum number of iterations to be evaluated.
+            tuner_class (class): A subclass of Tuner, to be used to find parameters for each pipeline. The default of None indicates the SKOptTuner will be used.
+            random_state (int, np.random.RandomState): The random seed/state. Defaults to 0.
+            eta (int): the factor by which the number of pipelines is divided, and the budget multiplied, after each batch. Must be greater than 1. Defaults to 3.
+            min_budget (float): the smallest fraction of the training rows to evaluate pipelines on. Must be greater than 0 and at most 1.
+                Budgets are powers of 1/eta, so the smallest budget used is the smallest power of 1/eta which is at least min_budget. Defaults to 1/9.
+            hyperband (bool): If True, brackets are run with varying initial budgets as in hyperband. Defaults to False.
+            n_jobs (int or None): Non-negative integer describing level of parallelism used for pipelines.
+            number_features (int): The number of columns in the input features.
+        """
+        if eta <= 1:
+            raise ValueError(f"eta must be greater than 1. Received {eta} instead")
+        if not 0 < min_budget <= 1:
+            raise ValueError(f"min_budget must be greater than 0 and at most 1. Received {min_budget} instead")
+        super().__init__(allowed_pipelines=allowed_pipelines,
+                         max_iterations=max_iterations,
+                         tuner_class=tuner_class,
+                         random_state=random_state)
+        self.eta = eta
+        self.min_budget = min_budget
+        self.hyperband = hyperband
+        self.n_jobs = n_jobs
+        self.number_features = number_features
+        # the number of times the budget is multiplied by eta to go from min_budget to 1.0
+        self._max_rung = int(math.floor(math.log(1 / min_budget, eta) + 1e-9))
+        self._bracket_number = 0
+        self._bracket_max_rung = 0
+        self._rung = 0
+        self._rung_budget = 1.0
+        self._rung_results = []
+        self._pipeline_class_index = 0
+
+    def next_batch(self):
+        """Get the next batch of pipelines to evaluate
+
+        Returns:
+            list(PipelineBase): a list of instances of PipelineBase subclasses, ready to be trained and evaluated.
+        """
+        if self._batch_number > 0 and self._rung < self._bracket_max_rung:
+            if len(self._rung_results) == 0:
+                raise AutoMLAlgorithmException('No results were reported from the previous batch')
+            next_batch = self._promote()
+            self._rung += 1
+        else:
+            next_batch = self._start_bracket()
+        self._rung_budget = float(self.eta) ** (self._rung - self._bracket_max_rung)
+        self._rung_results = []
+        self._set_budgets(next_batch, self._rung_budget)
+        self._pipeline_number += len(next_batch)
+        self._batch_number += 1
+        return next_batch
+
+    def _start_bracket(self):
+        """Proposes the pipelines to evaluate in the first batch of a new bracket."""
+        if self.hyperband:
+            self._bracket_max_rung = self._max_rung - self._bracket_number % (self._max_rung + 1)
+            n_pipelines = int(math.ceil((self._max_rung + 1) / (self._bracket_max_rung + 1) * self.eta ** self._bracket_max_rung))
+        else:
+            self._bracket_max_rung = self._max_rung
+            n_pipelines = int(math.ceil(self.eta ** self._max_rung))
+        self._rung = 0
+        next_batch = []
+        if self._bracket_number == 0:
+            next_batch = [pipeline_class(parameters=self._transform_parameters(pipeline_class, {}))
+                          for pipeline_class in self.allowed_pipelines]
+        while len(next_batch) < n_pipelines:
+            pipeline_class = self.allowed_pipelines[self._pipeline_class_index % len(self.allowed_pipelines)]
+            self._pipeline_class_index += 1
+            proposed_parameters = self._tuners[pipeline_class.name].propose()
+            next_batch.append(pipeline_class(parameters=self._transform_parameters(pipeline_class, proposed_parameters)))
+        self._bracket_number += 1
+        return next_batch
+
+    def _promote(self):
+        """Returns new instances of the best 1/eta of the pipelines evaluated in the previous batch."""
+        n_promoted = max(1, int(len(self._rung_results) // self.eta))
+        # downsized and then nan scores are ranked last, and ties keep the order in which the results were reported
+        scores = np.array([score for score, _, _ in self._rung_results], dtype=float)
+        downsized = [downsized for _, _, downsized in self._rung_results]
+        order = np.lexsort((np.where(np.isnan(scores), np.inf, scores), downsized))
+        return [self._rung_results[i][1].__class__(parameters=self._rung_results[i][1].parameters)
+                for i in order[:n_promoted]]
+
+    def add_result(self, score_to_minimize, pipeline, budget=None):
+        """Register results from evaluating a pipeline. Only results on all of the data are added to the tuners.
+
+        Arguments:
+            score_to_minimize (float): The score obtained by this pipeline on the primary objective, converted so that lower values indicate better pipelines.
+            pipeline (PipelineBase): The trained pipeline object which was used to compute the score.
+            budget (float): The fraction of the training rows the pipeline was evaluated on, which is less than get_budget
+                returned if the search downsized the pipeline to finish in time. Defaults to None, for the budget returned by get_budget.
+        """
+        if budget is None:
+            budget = self.get_budget(pipeline)
+        super().add_result(score_to_minimize, pipeline, budget)
+        # scores on fewer rows than the batch was evaluated on aren't comparable, so they're ranked after the rest of the batch
+        downsized = budget < self.get_budget(pipeline)
+        if self._in_latest_batch(pipeline):
+            self._rung_results.append((score_to_minimize, pipeline, downsized))
@@ -15,8 +15,22 @@ from sklearn.model_selection import (
 
 from .pipeline_search_plots import PipelineSearchPlots
 
-from evalml.automl.automl_algorithm import IterativeAlgorithm
+from evalml.automl.automl_algorithm import (
+    IterativeAlgorithm,
+    SuccessiveHalvingAlgorithm
+)
+from evalml.automl.cost_model import RuntimeCostModel
 from evalml.automl.data_splitters import TrainingValidationSplit
+from evalml.automl.engine import (
+    AutoMLConfig,
+    EngineBase,
+    SequentialEngine,
+    ThreadPoolEngine
+)
+from evalml.automl.fold_store import FoldStore
+from evalml.automl.journal import ReplayedComputation, ResultsJournal
+from evalml.automl.pruning_policies import PruningPolicyBase
+from evalml.automl.rankings_store import RankingsStore
 from evalml.automl.utils import get_default_primary_search_objective
 from evalml.data_checks import (
     AutoMLDataChecks,
@@ -27,8 +41,8 @@ from evalml.data_checks import (
 from evalml.data_checks.data_check_message_type import DataCheckMessageType
 from evalml.exceptions import (
     AutoMLSearchException,
-    PipelineNotFoundError,
-    PipelineScoreError
+    EngineJobError,
+    PipelineNotFoundError
 )
 from evalml.objectives import (
     get_all_objective_names,
@@ -37,16 +51,18 @@ from evalml.objectives import (
     get_objective
 )
 from evalml.pipelines import (
-    BinaryClassificationPipeline,
+    ComponentTelemetry,
     MeanBaselineRegressionPipeline,
     ModeBaselineBinaryPipeline,
-    ModeBaselineMulticlassPipeline
+    ModeBaselineMulticlassPipeline,
+    TransformerCache
 )
+from evalml.pipelines.component_telemetry import _start_tracing, _stop_tracing
 from evalml.pipelines.components.utils import get_estimators
 from evalml.pipelines.utils import make_pipeline
 from evalml.problem_types import ProblemTypes, handle_problem_types
 from evalml.tuners import SKOptTuner
-from evalml.utils import convert_to_seconds, get_random_state
+from evalml.utils import convert_to_seconds, get_random_seed, get_random_state
 from evalml.utils.logger import (
     get_logger,
     log_subtitle,
@@ -63,6 +79,13 @@ class AutoMLSearch:
     _MAX_NAME_LEN = 40
     _LARGE_DATA_ROW_THRESHOLD = int(1e5)
     _LARGE_DATA_PERCENT_VALIDATION = 0.75
+    _AUTOML_ALGORITHMS = ['iterative', 'successive_halving', 'hyperband']
+    # the smallest fraction of the rows pipelines are downsized to in order to finish before max_time
+    _MIN_COST_MODEL_BUDGET = 0.1
+    # the factor by which each subsample of progressive sampling is larger than the previous one
+    _PROGRESSIVE_SAMPLING_GROWTH = 10
+    # the smallest number of pipelines progressive sampling evaluates again on each larger subsample
+    _PROGRESSIVE_SAMPLING_PROMOTED = 3
 
     # Necessary for "Plotting" documentation, since Sphinx does not work well with instance attributes.
     plot = PipelineSearchPlots
@@ -86,6 +109,15 @@ class AutoMLSearch:
                  tuner_class=None,
                  verbose=True,
                  optimize_thresholds=False,
+                 parallel_batches=False,
+                 engine=None,
+                 transformer_cache_size=None,
+                 automl_algorithm='iterative',
+                 pruning_policy=None,
+                 cost_model=None,
+                 journal=None,
+                 progressive_sampling=False,
+                 track_memory=False,
                  _max_batches=None):
         """Automated pipeline search
 
@@ -140,11 +172,59 @@ class AutoMLSearch:
 
             random_state (int, np.random.RandomState): The random seed/state. Defaults to 0.
 
-            n_jobs (int or None): Non-negative integer describing level of parallelism used for pipelines.
+            n_jobs (int or None): Non-negative integer describing level of parallelism used for pipelines and for
+                training and scoring the cross-validation folds of each pipeline concurrently. While folds are trained
+                concurrently, the n_jobs of each component is capped so that the folds share the CPUs between them.
                 None and 1 are equivalent. If set to -1, all CPUs are used. For n_jobs below -1, (n_cpus + 1 + n_jobs) are used.
 
             verbose (boolean): If True, turn verbosity on. Defaults to True
 
+            parallel_batches (boolean): If True, all pipelines in each batch proposed by the automl algorithm are submitted to
+                the engine at once, and the cross-validation folds of each pipeline are run serially. Results are still reported
+                to the automl algorithm in the order the pipelines were proposed. Pipelines which the engine has not started when
+                max_time elapses are skipped. Defaults to False.
+
+            engine (EngineBase): The engine used to train and score pipelines. Defaults to a ThreadPoolEngine with n_jobs workers
+                if parallel_batches is True, and to a SequentialEngine otherwise.
+
+            transformer_cache_size (int): If set, fitted transformers and the data they output are cached and reused across
+                pipelines which start with the same transformers, such as the imputers and encoders added by make_pipeline.
+                The value is the maximum size of the cached data in bytes. The cache is shared between threads but not
+                between processes. If None, caching is disabled. Defaults to None.
+
+            automl_algorithm (str): The algorithm used to choose which pipelines to evaluate. One of 'iterative', 'successive_halving'
+                or 'hyperband'. 'successive_halving' and 'hyperband' first evaluate pipelines on stratified subsamples of the rows,
+                and only evaluate the best ones on all of the data. The fraction of the rows used is stored as the budget of
+                each result, and only results on all of the data are ranked. Defaults to 'iterative'.
+
+            pruning_policy (PruningPolicyBase): If set, the cross-validation folds of each pipeline are evaluated one at a time, and
+                the remaining folds are skipped when the policy decides the pipeline can't compete with the pipelines evaluated
+                before it. Pruned results are recorded but not ranked, and are reported to the automl algorithm with a penalized
+                score. If None, every fold is always evaluated. Defaults to None.
+
+            cost_model (RuntimeCostModel): If set, the cost model learns how long pipelines of each model family take to evaluate
+                from the pipelines evaluated so far. When max_time is set, pipelines predicted to run past it are evaluated on a
+                subsample small enough to finish in time, or skipped if that subsample would be too small. The remaining folds
+                of pipelines which run longer than the cost model's time_limit_factor times their predicted time are cancelled.
+                Defaults to None.
+
+            journal (str): Location of a journal file the results of each pipeline are appended to as soon as it is evaluated,
+                so that the search can be continued with resume if it is interrupted. Must not hold the results of another
+                search. If None, no journal is written. Defaults to None.
+
+            progressive_sampling (bool): If True and the data has more than 100,000 rows, the first batch of pipelines is
+                evaluated on stratified subsamples of the rows, starting with 100,000 rows and growing tenfold each
+                time. Only the better half of the pipelines, but at least three of them, are evaluated again on each larger
+                subsample, and only the pipelines which make it to all of the data are tuned afterwards. The fraction of the rows
+                used is stored as the budget of each result, and only results on all of the data are ranked. Can only be used
+                with the 'iterative' automl_algorithm. Defaults to False.
+
+            track_memory (bool): If True, the peak memory allocated by each component of a pipeline is traced with tracemalloc
+                during the search and recorded in the component telemetry of each result, together with the resident set size
+                of the process. The wall time and CPU time of each component are always recorded. Tracing memory slows down the
+                search, and is only accurate when the cross-validation folds and pipelines are not evaluated concurrently.
+                Defaults to False.
+
             _max_batches (int): The maximum number of batches of pipelines to search. Parameters max_time, and
                 max_iterations have precedence over stopping the search.
         """
@@ -159,6 +239,44 @@ class AutoMLSearch:
         self.data_split = data_split
         self.verbose = verbose
         self.optimize_thresholds = optimize_thresholds
+        self.parallel_batches = parallel_batches
+        if engine is None:
+            engine = ThreadPoolEngine(n_workers=n_jobs) if parallel_batches else SequentialEngine()
+        if not isinstance(engine, EngineBase):
+            raise ValueError("Not a valid engine")
+        self.engine = engine
+        if automl_algorithm not in self._AUTOML_ALGORITHMS:
+            raise ValueError(f"automl_algorithm must be one of {self._AUTOML_ALGORITHMS}. Received {automl_algorithm} instead")
+        self.automl_algorithm = automl_algorithm
+        if progressive_sampling and automl_algorithm != 'iterative':
+            raise ValueError(f"progressive_sampling can only be used with the 'iterative' automl_algorithm. Received {automl_algorithm} instead")
+        self.progressive_sampling = progressive_sampling
+        self._sample_budgets = []
+        self.track_memory = track_memory
+        self._started_tracemalloc = False
+        if pruning_policy is not None and not isinstance(pruning_policy, PruningPolicyBase):
+            raise ValueError("Not a valid pruning policy")
+        self.pruning_policy = pruning_policy
+        if cost_model is not None and not isinstance(cost_model, RuntimeCostModel):
+            raise ValueError("Not a valid cost model")
+        self.cost_model = cost_model
+        # the budgets chosen instead of the automl algorithm's, keyed by id. Each pipeline is kept with its budget, so that
+        # its id can't be reused by a pipeline created later while the budget is recorded
+        self._budget_overrides = {}
+        self.journal = journal
+        self._journal = None
+        self._journal_header = None
+        self._journal_records = {}
+        self._journaled_positions = set()
+        # the position at which the automl algorithm proposed each pipeline of the current batch, keyed by id
+        self._search_positions = {}
+        self._n_proposed = 0
+        self._subsample_seed = None
+        self._fold_store = None
+        self._warm_start_results = []
+        if transformer_cache_size is not None and transformer_cache_size <= 0:
+            raise ValueError(f"transformer_cache_size must be None or positive. Received {transformer_cache_size} instead")
+        self.transformer_cache = TransformerCache(max_size=transformer_cache_size) if transformer_cache_size else None
         if objective == 'auto':
             objective = get_default_primary_search_objective(self.problem_type.value)
         objective = get_objective(objective, return_instance=False)
@@ -207,6 +325,10 @@ class AutoMLSearch:
             'pipeline_results': {},
             'search_order': []
         }
+        self._rankings = RankingsStore(self.objective.greater_is_better)
+        self._n_early_stopping_results = 0
+        self._early_stopping_best_score = None
+        self._iterations_without_improvement = 0
         self.random_state = get_random_state(random_state)
         self.n_jobs = n_jobs
 
@@ -276,6 +398,12 @@ class AutoMLSearch:
             f"n_jobs: {self.n_jobs}\n"
             f"Verbose: {self.verbose}\n"
             f"Optimize Thresholds: {self.optimize_thresholds}\n"
+            f"Parallel Batches: {self.parallel_batches}\n"
+            f"Engine: {type(self.engine).__name__}\n"
+            f"AutoML Algorithm: {self.automl_algorithm}\n"
+            f"Pruning Policy: {type(self.pruning_policy).__name__ if self.pruning_policy else None}\n"
+            f"Cost Model: {type(self.cost_model).__name__ if self.cost_model else None}\n"
+            f"Progressive Sampling: {self.progressive_sampling}\n"
         )
 
         rankings_desc = ""
@@ -323,18 +451,28 @@ class AutoMLSearch:
             list: Next pipelines to search in the batch. If the user decides to stop the search,
                 an empty list will be returned.
         """
+        if self._confirm_exit():
+            return []
+        return [pipeline] + current_batch_pipelines
+
+    def _confirm_exit(self):
+        """Presents a prompt to the user asking if they want to stop the search.
+
+        Returns:
+            bool: True if the user decides to stop the search, False otherwise.
+        """
         leading_char = "\n"
         start_of_loop = time.time()
         while True:
             choice = input(leading_char + "Do you really want to exit search (y/n)? ").strip().lower()
             if choice == "y":
                 logger.info("Exiting AutoMLSearch.")
-                return []
+                return True
             elif choice == "n":
                 # So that the time in this loop does not count towards the time budget (if set)
                 time_in_loop = time.time() - start_of_loop
                 self._start += time_in_loop
-                return [pipeline] + current_batch_pipelines
+                return False
             else:
                 leading_char = ""
 
@@ -354,6 +492,28 @@ class AutoMLSearch:
 
         self.data_split = self.data_split or default_data_split
 
+    def _get_sample_budgets(self, X):
+        """Returns the increasing fractions of the rows the first batch is evaluated on before all of the data when progressive sampling is enabled."""
+        if not self.progressive_sampling:
+            return []
+        budgets = []
+        n_rows = self._LARGE_DATA_ROW_THRESHOLD
+        while n_rows < X.shape[0]:
+            budgets.append(n_rows / X.shape[0])
+            n_rows *= self._PROGRESSIVE_SAMPLING_GROWTH
+        return budgets
+
+    def _get_n_base_round_pipelines(self):
+        """Returns the number of pipelines the automl algorithm evaluates with default parameters, including those re-evaluated on larger subsamples."""
+        if self.automl_algorithm != 'iterative':
+            return len(self.allowed_pipelines)
+        n_pipelines = len(self.allowed_pipelines)
+        n_total = n_pipelines
+        for _ in self._sample_budgets:
+            n_pipelines = max(min(self._PROGRESSIVE_SAMPLING_PROMOTED, n_pipelines), int(np.ceil(n_pipelines / 2)))
+            n_total += n_pipelines
+        return n_total
+
     def search(self, X, y, data_checks="auto", feature_types=None, show_iteration_plot=True):
         """Find the best pipeline for the data set.
 
@@ -391,6 +551,7 @@ class AutoMLSearch:
             y = pd.Series(y)
 
         self._set_data_split(X)
+        self._sample_budgets = self._get_sample_budgets(X)
 
         data_checks = self._validate_data_checks(data_checks)
         data_check_results = data_checks.validate(X, y)
@@ -414,22 +575,39 @@ class AutoMLSearch:
         if self.allowed_pipelines == []:
             raise ValueError("No allowed pipelines to search")
         if self._max_batches and self.max_iterations is None:
-            self.max_iterations = 1 + len(self.allowed_pipelines) + (self._pipelines_per_batch * (self._max_batches - 1))
+            self.max_iterations = 1 + self._get_n_base_round_pipelines() + (self._pipelines_per_batch * (self._max_batches - 1))
 
         self.allowed_model_families = list(set([p.model_family for p in (self.allowed_pipelines)]))
 
         logger.debug(f"allowed_pipelines set to {[pipeline.name for pipeline in self.allowed_pipelines]}")
         logger.debug(f"allowed_model_families set to {self.allowed_model_families}")
 
-        self._automl_algorithm = IterativeAlgorithm(
-            max_iterations=self.max_iterations,
-            allowed_pipelines=self.allowed_pipelines,
-            tuner_class=self.tuner_class,
-            random_state=self.random_state,
-            n_jobs=self.n_jobs,
-            number_features=X.shape[1],
-            pipelines_per_batch=self._pipelines_per_batch
-        )
+        if self.automl_algorithm == 'iterative':
+            self._automl_algorithm = IterativeAlgorithm(
+                max_iterations=self.max_iterations,
+                allowed_pipelines=self.allowed_pipelines,
+                tuner_class=self.tuner_class,
+                random_state=self.random_state,
+                n_jobs=self.n_jobs,
+                number_features=X.shape[1],
+                pipelines_per_batch=self._pipelines_per_batch,
+                sample_budgets=self._sample_budgets,
+                n_promoted=self._PROGRESSIVE_SAMPLING_PROMOTED
+            )
+        else:
+            self._automl_algorithm = SuccessiveHalvingAlgorithm(
+                max_iterations=self.max_iterations,
+                allowed_pipelines=self.allowed_pipelines,
+                tuner_class=self.tuner_class,
+                random_state=self.random_state,
+                n_jobs=self.n_jobs,
+                number_features=X.shape[1],
+                hyperband=self.automl_algorithm == 'hyperband'
+            )
+
+        if self._warm_start_results:
+            n_added = self._automl_algorithm.warm_start(self._warm_start_results)
+            logger.info(f"Warm started the tuners with {n_added} of {len(self._warm_start_results)} results from a previous search")
 
         log_title(logger, "Beginning pipeline search")
         logger.info("Optimizing for %s. " % self.objective.name)
@@ -445,62 +623,171 @@ class AutoMLSearch:
             search_iteration_plot = self.plot.search_iteration_plot(interactive_plot=show_iteration_plot)
 
         self._start = time.time()
+        self._fold_store = FoldStore(self.data_split, X, y, self.problem_type)
+        self._open_journal(X)
+        if self.track_memory:
+            self._started_tracemalloc = _start_tracing()
 
         should_terminate = self._add_baseline_pipelines(X, y)
         if should_terminate:
+            self._finish_search()
             return
 
         current_batch_pipelines = []
         current_batch_pipeline_scores = []
+        current_batch_skipped = False
         while self._check_stopping_condition(self._start):
+            # the pipelines taken from the batch whose results haven't been recorded yet, which are evaluated again if
+            # the search is interrupted and the user decides to continue
+            unrecorded_pipelines = []
             try:
                 if len(current_batch_pipelines) == 0:
+                    if current_batch_skipped and not current_batch_pipeline_scores:
+                        logger.info('Every pipeline in the batch was predicted to run past max_time, ending')
+                        break
                     try:
                         if current_batch_pipeline_scores and np.isnan(np.array(current_batch_pipeline_scores, dtype=float)).all():
                             raise AutoMLSearchException(f"All pipelines in the current AutoML batch produced a score of np.nan on the primary objective {self.objective}.")
                         current_batch_pipelines = self._automl_algorithm.next_batch()
+                        self._search_positions = {id(pipeline): self._n_proposed + i for i, pipeline in enumerate(current_batch_pipelines)}
+                        self._n_proposed += len(current_batch_pipelines)
                         current_batch_pipeline_scores = []
+                        current_batch_skipped = False
+                        self._budget_overrides = {}
                     except StopIteration:
                         logger.info('AutoML Algorithm out of recommendations, ending')
                         break
-                pipeline = current_batch_pipelines.pop(0)
-                parameters = pipeline.parameters
-                logger.debug('Evaluating pipeline {}'.format(pipeline.name))
-                logger.debug('Pipeline parameters: {}'.format(parameters))
-
-                if self.start_iteration_callback:
-                    self.start_iteration_callback(pipeline.__class__, parameters, self)
-                desc = f"{pipeline.name}"
-                if len(desc) > self._MAX_NAME_LEN:
-                    desc = desc[:self._MAX_NAME_LEN - 3] + "..."
-                desc = desc.ljust(self._MAX_NAME_LEN)
-
-                update_pipeline(logger, desc, len(self._results['pipeline_results']) + 1, self.max_iterations, self._start)
+                if self.parallel_batches:
+                    unrecorded_pipelines, current_batch_pipelines = self._split_batch_for_parallel_evaluation(current_batch_pipelines)
+                    n_pipelines = len(unrecorded_pipelines)
+                    pipelines = [pipeline for pipeline in unrecorded_pipelines if self._fits_time_budget(pipeline, X)]
+                    unrecorded_pipelines = list(pipelines)
+                    current_batch_skipped = current_batch_skipped or len(pipelines) < n_pipelines
+                    for i, pipeline in enumerate(pipelines):
+                        self._start_iteration(pipeline, len(self._results['pipeline_results']) + 1 + i)
+                    batch_results = self._evaluate_batch(pipelines, X, y)
+                    for pipeline, evaluation_results in zip(pipelines, batch_results):
+                        # a pipeline counts as recorded once its result starts being added, so that it's never recorded twice
+                        unrecorded_pipelines.remove(pipeline)
+                        if evaluation_results is not None:
+                            self._update_cost_model(pipeline, X, evaluation_results)
+                            self._add_result(trained_pipeline=pipeline,
+                                             parameters=pipeline.parameters,
+                                             training_time=evaluation_results['training_time'],
+                                             cv_data=evaluation_results['cv_data'],
+                                             cv_scores=evaluation_results['cv_scores'],
+                                             budget=self._get_budget(pipeline),
+                                             pruned=evaluation_results.get('pruned', False))
+                            current_batch_pipeline_scores.append(self._report_score_to_algorithm(pipeline, evaluation_results))
+                            if search_iteration_plot:
+                                search_iteration_plot.update()
+                    continue
 
+                pipeline = current_batch_pipelines.pop(0)
+                unrecorded_pipelines = [pipeline]
+                if not self._fits_time_budget(pipeline, X):
+                    current_batch_skipped = True
+                    continue
+                self._start_iteration(pipeline, len(self._results['pipeline_results']) + 1)
                 evaluation_results = self._evaluate(pipeline, X, y)
-                score = evaluation_results['cv_score_mean']
-                score_to_minimize = -score if self.objective.greater_is_better else score
+                score_to_minimize = self._report_score_to_algorithm(pipeline, evaluation_results)
                 current_batch_pipeline_scores.append(score_to_minimize)
-                self._automl_algorithm.add_result(score_to_minimize, pipeline)
+                unrecorded_pipelines = []
 
                 if search_iteration_plot:
                     search_iteration_plot.update()
 
             except KeyboardInterrupt:
-                current_batch_pipelines = self._handle_keyboard_interrupt(pipeline, current_batch_pipelines)
-                if not current_batch_pipelines:
+                # results of the interrupted evaluation which weren't recorded yet are dropped, and their pipelines
+                # are evaluated again if the search continues
+                if self._confirm_exit():
+                    self._finish_search()
                     return
+                current_batch_pipelines = unrecorded_pipelines + current_batch_pipelines
 
+        self._finish_search()
         elapsed_time = time_elapsed(self._start)
         desc = f"\nSearch finished after {elapsed_time}"
         desc = desc.ljust(self._MAX_NAME_LEN)
         logger.info(desc)
 
-        best_pipeline = self.rankings.iloc[0]
+        if self._rankings.best_id is None:
+            logger.info("No pipeline was evaluated on all of the data")
+            return
+        best_pipeline = self._results['pipeline_results'][self._rankings.best_id]
         best_pipeline_name = best_pipeline["pipeline_name"]
         logger.info(f"Best pipeline: {best_pipeline_name}")
         logger.info(f"Best pipeline {self.objective.name}: {best_pipeline['score']:3f}")
 
+    def _start_iteration(self, pipeline, current_iteration):
+        """Calls the start iteration callback and logs the progress of the search before a pipeline is evaluated."""
+        parameters = pipeline.parameters
+        logger.debug('Evaluating pipeline {}'.format(pipeline.name))
+        logger.debug('Pipeline parameters: {}'.format(parameters))
+
+        if self.start_iteration_callback:
+            self.start_iteration_callback(pipeline.__class__, parameters, self)
+        desc = f"{pipeline.name}"
+        if len(desc) > self._MAX_NAME_LEN:
+            desc = desc[:self._MAX_NAME_LEN - 3] + "..."
+        desc = desc.ljust(self._MAX_NAME_LEN)
+
+        update_pipeline(logger, desc, current_iteration, self.max_iterations, self._start)
+
+    def _report_score_to_algorithm(self, pipeline, evaluation_results):
+        """Reports the mean cross-validation score of an evaluated pipeline to the automl algorithm, with the fraction of the rows it was actually evaluated on.
+
+        Returns:
+            float: the score reported to the automl algorithm, converted so that lower values indicate better pipelines.
+        """
+        score = evaluation_results['cv_score_mean']
+        score_to_minimize = -score if self.objective.greater_is_better else score
+        if evaluation_results.get('pruned', False):
+            # pipelines cancelled by the cost model's time limit are penalized the same way as pruned pipelines
+            score_to_minimize = (self.pruning_policy or PruningPolicyBase).penalize(score_to_minimize, self._get_pruning_reference())
+        self._automl_algorithm.add_result(score_to_minimize, pipeline, self._get_budget(pipeline))
+        return score_to_minimize
+
+    def _split_batch_for_parallel_evaluation(self, current_batch_pipelines):
+        """Splits the current batch into the pipelines to evaluate concurrently and the pipelines left over once max_iterations is reached.
+
+        Returns:
+            (list, list): the pipelines to evaluate now and the remaining pipelines of the batch.
+        """
+        n_pipelines = len(current_batch_pipelines)
+        if self.max_iterations:
+            n_pipelines = min(n_pipelines, self.max_iterations - len(self._results['pipeline_results']))
+        return current_batch_pipelines[:n_pipelines], current_batch_pipelines[n_pipelines:]
+
+    def _evaluate_batch(self, pipelines, X, y):
+        """Submits all pipelines to the engine at once and collects their evaluation results in order.
+
+        Pipelines which the engine has not started by the time max_time elapses are cancelled.
+
+        Arguments:
+            pipelines (list(PipelineBase)): the pipelines to evaluate.
+            X (pd.DataFrame): the input training data of shape [n_samples, n_features]
+            y (pd.Series): the target training data of length [n_samples]
+
+        Returns:
+            list(dict): the evaluation results for each pipeline, in the same order as pipelines. Entries for cancelled pipelines are None.
+        """
+        computations = [self._submit_evaluation_job(pipeline, X, y) for pipeline in pipelines]
+        batch_results = []
+        out_of_time = False
+        for i, (pipeline, computation) in enumerate(zip(pipelines, computations)):
+            if not out_of_time and self.max_time and time.time() - self._start >= self.max_time:
+                # cancel all the remaining jobs at once, so that queued jobs don't start while the results before them are collected
+                out_of_time = True
+                for remaining_computation in computations[i:]:
+                    remaining_computation.cancel()
+            if out_of_time and computation.cancel():
+                logger.debug(f'Skipping pipeline {pipeline.name}: max_time elapsed before it could be evaluated')
+                batch_results.append(None)
+            else:
+                batch_results.append(self._get_evaluation_results(pipeline, computation))
+        return batch_results
+
     def _check_stopping_condition(self, start):
         should_continue = True
         num_pipelines = len(self._results['pipeline_results'])
@@ -516,21 +803,28 @@ class AutoMLSearch:
         if self.patience is None:
             return True
 
-        first_id = self._results['search_order'][0]
-        best_score = self._results['pipeline_results'][first_id]['score']
-        num_without_improvement = 0
-        for id in self._results['search_order'][1:]:
-            curr_score = self._results['pipeline_results'][id]['score']
+        # only the results added since the last check are compared with the best score so far
+        search_order = self._results['search_order']
+        while self._iterations_without_improvement < self.patience and self._n_early_stopping_results < len(search_order):
+            pipeline_results = self._results['pipeline_results'][search_order[self._n_early_stopping_results]]
+            self._n_early_stopping_results += 1
+            if not self._is_fully_evaluated(pipeline_results):
+                continue
+            curr_score = pipeline_results['score']
+            best_score = self._early_stopping_best_score
+            if best_score is None:
+                self._early_stopping_best_score = curr_score
+                continue
             significant_change = abs((curr_score - best_score) / best_score) > self.tolerance
             score_improved = curr_score > best_score if self.objective.greater_is_better else curr_score < best_score
             if score_improved and significant_change:
-                best_score = curr_score
-                num_without_improvement = 0
+                self._early_stopping_best_score = curr_score
+                self._iterations_without_improvement = 0
             else:
-                num_without_improvement += 1
-            if num_without_improvement >= self.patience:
-                logger.info("\n\n{} iterations without improvement. Stopping search early...".format(self.patience))
-                return False
+                self._iterations_without_improvement += 1
+        if self._iterations_without_improvement >= self.patience:
+            logger.info("\n\n{} iterations without improvement. Stopping search early...".format(self.patience))
+            return False
         return should_continue
 
     def _validate_problem_type(self):
@@ -563,7 +857,11 @@ class AutoMLSearch:
         elif self.problem_type == ProblemTypes.REGRESSION:
             baseline = MeanBaselineRegressionPipeline(parameters={})
 
+        # the baseline is always evaluated on all of the data, even with progressive sampling, so that it's ranked and
+        # every pipeline is compared with the same baseline scores
         pipelines = [baseline]
+        self._search_positions = {id(baseline): 0}
+        self._n_proposed = 1
         # Using a while loop so that we can retry the pipeline after the user hits ctr-c
         # but decides to not stop the search.
         while pipelines:
@@ -580,12 +878,14 @@ class AutoMLSearch:
                                 self._start)
 
                 baseline_results = self._compute_cv_scores(baseline, X, y)
+                self._update_cost_model(baseline, X, baseline_results)
                 self._baseline_cv_scores = self._get_mean_cv_scores_for_all_objectives(baseline_results["cv_data"])
                 self._add_result(trained_pipeline=baseline,
                                  parameters=baseline.parameters,
                                  training_time=baseline_results['training_time'],
                                  cv_data=baseline_results['cv_data'],
-                                 cv_scores=baseline_results['cv_scores'])
+                                 cv_scores=baseline_results['cv_scores'],
+                                 budget=self._get_budget(baseline))
             except KeyboardInterrupt:
                 pipelines = self._handle_keyboard_interrupt(baseline, pipelines)
                 if not pipelines:
@@ -604,84 +904,203 @@ class AutoMLSearch:
                     scores[field] += value
         return {objective_name: float(score) / n_folds for objective_name, score in scores.items()}
 
+    def _get_automl_config(self):
+        """Returns the settings needed by an engine to train and score a pipeline."""
+        return AutoMLConfig(data_split=self.data_split,
+                            problem_type=self.problem_type,
+                            objective=self.objective,
+                            additional_objectives=self.additional_objectives,
+                            optimize_thresholds=self.optimize_thresholds,
+                            n_jobs=1 if self.parallel_batches else self.n_jobs,
+                            transformer_cache=self.transformer_cache,
+                            pruning_policy=self.pruning_policy,
+                            pruning_reference=self._get_pruning_reference() if self.pruning_policy else None,
+                            time_limit=None,
+                            fold_store=self._fold_store,
+                            track_memory=self.track_memory)
+
+    @staticmethod
+    def _is_fully_evaluated(pipeline_results):
+        """Returns True if a result was computed on every fold of all of the data, so that it can be compared with other results."""
+        return pipeline_results.get('budget', 1.0) == 1.0 and not pipeline_results.get('pruned', False)
+
+    def _get_pruning_reference(self):
+        """Returns the fold scores of all fully evaluated pipelines, converted so that lower values indicate better pipelines."""
+        sign = -1 if self.objective.greater_is_better else 1
+        return [[sign * fold['score'] for fold in pipeline_results['cv_data']]
+                for pipeline_results in self._results['pipeline_results'].values()
+                if self._is_fully_evaluated(pipeline_results)]
+
+    def _submit_evaluation_job(self, pipeline, X, y):
+        """Submits a job to the engine to train and score the pipeline on all cross-validation folds.
+
+        Returns:
+            EngineComputation: computation whose result is the dictionary returned by train_and_score_pipeline.
+        """
+        automl_config = self._get_automl_config()
+        budget = self._get_budget(pipeline)
+        if budget < 1:
+            X, y = self._subsample(X, y, budget)
+            # the reference scores were computed on all of the data, so they can't be used to prune subsample evaluations
+            automl_config = automl_config._replace(pruning_policy=None, pruning_reference=None, fold_store=None)
+        if self.cost_model is not None:
+            predicted_time = self._predict_training_time(pipeline, len(X), X.shape[1])
+            if predicted_time is not None:
+                automl_config = automl_config._replace(time_limit=self.cost_model.time_limit_factor * predicted_time)
+        random_seed = None
+        if self.optimize_thresholds and self.objective.problem_type == ProblemTypes.BINARY and self.objective.can_optimize_threshold:
+            random_seed = get_random_seed(self.random_state)
+        record = self._get_journal_record(pipeline)
+        if record is not None:
+            del self._journal_records[self._search_positions[id(pipeline)]]
+            return ReplayedComputation(record)
+        return self.engine.submit_evaluation_job(automl_config, pipeline, X, y, random_seed=random_seed)
+
+    def _get_budget(self, pipeline):
+        """Returns the fraction of the training rows the pipeline is evaluated on, as chosen by the automl algorithm or reduced to finish before max_time."""
+        pipeline_and_budget = self._budget_overrides.get(id(pipeline))
+        if pipeline_and_budget is not None and pipeline_and_budget[0] is pipeline:
+            return pipeline_and_budget[1]
+        if self._automl_algorithm is None:
+            return 1.0
+        return self._automl_algorithm.get_budget(pipeline)
+
+    def _predict_training_time(self, pipeline, n_rows, n_features):
+        """Returns the time the cost model predicts evaluating the pipeline on every fold will take, or None if it can't predict it."""
+        fold_time = self.cost_model.predict(pipeline.model_family, n_rows, n_features)
+        if fold_time is None:
+            return None
+        return fold_time * self.data_split.get_n_splits()
+
+    def _update_cost_model(self, pipeline, X, evaluation_results):
+        """Records the time taken per fold to evaluate a pipeline in the cost model, if there is one."""
+        if self.cost_model is None or not evaluation_results['cv_data'] or evaluation_results.get('failed', False):
+            return
+        n_rows = int(np.ceil(self._get_budget(pipeline) * len(X)))
+        fold_time = evaluation_results['training_time'] / len(evaluation_results['cv_data'])
+        self.cost_model.add(pipeline.model_family, n_rows, X.shape[1], fold_time)
+
+    def _fits_time_budget(self, pipeline, X):
+        """Checks whether the cost model predicts the pipeline can be evaluated before max_time elapses.
+
+        Pipelines predicted to run past max_time are evaluated on a subsample small enough to finish in time instead,
+        unless that subsample would hold less than _MIN_COST_MODEL_BUDGET of the rows, in which case they are skipped.
+
+        Returns:
+            bool: False if the pipeline should be skipped, True otherwise.
+        """
+        record = self._get_journal_record(pipeline)
+        if record is not None:
+            # replay the decision made when the journal was written, since the time left is different now
+            if record.get('skipped', False):
+                del self._journal_records[self._search_positions[id(pipeline)]]
+                return False
+            if record['budget'] != self._get_budget(pipeline):
+                self._budget_overrides[id(pipeline)] = (pipeline, record['budget'])
+            return True
+        if self.cost_model is None or not self.max_time:
+            return True
+        budget = self._get_budget(pipeline)
+        predicted_time = self._predict_training_time(pipeline, int(np.ceil(budget * len(X))), X.shape[1])
+        if predicted_time is None:
+            return True
+        remaining_time = self.max_time - (time.time() - self._start)
+        if predicted_time <= remaining_time:
+            return True
+        downsized_budget = budget * remaining_time / predicted_time
+        if downsized_budget < self._MIN_COST_MODEL_BUDGET:
+            logger.info(f"Skipping {pipeline.name}: predicted to take {predicted_time:.1f} seconds with {max(remaining_time, 0):.1f} seconds left")
+            if self._journal is not None:
+                position = self._search_positions[id(pipeline)]
+                self._journal.append_skip(position, pipeline.name, pipeline.parameters)
+                self._journaled_positions.add(position)
+            return False
+        logger.info(f"Evaluating {pipeline.name} on {downsized_budget:.0%} of the rows: predicted to take {predicted_time:.1f} seconds with {remaining_time:.1f} seconds left")
+        self._budget_overrides[id(pipeline)] = (pipeline, downsized_budget)
+        return True
+
+    def _open_journal(self, X):
+        """Starts writing the journal, or checks that the journal being resumed was written by a search with the same settings and data."""
+        if self.journal is None:
+            return
+        journal = ResultsJournal(self.journal)
+        header = {'problem_type': self.problem_type.value, 'objective': self.objective.name,
+                  'n_rows': X.shape[0], 'n_features': X.shape[1]}
+        if self._journal_header is None:
+            if journal.exists():
+                raise ValueError(f"Journal {self.journal} already holds the results of a search. Use resume to continue that search")
+            journal.write_header(header)
+        elif self._journal_header != header:
+            raise ValueError(f"Journal {self.journal} was written by a search with different settings or data: {self._journal_header}")
+        self._journal_header = None
+        self._journal = journal
+
+    def _finish_search(self):
+        """Stops writing the journal, drops any journal records which were not replayed and the budgets of the latest batch, and releases the folds of the data."""
+        self._journal = None
+        self._fold_store = None
+        self._journal_records = {}
+        self._search_positions = {}
+        self._budget_overrides = {}
+        self._automl_algorithm.clear_budgets()
+        if self._started_tracemalloc:
+            _stop_tracing()
+            self._started_tracemalloc = False
+
+    def _get_journal_record(self, pipeline):
+        """Returns the record of the journal being resumed for the pipeline, or None if there isn't one.
+
+        Raises ValueError if the record is for a different pipeline, which happens when the search which wrote the journal was created with different settings.
+        """
+        position = self._search_positions.get(id(pipeline))
+        if position is None or position not in self._journal_records:
+            return None
+        record = self._journal_records[position]
+        if record['pipeline_name'] != pipeline.name or record['parameters'] != ResultsJournal.normalize(pipeline.parameters):
+            raise ValueError(f"Journal {self.journal} does not match this search: pipeline {position} was {record['pipeline_name']} "
+                             f"with parameters {dict(record['parameters'])}, but this search proposed {pipeline.name} with parameters {pipeline.parameters}")
+        return record
+
+    def _subsample(self, X, y, budget):
+        """Returns a random subsample of the rows of the training data, stratified by the target for classification problems.
+
+        Samples of the same size are the same throughout the search, so that pipelines evaluated on them can be compared.
+        """
+        n_rows = int(np.ceil(budget * len(X)))
+        if n_rows >= len(X):
+            return X, y
+        if self._subsample_seed is None:
+            self._subsample_seed = get_random_seed(self.random_state)
+        stratify = y if self.problem_type in [ProblemTypes.BINARY, ProblemTypes.MULTICLASS] else None
+        X_sample, _, y_sample, _ = train_test_split(X, y, train_size=n_rows, stratify=stratify, random_state=self._subsample_seed)
+        return X_sample, y_sample
+
     def _compute_cv_scores(self, pipeline, X, y):
-        start = time.time()
-        cv_data = []
-        logger.info("\tStarting cross validation")
-        for i, (train, test) in enumerate(self.data_split.split(X, y)):
-            logger.debug(f"\t\tTraining and scoring on fold {i}")
-            X_train, X_test = X.iloc[train], X.iloc[test]
-            y_train, y_test = y.iloc[train], y.iloc[test]
-            if self.problem_type in [ProblemTypes.BINARY, ProblemTypes.MULTICLASS]:
-                diff_train = set(np.setdiff1d(y, y_train))
-                diff_test = set(np.setdiff1d(y, y_test))
-                diff_string = f"Missing target values in the training set after data split: {diff_train}. " if diff_train else ""
-                diff_string += f"Missing target values in the test set after data split: {diff_test}." if diff_test else ""
-                if diff_string:
-                    raise Exception(diff_string)
-            objectives_to_score = [self.objective] + self.additional_objectives
-            cv_pipeline = None
-            try:
-                X_threshold_tuning = None
-                y_threshold_tuning = None
-                if self.optimize_thresholds and self.objective.problem_type == ProblemTypes.BINARY and self.objective.can_optimize_threshold:
-                    X_train, X_threshold_tuning, y_train, y_threshold_tuning = train_test_split(X_train, y_train, test_size=0.2, random_state=self.random_state)
-                cv_pipeline = pipeline.clone()
-                logger.debug(f"\t\t\tFold {i}: starting training")
-                cv_pipeline.fit(X_train, y_train)
-                logger.debug(f"\t\t\tFold {i}: finished training")
-                if self.objective.problem_type == ProblemTypes.BINARY:
-                    cv_pipeline.threshold = 0.5
-                    if self.optimize_thresholds and self.objective.can_optimize_threshold:
-                        logger.debug(f"\t\t\tFold {i}: Optimizing threshold for {self.objective.name}")
-                        y_predict_proba = cv_pipeline.predict_proba(X_threshold_tuning)
-                        if isinstance(y_predict_proba, pd.DataFrame):
-                            y_predict_proba = y_predict_proba.iloc[:, 1]
-                        else:
-                            y_predict_proba = y_predict_proba[:, 1]
-                        cv_pipeline.threshold = self.objective.optimize_threshold(y_predict_proba, y_threshold_tuning, X=X_threshold_tuning)
-                        logger.debug(f"\t\t\tFold {i}: Optimal threshold found ({cv_pipeline.threshold:.3f})")
-                logger.debug(f"\t\t\tFold {i}: Scoring trained pipeline")
-                scores = cv_pipeline.score(X_test, y_test, objectives=objectives_to_score)
-                logger.debug(f"\t\t\tFold {i}: {self.objective.name} score: {scores[self.objective.name]:.3f}")
-                score = scores[self.objective.name]
-            except Exception as e:
-                if isinstance(e, PipelineScoreError):
-                    logger.info(f"\t\t\tFold {i}: Encountered an error scoring the following objectives: {', '.join(e.exceptions)}.")
-                    logger.info(f"\t\t\tFold {i}: The scores for these objectives will be replaced with nan.")
-                    logger.info(f"\t\t\tFold {i}: Please check {logger.handlers[1].baseFilename} for the current hyperparameters and stack trace.")
-                    logger.debug(f"\t\t\tFold {i}: Hyperparameters:\n\t{pipeline.hyperparameters}")
-                    logger.debug(f"\t\t\tFold {i}: Exception during automl search: {str(e)}")
-                    nan_scores = {objective: np.nan for objective in e.exceptions}
-                    scores = {**nan_scores, **e.scored_successfully}
-                    scores = OrderedDict({o.name: scores[o.name] for o in [self.objective] + self.additional_objectives})
-                    score = scores[self.objective.name]
-                else:
-                    logger.info(f"\t\t\tFold {i}: Encountered an error.")
-                    logger.info(f"\t\t\tFold {i}: All scores will be replaced with nan.")
-                    logger.info(f"\t\t\tFold {i}: Please check {logger.handlers[1].baseFilename} for the current hyperparameters and stack trace.")
-                    logger.debug(f"\t\t\tFold {i}: Hyperparameters:\n\t{pipeline.hyperparameters}")
-                    logger.debug(f"\t\t\tFold {i}: Exception during automl search: {str(e)}")
-                    score = np.nan
-                    scores = OrderedDict(zip([n.name for n in self.additional_objectives], [np.nan] * len(self.additional_objectives)))
-
-            ordered_scores = OrderedDict()
-            ordered_scores.update({self.objective.name: score})
-            ordered_scores.update(scores)
-            ordered_scores.update({"# Training": len(y_train)})
-            ordered_scores.update({"# Testing": len(y_test)})
-
-            evaluation_entry = {"all_objective_scores": ordered_scores, "score": score, 'binary_classification_threshold': None}
-            if isinstance(cv_pipeline, BinaryClassificationPipeline) and cv_pipeline.threshold is not None:
-                evaluation_entry['binary_classification_threshold'] = cv_pipeline.threshold
-            cv_data.append(evaluation_entry)
-        training_time = time.time() - start
-        cv_scores = pd.Series([fold['score'] for fold in cv_data])
-        cv_score_mean = cv_scores.mean()
-        logger.info(f"\tFinished cross validation - mean {self.objective.name}: {cv_score_mean:.3f}")
-        return {'cv_data': cv_data, 'training_time': training_time, 'cv_scores': cv_scores, 'cv_score_mean': cv_score_mean}
-
-    def _add_result(self, trained_pipeline, parameters, training_time, cv_data, cv_scores):
+        return self._get_evaluation_results(pipeline, self._submit_evaluation_job(pipeline, X, y))
+
+    def _get_evaluation_results(self, pipeline, computation):
+        """Waits for the result of an evaluation job.
+
+        Jobs which the engine couldn't run to completion, for example because the worker running them exited, are
+        recorded as failed pipelines with nan scores, like folds which raise an error, instead of ending the search.
+
+        Returns:
+            dict: the evaluation results of the pipeline.
+        """
+        try:
+            return computation.get_result()
+        except EngineJobError as e:
+            logger.info(f"\tEvaluation of {pipeline.name} failed: {str(e)}")
+            logger.info("\tAll scores will be replaced with nan.")
+            objectives = [self.objective] + self.additional_objectives
+            fold_scores = OrderedDict([(objective.name, np.nan) for objective in objectives] + [("# Training", np.nan), ("# Testing", np.nan)])
+            cv_data = [{"all_objective_scores": OrderedDict(fold_scores), "score": np.nan, "binary_classification_threshold": None,
+                        "component_telemetry": []}
+                       for _ in range(self.data_split.get_n_splits())]
+            return {'cv_data': cv_data, 'training_time': np.nan, 'cv_scores': pd.Series([np.nan] * len(cv_data)),
+                    'cv_score_mean': np.nan, 'pruned': False, 'failed': True}
+
+    def _add_result(self, trained_pipeline, parameters, training_time, cv_data, cv_scores, budget=1.0, pruned=False):
         cv_score = cv_scores.mean()
 
         percent_better_than_baseline = {}
@@ -716,9 +1135,18 @@ class AutoMLSearch:
             "cv_data": cv_data,
             "percent_better_than_baseline_all_objectives": percent_better_than_baseline,
             "percent_better_than_baseline": percent_better_than_baseline[self.objective.name],
-            "validation_score": cv_scores[0]
+            "validation_score": cv_scores[0],
+            "budget": budget,
+            "pruned": pruned,
+            "component_telemetry": ComponentTelemetry.combine([fold.get('component_telemetry', []) for fold in cv_data])
         }
         self._results['search_order'].append(pipeline_id)
+        self._rankings.add(self._results['pipeline_results'][pipeline_id], self._is_fully_evaluated(self._results['pipeline_results'][pipeline_id]))
+
+        position = self._search_positions.get(id(trained_pipeline))
+        if self._journal is not None and position is not None and position not in self._journaled_positions:
+            self._journal.append_result(position, pipeline_name, parameters, training_time, cv_data, budget, pruned)
+            self._journaled_positions.add(position)
 
         if self.add_result_callback:
             self.add_result_callback(self._results['pipeline_results'][pipeline_id], trained_pipeline, self)
@@ -726,13 +1154,16 @@ class AutoMLSearch:
     def _evaluate(self, pipeline, X, y):
         parameters = pipeline.parameters
         evaluation_results = self._compute_cv_scores(pipeline, X, y)
+        self._update_cost_model(pipeline, X, evaluation_results)
         logger.debug('Adding results for pipeline {}\nparameters {}\nevaluation_results {}'.format(pipeline.name, parameters, evaluation_results))
 
         self._add_result(trained_pipeline=pipeline,
                          parameters=parameters,
                          training_time=evaluation_results['training_time'],
                          cv_data=evaluation_results['cv_data'],
-                         cv_scores=evaluation_results['cv_scores'])
+                         cv_scores=evaluation_results['cv_scores'],
+                         budget=self._get_budget(pipeline),
+                         pruned=evaluation_results.get('pruned', False))
 
         logger.debug('Adding results complete')
         return evaluation_results
@@ -783,6 +1214,8 @@ class AutoMLSearch:
             logger.info("Objective to optimize binary classification pipeline thresholds for: {}".format(self.objective))
 
         logger.info("Total training time (including CV): %.1f seconds" % pipeline_results["training_time"])
+        if pipeline_results.get("budget", 1.0) < 1.0:
+            logger.info("Evaluated on {:.1%} of the rows".format(pipeline_results["budget"]))
         log_subtitle(logger, "Cross Validation", underline="-")
 
         if pipeline_results["high_variance_cv"]:
@@ -808,6 +1241,13 @@ class AutoMLSearch:
         with pd.option_context('display.float_format', '{:.3f}'.format, 'expand_frame_repr', False):
             logger.info(all_objective_scores)
 
+        component_telemetry = pipeline_results.get("component_telemetry")
+        if component_telemetry:
+            log_subtitle(logger, "Component Telemetry", underline="-")
+            component_telemetry = pd.DataFrame(component_telemetry, columns=ComponentTelemetry.columns).fillna("-")
+            with pd.option_context('display.float_format', '{:.3f}'.format, 'expand_frame_repr', False):
+                logger.info(component_telemetry.to_string(index=False))
+
         if return_dict:
             return pipeline_results
 
@@ -829,11 +1269,14 @@ class AutoMLSearch:
 
         self._set_data_split(X)
 
-        pipeline_rows = self.full_rankings[self.full_rankings['pipeline_name'] == pipeline.name]
-        for parameter in pipeline_rows['parameters']:
-            if pipeline.parameters == parameter:
-                return
-        self._evaluate(pipeline, X, y)
+        if self._rankings.contains(pipeline.name, pipeline.parameters):
+            return
+        # pipelines added to the rankings are always evaluated on all of the data, without asking the automl algorithm
+        self._budget_overrides[id(pipeline)] = (pipeline, 1.0)
+        try:
+            self._evaluate(pipeline, X, y)
+        finally:
+            del self._budget_overrides[id(pipeline)]
 
     @property
     def results(self):
@@ -844,6 +1287,19 @@ class AutoMLSearch:
            """
         return copy.deepcopy(self._results)
 
+    def iteration_scores(self, start=0):
+        """Returns the id and primary objective score of each result in the order the pipelines were evaluated, without
+        copying the rest of the results.
+
+        Arguments:
+            start (int): the number of results to skip, so that only the results added since then are returned. Defaults to 0.
+
+        Returns:
+            list(tuple): (pipeline id, score) for each result from the start-th one on.
+        """
+        pipeline_results = self._results['pipeline_results']
+        return [(id, pipeline_results[id]['score']) for id in self._results['search_order'][start:]]
+
     @property
     def has_searched(self):
         """Returns `True` if search has been ran and `False` if not"""
@@ -852,26 +1308,16 @@ class AutoMLSearch:
 
     @property
     def rankings(self):
-        """Returns a pandas.DataFrame with scoring results from the highest-scoring set of parameters used with each pipeline."""
-        return self.full_rankings.drop_duplicates(subset="pipeline_name", keep="first")
+        """Returns a pandas.DataFrame with scoring results from the highest-scoring set of parameters used with each pipeline.
+
+        Results of pipelines evaluated on a subsample of the data by the automl algorithm, or pruned before all folds
+        were evaluated, are not included."""
+        return self._rankings.rankings
 
     @property
     def full_rankings(self):
         """Returns a pandas.DataFrame with scoring results from all pipelines searched"""
-        ascending = True
-        if self.objective.greater_is_better:
-            ascending = False
-
-        full_rankings_cols = ["id", "pipeline_name", "score", "validation_score",
-                              "percent_better_than_baseline", "high_variance_cv", "parameters"]
-        if not self.has_searched:
-            return pd.DataFrame(columns=full_rankings_cols)
-
-        rankings_df = pd.DataFrame(self._results['pipeline_results'].values())
-        rankings_df = rankings_df[full_rankings_cols]
-        rankings_df.sort_values("score", ascending=ascending, inplace=True)
-        rankings_df.reset_index(drop=True, inplace=True)
-        return rankings_df
+        return self._rankings.full_rankings
 
     @property
     def best_pipeline(self):
@@ -883,8 +1329,9 @@ class AutoMLSearch:
         if not self.has_searched:
             raise PipelineNotFoundError("automl search must be run before selecting `best_pipeline`.")
 
-        best = self.rankings.iloc[0]
-        return self.get_pipeline(best["id"])
+        if self._rankings.best_id is None:
+            raise PipelineNotFoundError("No pipeline was evaluated on all of the data, so there is no `best_pipeline`.")
+        return self.get_pipeline(self._rankings.best_id)
 
     def save(self, file_path, pickle_protocol=cloudpickle.DEFAULT_PROTOCOL):
         """Saves AutoML object at file path
@@ -899,6 +1346,55 @@ class AutoMLSearch:
         with open(file_path, 'wb') as f:
             cloudpickle.dump(self, f, protocol=pickle_protocol)
 
+    def warm_start(self, previous_results):
+        """Seeds the tuners of the search with the results of a previous search, such as one run on an older version of the data.
+
+        Must be called before search. Only pipelines evaluated on all of the data are used, scored on the primary objective
+        of this search. Results for pipelines which aren't allowed in this search, which weren't scored on its primary
+        objective, or whose parameters don't fit its hyperparameter ranges are ignored.
+
+        Arguments:
+            previous_results (dict, str): the results of the previous search, as returned by AutoMLSearch.results, or the location of its journal.
+
+        Returns:
+            None
+        """
+        if self.has_searched:
+            raise ValueError("warm_start must be called before search")
+        if isinstance(previous_results, str):
+            _, records = ResultsJournal(previous_results).read()
+            pipeline_results = [record for _, record in sorted(records.items()) if not record.get('skipped', False)]
+        else:
+            pipeline_results = [previous_results['pipeline_results'][id] for id in previous_results['search_order']]
+        sign = -1 if self.objective.greater_is_better else 1
+        self._warm_start_results = []
+        for pipeline_result in pipeline_results:
+            if not self._is_fully_evaluated(pipeline_result):
+                continue
+            score = np.mean([fold['all_objective_scores'].get(self.objective.name, np.nan) for fold in pipeline_result['cv_data']])
+            self._warm_start_results.append((pipeline_result['pipeline_name'], pipeline_result['parameters'], sign * score))
+
+    def resume(self, journal):
+        """Continues the search recorded in a journal, such as one which was interrupted by a crash.
+
+        Must be called before search, on an AutoMLSearch created with the same arguments as the search which wrote the journal.
+        search must then be called with the same data. It replays the journaled results in the order they were produced,
+        rebuilding the results, the state of the automl algorithm and its tuners without evaluating any pipeline again,
+        then continues the search, appending new results to the journal.
+
+        Arguments:
+            journal (str): location of the journal file.
+
+        Returns:
+            None
+        """
+        if self.has_searched:
+            raise ValueError("resume must be called before search")
+        self._journal_header, self._journal_records = ResultsJournal(journal).read()
+        self._journaled_positions = set(self._journal_records)
+        self.journal = journal
+        logger.info(f"Resuming search from {len(self._journal_records)} journaled pipelines")
+
     @staticmethod
     def load(file_path):
         """Loads AutoML object at file path
@@ -0,0 +1,53 @@
+from collections import defaultdict
+
+import numpy as np
+
+
+class RuntimeCostModel:
+    """Predicts how long it takes to train and score a pipeline on one cross-validation fold, from the training times of the pipelines evaluated before it.
+
+    The time per fold is assumed to grow linearly with both the number of rows and the number of features. For each model
+    family, the model keeps the median of the observed times per fold divided by rows times features. Model families
+    which haven't been observed yet can't be predicted.
+    """
+
+    def __init__(self, time_limit_factor=5.0):
+        """Predicts how long it takes to train and score a pipeline on one cross-validation fold.
+
+        Arguments:
+            time_limit_factor (float): how many times longer than predicted a pipeline may run before its remaining folds are
+                cancelled. Must be greater than 1. Defaults to 5.
+        """
+        if time_limit_factor <= 1:
+            raise ValueError(f"time_limit_factor must be greater than 1. Received {time_limit_factor} instead")
+        self.time_limit_factor = time_limit_factor
+        self._rates = defaultdict(list)
+
+    def add(self, model_family, n_rows, n_features, fold_time):
+        """Records how long a pipeline took to train and score on one fold.
+
+        Arguments:
+            model_family (ModelFamily): the model family of the pipeline.
+            n_rows (int): the number of rows in the fold, including the test split.
+            n_features (int): the number of input features.
+            fold_time (float): the time taken per fold, in seconds.
+        """
+        if n_rows <= 0 or np.isnan(fold_time):
+            return
+        self._rates[model_family].append(fold_time / (n_rows * max(n_features, 1)))
+
+    def predict(self, model_family, n_rows, n_features):
+        """Predicts how long a pipeline will take to train and score on one fold.
+
+        Arguments:
+            model_family (ModelFamily): the model family of the pipeline.
+            n_rows (int): the number of rows in the fold, including the test split.
+            n_features (int): the number of input features.
+
+        Returns:
+            float: the predicted time per fold in seconds, or None if no pipeline of the model family has been observed.
+        """
+        rates = self._rates.get(model_family)
+        if not rates:
+            return None
+        return float(np.median(rates)) * n_rows * max(n_features, 1)
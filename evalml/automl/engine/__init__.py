@@ -0,0 +1,4 @@
+from .engine_base import AutoMLConfig, EngineBase, EngineComputation, train_and_score_pipeline
+from .sequential_engine import SequentialEngine
+from .pool_engines import ProcessPoolEngine, ThreadPoolEngine
+from .queue_engine import QueueEngine, queue_worker
@@ -0,0 +1,271 @@
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict, namedtuple
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed, effective_n_jobs
+from sklearn.model_selection import train_test_split
+
+from evalml.automl.fold_store import _check_class_coverage
+from evalml.exceptions import PipelineScoreError
+from evalml.pipelines import BinaryClassificationPipeline, ComponentTelemetry
+from evalml.problem_types import ProblemTypes
+from evalml.utils import get_random_seed, get_random_state
+from evalml.utils.logger import get_logger
+
+logger = get_logger(__file__)
+
+AutoMLConfig = namedtuple('AutoMLConfig', ['data_split', 'problem_type', 'objective', 'additional_objectives',
+                                           'optimize_thresholds', 'n_jobs', 'transformer_cache', 'pruning_policy',
+                                           'pruning_reference', 'time_limit', 'fold_store', 'track_memory'])
+AutoMLConfig.__doc__ = """The subset of AutoMLSearch settings needed to train and score a pipeline, small enough to be sent to a worker.
+
+Arguments:
+    data_split (sklearn.model_selection.BaseCrossValidator): data splitting method to use.
+    problem_type (ProblemTypes): the problem type of the search.
+    objective (ObjectiveBase): the primary objective of the search.
+    additional_objectives (list(ObjectiveBase)): the additional objectives to score on.
+    optimize_thresholds (bool): whether to optimize the binary classification threshold on each fold.
+    n_jobs (int or None): the number of threads used to train and score the cross-validation folds of a pipeline. The n_jobs of each
+        component is capped so that the folds trained at once share the CPUs.
+    transformer_cache (TransformerCache): cache used to reuse fitted transformers between pipelines, or None to disable caching.
+    pruning_policy (PruningPolicyBase): policy used to stop cross-validation early, or None to always evaluate every fold.
+    pruning_reference (list(list(float))): the fold scores, converted so that lower is better, of the pipelines the pruning policy compares against.
+    time_limit (float): the number of seconds after which the remaining folds of a pipeline are skipped, or None for no limit.
+    fold_store (FoldStore): the precomputed folds of the data, or None to split the data for every pipeline.
+    track_memory (bool): whether to record the memory used by each component in the telemetry of each fold.
+"""
+
+
+class EngineComputation(ABC):
+    """Wrapper around the result of an evaluation job submitted to an engine."""
+
+    @abstractmethod
+    def get_result(self):
+        """Waits for the job to finish and returns its result. Raises the exception raised by the job, if any."""
+
+    @abstractmethod
+    def done(self):
+        """Returns True if the job has finished, False otherwise."""
+
+    @abstractmethod
+    def cancel(self):
+        """Attempts to cancel the job. Returns True if the job was cancelled before it started, False otherwise."""
+
+
+class EngineBase(ABC):
+    """Base class for the engines which evaluate pipelines during AutoMLSearch."""
+    # attributes holding workers or connections, which are dropped when the engine is pickled
+    _unpicklable_attributes = []
+
+    @abstractmethod
+    def submit(self, fn, *args, **kwargs):
+        """Schedules fn(*args, **kwargs) to be run by the engine.
+
+        Arguments:
+            fn (callable): the function to run.
+            args: positional arguments passed to fn.
+            kwargs: keyword arguments passed to fn.
+
+        Returns:
+            EngineComputation: computation which gives access to the result of the job.
+        """
+
+    def submit_evaluation_job(self, automl_config, pipeline, X, y, random_seed=None):
+        """Schedules training and scoring of a pipeline on all cross-validation folds.
+
+        Arguments:
+            automl_config (AutoMLConfig): the search settings needed to evaluate the pipeline.
+            pipeline (PipelineBase): the pipeline to evaluate.
+            X (pd.DataFrame): the input training data of shape [n_samples, n_features]
+            y (pd.Series): the target training data of length [n_samples]
+            random_seed (int): seed used for any randomness in the evaluation, such as splitting off the threshold tuning data.
+
+        Returns:
+            EngineComputation: computation whose result is the dictionary returned by train_and_score_pipeline.
+        """
+        return self.submit(train_and_score_pipeline, pipeline, automl_config, X, y, random_seed=random_seed)
+
+    def close(self):
+        """Releases any workers held by the engine. The engine can still be used afterwards, in which case new workers are started."""
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        for attribute in self._unpicklable_attributes:
+            state[attribute] = None
+        return state
+
+
+def train_and_score_pipeline(pipeline, automl_config, X, y, random_seed=None):
+    """Trains and scores a pipeline on every cross-validation fold of the data.
+
+    Arguments:
+        pipeline (PipelineBase): the pipeline to evaluate.
+        automl_config (AutoMLConfig): the search settings needed to evaluate the pipeline.
+        X (pd.DataFrame): the input training data of shape [n_samples, n_features]
+        y (pd.Series): the target training data of length [n_samples]
+        random_seed (int): seed used to split off the threshold tuning data of each fold. Only used when optimizing thresholds.
+
+    If a pruning policy or a time limit is set, the folds are evaluated one at a time, and the remaining folds are skipped
+    as soon as the policy decides the pipeline can't compete with the reference pipelines, or the time limit is exceeded.
+    A fold which has started is always finished.
+
+    Returns:
+        dict: containing the per-fold results in `cv_data`, the per-fold primary objective scores in `cv_scores`,
+            their mean in `cv_score_mean`, the total `training_time` and whether the remaining folds were skipped in `pruned`.
+    """
+    start = time.time()
+    logger.info("\tStarting cross validation")
+    if automl_config.fold_store is not None:
+        folds = automl_config.fold_store.folds
+    else:
+        folds = list(automl_config.data_split.split(X, y))
+    # Draw the threshold tuning seeds up front so that each fold is seeded the same way
+    # regardless of the order in which the folds are run.
+    random_state = get_random_state(random_seed)
+    threshold_tuning_seeds = [get_random_seed(random_state) for _ in folds]
+    pruned = False
+    pruning_policy = automl_config.pruning_policy
+    time_limit = automl_config.time_limit
+    if pruning_policy is None and time_limit is None:
+        n_jobs = automl_config.n_jobs if len(folds) > 1 else 1
+        fold_pipeline = _cap_n_jobs(pipeline, min(effective_n_jobs(n_jobs), len(folds)))
+        cv_data = Parallel(n_jobs=n_jobs, prefer="threads")(
+            delayed(_train_and_score_fold)(fold_pipeline, automl_config, X, y, i, train, test, threshold_tuning_seeds[i])
+            for i, (train, test) in enumerate(folds))
+    else:
+        cv_data = []
+        sign = -1 if automl_config.objective.greater_is_better else 1
+        for i, (train, test) in enumerate(folds):
+            cv_data.append(_train_and_score_fold(pipeline, automl_config, X, y, i, train, test, threshold_tuning_seeds[i]))
+            fold_scores = [sign * fold['score'] for fold in cv_data]
+            if i == len(folds) - 1:
+                break
+            if time_limit is not None and time.time() - start > time_limit:
+                logger.info(f"\tCancelled cross validation after {i + 1} of {len(folds)} folds: exceeded the time limit of {time_limit:.1f} seconds")
+                pruned = True
+                break
+            if pruning_policy is not None and pruning_policy.should_prune(fold_scores, automl_config.pruning_reference):
+                logger.info(f"\tPruned cross validation after {i + 1} of {len(folds)} folds")
+                pruned = True
+                break
+    training_time = time.time() - start
+    cv_scores = pd.Series([fold['score'] for fold in cv_data])
+    cv_score_mean = cv_scores.mean()
+    logger.info(f"\tFinished cross validation - mean {automl_config.objective.name}: {cv_score_mean:.3f}")
+    return {'cv_data': cv_data, 'training_time': training_time, 'cv_scores': cv_scores, 'cv_score_mean': cv_score_mean,
+            'pruned': pruned}
+
+
+def _cap_n_jobs(pipeline, n_fold_threads):
+    """Returns the pipeline to train on each fold when n_fold_threads folds are trained at once.
+
+    Components which use more than their share of the CPUs, such as estimators with n_jobs=-1, would start a pool of
+    workers on every CPU from each fold thread, so their n_jobs is capped at the number of CPUs divided by the number of
+    fold threads.
+    """
+    if n_fold_threads <= 1:
+        return pipeline
+    max_n_jobs = max(1, effective_n_jobs(-1) // n_fold_threads)
+    parameters = {}
+    capped = False
+    for name, component_parameters in pipeline.parameters.items():
+        component_parameters = dict(component_parameters)
+        if component_parameters.get('n_jobs') is not None and effective_n_jobs(component_parameters['n_jobs']) > max_n_jobs:
+            component_parameters['n_jobs'] = max_n_jobs
+            capped = True
+        parameters[name] = component_parameters
+    if not capped:
+        return pipeline
+    return pipeline.__class__(parameters, random_state=pipeline.random_state)
+
+
+def _train_and_score_fold(pipeline, automl_config, X, y, i, train, test, threshold_tuning_seed=None):
+    """Trains a clone of the pipeline on a single cross-validation fold and scores it on the fold's test split.
+
+    Arguments:
+        pipeline (PipelineBase): the pipeline to evaluate.
+        automl_config (AutoMLConfig): the search settings needed to evaluate the pipeline.
+        X (pd.DataFrame): the input training data of shape [n_samples, n_features]
+        y (pd.Series): the target training data of length [n_samples]
+        i (int): the index of the fold, used for logging.
+        train (list): indices of the rows in the training split.
+        test (list): indices of the rows in the test split.
+        threshold_tuning_seed (int): seed used to split off the threshold tuning data. Only used when optimizing thresholds.
+
+    Returns:
+        dict: the evaluation entry for the fold, containing all objective scores, the primary objective score, the binary classification threshold
+            and the component telemetry records of the fold.
+    """
+    objective = automl_config.objective
+    additional_objectives = automl_config.additional_objectives
+    logger.debug(f"\t\tTraining and scoring on fold {i}")
+    if automl_config.fold_store is not None:
+        # the fold store checked the class coverage of every fold when it was created
+        X_train, X_test, y_train, y_test = automl_config.fold_store.get_fold(i, X, y)
+    else:
+        X_train, X_test = X.iloc[train], X.iloc[test]
+        y_train, y_test = y.iloc[train], y.iloc[test]
+        if automl_config.problem_type in [ProblemTypes.BINARY, ProblemTypes.MULTICLASS]:
+            _check_class_coverage(y, y_train, y_test)
+    objectives_to_score = [objective] + additional_objectives
+    cv_pipeline = None
+    telemetry = ComponentTelemetry(track_memory=automl_config.track_memory)
+    try:
+        X_threshold_tuning = None
+        y_threshold_tuning = None
+        if automl_config.optimize_thresholds and objective.problem_type == ProblemTypes.BINARY and objective.can_optimize_threshold:
+            X_train, X_threshold_tuning, y_train, y_threshold_tuning = train_test_split(X_train, y_train, test_size=0.2, random_state=threshold_tuning_seed)
+        cv_pipeline = pipeline.clone()
+        cv_pipeline.transformer_cache = automl_config.transformer_cache
+        cv_pipeline.telemetry = telemetry
+        logger.debug(f"\t\t\tFold {i}: starting training")
+        cv_pipeline.fit(X_train, y_train)
+        logger.debug(f"\t\t\tFold {i}: finished training")
+        if objective.problem_type == ProblemTypes.BINARY:
+            cv_pipeline.threshold = 0.5
+            if automl_config.optimize_thresholds and objective.can_optimize_threshold:
+                logger.debug(f"\t\t\tFold {i}: Optimizing threshold for {objective.name}")
+                y_predict_proba = cv_pipeline.predict_proba(X_threshold_tuning)
+                if isinstance(y_predict_proba, pd.DataFrame):
+                    y_predict_proba = y_predict_proba.iloc[:, 1]
+                else:
+                    y_predict_proba = y_predict_proba[:, 1]
+                cv_pipeline.threshold = objective.optimize_threshold(y_predict_proba, y_threshold_tuning, X=X_threshold_tuning)
+                logger.debug(f"\t\t\tFold {i}: Optimal threshold found ({cv_pipeline.threshold:.3f})")
+        logger.debug(f"\t\t\tFold {i}: Scoring trained pipeline")
+        scores = cv_pipeline.score(X_test, y_test, objectives=objectives_to_score)
+        logger.debug(f"\t\t\tFold {i}: {objective.name} score: {scores[objective.name]:.3f}")
+        score = scores[objective.name]
+    except Exception as e:
+        if isinstance(e, PipelineScoreError):
+            logger.info(f"\t\t\tFold {i}: Encountered an error scoring the following objectives: {', '.join(e.exceptions)}.")
+            logger.info(f"\t\t\tFold {i}: The scores for these objectives will be replaced with nan.")
+            logger.info(f"\t\t\tFold {i}: Please check {logger.handlers[1].baseFilename} for the current hyperparameters and stack trace.")
+            logger.debug(f"\t\t\tFold {i}: Hyperparameters:\n\t{pipeline.hyperparameters}")
+            logger.debug(f"\t\t\tFold {i}: Exception during automl search: {str(e)}")
+            nan_scores = {objective: np.nan for objective in e.exceptions}
+            scores = {**nan_scores, **e.scored_successfully}
+            scores = OrderedDict({o.name: scores[o.name] for o in [objective] + additional_objectives})
+            score = scores[objective.name]
+        else:
+            logger.info(f"\t\t\tFold {i}: Encountered an error.")
+            logger.info(f"\t\t\tFold {i}: All scores will be replaced with nan.")
+            logger.info(f"\t\t\tFold {i}: Please check {logger.handlers[1].baseFilename} for the current hyperparameters and stack trace.")
+            logger.debug(f"\t\t\tFold {i}: Hyperparameters:\n\t{pipeline.hyperparameters}")
+            logger.debug(f"\t\t\tFold {i}: Exception during automl search: {str(e)}")
+            score = np.nan
+            scores = OrderedDict(zip([n.name for n in additional_objectives], [np.nan] * len(additional_objectives)))
+
+    ordered_scores = OrderedDict()
+    ordered_scores.update({objective.name: score})
+    ordered_scores.update(scores)
+    ordered_scores.update({"# Training": len(y_train)})
+    ordered_scores.update({"# Testing": len(y_test)})
+
+    evaluation_entry = {"all_objective_scores": ordered_scores, "score": score, 'binary_classification_threshold': None,
+                        'component_telemetry': telemetry.to_records()}
+    if isinstance(cv_pipeline, BinaryClassificationPipeline) and cv_pipeline.threshold is not None:
+        evaluation_entry['binary_classification_threshold'] = cv_pipeline.threshold
+    return evaluation_entry
@@ -0,0 +1,94 @@
+from abc import abstractmethod
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import cloudpickle
+from joblib import effective_n_jobs
+
+from .engine_base import EngineBase, EngineComputation
+
+
+class FutureComputation(EngineComputation):
+    """Wraps a concurrent.futures.Future."""
+
+    def __init__(self, future):
+        self._future = future
+
+    def get_result(self):
+        """Waits for the job to finish and returns its result."""
+        return self._future.result()
+
+    def done(self):
+        """Returns True if the job has finished or was cancelled, False otherwise."""
+        return self._future.done()
+
+    def cancel(self):
+        """Attempts to cancel the job. Jobs which are already running can't be cancelled."""
+        return self._future.cancel()
+
+
+def _run_pickled_job(pickled_job):
+    """Unpickles and runs a job serialized with cloudpickle, so that jobs referring to classes defined at runtime can be sent to other processes."""
+    fn, args, kwargs = cloudpickle.loads(pickled_job)
+    return fn(*args, **kwargs)
+
+
+class PoolEngine(EngineBase):
+    """Base class for engines which evaluate pipelines concurrently using a concurrent.futures executor."""
+    _unpicklable_attributes = ['_executor']
+
+    def __init__(self, n_workers=-1):
+        """Base class for engines which evaluate pipelines concurrently using a concurrent.futures executor.
+
+        Arguments:
+            n_workers (int): the number of workers. If set to -1, one worker per CPU is used. For n_workers below -1, (n_cpus + 1 + n_workers) are used.
+        """
+        self.n_workers = effective_n_jobs(n_workers)
+        self._executor = None
+
+    @abstractmethod
+    def _make_executor(self):
+        """Returns a new concurrent.futures executor with n_workers workers."""
+
+    def _submit_to_executor(self, fn, *args, **kwargs):
+        return self._executor.submit(fn, *args, **kwargs)
+
+    def submit(self, fn, *args, **kwargs):
+        """Schedules fn(*args, **kwargs) to be run by one of the workers.
+
+        Arguments:
+            fn (callable): the function to run.
+            args: positional arguments passed to fn.
+            kwargs: keyword arguments passed to fn.
+
+        Returns:
+            FutureComputation: computation which gives access to the result of the job.
+        """
+        if self._executor is None:
+            self._executor = self._make_executor()
+        return FutureComputation(self._submit_to_executor(fn, *args, **kwargs))
+
+    def close(self):
+        """Waits for running jobs to finish and shuts the workers down."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+class ThreadPoolEngine(PoolEngine):
+    """Evaluates pipelines concurrently in a pool of threads within the calling process."""
+
+    def _make_executor(self):
+        return ThreadPoolExecutor(max_workers=self.n_workers)
+
+
+class ProcessPoolEngine(PoolEngine):
+    """Evaluates pipelines concurrently in a pool of worker processes.
+
+    Jobs are serialized with cloudpickle, so the pipeline and data are copied to a worker for every job.
+    """
+
+    def _make_executor(self):
+        return ProcessPoolExecutor(max_workers=self.n_workers)
+
+    def _submit_to_executor(self, fn, *args, **kwargs):
+        return self._executor.submit(_run_pickled_job, cloudpickle.dumps((fn, args, kwargs)))
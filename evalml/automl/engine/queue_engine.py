@@ -0,0 +1,272 @@
+import itertools
+import multiprocessing
+import queue
+import time
+from collections import OrderedDict
+
+import cloudpickle
+
+from .engine_base import EngineBase, EngineComputation
+from .pool_engines import _run_pickled_job
+
+from evalml.exceptions import EngineJobError
+
+
+def queue_worker(task_queue, result_queue, current_job=None):
+    """Runs jobs taken from a task queue until a None task is received, putting their results on a result queue.
+
+    This is the loop run by the local workers of a QueueEngine. Workers on other machines can run the same loop
+    against a transport shared with the engine, such as a socket-backed queue.
+
+    Arguments:
+        task_queue: queue to get (job_id, pickled job) tasks from.
+        result_queue: queue to put pickled (job_id, succeeded, result or exception) messages on.
+        current_job (multiprocessing.Value): shared integer set to the id of the job being run, and to -1 between jobs,
+            so that the engine knows which job a worker was running if it exits. Defaults to None.
+    """
+    while True:
+        task = task_queue.get()
+        if task is None:
+            break
+        job_id, pickled_job = task
+        if current_job is not None:
+            current_job.value = job_id
+        try:
+            message = (job_id, True, _run_pickled_job(pickled_job))
+        except Exception as e:
+            message = (job_id, False, e)
+        try:
+            pickled_message = cloudpickle.dumps(message)
+        except Exception as e:
+            pickled_message = cloudpickle.dumps((job_id, False, RuntimeError(f"Unable to send the result of job {job_id}: {str(e)}")))
+        result_queue.put(pickled_message)
+        if current_job is not None:
+            current_job.value = -1
+
+
+class QueueComputation(EngineComputation):
+    """A job sent to the workers of a QueueEngine."""
+
+    def __init__(self, engine, job_id):
+        self._engine = engine
+        self.job_id = job_id
+        self._received = False
+        self._result = None
+        self._cancelled = False
+
+    def get_result(self):
+        """Waits for a worker to send back the result of the job and returns it."""
+        if self._cancelled:
+            raise RuntimeError("Cannot get the result of a cancelled computation.")
+        if not self._received:
+            self._result = self._engine._get_result(self.job_id)
+            self._received = True
+        return self._result
+
+    def done(self):
+        """Returns True if a worker has sent back the result of the job or it was cancelled, False otherwise."""
+        return self._received or self._cancelled or self._engine._is_done(self.job_id)
+
+    def cancel(self):
+        """Cancels the job if it is still waiting for a local worker to be free. Jobs which were put on the task queue can't be taken back."""
+        if not self._cancelled:
+            self._cancelled = self._engine._cancel(self.job_id)
+        return self._cancelled
+
+
+class QueueEngine(EngineBase):
+    """Evaluates pipelines using workers which take jobs from a task queue and put their results on a result queue."""
+    _unpicklable_attributes = ['_task_queue', '_result_queue', '_workers', '_backlog']
+    # seconds between checks that the local workers are still alive while waiting for a result
+    _POLL_INTERVAL = 1
+
+    def __init__(self, n_workers=2, task_queue=None, result_queue=None, timeout=None):
+        """Evaluates pipelines using workers which take jobs from a task queue and put their results on a result queue.
+
+        If a local worker exits while running a job, for example because it ran out of memory, the job is reported as
+        failed by raising EngineJobError from get_result, and the worker is replaced. Jobs which are neither on the task
+        queue nor run by a local worker, because a worker exited right after taking them from the queue, are reported as
+        failed too. Workers on other machines can't be monitored, so their jobs are only reported as failed after the timeout.
+
+        With local workers, no more jobs than there are workers are put on the task queue at once. The other jobs wait in
+        the engine, so that they can still be cancelled, for example when the max_time of a search elapses. Jobs sent to
+        workers on other machines are put on the task queue straight away, so they can't be cancelled.
+
+        Arguments:
+            n_workers (int): the number of local worker processes to start. Ignored if task_queue and result_queue are provided.
+            task_queue: queue which jobs are put on. Must implement put(item). If provided along with result_queue, no
+                local workers are started, and workers are expected to run `queue_worker(task_queue, result_queue)`
+                against the other end of the queues. Defaults to a multiprocessing queue.
+            result_queue: queue which results are read from. Must implement get(block=True, timeout=None), raising
+                queue.Empty when called with block=False or a timeout and no result is available. Defaults to a multiprocessing queue.
+            timeout (float): the number of seconds to wait for the result of a job before reporting it as failed with EngineJobError. Local
+                workers running a job which times out are replaced. Defaults to None, to wait as long as the job takes.
+        """
+        if (task_queue is None) != (result_queue is None):
+            raise ValueError("task_queue and result_queue must either both be provided or both be None.")
+        if timeout is not None and timeout <= 0:
+            raise ValueError(f"timeout must be positive. Received {timeout} instead")
+        self.n_workers = n_workers
+        self.timeout = timeout
+        self._task_queue = task_queue
+        self._result_queue = result_queue
+        self._workers = []
+        self._job_ids = itertools.count()
+        self._results = {}
+        # jobs waiting for a local worker to be free before they're put on the task queue, in the order they were submitted
+        self._backlog = OrderedDict()
+        # jobs which were put on the task queue and whose result hasn't arrived or been reported as failed
+        self._pending = set()
+        # pending jobs which were neither on the task queue nor run by a local worker the last time the workers were checked
+        self._unlocated = set()
+        # jobs which were reported as failed before their result arrived, whose results are dropped
+        self._abandoned = set()
+
+    def _start_workers(self):
+        context = multiprocessing.get_context()
+        self._task_queue = context.Queue()
+        self._result_queue = context.Queue()
+        # jobs put on the queues of previous workers will never be run
+        self._backlog = OrderedDict()
+        self._pending = set()
+        self._unlocated = set()
+        self._workers = [self._start_worker() for _ in range(self.n_workers)]
+
+    def _start_worker(self):
+        """Starts a local worker, returning the process and the shared id of the job it's running."""
+        context = multiprocessing.get_context()
+        current_job = context.Value('q', -1, lock=False)
+        process = context.Process(target=queue_worker, args=(self._task_queue, self._result_queue, current_job), daemon=True)
+        process.start()
+        return process, current_job
+
+    def submit(self, fn, *args, **kwargs):
+        """Puts fn(*args, **kwargs) on the task queue, after the jobs submitted before it if all local workers are busy.
+
+        Arguments:
+            fn (callable): the function to run.
+            args: positional arguments passed to fn.
+            kwargs: keyword arguments passed to fn.
+
+        Returns:
+            QueueComputation: computation which gives access to the result of the job.
+        """
+        if self._task_queue is None:
+            self._start_workers()
+        job_id = next(self._job_ids)
+        self._backlog[job_id] = cloudpickle.dumps((fn, args, kwargs))
+        self._dispatch()
+        return QueueComputation(self, job_id)
+
+    def _dispatch(self):
+        """Puts jobs from the backlog on the task queue, keeping at most one pending job per local worker."""
+        while self._backlog and (not self._workers or len(self._pending) < len(self._workers)):
+            job_id, pickled_job = self._backlog.popitem(last=False)
+            self._task_queue.put((job_id, pickled_job))
+            self._pending.add(job_id)
+
+    def _cancel(self, job_id):
+        """Removes the job from the backlog. Returns False if it was already put on the task queue."""
+        if job_id not in self._backlog:
+            return False
+        del self._backlog[job_id]
+        return True
+
+    def _receive(self, block, timeout=None):
+        """Reads one message from the result queue, if any, and stores it. Returns False if no message was available."""
+        try:
+            if timeout is None:
+                pickled_message = self._result_queue.get(block=block)
+            else:
+                pickled_message = self._result_queue.get(block=block, timeout=timeout)
+        except queue.Empty:
+            return False
+        job_id, succeeded, result = cloudpickle.loads(pickled_message)
+        if job_id in self._abandoned:
+            self._abandoned.remove(job_id)
+        else:
+            self._results[job_id] = (succeeded, result)
+            self._pending.discard(job_id)
+            self._dispatch()
+        return True
+
+    def _is_done(self, job_id):
+        while job_id not in self._results and self._receive(block=False):
+            pass
+        return job_id in self._results
+
+    def _get_result(self, job_id):
+        start = time.time()
+        while job_id not in self._results:
+            wait = self._POLL_INTERVAL if self._workers else None
+            if self.timeout is not None:
+                remaining = self.timeout - (time.time() - start)
+                if remaining <= 0:
+                    self._fail(job_id, EngineJobError(f"Job {job_id} didn't finish within the timeout of {self.timeout} seconds"))
+                    break
+                wait = remaining if wait is None else min(wait, remaining)
+            if not self._receive(block=True, timeout=wait) and self._workers:
+                self._check_workers()
+                self._check_lost_jobs()
+        succeeded, result = self._results.pop(job_id)
+        if not succeeded:
+            raise result
+        return result
+
+    def _fail(self, job_id, exception):
+        """Reports a job as failed, replacing the local worker running it, if any, and dropping its result if it arrives later."""
+        for i, (process, current_job) in enumerate(self._workers):
+            if current_job.value == job_id:
+                process.terminate()
+                process.join()
+                self._workers[i] = self._start_worker()
+        self._report_failure(job_id, exception)
+
+    def _report_failure(self, job_id, exception):
+        """Stores the exception as the result of the job, dropping the job's result if it arrives later."""
+        self._results[job_id] = (False, exception)
+        self._pending.discard(job_id)
+        self._abandoned.add(job_id)
+        self._dispatch()
+
+    def _check_workers(self):
+        """Reports the jobs of local workers which have exited as failed, and replaces those workers."""
+        exited = [(i, process, current_job) for i, (process, current_job) in enumerate(self._workers) if not process.is_alive()]
+        if not exited:
+            return
+        # read any results the workers sent before they exited
+        while self._receive(block=False):
+            pass
+        for i, process, current_job in exited:
+            job_id = current_job.value
+            if job_id >= 0 and job_id not in self._results:
+                self._report_failure(job_id, EngineJobError(f"The worker running job {job_id} exited unexpectedly with exit code {process.exitcode}"))
+            self._workers[i] = self._start_worker()
+
+    def _check_lost_jobs(self):
+        """Reports pending jobs which are neither on the task queue nor run by a local worker as failed.
+
+        A worker which exits after taking a job from the task queue, but before recording which job it's running, loses
+        the job. Jobs in transit between the queues and the workers can't be located for a moment either, so a job is only
+        reported as lost when it couldn't be located on two consecutive checks.
+        """
+        if not self._task_queue.empty():
+            self._unlocated = set()
+            return
+        running = {current_job.value for _, current_job in self._workers}
+        unlocated = {job_id for job_id in self._pending if job_id not in running}
+        for job_id in unlocated & self._unlocated:
+            self._report_failure(job_id, EngineJobError(f"Job {job_id} was lost: it was taken from the task queue but no worker is running it"))
+        self._unlocated = unlocated - self._unlocated
+
+    def close(self):
+        """Stops the local workers, if any were started. Queues which were passed in are left open."""
+        if not self._workers:
+            return
+        for _ in self._workers:
+            self._task_queue.put(None)
+        for process, _ in self._workers:
+            process.join()
+        self._workers = []
+        self._task_queue = None
+        self._result_queue = None
@@ -0,0 +1,49 @@
+from .engine_base import EngineBase, EngineComputation
+
+
+class SequentialComputation(EngineComputation):
+    """A job which is run in the calling process the first time its result is requested."""
+
+    def __init__(self, fn, *args, **kwargs):
+        self._fn = fn
+        self._args = args
+        self._kwargs = kwargs
+        self._result = None
+        self._done = False
+        self._cancelled = False
+
+    def get_result(self):
+        """Runs the job if it has not been run yet and returns its result."""
+        if self._cancelled:
+            raise RuntimeError("Cannot get the result of a cancelled computation.")
+        if not self._done:
+            self._result = self._fn(*self._args, **self._kwargs)
+            self._done = True
+        return self._result
+
+    def done(self):
+        """Returns True if the job has been run, False otherwise."""
+        return self._done
+
+    def cancel(self):
+        """Cancels the job if it has not been run yet."""
+        if not self._done:
+            self._cancelled = True
+        return self._cancelled
+
+
+class SequentialEngine(EngineBase):
+    """The default engine for AutoMLSearch. Evaluates pipelines one at a time in the calling process."""
+
+    def submit(self, fn, *args, **kwargs):
+        """Schedules fn(*args, **kwargs) to be run when its result is requested.
+
+        Arguments:
+            fn (callable): the function to run.
+            args: positional arguments passed to fn.
+            kwargs: keyword arguments passed to fn.
+
+        Returns:
+            SequentialComputation: computation which runs the job when its result is requested.
+        """
+        return SequentialComputation(fn, *args, **kwargs)
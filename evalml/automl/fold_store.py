@@ -0,0 +1,55 @@
+import numpy as np
+
+from evalml.problem_types import ProblemTypes
+
+
+class FoldStore:
+    """Computes the cross-validation folds of the training data once, and hands out the rows of each fold to every pipeline evaluated on them.
+
+    The class coverage of each fold is checked once when the store is created. Only the indices of each fold are kept,
+    and the rows of a fold are sliced out of the training data each time they're requested, so every pipeline gets its
+    own copy of the rows which it can't modify for the pipelines evaluated after it.
+
+    The rows are not cached or handed out as views: pandas can't make a dataframe read-only, so a shared block could be
+    modified by a component and leak into the scores of later pipelines, and caching every fold would keep n_splits
+    copies of the training data alive for the whole search. Only the splitting and class checks are done once.
+    """
+
+    def __init__(self, data_split, X, y, problem_type):
+        """Computes the cross-validation folds of the training data once.
+
+        Arguments:
+            data_split (sklearn.model_selection.BaseCrossValidator): data splitting method to use.
+            X (pd.DataFrame): the input training data of shape [n_samples, n_features]
+            y (pd.Series): the target training data of length [n_samples]
+            problem_type (ProblemTypes): the problem type, used to check that every fold contains every class for classification problems.
+        """
+        self.folds = [(np.asarray(train), np.asarray(test)) for train, test in data_split.split(X, y)]
+        if problem_type in [ProblemTypes.BINARY, ProblemTypes.MULTICLASS]:
+            for train, test in self.folds:
+                _check_class_coverage(y, y.iloc[train], y.iloc[test])
+
+    def get_fold(self, i, X, y):
+        """Returns a copy of the training and test rows of a fold.
+
+        Arguments:
+            i (int): the index of the fold.
+            X (pd.DataFrame): the input training data the store was created with.
+            y (pd.Series): the target training data the store was created with.
+
+        Returns:
+            (pd.DataFrame, pd.DataFrame, pd.Series, pd.Series): the training and test rows of X and y.
+        """
+        train, test = self.folds[i]
+        # indexing with an array of positions always copies the rows, even when they're contiguous
+        return X.iloc[train], X.iloc[test], y.iloc[train], y.iloc[test]
+
+
+def _check_class_coverage(y, y_train, y_test):
+    """Raises an exception if a class of the target is missing from the training or test rows of a fold."""
+    diff_train = set(np.setdiff1d(y, y_train))
+    diff_test = set(np.setdiff1d(y, y_test))
+    diff_string = f"Missing target values in the training set after data split: {diff_train}. " if diff_train else ""
+    diff_string += f"Missing target values in the test set after data split: {diff_test}." if diff_test else ""
+    if diff_string:
+        raise Exception(diff_string)
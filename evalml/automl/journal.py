@@ -0,0 +1,138 @@
+import json
+import os
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from evalml.automl.engine import EngineComputation
+
+
+class ResultsJournal:
+    """An append-only journal of the pipelines evaluated during AutoMLSearch, stored as one JSON record per line.
+
+    The first record describes the search and its data. Every following record is either the evaluation results of a
+    pipeline or a note that a pipeline was skipped, keyed by the position at which the automl algorithm proposed the
+    pipeline. Each record is flushed to disk as soon as it is written, so a search which crashes loses at most the
+    pipeline it was evaluating.
+    """
+
+    def __init__(self, file_path):
+        """An append-only journal of the pipelines evaluated during AutoMLSearch.
+
+        Arguments:
+            file_path (str): location of the journal file.
+        """
+        self.file_path = file_path
+
+    def exists(self):
+        """Returns True if the journal file exists and holds any records, False otherwise."""
+        return os.path.exists(self.file_path) and os.path.getsize(self.file_path) > 0
+
+    def write_header(self, header):
+        """Starts a new journal, overwriting any existing file.
+
+        Arguments:
+            header (dict): description of the search and its data, used to check that a resumed search matches.
+        """
+        with open(self.file_path, 'w') as f:
+            f.write(self._dumps({'header': header}) + '\n')
+
+    def append_result(self, position, pipeline_name, parameters, training_time, cv_data, budget, pruned):
+        """Records the evaluation results of a pipeline.
+
+        Arguments:
+            position (int): the position at which the automl algorithm proposed the pipeline. The baseline pipeline is at position 0.
+            pipeline_name (str): the name of the pipeline.
+            parameters (dict): the parameters of the pipeline.
+            training_time (float): the time taken to evaluate the pipeline, in seconds.
+            cv_data (list(dict)): the evaluation entry for each cross-validation fold.
+            budget (float): the fraction of the training rows the pipeline was evaluated on.
+            pruned (bool): whether the remaining folds of the pipeline were skipped.
+        """
+        self._append({'position': position, 'pipeline_name': pipeline_name, 'parameters': parameters,
+                      'training_time': training_time, 'cv_data': cv_data, 'budget': budget, 'pruned': pruned})
+
+    def append_skip(self, position, pipeline_name, parameters):
+        """Records that a pipeline was skipped without being evaluated.
+
+        Arguments:
+            position (int): the position at which the automl algorithm proposed the pipeline.
+            pipeline_name (str): the name of the pipeline.
+            parameters (dict): the parameters of the pipeline.
+        """
+        self._append({'position': position, 'pipeline_name': pipeline_name, 'parameters': parameters, 'skipped': True})
+
+    def read(self):
+        """Reads the journal.
+
+        A final record which was only partially written, because the search crashed while writing it, is ignored.
+
+        Returns:
+            (dict, dict): the header, and the records keyed by position.
+        """
+        with open(self.file_path) as f:
+            lines = f.read().split('\n')
+        records = []
+        for i, line in enumerate(lines):
+            if not line:
+                continue
+            try:
+                records.append(json.loads(line, object_pairs_hook=OrderedDict))
+            except ValueError:
+                if i < len(lines) - 1:
+                    raise ValueError(f"Line {i + 1} of journal {self.file_path} is corrupted")
+        if not records or 'header' not in records[0]:
+            raise ValueError(f"Journal {self.file_path} is missing its header")
+        return dict(records[0]['header']), {record['position']: record for record in records[1:]}
+
+    @staticmethod
+    def normalize(value):
+        """Returns value as it would be read back from the journal, to compare values which were written to it with values which were not."""
+        return json.loads(ResultsJournal._dumps(value), object_pairs_hook=OrderedDict)
+
+    @staticmethod
+    def _dumps(record):
+        return json.dumps(record, default=_to_json)
+
+    def _append(self, record):
+        with open(self.file_path, 'a') as f:
+            f.write(self._dumps(record) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+
+def _to_json(value):
+    """Converts the numpy values found in parameters and scores to their python equivalents."""
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} can't be written to a journal")
+
+
+class ReplayedComputation(EngineComputation):
+    """The evaluation results of a pipeline read back from a journal, standing in for the results of an evaluation job."""
+
+    def __init__(self, record):
+        """The evaluation results of a pipeline read back from a journal.
+
+        Arguments:
+            record (dict): the journal record of the pipeline's evaluation results.
+        """
+        cv_data = [dict(fold) for fold in record['cv_data']]
+        cv_scores = pd.Series([fold['score'] for fold in cv_data])
+        self._result = {'cv_data': cv_data, 'training_time': record['training_time'], 'cv_scores': cv_scores,
+                        'cv_score_mean': cv_scores.mean(), 'pruned': record['pruned']}
+
+    def get_result(self):
+        """Returns the evaluation results read from the journal."""
+        return self._result
+
+    def done(self):
+        """Returns True, since replayed results are always available."""
+        return True
+
+    def cancel(self):
+        """Replayed results can't be cancelled, so this always returns False."""
+        return False
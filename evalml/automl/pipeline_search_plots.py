@@ -10,6 +10,7 @@ class SearchIterationPlot():
 
         self.data = data
         self.best_score_by_iter_fig = None
+        self.iteration_ids = list()
         self.curr_iteration_scores = list()
         self.best_iteration_scores = list()
 
@@ -33,38 +34,31 @@ class SearchIterationPlot():
         self.update()
 
     def update(self):
-        if len(self.data.results['search_order']) > 0 and len(self.data.results['pipeline_results']) > 0:
-            iter_idx = self.data.results['search_order']
-            pipeline_res = self.data.results['pipeline_results']
-            iter_scores = [pipeline_res[i]['score'] for i in iter_idx]
-
-            iter_score_pairs = zip(iter_idx, iter_scores)
-            iter_score_pairs = sorted(iter_score_pairs, key=lambda value: value[0])
-            sorted_iter_idx, sorted_iter_scores = zip(*iter_score_pairs)
-
-            # Create best score data
-            best_iteration_scores = list()
-            curr_best = None
-            for score in sorted_iter_scores:
-                if curr_best is None:
-                    best_iteration_scores.append(score)
-                    curr_best = score
-                else:
-                    if self.data.objective.greater_is_better and score > curr_best \
-                            or not self.data.objective.greater_is_better and score < curr_best:
-                        best_iteration_scores.append(score)
-                        curr_best = score
-                    else:
-                        best_iteration_scores.append(curr_best)
-
-            # Update entire line plot
-            best_score_trace = self.best_score_by_iter_fig.data[0]
-            best_score_trace.x = sorted_iter_idx
-            best_score_trace.y = best_iteration_scores
-
-            curr_score_trace = self.best_score_by_iter_fig.data[1]
-            curr_score_trace.x = sorted_iter_idx
-            curr_score_trace.y = sorted_iter_scores
+        # only the results added since the last update are read, the scores plotted so far are kept
+        new_scores = sorted(self.data.iteration_scores(len(self.iteration_ids)))
+        if not new_scores:
+            return
+        if self.iteration_ids and new_scores[0][0] < self.iteration_ids[-1]:
+            self.iteration_ids, self.curr_iteration_scores, self.best_iteration_scores = [], [], []
+            new_scores = sorted(self.data.iteration_scores())
+
+        for id, score in new_scores:
+            curr_best = self.best_iteration_scores[-1] if self.best_iteration_scores else None
+            if curr_best is None or self.data.objective.greater_is_better and score > curr_best \
+                    or not self.data.objective.greater_is_better and score < curr_best:
+                curr_best = score
+            self.iteration_ids.append(id)
+            self.curr_iteration_scores.append(score)
+            self.best_iteration_scores.append(curr_best)
+
+        # Update entire line plot
+        best_score_trace = self.best_score_by_iter_fig.data[0]
+        best_score_trace.x = self.iteration_ids
+        best_score_trace.y = self.best_iteration_scores
+
+        curr_score_trace = self.best_score_by_iter_fig.data[1]
+        curr_score_trace.x = self.iteration_ids
+        curr_score_trace.y = self.curr_iteration_scores
 
 
 class PipelineSearchPlots:
@@ -0,0 +1,128 @@
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+
+class PruningPolicyBase(ABC):
+    """Base class for policies which stop the cross-validation of a pipeline early when it can't compete with the pipelines evaluated before it.
+
+    All scores passed to a policy are converted so that lower values indicate better pipelines.
+    """
+
+    def __init__(self, min_folds=1, min_pipelines=1):
+        """Base class for policies which stop the cross-validation of a pipeline early.
+
+        Arguments:
+            min_folds (int): the number of folds to evaluate before a pipeline can be pruned. Must be positive.
+            min_pipelines (int): the number of fully evaluated pipelines needed before any pipeline can be pruned. Must be positive.
+        """
+        if min_folds < 1:
+            raise ValueError(f"min_folds must be positive. Received {min_folds} instead")
+        if min_pipelines < 1:
+            raise ValueError(f"min_pipelines must be positive. Received {min_pipelines} instead")
+        self.min_folds = min_folds
+        self.min_pipelines = min_pipelines
+
+    def should_prune(self, fold_scores, reference_fold_scores):
+        """Decides whether to stop evaluating a pipeline after some of its folds have been scored.
+
+        Arguments:
+            fold_scores (list(float)): the scores of the pipeline on the folds evaluated so far.
+            reference_fold_scores (list(list(float))): the scores on every fold of each pipeline which was fully evaluated before.
+
+        Returns:
+            bool: True if the remaining folds should be skipped, False otherwise.
+        """
+        n_folds = len(fold_scores)
+        reference_fold_scores = [np.array(scores, dtype=float) for scores in reference_fold_scores if len(scores) > n_folds]
+        reference_fold_scores = [scores for scores in reference_fold_scores if not np.isnan(scores).any()]
+        if n_folds < self.min_folds or len(reference_fold_scores) < self.min_pipelines:
+            return False
+        partial_score = np.mean(fold_scores)
+        if np.isnan(partial_score):
+            return True
+        return self._should_prune(partial_score, n_folds, reference_fold_scores)
+
+    @abstractmethod
+    def _should_prune(self, partial_score, n_folds, reference_fold_scores):
+        """Decides whether to prune a pipeline given its mean score over its first n_folds folds.
+
+        Arguments:
+            partial_score (float): the mean score of the pipeline on the folds evaluated so far.
+            n_folds (int): the number of folds evaluated so far.
+            reference_fold_scores (list(np.ndarray)): the scores on every fold of at least min_pipelines fully evaluated pipelines.
+
+        Returns:
+            bool: True if the remaining folds should be skipped, False otherwise.
+        """
+
+    @staticmethod
+    def penalize(score, reference_fold_scores):
+        """Returns the score reported to the automl algorithm for a pruned pipeline.
+
+        The mean score of a pruned pipeline only covers some folds, so it's replaced by the worst mean score of the
+        reference pipelines if that is worse, ensuring pruned pipelines don't look better than the pipelines they lost to.
+
+        Arguments:
+            score (float): the mean score of the pruned pipeline on the folds it was evaluated on.
+            reference_fold_scores (list(list(float))): the scores on every fold of each pipeline which was fully evaluated before.
+
+        Returns:
+            float: the penalized score.
+        """
+        reference_scores = [np.mean(scores) for scores in reference_fold_scores]
+        reference_scores = [score for score in reference_scores if not np.isnan(score)]
+        if np.isnan(score) or not reference_scores:
+            return score
+        return max(score, max(reference_scores))
+
+
+class MedianPruningPolicy(PruningPolicyBase):
+    """Prunes a pipeline when its mean score over the folds evaluated so far is worse than the median of the mean scores of the reference pipelines over the same folds."""
+
+    def __init__(self, margin=0.0, min_folds=1, min_pipelines=5):
+        """Prunes a pipeline when its mean score over the folds evaluated so far is worse than the median of the mean scores of the reference pipelines over the same folds.
+
+        Arguments:
+            margin (float): how much worse than the median a pipeline can be before it is pruned, relative to the absolute value of the median. Must be non-negative. Defaults to 0.
+            min_folds (int): the number of folds to evaluate before a pipeline can be pruned. Defaults to 1.
+            min_pipelines (int): the number of fully evaluated pipelines needed before any pipeline can be pruned. Defaults to 5.
+        """
+        if margin < 0:
+            raise ValueError(f"margin must be non-negative. Received {margin} instead")
+        super().__init__(min_folds=min_folds, min_pipelines=min_pipelines)
+        self.margin = margin
+
+    def _should_prune(self, partial_score, n_folds, reference_fold_scores):
+        median = np.median([scores[:n_folds].mean() for scores in reference_fold_scores])
+        return partial_score > median + self.margin * abs(median)
+
+
+class VarianceBoundPruningPolicy(PruningPolicyBase):
+    """Prunes a pipeline when even an optimistic bound on its mean score, based on the variance of the best reference pipeline's fold scores, is worse than the best reference pipeline's mean score."""
+
+    def __init__(self, n_std=2.0, margin=0.0, min_folds=1, min_pipelines=1):
+        """Prunes a pipeline when even an optimistic bound on its mean score is worse than the best reference pipeline's mean score.
+
+        After k folds, the bound is the pipeline's mean score minus n_std standard deviations of the best reference
+        pipeline's fold scores, divided by the square root of k.
+
+        Arguments:
+            n_std (float): the number of standard deviations used for the bound. Must be non-negative. Defaults to 2.
+            margin (float): how much worse than the best mean score the bound can be before a pipeline is pruned, relative to the absolute value of the best mean score. Must be non-negative. Defaults to 0.
+            min_folds (int): the number of folds to evaluate before a pipeline can be pruned. Defaults to 1.
+            min_pipelines (int): the number of fully evaluated pipelines needed before any pipeline can be pruned. Defaults to 1.
+        """
+        if n_std < 0:
+            raise ValueError(f"n_std must be non-negative. Received {n_std} instead")
+        if margin < 0:
+            raise ValueError(f"margin must be non-negative. Received {margin} instead")
+        super().__init__(min_folds=min_folds, min_pipelines=min_pipelines)
+        self.n_std = n_std
+        self.margin = margin
+
+    def _should_prune(self, partial_score, n_folds, reference_fold_scores):
+        best_scores = min(reference_fold_scores, key=np.mean)
+        best_score = best_scores.mean()
+        bound = partial_score - self.n_std * best_scores.std(ddof=1) / np.sqrt(n_folds)
+        return bound > best_score + self.margin * abs(best_score)
@@ -0,0 +1,100 @@
+from bisect import bisect_left, insort
+from collections import defaultdict
+
+import pandas as pd
+
+
+class RankingsStore:
+    """Keeps the columns shown in the rankings of AutoMLSearch up to date as results are added.
+
+    The columns of each result are appended to lists, and the results are kept sorted by score in a list of sort keys,
+    so adding a result finds its position with a binary search and inserts its key there, instead of sorting every result
+    again. Inserting shifts the keys after it, so adding a result is O(n), but only moves n small tuples in memory rather
+    than the O(n log n) comparisons of a sort. The best fully evaluated result of each pipeline is kept in a second sorted
+    list, so the best result of the search is always its first entry.
+    The dataframes of full_rankings and rankings are only built when they're read after a result was added, so the search
+    itself never builds them, and the search iteration plot reads new scores from AutoMLSearch.iteration_scores instead.
+    Results with the same score are ranked in the order they were added, and results scored nan are ranked last.
+    """
+    columns = ["id", "pipeline_name", "score", "validation_score", "percent_better_than_baseline", "high_variance_cv", "parameters"]
+
+    def __init__(self, greater_is_better):
+        """Keeps the columns shown in the rankings of AutoMLSearch up to date as results are added.
+
+        Arguments:
+            greater_is_better (bool): whether a greater score indicates a better pipeline.
+        """
+        self._sign = -1 if greater_is_better else 1
+        self._columns = {column: [] for column in self.columns}
+        self._sorted_keys = []
+        self._ranked_keys = []
+        self._best_key_by_name = {}
+        self._parameters_by_name = defaultdict(list)
+        self._full_rankings = None
+        self._rankings = None
+
+    def __len__(self):
+        return len(self._columns["id"])
+
+    def add(self, pipeline_results, fully_evaluated=True):
+        """Adds a result.
+
+        Arguments:
+            pipeline_results (dict): the result, holding at least the ranking columns.
+            fully_evaluated (bool): whether the result was computed on every fold of all of the data. Only fully evaluated results are ranked in rankings.
+        """
+        row = len(self)
+        for column in self.columns:
+            self._columns[column].append(pipeline_results[column])
+        score = pipeline_results["score"]
+        key = (1, 0.0, row) if pd.isna(score) else (0, self._sign * score, row)
+        insort(self._sorted_keys, key)
+
+        pipeline_name = pipeline_results["pipeline_name"]
+        self._parameters_by_name[pipeline_name].append(pipeline_results["parameters"])
+        if fully_evaluated:
+            best_key = self._best_key_by_name.get(pipeline_name)
+            if best_key is None or key < best_key:
+                if best_key is not None:
+                    del self._ranked_keys[bisect_left(self._ranked_keys, best_key)]
+                insort(self._ranked_keys, key)
+                self._best_key_by_name[pipeline_name] = key
+        self._full_rankings = None
+        self._rankings = None
+
+    def contains(self, pipeline_name, parameters):
+        """Returns True if a result was added for the pipeline with the given parameters."""
+        return any(parameters == added for added in self._parameters_by_name.get(pipeline_name, []))
+
+    @property
+    def best_id(self):
+        """The id of the best fully evaluated result, or None if no fully evaluated result was added."""
+        if not self._ranked_keys:
+            return None
+        return self._columns["id"][self._ranked_keys[0][2]]
+
+    @property
+    def full_rankings(self):
+        """A pandas.DataFrame with the ranking columns of every result, sorted from the best score to the worst."""
+        return self._get_full_rankings().copy()
+
+    @property
+    def rankings(self):
+        """A pandas.DataFrame with the ranking columns of the best fully evaluated result of each pipeline, sorted from the best score to the worst.
+
+        Each row keeps its index in full_rankings.
+        """
+        if self._rankings is None:
+            positions = [bisect_left(self._sorted_keys, key) for key in self._ranked_keys]
+            self._rankings = self._get_full_rankings().iloc[positions]
+        return self._rankings.copy()
+
+    def _get_full_rankings(self):
+        if self._full_rankings is None:
+            if len(self) == 0:
+                self._full_rankings = pd.DataFrame(columns=self.columns)
+            else:
+                rows = [key[2] for key in self._sorted_keys]
+                self._full_rankings = pd.DataFrame({column: [self._columns[column][row] for row in rows] for column in self.columns},
+                                                   columns=self.columns)
+        return self._full_rankings
@@ -8,6 +8,7 @@ from .exceptions import (
     ComponentNotYetFittedError,
     PipelineNotYetFittedError,
     AutoMLSearchException,
+    EngineJobError,
     PipelineScoreError,
     DataCheckInitError,
     EnsembleMissingPipelinesError
@@ -38,6 +38,11 @@ class AutoMLSearchException(Exception):
     pass
 
 
+class EngineJobError(RuntimeError):
+    """Exception raised by an engine when a job couldn't be run to completion, for example because the worker running it exited or it didn't finish within the timeout."""
+    pass
+
+
 class EnsembleMissingPipelinesError(Exception):
     """An exception raised when an ensemble is missing `estimators` (list) as a parameter."""
     pass
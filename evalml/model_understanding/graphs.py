@@ -1,4 +1,3 @@
-import copy
 import warnings
 
 import numpy as np
@@ -350,6 +349,9 @@ def binary_objective_vs_threshold(pipeline, X, y, objective, steps=100):
     """Computes objective score as a function of potential binary classification
         decision thresholds for a fitted binary classification pipeline.
 
+    The probabilities are predicted once. Objectives which can be computed from the confusion matrix alone score every
+    threshold at once from the sorted probabilities.
+
     Arguments:
         pipeline (BinaryClassificationPipeline obj): Fitted binary classification pipeline
         X (pd.DataFrame): The input data used to compute objective score
@@ -367,13 +369,22 @@ def binary_objective_vs_threshold(pipeline, X, y, objective, steps=100):
     if objective.score_needs_proba:
         raise ValueError("Objective `score_needs_proba` must be False")
 
-    pipeline_tmp = copy.copy(pipeline)
+    if not isinstance(X, pd.DataFrame):
+        X = pd.DataFrame(X)
+    if not isinstance(y, pd.Series):
+        y = pd.Series(y)
     thresholds = np.linspace(0, 1, steps + 1)
-    costs = []
-    for threshold in thresholds:
-        pipeline_tmp.threshold = threshold
-        scores = pipeline_tmp.score(X, y, [objective])
-        costs.append(scores[objective.name])
+    # the probabilities are predicted once and every threshold is applied to them
+    y = pipeline._encode_targets(y)
+    ypred_proba = pipeline.predict_proba(X).iloc[:, 1]
+    if objective._can_score_from_confusion_matrix():
+        objective.validate_inputs(y.to_numpy(), (ypred_proba > 0.5).to_numpy())
+        costs = objective._score_thresholds(ypred_proba, y, thresholds)
+    else:
+        costs = []
+        for threshold in thresholds:
+            scores = pipeline._score_all_objectives(X, y, ypred_proba > threshold, None, [objective])
+            costs.append(scores[objective.name])
     df = pd.DataFrame({"threshold": thresholds, "score": costs})
     return df
 
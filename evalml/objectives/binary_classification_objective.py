@@ -25,6 +25,10 @@ class BinaryClassificationObjective(ObjectiveBase):
     def optimize_threshold(self, ypred_proba, y_true, X=None):
         """Learn a binary classification threshold which optimizes the current objective.
 
+        Objectives which can be computed from the confusion matrix alone are optimized exactly, by sorting the predicted
+        probabilities once and scoring every threshold which changes the predictions. Other objectives, such as those which
+        need X, are optimized with golden section search.
+
         Arguments:
             ypred_proba (list): The classifier's predicted probabilities
             y_true (list): The ground truth for the predictions.
@@ -36,6 +40,9 @@ class BinaryClassificationObjective(ObjectiveBase):
         if not self.can_optimize_threshold:
             raise RuntimeError("Trying to optimize objective that can't be optimized!")
 
+        if self._can_optimize_threshold_exactly(y_true):
+            return self._optimize_threshold_exactly(ypred_proba, y_true)
+
         def cost(threshold):
             y_predicted = self.decision_function(ypred_proba=ypred_proba, threshold=threshold, X=X)
             cost = self.objective_function(y_true, y_predicted, X=X)
@@ -44,6 +51,106 @@ class BinaryClassificationObjective(ObjectiveBase):
         optimal = minimize_scalar(cost, method='Golden', options={"maxiter": 100})
         return optimal.x
 
+    def _score_from_confusion_matrix(self, true_positives, false_positives, true_negatives, false_negatives):
+        """Computes the objective from the counts of the binary confusion matrix, for many confusion matrices at once.
+
+        Objectives which only depend on the confusion matrix override this, so that their threshold can be optimized exactly.
+
+        Arguments:
+            true_positives (np.ndarray): the number of true positives of each confusion matrix.
+            false_positives (np.ndarray): the number of false positives of each confusion matrix.
+            true_negatives (np.ndarray): the number of true negatives of each confusion matrix.
+            false_negatives (np.ndarray): the number of false negatives of each confusion matrix.
+
+        Returns:
+            np.ndarray: the score of each confusion matrix.
+        """
+        raise NotImplementedError("This objective can't be computed from the confusion matrix alone")
+
+    def _can_score_from_confusion_matrix(self):
+        return self._defines_confusion_matrix_scoring(BinaryClassificationObjective)
+
+    def _score_confusion_matrix(self, confusion_matrix):
+        if confusion_matrix.shape != (2, 2):
+            raise ValueError("Binary classification objectives can only score labels encoded as 0 and 1")
+        (true_negatives, false_positives), (false_negatives, true_positives) = confusion_matrix
+        return float(self._score_from_confusion_matrix(true_positives, false_positives, true_negatives, false_negatives))
+
+    def _can_optimize_threshold_exactly(self, y_true):
+        """Returns True if the objective is computed from the confusion matrix of the predictions made by the default decision function, and the target is encoded as 0 and 1."""
+        decision_function_class = next(cls for cls in type(self).__mro__ if 'decision_function' in cls.__dict__)
+        if decision_function_class is not BinaryClassificationObjective or not self._can_score_from_confusion_matrix():
+            return False
+        return set(pd.unique(np.asarray(y_true).ravel())) <= {0, 1}
+
+    def _score_thresholds(self, ypred_proba, y_true, thresholds):
+        """Scores the predictions ypred_proba > threshold for many thresholds at once, using confusion matrix counts.
+
+        Only valid when _can_score_from_confusion_matrix() is True.
+
+        Arguments:
+            ypred_proba (np.ndarray): The predicted probabilities of the positive class.
+            y_true (np.ndarray): The ground truth, encoded as 0 and 1.
+            thresholds (np.ndarray): The thresholds to score.
+
+        Returns:
+            np.ndarray: the score of the predictions made with each threshold.
+        """
+        ypred_proba = np.asarray(ypred_proba, dtype=float).ravel()
+        y_true = np.asarray(y_true).ravel().astype(bool)
+        thresholds = np.asarray(thresholds, dtype=float)
+        n_positives = y_true.sum()
+        n_negatives = len(y_true) - n_positives
+        # nan probabilities are never above the threshold, so they are always predicted negative
+        not_nan = ~np.isnan(ypred_proba)
+        positive_proba = np.sort(ypred_proba[not_nan & y_true])
+        negative_proba = np.sort(ypred_proba[not_nan & ~y_true])
+        true_positives = len(positive_proba) - np.searchsorted(positive_proba, thresholds, side='right')
+        false_positives = len(negative_proba) - np.searchsorted(negative_proba, thresholds, side='right')
+        return self._score_from_confusion_matrix(true_positives, false_positives,
+                                                 n_negatives - false_positives, n_positives - true_positives)
+
+    def _optimize_threshold_exactly(self, ypred_proba, y_true):
+        """Finds the threshold which optimizes the objective by scoring the predictions of every distinct threshold with cumulative confusion matrix counts.
+
+        Each candidate threshold lies halfway between two consecutive distinct predicted probabilities. When several
+        thresholds give the best score, the one closest to 0.5 is returned.
+        """
+        ypred_proba = np.asarray(ypred_proba, dtype=float).ravel()
+        y_true = np.asarray(y_true).ravel().astype(bool)
+        n_positives = y_true.sum()
+        n_negatives = len(y_true) - n_positives
+        # nan probabilities are never above the threshold, so they are always predicted negative
+        not_nan = ~np.isnan(ypred_proba)
+        order = np.argsort(-ypred_proba[not_nan], kind='mergesort')
+        sorted_proba = ypred_proba[not_nan][order]
+        cumulative_positives = np.concatenate([[0], np.cumsum(y_true[not_nan][order])])
+        # the number of rows predicted positive by each distinct threshold, from the highest threshold to the lowest
+        n_predicted = np.concatenate([[0], np.flatnonzero(np.diff(sorted_proba)) + 1, [len(sorted_proba)]])
+        n_predicted = np.unique(n_predicted)
+        true_positives = cumulative_positives[n_predicted]
+        false_positives = n_predicted - true_positives
+        scores = self._score_from_confusion_matrix(true_positives, false_positives,
+                                                   n_negatives - false_positives, n_positives - true_positives)
+
+        if len(sorted_proba) == 0:
+            thresholds = np.array([0.5])
+        else:
+            upper = np.concatenate([[np.inf], sorted_proba])[n_predicted]
+            lower = np.concatenate([sorted_proba, [-np.inf]])[n_predicted]
+            with np.errstate(invalid='ignore'):
+                thresholds = (upper + lower) / 2
+            # predicting every row positive or negative needs a threshold just outside the predicted probabilities
+            thresholds[n_predicted == 0] = sorted_proba[0]
+            thresholds[n_predicted == len(sorted_proba)] = np.nextafter(sorted_proba[-1], -np.inf)
+            # halfway between two adjacent floats can round up to the higher one
+            thresholds = np.where(thresholds < upper, thresholds, lower)
+        best_score = np.nanmax(scores) if self.greater_is_better else np.nanmin(scores)
+        best = np.flatnonzero(scores == best_score)
+        if len(best) == 0:
+            return 0.5
+        return float(thresholds[best[np.argmin(np.abs(thresholds[best] - 0.5))]])
+
     def decision_function(self, ypred_proba, threshold=0.5, X=None):
         """Apply a learned threshold to predicted probabilities to get predicted classes.
 
@@ -65,3 +172,11 @@ class BinaryClassificationObjective(ObjectiveBase):
             raise ValueError("y_true contains more than two unique values")
         if len(np.unique(y_predicted)) > 2 and not self.score_needs_proba:
             raise ValueError("y_predicted contains more than two unique values")
+
+
+def _divide_or_zero(numerator, denominator):
+    """Divides arrays elementwise, returning 0 where the denominator is 0."""
+    numerator = np.asarray(numerator, dtype=float)
+    denominator = np.asarray(denominator, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(denominator == 0, 0.0, numerator / denominator)
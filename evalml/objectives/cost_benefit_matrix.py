@@ -1,9 +1,10 @@
 
 import numpy as np
 
-from .binary_classification_objective import BinaryClassificationObjective
-
-from evalml.model_understanding.graphs import confusion_matrix
+from .binary_classification_objective import (
+    BinaryClassificationObjective,
+    _divide_or_zero
+)
 
 
 class CostBenefitMatrix(BinaryClassificationObjective):
@@ -43,9 +44,16 @@ class CostBenefitMatrix(BinaryClassificationObjective):
         Returns:
             float: Cost-benefit matrix score
         """
+        # imported here because evalml.model_understanding imports slowly and isn't needed by other objectives
+        from evalml.model_understanding.graphs import confusion_matrix
         conf_matrix = confusion_matrix(y_true, y_predicted, normalize_method='all')
         cost_matrix = np.array([[self.true_negative, self.false_positive],
                                 [self.false_negative, self.true_positive]])
 
         total_cost = np.multiply(conf_matrix.values, cost_matrix).sum()
         return total_cost
+
+    def _score_from_confusion_matrix(self, true_positives, false_positives, true_negatives, false_negatives):
+        total_cost = (self.true_positive * true_positives + self.true_negative * true_negatives +
+                      self.false_positive * false_positives + self.false_negative * false_negatives)
+        return _divide_or_zero(total_cost, true_positives + false_positives + true_negatives + false_negatives)
@@ -2,7 +2,10 @@ import math
 
 import pandas as pd
 
-from .binary_classification_objective import BinaryClassificationObjective
+from .binary_classification_objective import (
+    BinaryClassificationObjective,
+    _divide_or_zero
+)
 
 
 class LeadScoring(BinaryClassificationObjective):
@@ -48,3 +51,7 @@ class LeadScoring(BinaryClassificationObjective):
         profit_per_lead = profit / len(y_true)
 
         return profit_per_lead
+
+    def _score_from_confusion_matrix(self, true_positives, false_positives, true_negatives, false_negatives):
+        profit = self.true_positives * true_positives + self.false_positives * false_positives
+        return _divide_or_zero(profit, true_positives + false_positives + true_negatives + false_negatives)
@@ -10,3 +10,24 @@ class MulticlassClassificationObjective(ObjectiveBase):
     """
 
     problem_type = ProblemTypes.MULTICLASS
+
+    def _score_from_confusion_matrix(self, confusion_matrix):
+        """Computes the objective from the multiclass confusion matrix.
+
+        Objectives which only depend on the confusion matrix override this, so that they can be scored from a confusion matrix shared with other objectives.
+
+        Arguments:
+            confusion_matrix (np.ndarray): the confusion matrix of the labels which are either true or predicted, with a row for each true label and a column for each predicted label.
+
+        Returns:
+            float: the score.
+        """
+        raise NotImplementedError("This objective can't be computed from the confusion matrix alone")
+
+    def _can_score_from_confusion_matrix(self):
+        return self._defines_confusion_matrix_scoring(MulticlassClassificationObjective)
+
+    def _score_confusion_matrix(self, confusion_matrix):
+        # like sklearn, labels which are neither true nor predicted are left out
+        present = (confusion_matrix.sum(axis=0) + confusion_matrix.sum(axis=1)) > 0
+        return float(self._score_from_confusion_matrix(confusion_matrix[present][:, present]))
@@ -3,10 +3,16 @@ from abc import ABC, abstractmethod
 import numpy as np
 import pandas as pd
 
+from evalml.utils.gen_utils import _clear_subclass_caches
+
 
 class ObjectiveBase(ABC):
     """Base class for all objectives."""
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _clear_subclass_caches()
+
     @property
     @classmethod
     @abstractmethod
@@ -61,6 +67,29 @@ class ObjectiveBase(ABC):
         self.validate_inputs(y_true, y_predicted)
         return self.objective_function(y_true, y_predicted, X=X)
 
+    def _can_score_from_confusion_matrix(self):
+        """Returns True if the objective is computed from the confusion matrix of the predictions alone, so that it can be scored from a confusion matrix shared with other objectives."""
+        return False
+
+    def _score_confusion_matrix(self, confusion_matrix):
+        """Computes the objective from the confusion matrix of the predictions.
+
+        Arguments:
+            confusion_matrix (np.ndarray): the confusion matrix returned by _confusion_matrix, with a row for each true label and a column for each predicted label.
+
+        Returns:
+            score
+        """
+        raise NotImplementedError("This objective can't be computed from the confusion matrix alone")
+
+    def _defines_confusion_matrix_scoring(self, base_class):
+        """Returns True if a subclass of base_class implements _score_from_confusion_matrix, no class between it and this objective's class overrides objective_function, and score isn't overridden."""
+        mro = type(self).__mro__
+        scoring_class = next(cls for cls in mro if '_score_from_confusion_matrix' in cls.__dict__)
+        objective_function_class = next(cls for cls in mro if 'objective_function' in cls.__dict__)
+        score_class = next(cls for cls in mro if 'score' in cls.__dict__)
+        return scoring_class is not base_class and issubclass(scoring_class, objective_function_class) and score_class is ObjectiveBase
+
     @staticmethod
     def _standardize_input_type(y_in):
         """Standardize np or pd input to np for scoring
@@ -126,3 +155,44 @@ class ObjectiveBase(ABC):
         difference = (baseline_score - score)
         change = difference / baseline_score
         return 100 * (-1) ** (decrease) * np.abs(change)
+
+
+_MAX_CONFUSION_MATRIX_LABELS = 1000
+
+
+def _confusion_matrix(y_true, y_predicted):
+    """Counts the confusion matrix of predicted labels with np.bincount.
+
+    Arguments:
+        y_true (np.ndarray or pd.Series): the true labels, encoded as integers starting at 0.
+        y_predicted (np.ndarray or pd.Series): the predicted labels, encoded as integers starting at 0 or as booleans.
+
+    Returns:
+        np.ndarray: the confusion matrix, with a row for each true label and a column for each predicted label, and at least two labels.
+            None if the labels aren't encoded as integers starting at 0.
+    """
+    y_true = np.asarray(y_true)
+    y_predicted = np.asarray(y_predicted)
+    if len(y_true) != len(y_predicted) or not (_is_label_encoded(y_true) and _is_label_encoded(y_predicted)):
+        return None
+    y_true = y_true.astype(np.int64)
+    y_predicted = y_predicted.astype(np.int64)
+    n_labels = max(y_true.max(initial=0), y_predicted.max(initial=0), 1) + 1
+    if n_labels > _MAX_CONFUSION_MATRIX_LABELS:
+        return None
+    counts = np.bincount(y_true * n_labels + y_predicted, minlength=n_labels * n_labels)
+    return counts.reshape(n_labels, n_labels)
+
+
+def _is_label_encoded(values):
+    """Returns True if the values are booleans or non-negative integers, even if stored as floats."""
+    if values.ndim != 1:
+        return False
+    if values.dtype.kind == 'b':
+        return True
+    if values.dtype.kind in 'iu':
+        return len(values) == 0 or values.min() >= 0
+    if values.dtype.kind == 'f':
+        with np.errstate(invalid='ignore'):
+            return bool(np.all((values >= 0) & (values == np.floor(values)) & np.isfinite(values)))
+    return False
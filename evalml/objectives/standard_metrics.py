@@ -4,7 +4,10 @@ import numpy as np
 from sklearn import metrics
 from sklearn.preprocessing import label_binarize
 
-from .binary_classification_objective import BinaryClassificationObjective
+from .binary_classification_objective import (
+    BinaryClassificationObjective,
+    _divide_or_zero
+)
 from .multiclass_classification_objective import (
     MulticlassClassificationObjective
 )
@@ -21,6 +24,9 @@ class AccuracyBinary(BinaryClassificationObjective):
     def objective_function(self, y_true, y_predicted, X=None):
         return metrics.accuracy_score(y_true, y_predicted)
 
+    def _score_from_confusion_matrix(self, true_positives, false_positives, true_negatives, false_negatives):
+        return _divide_or_zero(true_positives + true_negatives, true_positives + false_positives + true_negatives + false_negatives)
+
 
 class AccuracyMulticlass(MulticlassClassificationObjective):
     """Accuracy score for multiclass classification."""
@@ -32,6 +38,9 @@ class AccuracyMulticlass(MulticlassClassificationObjective):
     def objective_function(self, y_true, y_predicted, X=None):
         return metrics.accuracy_score(y_true, y_predicted)
 
+    def _score_from_confusion_matrix(self, confusion_matrix):
+        return _divide_or_zero(np.trace(confusion_matrix), confusion_matrix.sum())
+
 
 class BalancedAccuracyBinary(BinaryClassificationObjective):
     """Balanced accuracy score for binary classification."""
@@ -43,6 +52,13 @@ class BalancedAccuracyBinary(BinaryClassificationObjective):
     def objective_function(self, y_true, y_predicted, X=None):
         return metrics.balanced_accuracy_score(y_true, y_predicted)
 
+    def _score_from_confusion_matrix(self, true_positives, false_positives, true_negatives, false_negatives):
+        # classes which are missing from the target are left out of the average
+        n_positives = true_positives + false_negatives
+        n_negatives = true_negatives + false_positives
+        n_classes = (n_positives > 0).astype(int) + (n_negatives > 0).astype(int)
+        return _divide_or_zero(_divide_or_zero(true_positives, n_positives) + _divide_or_zero(true_negatives, n_negatives), n_classes)
+
 
 class BalancedAccuracyMulticlass(MulticlassClassificationObjective):
     """Balanced accuracy score for multiclass classification."""
@@ -54,6 +70,11 @@ class BalancedAccuracyMulticlass(MulticlassClassificationObjective):
     def objective_function(self, y_true, y_predicted, X=None):
         return metrics.balanced_accuracy_score(y_true, y_predicted)
 
+    def _score_from_confusion_matrix(self, confusion_matrix):
+        # classes which are missing from the target are left out of the average
+        n_true = confusion_matrix.sum(axis=1)
+        return np.mean(np.diag(confusion_matrix)[n_true > 0] / n_true[n_true > 0])
+
 
 class F1(BinaryClassificationObjective):
     """F1 score for binary classification."""
@@ -65,6 +86,9 @@ class F1(BinaryClassificationObjective):
     def objective_function(self, y_true, y_predicted, X=None):
         return metrics.f1_score(y_true, y_predicted, zero_division=0.0)
 
+    def _score_from_confusion_matrix(self, true_positives, false_positives, true_negatives, false_negatives):
+        return _divide_or_zero(2 * true_positives, 2 * true_positives + false_positives + false_negatives)
+
 
 class F1Micro(MulticlassClassificationObjective):
     """F1 score for multiclass classification using micro averaging."""
@@ -76,6 +100,9 @@ class F1Micro(MulticlassClassificationObjective):
     def objective_function(self, y_true, y_predicted, X=None):
         return metrics.f1_score(y_true, y_predicted, average='micro', zero_division=0.0)
 
+    def _score_from_confusion_matrix(self, confusion_matrix):
+        return _precision_recall_f1(confusion_matrix, average='micro')[2]
+
 
 class F1Macro(MulticlassClassificationObjective):
     """F1 score for multiclass classification using macro averaging."""
@@ -87,6 +114,9 @@ class F1Macro(MulticlassClassificationObjective):
     def objective_function(self, y_true, y_predicted, X=None):
         return metrics.f1_score(y_true, y_predicted, average='macro', zero_division=0.0)
 
+    def _score_from_confusion_matrix(self, confusion_matrix):
+        return _precision_recall_f1(confusion_matrix, average='macro')[2]
+
 
 class F1Weighted(MulticlassClassificationObjective):
     """F1 score for multiclass classification using weighted averaging."""
@@ -98,6 +128,9 @@ class F1Weighted(MulticlassClassificationObjective):
     def objective_function(self, y_true, y_predicted, X=None):
         return metrics.f1_score(y_true, y_predicted, average='weighted', zero_division=0.0)
 
+    def _score_from_confusion_matrix(self, confusion_matrix):
+        return _precision_recall_f1(confusion_matrix, average='weighted')[2]
+
 
 class Precision(BinaryClassificationObjective):
     """Precision score for binary classification."""
@@ -109,6 +142,9 @@ class Precision(BinaryClassificationObjective):
     def objective_function(self, y_true, y_predicted, X=None):
         return metrics.precision_score(y_true, y_predicted, zero_division=0.0)
 
+    def _score_from_confusion_matrix(self, true_positives, false_positives, true_negatives, false_negatives):
+        return _divide_or_zero(true_positives, true_positives + false_positives)
+
 
 class PrecisionMicro(MulticlassClassificationObjective):
     """Precision score for multiclass classification using micro averaging."""
@@ -120,6 +156,9 @@ class PrecisionMicro(MulticlassClassificationObjective):
     def objective_function(self, y_true, y_predicted, X=None):
         return metrics.precision_score(y_true, y_predicted, average='micro', zero_division=0.0)
 
+    def _score_from_confusion_matrix(self, confusion_matrix):
+        return _precision_recall_f1(confusion_matrix, average='micro')[0]
+
 
 class PrecisionMacro(MulticlassClassificationObjective):
     """Precision score for multiclass classification using macro averaging."""
@@ -131,6 +170,9 @@ class PrecisionMacro(MulticlassClassificationObjective):
     def objective_function(self, y_true, y_predicted, X=None):
         return metrics.precision_score(y_true, y_predicted, average='macro', zero_division=0.0)
 
+    def _score_from_confusion_matrix(self, confusion_matrix):
+        return _precision_recall_f1(confusion_matrix, average='macro')[0]
+
 
 class PrecisionWeighted(MulticlassClassificationObjective):
     """Precision score for multiclass classification using weighted averaging."""
@@ -142,6 +184,9 @@ class PrecisionWeighted(MulticlassClassificationObjective):
     def objective_function(self, y_true, y_predicted, X=None):
         return metrics.precision_score(y_true, y_predicted, average='weighted', zero_division=0.0)
 
+    def _score_from_confusion_matrix(self, confusion_matrix):
+        return _precision_recall_f1(confusion_matrix, average='weighted')[0]
+
 
 class Recall(BinaryClassificationObjective):
     """Recall score for binary classification."""
@@ -153,6 +198,9 @@ class Recall(BinaryClassificationObjective):
     def objective_function(self, y_true, y_predicted, X=None):
         return metrics.recall_score(y_true, y_predicted, zero_division=0.0)
 
+    def _score_from_confusion_matrix(self, true_positives, false_positives, true_negatives, false_negatives):
+        return _divide_or_zero(true_positives, true_positives + false_negatives)
+
 
 class RecallMicro(MulticlassClassificationObjective):
     """Recall score for multiclass classification using micro averaging."""
@@ -164,6 +212,9 @@ class RecallMicro(MulticlassClassificationObjective):
     def objective_function(self, y_true, y_predicted, X=None):
         return metrics.recall_score(y_true, y_predicted, average='micro', zero_division=0.0)
 
+    def _score_from_confusion_matrix(self, confusion_matrix):
+        return _precision_recall_f1(confusion_matrix, average='micro')[1]
+
 
 class RecallMacro(MulticlassClassificationObjective):
     """Recall score for multiclass classification using macro averaging."""
@@ -175,6 +226,9 @@ class RecallMacro(MulticlassClassificationObjective):
     def objective_function(self, y_true, y_predicted, X=None):
         return metrics.recall_score(y_true, y_predicted, average='macro', zero_division=0.0)
 
+    def _score_from_confusion_matrix(self, confusion_matrix):
+        return _precision_recall_f1(confusion_matrix, average='macro')[1]
+
 
 class RecallWeighted(MulticlassClassificationObjective):
     """Recall score for multiclass classification using weighted averaging."""
@@ -186,6 +240,9 @@ class RecallWeighted(MulticlassClassificationObjective):
     def objective_function(self, y_true, y_predicted, X=None):
         return metrics.recall_score(y_true, y_predicted, average='weighted', zero_division=0.0)
 
+    def _score_from_confusion_matrix(self, confusion_matrix):
+        return _precision_recall_f1(confusion_matrix, average='weighted')[1]
+
 
 class AUC(BinaryClassificationObjective):
     """AUC score for binary classification."""
@@ -269,6 +326,14 @@ class MCCBinary(BinaryClassificationObjective):
             warnings.simplefilter('ignore', RuntimeWarning)
             return metrics.matthews_corrcoef(y_true, y_predicted)
 
+    def _score_from_confusion_matrix(self, true_positives, false_positives, true_negatives, false_negatives):
+        # counts are converted to floats so that the products can't overflow on large data
+        true_positives, false_positives, true_negatives, false_negatives = \
+            [np.asarray(counts, dtype=float) for counts in (true_positives, false_positives, true_negatives, false_negatives)]
+        denominator = np.sqrt((true_positives + false_positives) * (true_positives + false_negatives) *
+                              (true_negatives + false_positives) * (true_negatives + false_negatives))
+        return _divide_or_zero(true_positives * true_negatives - false_positives * false_negatives, denominator)
+
 
 class MCCMulticlass(MulticlassClassificationObjective):
     """Matthews correlation coefficient for multiclass classification."""
@@ -283,6 +348,15 @@ class MCCMulticlass(MulticlassClassificationObjective):
             warnings.simplefilter('ignore', RuntimeWarning)
             return metrics.matthews_corrcoef(y_true, y_predicted)
 
+    def _score_from_confusion_matrix(self, confusion_matrix):
+        n_true = confusion_matrix.sum(axis=1, dtype=float)
+        n_predicted = confusion_matrix.sum(axis=0, dtype=float)
+        n_samples = n_true.sum()
+        covariance = np.trace(confusion_matrix, dtype=float) * n_samples - np.dot(n_true, n_predicted)
+        variance_true = n_samples ** 2 - np.dot(n_true, n_true)
+        variance_predicted = n_samples ** 2 - np.dot(n_predicted, n_predicted)
+        return _divide_or_zero(covariance, np.sqrt(variance_true * variance_predicted))
+
 
 class RootMeanSquaredError(RegressionObjective):
     """Root mean squared error for regression."""
@@ -395,3 +469,25 @@ def _handle_predictions(y_true, y_pred):
         y_true = label_binarize(y_true, classes=classes)
 
     return y_true, y_pred
+
+
+def _precision_recall_f1(confusion_matrix, average):
+    """Computes precision, recall and F1 from a multiclass confusion matrix like sklearn's precision_recall_fscore_support with zero_division=0.
+
+    Arguments:
+        confusion_matrix (np.ndarray): the confusion matrix, with a row for each true label and a column for each predicted label.
+        average (str): 'micro', 'macro' or 'weighted'.
+
+    Returns:
+        (float, float, float): precision, recall and F1.
+    """
+    true_positives = np.diag(confusion_matrix).astype(float)
+    n_predicted = confusion_matrix.sum(axis=0).astype(float)
+    n_true = confusion_matrix.sum(axis=1).astype(float)
+    if average == 'micro':
+        true_positives, n_predicted, n_true = true_positives.sum(), n_predicted.sum(), n_true.sum()
+    precision = _divide_or_zero(true_positives, n_predicted)
+    recall = _divide_or_zero(true_positives, n_true)
+    f1 = _divide_or_zero(2 * precision * recall, precision + recall)
+    weights = n_true if average == 'weighted' else None
+    return tuple(np.average(score, weights=weights) for score in (precision, recall, f1))
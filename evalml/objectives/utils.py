@@ -4,7 +4,7 @@ from .objective_base import ObjectiveBase
 from evalml import objectives
 from evalml.exceptions import ObjectiveNotFoundError
 from evalml.problem_types import handle_problem_types
-from evalml.utils.gen_utils import _get_subclasses
+from evalml.utils.gen_utils import _cache_until_new_subclass, _get_subclasses
 
 
 def get_non_core_objectives():
@@ -22,6 +22,11 @@ def get_non_core_objectives():
 
 
 def _all_objectives_dict():
+    return dict(_objective_classes_by_name())
+
+
+@_cache_until_new_subclass
+def _objective_classes_by_name():
     all_objectives = _get_subclasses(ObjectiveBase)
     objectives_dict = {}
     for objective in all_objectives:
@@ -70,7 +75,7 @@ def get_objective(objective, return_instance=False, **kwargs):
         raise TypeError("Objective parameter cannot be NoneType")
     if isinstance(objective, ObjectiveBase):
         return objective
-    all_objectives_dict = _all_objectives_dict()
+    all_objectives_dict = _objective_classes_by_name()
     if not isinstance(objective, str):
         raise TypeError("If parameter objective is not a string, it must be an instance of ObjectiveBase!")
     if objective.lower() not in all_objectives_dict:
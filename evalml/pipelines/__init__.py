@@ -22,10 +22,15 @@ from .components import (
     ExtraTreesClassifier,
     ExtraTreesRegressor,
     DecisionTreeClassifier,
-    DecisionTreeRegressor
+    DecisionTreeRegressor,
+    ComponentHook
 )
 
+from .component_telemetry import ComponentTelemetry
+from .transformer_cache import TransformerCache
 from .pipeline_base import PipelineBase
+from .compiled_pipeline import CompiledPipeline
+from .parallel_predictor import ParallelPredictor
 from .classification_pipeline import ClassificationPipeline
 from .binary_classification_pipeline import BinaryClassificationPipeline
 from .multiclass_classification_pipeline import MulticlassClassificationPipeline
@@ -0,0 +1,118 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+from pandas.api.types import is_categorical_dtype, is_dtype_equal
+
+from evalml.utils.gen_utils import import_or_raise
+
+_PYARROW_ERROR = "pyarrow is needed to read and write parquet files"
+
+
+def _read_chunks(source, columns, chunk_rows):
+    """Returns an iterator of DataFrames of at most chunk_rows rows read from the source.
+
+    Arguments:
+        source (str or iterable): the path of a CSV or parquet file, or an iterable of DataFrames.
+        columns (list): the columns to read from files.
+        chunk_rows (int): the number of rows to read from files at a time.
+    """
+    if not isinstance(source, str):
+        return iter(source)
+    if source.endswith('.csv'):
+        return iter(pd.read_csv(source, usecols=columns, chunksize=chunk_rows))
+    if source.endswith('.parquet'):
+        pq = import_or_raise("pyarrow.parquet", error_msg=_PYARROW_ERROR)
+        batches = pq.ParquetFile(source).iter_batches(batch_size=chunk_rows, columns=columns)
+        return (batch.to_pandas() for batch in batches)
+    raise ValueError(f"source must be a .csv or .parquet file or an iterable of DataFrames. Received {source} instead")
+
+
+def _prefetch(chunks):
+    """Yields the chunks, reading the next chunk on a background thread while the current one is used."""
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        next_chunk = executor.submit(next, chunks, None)
+        while True:
+            chunk = next_chunk.result()
+            if chunk is None:
+                return
+            next_chunk = executor.submit(next, chunks, None)
+            yield chunk
+
+
+def _conform_chunk(chunk, dtypes):
+    """Returns the chunk with the columns and dtypes of the data the pipeline was fit on.
+
+    Chunks read from files have their dtypes inferred from the rows in the chunk, so for example a chunk of a
+    categorical column comes back as strings, and a chunk without missing values of a numeric column with missing
+    values comes back as integers.
+    """
+    missing = [column for column in dtypes.index if column not in chunk.columns]
+    if missing:
+        raise ValueError(f"Chunk is missing columns the pipeline was fit on: {missing}")
+    columns = {}
+    for column, dtype in dtypes.items():
+        values = chunk[column]
+        if is_dtype_equal(values.dtype, dtype):
+            pass
+        elif is_categorical_dtype(dtype):
+            values = values.astype('category')
+        elif dtype.kind == 'M':
+            values = pd.to_datetime(values)
+        elif dtype.kind in 'iub' and values.hasnans:
+            # integer and boolean columns with missing values are floats in pandas
+            values = values.astype('float64')
+        else:
+            values = values.astype(dtype)
+        columns[column] = values
+    return pd.DataFrame(columns, index=chunk.index)
+
+
+class _CSVSink:
+    def __init__(self, path):
+        self._file = open(path, 'w', newline='')
+        self._header = True
+
+    def write(self, predictions):
+        predictions.to_csv(self._file, header=self._header, index=False)
+        self._header = False
+
+    def close(self):
+        self._file.close()
+
+
+class _ParquetSink:
+    def __init__(self, path):
+        self._pa = import_or_raise("pyarrow", error_msg=_PYARROW_ERROR)
+        self._pq = import_or_raise("pyarrow.parquet", error_msg=_PYARROW_ERROR)
+        self._path = path
+        self._writer = None
+
+    def write(self, predictions):
+        predictions = predictions.rename(columns=str)
+        table = self._pa.Table.from_pandas(predictions, preserve_index=False)
+        if self._writer is None:
+            self._writer = self._pq.ParquetWriter(self._path, table.schema)
+        self._writer.write_table(table)
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+
+
+class _CallableSink:
+    def __init__(self, function):
+        self.write = function
+
+    def close(self):
+        pass
+
+
+def _open_sink(output):
+    """Returns a sink with write(predictions) and close() methods which writes to the output."""
+    if callable(output):
+        return _CallableSink(output)
+    if isinstance(output, str) and output.endswith('.csv'):
+        return _CSVSink(output)
+    if isinstance(output, str) and output.endswith('.parquet'):
+        return _ParquetSink(output)
+    raise ValueError(f"output must be a .csv or .parquet file or a callable. Received {output} instead")
@@ -2,6 +2,7 @@ import pandas as pd
 
 from evalml.objectives import get_objective
 from evalml.pipelines.classification_pipeline import ClassificationPipeline
+from evalml.pipelines.components.component_hooks import _call_with_hooks
 from evalml.problem_types import ProblemTypes
 
 
@@ -18,6 +19,8 @@ class BinaryClassificationPipeline(ClassificationPipeline):
     @threshold.setter
     def threshold(self, value):
         self._threshold = value
+        # the compiled pipeline predicts with the threshold it was compiled with
+        self._compiled_pipeline = None
 
     def _predict(self, X, objective=None):
         """Make predictions using selected features.
@@ -39,8 +42,8 @@ class BinaryClassificationPipeline(ClassificationPipeline):
                 raise ValueError("You can only use a binary classification objective to make predictions for a binary classification pipeline.")
 
         if self.threshold is None:
-            return self.estimator.predict(X_t)
-        ypred_proba = self.predict_proba(X)
+            return _call_with_hooks(self._component_hooks(), self.estimator, 'predict', X_t, self.estimator.predict, X_t)
+        ypred_proba = self._estimator_predict_proba(X_t)
         ypred_proba = ypred_proba.iloc[:, 1]
         if objective is None:
             return ypred_proba > self.threshold
@@ -4,6 +4,7 @@ from sklearn.preprocessing import LabelEncoder
 
 from evalml.objectives import get_objective
 from evalml.pipelines import PipelineBase
+from evalml.pipelines.components.component_hooks import _call_with_hooks
 
 
 class ClassificationPipeline(PipelineBase):
@@ -79,7 +80,7 @@ class ClassificationPipeline(PipelineBase):
         if not isinstance(X, pd.DataFrame):
             X = pd.DataFrame(X)
         X_t = self.compute_estimator_features(X)
-        return self.estimator.predict(X_t)
+        return _call_with_hooks(self._component_hooks(), self.estimator, 'predict', X_t, self.estimator.predict, X_t)
 
     def predict(self, X, objective=None):
         """Make predictions using selected features.
@@ -106,8 +107,28 @@ class ClassificationPipeline(PipelineBase):
         if not isinstance(X, pd.DataFrame):
             X = pd.DataFrame(X)
 
-        X = self.compute_estimator_features(X)
-        proba = self.estimator.predict_proba(X)
+        X_t = self.compute_estimator_features(X)
+        return self._estimator_predict_proba(X_t)
+
+    def predict_proba_one(self, record):
+        """Make probability estimates for the labels of a single record, without building a DataFrame. The pipeline is
+        compiled the first time this is called after it is fit, and the compiled pipeline is reused after that. If the
+        pipeline can't be compiled, or the compiled pipeline can't predict the record, the record is predicted with
+        predict_proba instead.
+
+        Arguments:
+            record (dict or tuple): The value of each column the pipeline was fit on, as a dict of column names to
+                values, or a tuple of the values in the order the pipeline was fit on.
+
+        Returns:
+            np.array: The probability of each of the classes, in the order of classes_.
+        """
+        return self._predict_record('predict_proba', record)
+
+    def _estimator_predict_proba(self, X_t):
+        """Returns the estimator's probability estimates for the features computed by compute_estimator_features,
+        with a column for each class."""
+        proba = _call_with_hooks(self._component_hooks(), self.estimator, 'predict_proba', X_t, self.estimator.predict_proba, X_t)
         proba.columns = self._encoder.classes_
         return proba
 
@@ -0,0 +1,181 @@
+import numpy as np
+import pandas as pd
+
+from evalml.problem_types import ProblemTypes
+
+
+class CompiledPipeline:
+    """A fitted pipeline compiled into a fixed plan which predicts from numpy arrays, for low latency scoring.
+
+    The plan is built once from the fitted components: the position of each column, the fill value of each imputed
+    column, the lookup table of each one-hot encoded column and the scaling of each scaled column. Predicting then
+    passes one numpy array per column through the plan and fills a single feature matrix for the estimator, instead of
+    building DataFrames between components. Components which can't be compiled, such as the datetime and text
+    featurizers, are given their input as a DataFrame and transform it as usual, and estimators which can't predict from
+    numpy arrays, such as CatBoost, or LightGBM with categorical features, are given their features as a DataFrame.
+
+    The plan uses the pipeline's components as they were when it was compiled, so it must be compiled again after the
+    pipeline is fit again. Hooks and telemetry are not called.
+    """
+
+    def __init__(self, pipeline):
+        """Compiles a fitted pipeline. Use pipeline.compile() instead of calling this directly.
+
+        Arguments:
+            pipeline (PipelineBase): the fitted pipeline to compile.
+        """
+        self.name = pipeline.name
+        self.problem_type = pipeline.problem_type
+        feature_names = [list(pipeline.input_feature_names[component.name]) for component in pipeline.component_graph]
+        self.input_columns = feature_names[0]
+        self.compiled_components = []
+        self._transforms = []
+        for component, input_columns, output_columns in zip(pipeline.component_graph[:-1], feature_names, feature_names[1:]):
+            transform = component._compile(input_columns, output_columns)
+            if transform is None:
+                transform = _transform_dataframe(component, input_columns, output_columns)
+            else:
+                self.compiled_components.append(component.name)
+            self._transforms.append(transform)
+        self._feature_names = feature_names[-1]
+        self._estimator = pipeline.estimator
+        self._estimator_predict = None
+        self._estimator_predict_proba = None
+        compiled_estimator = pipeline.estimator._compile()
+        if compiled_estimator is not None:
+            self._estimator_predict, self._estimator_predict_proba = compiled_estimator
+            self.compiled_components.append(pipeline.estimator.name)
+        self._classes = None
+        self._threshold = None
+        if self.problem_type in [ProblemTypes.BINARY, ProblemTypes.MULTICLASS]:
+            self._classes = np.asarray(pipeline.classes_)
+        if self.problem_type == ProblemTypes.BINARY:
+            self._threshold = pipeline.threshold
+
+    def predict(self, X):
+        """Make predictions using the compiled pipeline. Binary classification pipelines use the threshold the
+        pipeline had when it was compiled.
+
+        Arguments:
+            X (pd.DataFrame or np.array): Data of shape [n_samples, n_features], with the columns the pipeline was fit
+                on. The columns of an np.array are taken in the order the pipeline was fit on.
+
+        Returns:
+            np.array: Predicted values, or estimated labels for classification pipelines.
+        """
+        return self._predict(self._data_columns(X))
+
+    def predict_proba(self, X):
+        """Make probability estimates for labels using the compiled pipeline.
+
+        Arguments:
+            X (pd.DataFrame or np.array): Data of shape [n_samples, n_features], with the columns the pipeline was fit
+                on. The columns of an np.array are taken in the order the pipeline was fit on.
+
+        Returns:
+            np.array: Probability estimates of shape [n_samples, n_classes], with a column for each of the classes in
+                the order of the pipeline's classes_.
+        """
+        self._check_classification()
+        return self._predict_proba(self._compute_features(self._data_columns(X)))
+
+    def predict_one(self, record):
+        """Make a prediction for a single record, without building a DataFrame.
+
+        Arguments:
+            record (dict or tuple): The value of each column the pipeline was fit on, as a dict of column names to
+                values, or a tuple of the values in the order the pipeline was fit on.
+
+        Returns:
+            The predicted value, or the estimated label for classification pipelines.
+        """
+        return self._predict(self._record_columns(record))[0]
+
+    def predict_proba_one(self, record):
+        """Make probability estimates for the labels of a single record, without building a DataFrame.
+
+        Arguments:
+            record (dict or tuple): The value of each column the pipeline was fit on, as a dict of column names to
+                values, or a tuple of the values in the order the pipeline was fit on.
+
+        Returns:
+            np.array: The probability of each of the classes, in the order of the pipeline's classes_.
+        """
+        self._check_classification()
+        return self._predict_proba(self._compute_features(self._record_columns(record)))[0]
+
+    def _check_classification(self):
+        if self._classes is None:
+            raise ValueError("Probability estimates are only available for classification pipelines")
+
+    def _predict(self, columns):
+        features = self._compute_features(columns)
+        if self._threshold is not None:
+            predictions = self._predict_proba(features)[:, 1] > self._threshold
+        elif self._estimator_predict is not None:
+            predictions = self._estimator_predict(self._feature_matrix(features))
+        else:
+            predictions = np.asarray(self._estimator.predict(self._feature_frame(features)))
+        if self._classes is None:
+            return predictions
+        return self._classes[predictions.astype(int)]
+
+    def _predict_proba(self, features):
+        if self._estimator_predict_proba is not None:
+            return self._estimator_predict_proba(self._feature_matrix(features))
+        return np.asarray(self._estimator.predict_proba(self._feature_frame(features)))
+
+    def _data_columns(self, X):
+        """Returns a numpy array of each of the input columns of the data."""
+        if isinstance(X, pd.DataFrame):
+            return [X[column].to_numpy() for column in self.input_columns]
+        X = np.asarray(X)
+        if X.ndim != 2 or X.shape[1] != len(self.input_columns):
+            raise ValueError(f"X must have shape [n_samples, {len(self.input_columns)}]. Received {X.shape} instead")
+        return list(X.T)
+
+    def _record_columns(self, record):
+        """Returns a numpy array of length one for each of the input columns of the record."""
+        if isinstance(record, dict):
+            values = [record[column] for column in self.input_columns]
+        else:
+            values = list(record)
+            if len(values) != len(self.input_columns):
+                raise ValueError(f"record must have {len(self.input_columns)} values. Received {len(values)} instead")
+        return [_record_array(value) for value in values]
+
+    def _compute_features(self, columns):
+        """Returns a numpy array of the estimator's input for each of its features."""
+        for transform in self._transforms:
+            columns = transform(columns)
+        return columns
+
+    def _feature_matrix(self, features):
+        matrix = np.empty((len(features[0]) if features else 0, len(features)))
+        for position, feature in enumerate(features):
+            matrix[:, position] = feature
+        return matrix
+
+    def _feature_frame(self, features):
+        return _to_dataframe(self._feature_names, features)
+
+
+def _record_array(value):
+    if isinstance(value, str) or value is None:
+        return np.array([value], dtype=object)
+    if isinstance(value, pd.Timestamp):
+        return np.array([value.to_datetime64()])
+    return np.array([value])
+
+
+def _to_dataframe(columns, arrays):
+    return pd.DataFrame(dict(zip(columns, arrays)), columns=columns)
+
+
+def _transform_dataframe(component, input_columns, output_columns):
+    """Returns a compiled transform which gives the input to the component as a DataFrame, for components which
+    can't be compiled."""
+    def transform_dataframe(columns):
+        X_t = component.transform(_to_dataframe(input_columns, columns))
+        return [X_t[column].to_numpy() for column in output_columns]
+    return transform_dataframe
@@ -0,0 +1,180 @@
+import threading
+import time
+import tracemalloc
+from collections import OrderedDict
+from contextlib import contextmanager
+
+import psutil
+
+from .components.component_hooks import ComponentHook
+
+
+class ComponentTelemetry(ComponentHook):
+    """Records how long each component of a pipeline takes to fit, transform and predict, and optionally how much memory it uses.
+
+    Set an instance as the telemetry of a pipeline, or add it as a hook to a pipeline or component, to enable it. Each
+    call to a component's fit, fit_transform, transform, predict or predict_proba method adds its wall time and CPU time
+    to the totals of that component and method. CPU time is
+    measured for the whole process, so it includes the threads a component starts, and any other thread running at the
+    same time.
+
+    With track_memory, the peak memory allocated by Python during each call, above the memory allocated before it, is
+    measured with tracemalloc, and the resident set size of the process is read after each call. The peak is measured
+    for the whole process, so it is only meaningful when components are not run concurrently. Memory is only measured
+    while tracemalloc is tracing.
+
+    Before Python 3.9, tracemalloc's peak can only be reset by clearing its traces, which is only done when tracemalloc
+    was started by evalml. When it was started by the user, the peak of a call which stays below an earlier peak can't be
+    measured, and the memory still allocated at the end of the call is recorded instead.
+    """
+    columns = ["component", "method", "calls", "wall_time", "cpu_time", "peak_memory", "rss"]
+
+    def __init__(self, track_memory=False):
+        """Records how long each component of a pipeline takes to fit, transform and predict.
+
+        Arguments:
+            track_memory (bool): If True, also record the peak memory allocated by Python during each call, and the
+                resident set size of the process after it. Defaults to False.
+        """
+        self.track_memory = track_memory
+        self._records = OrderedDict()
+        self._lock = threading.Lock()
+        self._memory_start = threading.local()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_lock'] = None
+        state['_memory_start'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+        self._memory_start = threading.local()
+
+    @contextmanager
+    def measure(self, component, method):
+        """Measures the code run in the context as a call to a component's method.
+
+        Arguments:
+            component (ComponentBase): the component being called.
+            method (str): the name of the method being called.
+        """
+        self.before_call(component, method, None)
+        cpu_start = time.process_time()
+        wall_start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.after_call(component, method, None, time.perf_counter() - wall_start, time.process_time() - cpu_start)
+
+    def before_call(self, component, method, input_shape):
+        if self.track_memory and tracemalloc.is_tracing():
+            _reset_peak()
+            self._memory_start.value = tracemalloc.get_traced_memory()
+        else:
+            self._memory_start.value = None
+
+    def after_call(self, component, method, input_shape, wall_time, cpu_time):
+        memory_start = self._memory_start.value
+        peak_memory = None
+        rss = None
+        if memory_start is not None:
+            current, peak = tracemalloc.get_traced_memory()
+            if peak > memory_start[1]:
+                peak_memory = peak - memory_start[0]
+            else:
+                # the peak wasn't reset and the call stayed below it
+                peak_memory = max(current - memory_start[0], 0)
+            rss = psutil.Process().memory_info().rss
+        self._add(component.name, method, wall_time, cpu_time, peak_memory, rss)
+
+    def _add(self, component_name, method, wall_time, cpu_time, peak_memory, rss):
+        with self._lock:
+            record = self._records.get((component_name, method))
+            if record is None:
+                record = OrderedDict([("component", component_name), ("method", method), ("calls", 0), ("wall_time", 0.0),
+                                      ("cpu_time", 0.0), ("peak_memory", None), ("rss", None)])
+                self._records[(component_name, method)] = record
+            record["calls"] += 1
+            record["wall_time"] += wall_time
+            record["cpu_time"] += cpu_time
+            record["peak_memory"] = _max_or_none(record["peak_memory"], peak_memory)
+            record["rss"] = _max_or_none(record["rss"], rss)
+
+    def to_records(self):
+        """Returns the totals recorded for each component and method, in the order they were first called.
+
+        Returns:
+            list(dict): for each component and method, the number of calls, the total wall time and CPU time in seconds, and
+                the largest peak memory and resident set size in bytes, which are None when memory isn't tracked.
+        """
+        with self._lock:
+            return [dict(record) for record in self._records.values()]
+
+    @staticmethod
+    def combine(records):
+        """Combines the records of several telemetries, such as those of each cross-validation fold, into one.
+
+        Calls and times are added up, and the largest memory figures are kept.
+
+        Arguments:
+            records (list(list(dict))): the records returned by to_records for each telemetry.
+
+        Returns:
+            list(dict): the combined records, in the order each component and method was first seen.
+        """
+        telemetry = ComponentTelemetry()
+        for telemetry_records in records:
+            for record in telemetry_records:
+                combined = telemetry._records.get((record["component"], record["method"]))
+                if combined is None:
+                    telemetry._records[(record["component"], record["method"])] = dict(record)
+                    continue
+                combined["calls"] += record["calls"]
+                combined["wall_time"] += record["wall_time"]
+                combined["cpu_time"] += record["cpu_time"]
+                combined["peak_memory"] = _max_or_none(combined["peak_memory"], record["peak_memory"])
+                combined["rss"] = _max_or_none(combined["rss"], record["rss"])
+        return telemetry.to_records()
+
+
+_started_tracing = False
+
+
+def _start_tracing():
+    """Starts tracemalloc if it isn't tracing already.
+
+    Returns:
+        bool: True if tracemalloc was started, in which case it should be stopped with _stop_tracing.
+    """
+    global _started_tracing
+    if tracemalloc.is_tracing():
+        return False
+    tracemalloc.start()
+    _started_tracing = True
+    return True
+
+
+def _stop_tracing():
+    """Stops tracemalloc after it was started by _start_tracing."""
+    global _started_tracing
+    _started_tracing = False
+    tracemalloc.stop()
+
+
+def _reset_peak():
+    """Resets the peak memory traced by tracemalloc to the memory currently traced, when that can be done without losing the user's traces."""
+    if hasattr(tracemalloc, 'reset_peak'):
+        tracemalloc.reset_peak()
+    elif _started_tracing:
+        # before python 3.9, the peak can only be reset by forgetting the blocks traced so far
+        tracemalloc.clear_traces()
+
+
+def _max_or_none(a, b):
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return max(a, b)
@@ -1,4 +1,5 @@
 from .component_base import ComponentBase, ComponentBaseMeta
+from .component_hooks import ComponentHook
 from .estimators import (
     Estimator,
     LinearRegressor,
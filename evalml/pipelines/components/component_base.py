@@ -5,6 +5,7 @@ import cloudpickle
 
 from evalml.exceptions import MethodPropertyNotFoundError
 from evalml.pipelines.components.component_base_meta import ComponentBaseMeta
+from evalml.pipelines.components.component_hooks import _add_hook, _remove_hook
 from evalml.utils import (
     check_random_state_equality,
     classproperty,
@@ -13,6 +14,8 @@ from evalml.utils import (
     log_subtitle,
     safe_repr
 )
+from evalml.utils.artifacts import load_object, open_artifact, save_object
+from evalml.utils.gen_utils import _clear_subclass_caches
 
 logger = get_logger(__file__)
 
@@ -20,6 +23,13 @@ logger = get_logger(__file__)
 class ComponentBase(ABC, metaclass=ComponentBaseMeta):
     """Base class for all components."""
     _default_parameters = None
+    _hooks = ()
+    # set while the component's hooks are called, so that the component's calls to its own methods don't call them again
+    _in_hook_call = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _clear_subclass_caches()
 
     def __init__(self, parameters=None, component_obj=None, random_state=0, **kwargs):
         self.random_state = get_random_state(random_state)
@@ -94,6 +104,39 @@ class ComponentBase(ABC, metaclass=ComponentBaseMeta):
         except AttributeError:
             raise MethodPropertyNotFoundError("Component requires a fit method or a component_obj that implements fit")
 
+    @property
+    def hooks(self):
+        """Returns the hooks added to this component, in the order they are called."""
+        return list(self._hooks)
+
+    def add_hook(self, hook):
+        """Adds a hook to be called before and after each call to this component's fit, fit_transform, transform,
+        predict and predict_proba methods.
+
+        Arguments:
+            hook (ComponentHook): the hook to add.
+
+        Returns:
+            None
+        """
+        self._hooks = _add_hook(self._hooks, hook)
+
+    def remove_hook(self, hook):
+        """Removes a hook added to this component.
+
+        Arguments:
+            hook (ComponentHook): the hook to remove.
+
+        Returns:
+            None
+        """
+        self._hooks = _remove_hook(self._hooks, hook)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop('_hooks', None)
+        return state
+
     def describe(self, print_name=False, return_dict=False):
         """Describe a component and its parameters
 
@@ -141,6 +184,35 @@ class ComponentBase(ABC, metaclass=ComponentBaseMeta):
         with open(file_path, 'rb') as f:
             return cloudpickle.load(f)
 
+    def save_artifact(self, path):
+        """Saves the component as an artifact, a directory or zip file holding its parameters and fitted state as JSON,
+        with its large arrays packed into a binary file, which can be loaded without pickle.
+
+        Arguments:
+            path (str): location to save the artifact. Paths ending in .zip are saved as zip files, other paths as
+                directories.
+
+        Returns:
+            None
+        """
+        with open_artifact(path, 'w') as artifact:
+            save_object(artifact, 'component.json', self)
+
+    @staticmethod
+    def load_artifact(path, mmap=True):
+        """Loads a component saved with save_artifact.
+
+        Arguments:
+            path (str): location of the artifact.
+            mmap (bool): whether to memory map the arrays of an artifact directory, so that their data is only read from
+                disk when it is used. Arrays in zip files are always read. Defaults to True.
+
+        Returns:
+            ComponentBase object
+        """
+        with open_artifact(path) as artifact:
+            return load_object(artifact, 'component.json', mmap=mmap)
+
     def __eq__(self, other):
         if not isinstance(other, self.__class__):
             return False
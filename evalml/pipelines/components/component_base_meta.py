@@ -3,12 +3,30 @@
 from functools import wraps
 
 from evalml.exceptions import ComponentNotYetFittedError
+from evalml.pipelines.components.component_hooks import (
+    _call_with_component_hooks
+)
 from evalml.utils.base_meta import BaseMeta
 
 
 class ComponentBaseMeta(BaseMeta):
     """Metaclass that overrides creating a new component by wrapping methods with validators and setters"""
 
+    HOOKED_METHODS = ['fit', 'fit_transform', 'predict', 'predict_proba', 'transform']
+
+    @classmethod
+    def set_fit(cls, method):
+        """`set_fit` wraps a fit method to set `self._is_fitted` to `True` once it returns, and to call the component's hooks."""
+        @wraps(method)
+        def _set_fit(self, X, y=None):
+            if self._hooks and not self._in_hook_call:
+                return_value = _call_with_component_hooks(self, method.__name__, X, method, self, X, y)
+            else:
+                return_value = method(self, X, y)
+            self._is_fitted = True
+            return return_value
+        return _set_fit
+
     @classmethod
     def check_for_fit(cls, method):
         """`check_for_fit` wraps a method that validates if `self._is_fitted` is `True`.
@@ -20,9 +38,12 @@ class ComponentBaseMeta(BaseMeta):
             if not self._is_fitted and self.needs_fitting:
                 raise ComponentNotYetFittedError(f'This {klass} is not fitted yet. You must fit {klass} before calling {method.__name__}.')
             elif X is None and y is None:
-                return method(self)
+                args = ()
             elif y is None:
-                return method(self, X)
+                args = (X,)
             else:
-                return method(self, X, y)
+                args = (X, y)
+            if self._hooks and not self._in_hook_call and method.__name__ in cls.HOOKED_METHODS:
+                return _call_with_component_hooks(self, method.__name__, X, method, self, *args)
+            return method(self, *args)
         return _check_for_fit
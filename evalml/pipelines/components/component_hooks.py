@@ -0,0 +1,83 @@
+import time
+
+
+class ComponentHook:
+    """Base class for hooks which are called before and after a component is fit, transforms data or predicts.
+
+    Hooks can be added to a component, to be called whenever its fit, fit_transform, transform, predict or
+    predict_proba methods are called, or to a pipeline, to be called whenever the pipeline calls one of its components.
+    Override before_call and after_call to profile, sample or export metrics about the calls. Both do nothing by default.
+
+    Hooks are called in the order they were added, on the thread making the call. They are not copied when the
+    component or pipeline is cloned, copied or pickled.
+    """
+
+    def before_call(self, component, method, input_shape):
+        """Called before a component method runs.
+
+        Arguments:
+            component (ComponentBase): the component being called.
+            method (str): the name of the method being called: 'fit', 'fit_transform', 'transform', 'predict' or 'predict_proba'.
+            input_shape (tuple): the shape of the input data, or None if it has no shape.
+        """
+
+    def after_call(self, component, method, input_shape, wall_time, cpu_time):
+        """Called after a component method returns or raises an exception.
+
+        Arguments:
+            component (ComponentBase): the component which was called.
+            method (str): the name of the method which was called.
+            input_shape (tuple): the shape of the input data, or None if it has no shape.
+            wall_time (float): the number of seconds the call took.
+            cpu_time (float): the number of seconds of CPU time the process used during the call, in all threads.
+        """
+
+
+def _add_hook(hooks, hook):
+    """Returns the hooks with the hook added at the end, after checking it is a ComponentHook."""
+    if not isinstance(hook, ComponentHook):
+        raise ValueError(f"hook must be a ComponentHook. Received {type(hook).__name__} instead")
+    return hooks + (hook,)
+
+
+def _remove_hook(hooks, hook):
+    """Returns the hooks without the hook, after checking it was added."""
+    if hook not in hooks:
+        raise ValueError("hook was not added")
+    hooks = list(hooks)
+    hooks.remove(hook)
+    return tuple(hooks)
+
+
+def _call_with_component_hooks(component, method, X, function, *args):
+    """Calls function(*args) as a call to the component's method, calling the component's own hooks before and after it.
+
+    Calls the component makes to its own methods while its hooks are running, such as fit_transform calling fit and
+    transform, don't call the hooks again.
+    """
+    component._in_hook_call = True
+    try:
+        return _call_with_hooks(component._hooks, component, method, X, function, *args)
+    finally:
+        component._in_hook_call = False
+
+
+def _call_with_hooks(hooks, component, method, X, function, *args):
+    """Calls function(*args) as a call to a component's method, calling each hook before and after it.
+
+    When there are no hooks, the function is called directly.
+    """
+    if not hooks:
+        return function(*args)
+    input_shape = getattr(X, 'shape', None)
+    for hook in hooks:
+        hook.before_call(component, method, input_shape)
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    try:
+        return function(*args)
+    finally:
+        wall_time = time.perf_counter() - wall_start
+        cpu_time = time.process_time() - cpu_start
+        for hook in hooks:
+            hook.after_call(component, method, input_shape, wall_time, cpu_time)
@@ -62,6 +62,10 @@ class StackedEnsembleBase(Estimator):
                          component_obj=self._stacking_estimator_class(**sklearn_parameters),
                          random_state=random_state)
 
+    def _compile(self):
+        # the input pipelines predict from DataFrames
+        return None
+
     @property
     def feature_importance(self):
         raise NotImplementedError("feature_importance is not implemented for StackedEnsembleClassifier and StackedEnsembleRegressor")
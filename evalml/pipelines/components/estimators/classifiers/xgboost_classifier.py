@@ -1,3 +1,5 @@
+from functools import partial
+
 import pandas as pd
 from skopt.space import Integer, Real
 
@@ -63,3 +65,7 @@ class XGBoostClassifier(Estimator):
     @property
     def feature_importance(self):
         return self._component_obj.feature_importances_
+
+    def _compile(self):
+        # the model was fit on numbered columns, so it can't check the names of a numpy array's columns
+        return partial(self._component_obj.predict, validate_features=False), self._component_obj.predict_proba
@@ -58,6 +58,21 @@ class Estimator(ComponentBase):
             pred_proba = pd.DataFrame(pred_proba)
         return pred_proba
 
+    def _compile(self):
+        """Returns the fitted model's predict and predict_proba functions, to predict directly from a numpy array of the
+        features. Returns None if the estimator needs the features as a DataFrame, which is the case if it overrides
+        fit, predict or predict_proba. For example, CatBoost is fit on categorical columns as they are, so its model
+        can't predict from a float matrix.
+
+        Returns:
+            (callable, callable) or None: predict_proba is None if the model doesn't estimate probabilities.
+        """
+        estimator_class = type(self)
+        if (estimator_class.fit is not Estimator.fit or estimator_class.predict is not Estimator.predict or
+                estimator_class.predict_proba is not Estimator.predict_proba):
+            return None
+        return self._component_obj.predict, getattr(self._component_obj, 'predict_proba', None)
+
     @property
     def feature_importance(self):
         """Returns importance associated with each feature.
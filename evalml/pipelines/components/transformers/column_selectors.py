@@ -4,6 +4,9 @@ import numpy as np
 import pandas as pd
 
 from evalml.pipelines.components.transformers import Transformer
+from evalml.pipelines.components.transformers.transformer import (
+    _select_columns
+)
 
 
 class ColumnSelector(Transformer):
@@ -80,6 +83,9 @@ class ColumnSelector(Transformer):
         self.fit(X, y)
         return self.transform(X, y)
 
+    def _compile(self, input_columns, output_columns):
+        return _select_columns(input_columns, output_columns)
+
 
 class DropColumns(ColumnSelector):
     """Drops specified columns in input data."""
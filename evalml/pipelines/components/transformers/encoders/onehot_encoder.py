@@ -3,7 +3,7 @@ import numpy as np
 import pandas as pd
 from sklearn.preprocessing import OneHotEncoder as SKOneHotEncoder
 
-from ..transformer import Transformer
+from ..transformer import Transformer, _isnull
 
 from evalml.pipelines.components import ComponentBaseMeta
 
@@ -83,16 +83,16 @@ class OneHotEncoder(Transformer, metaclass=OneHotEncoderMeta):
         top_n = self.parameters['top_n']
         if not isinstance(X, pd.DataFrame):
             X = pd.DataFrame(X)
-        X_t = X
-
         if self.features_to_encode is None:
-            self.features_to_encode = self._get_cat_cols(X_t)
+            self.features_to_encode = self._get_cat_cols(X)
         invalid_features = [col for col in self.features_to_encode if col not in list(X.columns)]
         if len(invalid_features) > 0:
             raise ValueError("Could not find and encode {} in input data.".format(', '.join(invalid_features)))
 
+        # selecting the columns returns a new DataFrame, so missing values are replaced without modifying the input
+        X_t = X[self.features_to_encode]
         if self.parameters['handle_missing'] == "as_category":
-            X_t[self.features_to_encode] = X_t[self.features_to_encode].replace(np.nan, "nan")
+            X_t = X_t.replace(np.nan, "nan")
         elif self.parameters['handle_missing'] == "error" and X.isnull().any().any():
             raise ValueError("Input contains NaN")
 
@@ -140,8 +140,9 @@ class OneHotEncoder(Transformer, metaclass=OneHotEncoderMeta):
 
         cat_cols = self.features_to_encode
 
+        X_cat = X[cat_cols]
         if self.parameters['handle_missing'] == "as_category":
-            X[cat_cols] = X[cat_cols].replace(np.nan, "nan")
+            X_cat = X_cat.replace(np.nan, "nan")
         if self.parameters['handle_missing'] == "error" and X.isnull().any().any():
             raise ValueError("Input contains NaN")
 
@@ -156,13 +157,42 @@ class OneHotEncoder(Transformer, metaclass=OneHotEncoderMeta):
 
         # Call sklearn's transform on the categorical columns
         if len(cat_cols) > 0:
-            X_cat = pd.DataFrame(self._encoder.transform(X[cat_cols]).toarray(), index=X.index)
+            X_cat = pd.DataFrame(self._encoder.transform(X_cat).toarray(), index=X.index)
             cat_cols_str = [str(c) for c in cat_cols]
             X_cat.columns = self._encoder.get_feature_names(input_features=cat_cols_str)
             X_t = pd.concat([X_t, X_cat], axis=1)
 
         return X_t
 
+    def _compile(self, input_columns, output_columns):
+        if self.parameters['handle_unknown'] == 'error':
+            return None
+        handle_missing = self.parameters['handle_missing']
+        cat_cols = set(self.features_to_encode)
+        passthrough_positions = [position for position, column in enumerate(input_columns) if column not in cat_cols]
+        encodings = []
+        for index, feature in enumerate(self.features_to_encode):
+            categories = list(self._encoder.categories_[index])
+            if self._encoder.drop_idx_ is not None and self._encoder.drop_idx_[index] is not None:
+                del categories[self._encoder.drop_idx_[index]]
+            codes = {category: code for code, category in enumerate(categories)}
+            # the one-hot rows of each code, with a row of zeros last for unknown categories, which are given code -1
+            one_hot_rows = np.vstack([np.eye(len(codes)), np.zeros(len(codes))])
+            encodings.append((input_columns.index(feature), codes, codes.get("nan", -1), one_hot_rows))
+
+        def encode_columns(columns):
+            if handle_missing == "error" and any(column.dtype.kind in 'fcO' and _isnull(column).any() for column in columns):
+                raise ValueError("Input contains NaN")
+            output = [columns[position] for position in passthrough_positions]
+            for position, codes, missing_code, one_hot_rows in encodings:
+                column = columns[position]
+                encoded = np.fromiter((codes.get(value, -1) for value in column), dtype=np.intp, count=len(column))
+                if handle_missing == "as_category":
+                    encoded[_isnull(column)] = missing_code
+                output.extend(one_hot_rows[encoded].T)
+            return output
+        return encode_columns
+
     def categories(self, feature_name):
         """Returns a list of the unique categories to be encoded for the particular feature, in order.
 
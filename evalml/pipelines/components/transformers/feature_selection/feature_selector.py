@@ -1,6 +1,9 @@
 import pandas as pd
 
 from evalml.pipelines.components.transformers import Transformer
+from evalml.pipelines.components.transformers.transformer import (
+    _select_columns
+)
 
 
 class FeatureSelector(Transformer):
@@ -68,3 +71,6 @@ class FeatureSelector(Transformer):
             return pd.DataFrame(X_t, columns=selected_col_names, index=X.index).astype(col_types)
         else:
             return pd.DataFrame(X_t)
+
+    def _compile(self, input_columns, output_columns):
+        return _select_columns(input_columns, output_columns)
@@ -2,6 +2,7 @@ import pandas as pd
 
 from evalml.pipelines.components.transformers import Transformer
 from evalml.pipelines.components.transformers.imputers import SimpleImputer
+from evalml.pipelines.components.transformers.transformer import _fill_missing
 from evalml.utils.gen_utils import boolean, categorical_dtypes, numeric_dtypes
 
 
@@ -108,3 +109,11 @@ class Imputer(Transformer):
             X_null_dropped[X_categorical.columns] = self._categorical_imputer.transform(X_categorical)
 
         return X_null_dropped
+
+    def _compile(self, input_columns, output_columns):
+        fill_values = {}
+        if self._numeric_cols is not None:
+            fill_values.update(zip(self._numeric_cols, self._numeric_imputer._component_obj.statistics_))
+        if self._categorical_cols is not None:
+            fill_values.update(zip(self._categorical_cols, self._categorical_imputer._component_obj.statistics_))
+        return _fill_missing(input_columns, output_columns, fill_values)
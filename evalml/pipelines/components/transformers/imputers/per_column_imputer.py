@@ -4,6 +4,7 @@ from evalml.pipelines.components.transformers import Transformer
 from evalml.pipelines.components.transformers.imputers.simple_imputer import (
     SimpleImputer
 )
+from evalml.pipelines.components.transformers.transformer import _fill_missing
 
 
 class PerColumnImputer(Transformer):
@@ -99,3 +100,7 @@ class PerColumnImputer(Transformer):
 
         self.fit(X, y)
         return self.transform(X, y)
+
+    def _compile(self, input_columns, output_columns):
+        fill_values = {column: imputer._component_obj.statistics_[0] for column, imputer in self.imputers.items()}
+        return _fill_missing(input_columns, output_columns, fill_values)
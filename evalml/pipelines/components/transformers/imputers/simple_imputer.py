@@ -3,6 +3,7 @@ import pandas as pd
 from sklearn.impute import SimpleImputer as SkImputer
 
 from evalml.pipelines.components.transformers import Transformer
+from evalml.pipelines.components.transformers.transformer import _fill_missing
 
 
 class SimpleImputer(Transformer):
@@ -88,3 +89,6 @@ class SimpleImputer(Transformer):
             pd.DataFrame: Transformed X
         """
         return self.fit(X, y).transform(X, y)
+
+    def _compile(self, input_columns, output_columns):
+        return _fill_missing(input_columns, output_columns, dict(zip(input_columns, self._component_obj.statistics_)))
@@ -67,13 +67,14 @@ class DateTimeFeaturizer(Transformer):
             pd.DataFrame: Transformed X
         """
 
-        X_t = X
-        if not isinstance(X_t, pd.DataFrame):
-            X_t = pd.DataFrame(X_t)
+        if not isinstance(X, pd.DataFrame):
+            X = pd.DataFrame(X)
         features_to_extract = self.parameters["features_to_extract"]
         if len(features_to_extract) == 0:
-            return X_t
+            return X
+        # drop returns a new DataFrame, so the features are added without modifying the input
+        X_t = X.drop(self._date_time_col_names, axis=1)
         for col_name in self._date_time_col_names:
             for feature in features_to_extract:
-                X_t[f"{col_name}_{feature}"] = self._function_mappings[feature](X_t[col_name])
-        return X_t.drop(self._date_time_col_names, axis=1)
+                X_t[f"{col_name}_{feature}"] = self._function_mappings[feature](X[col_name])
+        return X_t
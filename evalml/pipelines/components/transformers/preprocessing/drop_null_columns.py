@@ -1,6 +1,9 @@
 import pandas as pd
 
 from evalml.pipelines.components.transformers import Transformer
+from evalml.pipelines.components.transformers.transformer import (
+    _select_columns
+)
 
 
 class DropNullColumns(Transformer):
@@ -52,3 +55,6 @@ class DropNullColumns(Transformer):
         if not isinstance(X, pd.DataFrame):
             X = pd.DataFrame(X)
         return X.drop(columns=self._cols_to_drop, axis=1)
+
+    def _compile(self, input_columns, output_columns):
+        return _select_columns(input_columns, output_columns)
@@ -1,3 +1,4 @@
+import numpy as np
 from sklearn.preprocessing import StandardScaler as SkScaler
 
 from evalml.pipelines.components.transformers import Transformer
@@ -16,3 +17,12 @@ class StandardScaler(Transformer):
         super().__init__(parameters=parameters,
                          component_obj=scaler,
                          random_state=random_state)
+
+    def _compile(self, input_columns, output_columns):
+        mean = self._component_obj.mean_ if self._component_obj.with_mean else np.zeros(len(input_columns))
+        scale = self._component_obj.scale_ if self._component_obj.with_std else np.ones(len(input_columns))
+
+        def scale_columns(columns):
+            return [(column.astype(np.float64) - column_mean) / column_scale
+                    for column, column_mean, column_scale in zip(columns, mean, scale)]
+        return scale_columns
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 from evalml.exceptions import MethodPropertyNotFoundError
@@ -58,3 +59,61 @@ class Transformer(ComponentBase):
         if not isinstance(X_t, pd.DataFrame) and isinstance(X, pd.DataFrame):
             return pd.DataFrame(X_t, columns=X.columns, index=X.index)
         return pd.DataFrame(X_t)
+
+    def _compile(self, input_columns, output_columns):
+        """Returns a function which applies the fitted transformer to a list of numpy arrays, one for each of the
+        input_columns, and returns a list of arrays for the output_columns. Returns None if the transformer can only
+        transform DataFrames, which is the default.
+
+        Arguments:
+            input_columns (list): the names of the columns the transformer was fit on, in order.
+            output_columns (list): the names of the columns the transformer outputs, in order.
+
+        Returns:
+            callable or None
+        """
+        return None
+
+
+def _select_columns(input_columns, output_columns):
+    """Returns a compiled transform which selects the output columns out of the input columns."""
+    positions = {column: position for position, column in enumerate(input_columns)}
+    output_positions = [positions[column] for column in output_columns]
+
+    def select_columns(columns):
+        return [columns[position] for position in output_positions]
+    return select_columns
+
+
+def _fill_missing(input_columns, output_columns, fill_values):
+    """Returns a compiled transform which selects the output columns out of the input columns, and replaces the
+    missing values of each column in fill_values with its fill value."""
+    positions = {column: position for position, column in enumerate(input_columns)}
+    output_positions = [(positions[column], fill_values.get(column)) for column in output_columns]
+
+    def fill_missing(columns):
+        output = []
+        for position, fill_value in output_positions:
+            column = columns[position]
+            if fill_value is not None and column.dtype.kind in 'fcO':
+                missing = _isnull(column)
+                if missing.any():
+                    column = column.astype(object if column.dtype.kind == 'O' or isinstance(fill_value, str) else np.float64)
+                    column[missing] = fill_value
+            output.append(column)
+        return output
+    return fill_missing
+
+
+def _isnull(column):
+    """Returns whether each value of a numpy array is missing, like pd.isnull but without its overhead on small arrays."""
+    kind = column.dtype.kind
+    if kind in 'fc':
+        return np.isnan(column)
+    if kind in 'mM':
+        return np.isnat(column)
+    if kind != 'O':
+        return np.zeros(len(column), dtype=bool)
+    if len(column) > 100:
+        return pd.isnull(column)
+    return np.array([not isinstance(value, str) and pd.isnull(value) for value in column], dtype=bool)
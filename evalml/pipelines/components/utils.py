@@ -9,7 +9,10 @@ from evalml.model_family.utils import handle_model_family
 from evalml.pipelines.components import ComponentBase, Estimator, Transformer
 from evalml.problem_types import ProblemTypes, handle_problem_types
 from evalml.utils import get_logger
-from evalml.utils.gen_utils import get_importable_subclasses
+from evalml.utils.gen_utils import (
+    _cache_until_new_subclass,
+    get_importable_subclasses
+)
 
 logger = get_logger(__file__)
 
@@ -101,13 +104,18 @@ def handle_component_class(component_class):
     if not isinstance(component_class, str):
         raise ValueError(("component_graph may only contain str or ComponentBase subclasses, not '{}'")
                          .format(type(component_class)))
-    component_classes = {component.name: component for component in all_components()}
+    component_classes = _component_classes_by_name()
     if component_class not in component_classes:
         raise MissingComponentError('Component "{}" was not found'.format(component_class))
     component_class = component_classes[component_class]
     return component_class
 
 
+@_cache_until_new_subclass
+def _component_classes_by_name():
+    return {component.name: component for component in all_components()}
+
+
 class WrappedSKClassifier(BaseEstimator, ClassifierMixin):
     """Scikit-learn classifier wrapper class."""
 
@@ -0,0 +1,121 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import cloudpickle
+import numpy as np
+import pandas as pd
+from joblib import effective_n_jobs
+
+from .pipeline_base import PipelineBase
+
+from evalml.exceptions import PipelineNotYetFittedError
+
+# the pipeline loaded by each worker process of a ParallelPredictor
+_worker_pipeline = None
+
+
+def _load_worker_pipeline(pipeline):
+    """Loads the pipeline of a worker process from a pipeline serialized with cloudpickle or the path of a saved pipeline."""
+    global _worker_pipeline
+    if isinstance(pipeline, bytes):
+        _worker_pipeline = cloudpickle.loads(pipeline)
+    elif os.path.isdir(pipeline) or pipeline.endswith('.zip'):
+        _worker_pipeline = PipelineBase.load_artifact(pipeline)
+    else:
+        _worker_pipeline = PipelineBase.load(pipeline)
+
+
+def _predict_shard(method, X, objective=None):
+    """Predicts a shard of the rows with the pipeline of the worker process."""
+    if method == 'predict':
+        return _worker_pipeline.predict(X, objective)
+    if not hasattr(_worker_pipeline, 'predict_proba'):
+        raise ValueError("Probability estimates are only available for classification pipelines")
+    return _worker_pipeline.predict_proba(X)
+
+
+class ParallelPredictor:
+    """Predicts with a fitted pipeline in a pool of worker processes, for scoring large datasets on more than one core.
+
+    Each worker loads the pipeline once, when it starts, and reuses it for every prediction it makes after that. Rows
+    are split into one shard per worker and the predictions of the shards are put back together in the order of the
+    rows. Only the shards and their predictions are sent between processes.
+    """
+
+    def __init__(self, pipeline, n_workers=-1, min_shard_rows=1000):
+        """Predicts with a fitted pipeline in a pool of worker processes.
+
+        Arguments:
+            pipeline (PipelineBase or str): the fitted pipeline, or the path of a pipeline saved with pipeline.save or
+                pipeline.save_artifact. A pipeline is serialized once and given to each worker when it starts. Passing a
+                path instead has each worker load the pipeline from the file. Artifact directories are memory mapped, so
+                workers on the same machine share the pages of the pipeline's arrays.
+            n_workers (int): the number of workers. If set to -1, one worker per CPU is used. For n_workers below -1,
+                (n_cpus + 1 + n_workers) are used.
+            min_shard_rows (int): the smallest number of rows to send to a worker, so that small inputs are split
+                between fewer workers. Defaults to 1000.
+        """
+        if isinstance(pipeline, PipelineBase):
+            if not pipeline._is_fitted:
+                raise PipelineNotYetFittedError(f'This {type(pipeline).__name__} is not fitted yet. You must fit it before predicting with a ParallelPredictor.')
+            self._pipeline = cloudpickle.dumps(pipeline)
+        elif isinstance(pipeline, str):
+            self._pipeline = pipeline
+        else:
+            raise ValueError(f"pipeline must be a PipelineBase or a path. Received {type(pipeline).__name__} instead")
+        if not isinstance(min_shard_rows, int) or min_shard_rows < 1:
+            raise ValueError(f"min_shard_rows must be a positive integer. Received {min_shard_rows} instead")
+        self.n_workers = effective_n_jobs(n_workers)
+        self.min_shard_rows = min_shard_rows
+        self._executor = None
+
+    def predict(self, X, objective=None):
+        """Make predictions using the pipeline in the worker processes.
+
+        Arguments:
+            X (pd.DataFrame or np.array): Data of shape [n_samples, n_features]
+            objective (Object or string): The objective to use to make predictions
+
+        Returns:
+            pd.Series: Predicted values, as returned by the pipeline's predict.
+        """
+        return self._predict('predict', X, objective)
+
+    def predict_proba(self, X):
+        """Make probability estimates for labels using the pipeline in the worker processes.
+
+        Arguments:
+            X (pd.DataFrame or np.array): Data of shape [n_samples, n_features]
+
+        Returns:
+            pd.DataFrame: Probability estimates, as returned by the pipeline's predict_proba.
+        """
+        return self._predict('predict_proba', X)
+
+    def close(self):
+        """Shuts the worker processes down. They are started again if the predictor is used after being closed."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_executor'] = None
+        return state
+
+    def _predict(self, method, X, *args):
+        if not isinstance(X, pd.DataFrame):
+            X = pd.DataFrame(X)
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.n_workers, initializer=_load_worker_pipeline,
+                                                 initargs=(self._pipeline,))
+        n_shards = max(1, min(self.n_workers, len(X) // self.min_shard_rows))
+        shards = [X.iloc[rows] for rows in np.array_split(np.arange(len(X)), n_shards)]
+        futures = [self._executor.submit(_predict_shard, method, shard, *args) for shard in shards]
+        return pd.concat([future.result() for future in futures], ignore_index=True)
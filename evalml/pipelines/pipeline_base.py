@@ -10,7 +10,19 @@ from collections import OrderedDict
 import cloudpickle
 import pandas as pd
 
+from .batch_prediction import (
+    _conform_chunk,
+    _open_sink,
+    _prefetch,
+    _read_chunks
+)
+from .compiled_pipeline import CompiledPipeline
 from .components import Estimator
+from .components.component_hooks import (
+    _add_hook,
+    _call_with_hooks,
+    _remove_hook
+)
 from .components.utils import handle_component_class
 
 from evalml.exceptions import (
@@ -18,6 +30,7 @@ from evalml.exceptions import (
     MissingComponentError,
     PipelineScoreError
 )
+from evalml.objectives.objective_base import _confusion_matrix
 from evalml.pipelines.pipeline_base_meta import PipelineBaseMeta
 from evalml.utils import (
     check_random_state_equality,
@@ -30,6 +43,13 @@ from evalml.utils import (
     log_title,
     safe_repr
 )
+from evalml.utils.artifacts import (
+    _load_pipeline_class,
+    _pipeline_class_spec,
+    load_object,
+    open_artifact,
+    save_object
+)
 
 logger = get_logger(__file__)
 
@@ -50,6 +70,15 @@ class PipelineBase(ABC, metaclass=PipelineBaseMeta):
     custom_hyperparameters = None
     custom_name = None
     problem_type = None
+    # TransformerCache used to reuse fitted transformers and their outputs. Set on an instance to enable it.
+    transformer_cache = None
+    # ComponentTelemetry used to record the time and memory each component takes. Set on an instance to enable it.
+    telemetry = None
+    _hooks = ()
+    # CompiledPipeline used by predict_one, compiled on first use
+    _compiled_pipeline = None
+    # dtypes of the columns the pipeline was fit on, used by predict_batches
+    _input_dtypes = None
 
     def __init__(self, parameters, random_state=0):
         """Machine learning pipeline made out of transformers and a estimator.
@@ -71,6 +100,7 @@ class PipelineBase(ABC, metaclass=PipelineBaseMeta):
 
         self._validate_estimator_problem_type()
         self._is_fitted = False
+        self._transformer_cache_keys = None
 
     @classproperty
     def name(cls):
@@ -184,20 +214,35 @@ class PipelineBase(ABC, metaclass=PipelineBaseMeta):
         Returns:
             pd.DataFrame - New transformed features.
         """
+        if self.transformer_cache is not None and self._transformer_cache_keys is not None:
+            return self.transformer_cache.transform(self.component_graph[:-1], self._transformer_cache_keys, X, hooks=self._component_hooks())
+        hooks = self._component_hooks()
         X_t = X
         for component in self.component_graph[:-1]:
-            X_t = component.transform(X_t)
+            X_t = _call_with_hooks(hooks, component, 'transform', X_t, component.transform, X_t)
         return X_t
 
     def _fit(self, X, y):
         X_t = X
         y_t = y
-        for component in self.component_graph[:-1]:
-            self.input_feature_names.update({component.name: list(pd.DataFrame(X_t))})
-            X_t = component.fit_transform(X_t, y_t)
+        self._transformer_cache_keys = None
+        self._compiled_pipeline = None
+        self._input_dtypes = X.dtypes
+        cached_fit = None
+        hooks = self._component_hooks()
+        if self.transformer_cache is not None:
+            cached_fit = self.transformer_cache.fit_transform(self.component_graph[:-1], X_t, y_t, self.random_state, hooks=hooks)
+        if cached_fit is not None:
+            transformers, X_t, input_feature_names, self._transformer_cache_keys = cached_fit
+            self.component_graph[:-1] = transformers
+            self.input_feature_names.update(input_feature_names)
+        else:
+            for component in self.component_graph[:-1]:
+                self.input_feature_names.update({component.name: list(pd.DataFrame(X_t))})
+                X_t = _call_with_hooks(hooks, component, 'fit_transform', X_t, component.fit_transform, X_t, y_t)
 
         self.input_feature_names.update({self.estimator.name: list(pd.DataFrame(X_t))})
-        self.estimator.fit(X_t, y_t)
+        _call_with_hooks(hooks, self.estimator, 'fit', X_t, self.estimator.fit, X_t, y_t)
 
     @abstractmethod
     def fit(self, X, y):
@@ -227,7 +272,118 @@ class PipelineBase(ABC, metaclass=PipelineBaseMeta):
             X = pd.DataFrame(X)
 
         X_t = self.compute_estimator_features(X)
-        return self.estimator.predict(X_t)
+        return _call_with_hooks(self._component_hooks(), self.estimator, 'predict', X_t, self.estimator.predict, X_t)
+
+    def compile(self):
+        """Compiles the fitted pipeline into a plan which predicts from numpy arrays, for low latency scoring.
+
+        Returns:
+            CompiledPipeline: the compiled pipeline, which uses the components as they are now.
+        """
+        return CompiledPipeline(self)
+
+    def predict_one(self, record):
+        """Make a prediction for a single record, without building a DataFrame. The pipeline is compiled the first time
+        this is called after it is fit, and the compiled pipeline is reused after that. If the pipeline can't be
+        compiled, or the compiled pipeline can't predict the record, the record is predicted with predict instead.
+
+        Arguments:
+            record (dict or tuple): The value of each column the pipeline was fit on, as a dict of column names to
+                values, or a tuple of the values in the order the pipeline was fit on.
+
+        Returns:
+            The predicted value, or the estimated label for classification pipelines.
+        """
+        return self._predict_record('predict', record)
+
+    def predict_batches(self, source, output, chunk_rows=10000, method='predict', objective=None, prefetch=False):
+        """Make predictions for data too large to load at once, reading, predicting and writing it one chunk at a time.
+
+        Each chunk is given the columns and dtypes of the data the pipeline was fit on before it is predicted, so that
+        chunks read from files are transformed the same way regardless of the values they happen to contain. Only the
+        current chunk and its predictions are held in memory, along with the next chunk when prefetch is True.
+
+        Arguments:
+            source (str or iterable): The path of a .csv or .parquet file, or an iterable of DataFrames such as a
+                generator. Reading parquet files requires pyarrow.
+            output (str or callable): The path of a .csv or .parquet file to write the predictions to, or a function
+                called with the predictions for each chunk, indexed like the chunk. Predictions are written in a
+                "prediction" column, and probability estimates in a column for each class.
+            chunk_rows (int): The number of rows to read from a file at a time. Defaults to 10000.
+            method (str): 'predict' or 'predict_proba'. Defaults to 'predict'.
+            objective (Object or string): The objective to use to make predictions, with method 'predict'.
+            prefetch (bool): Whether to read the next chunk on a background thread while the current chunk is
+                predicted. Defaults to False.
+
+        Returns:
+            int: The number of rows predicted.
+        """
+        if method not in ['predict', 'predict_proba']:
+            raise ValueError(f"method must be 'predict' or 'predict_proba'. Received {method} instead")
+        if method == 'predict_proba' and not hasattr(self, 'predict_proba'):
+            raise ValueError("Probability estimates are only available for classification pipelines")
+        if not isinstance(chunk_rows, int) or chunk_rows < 1:
+            raise ValueError(f"chunk_rows must be a positive integer. Received {chunk_rows} instead")
+        columns = list(self.input_feature_names[self.component_graph[0].name])
+        chunks = _read_chunks(source, columns, chunk_rows)
+        if prefetch:
+            chunks = _prefetch(chunks)
+        sink = _open_sink(output)
+        n_rows = 0
+        try:
+            for chunk in chunks:
+                if self._input_dtypes is not None:
+                    chunk = _conform_chunk(chunk, self._input_dtypes)
+                if method == 'predict':
+                    predictions = self.predict(chunk, objective=objective).to_frame('prediction')
+                else:
+                    predictions = self.predict_proba(chunk)
+                predictions.index = chunk.index
+                sink.write(predictions)
+                n_rows += len(chunk)
+        finally:
+            sink.close()
+        return n_rows
+
+    def _get_compiled_pipeline(self):
+        """Returns the compiled pipeline, compiling it if needed, or None if the pipeline can't be compiled."""
+        if self._compiled_pipeline is None:
+            try:
+                compiled_pipeline = self.compile()
+            except Exception as e:
+                logger.debug(f"Unable to compile {self.name}, predicting records with DataFrames instead: {e}")
+                compiled_pipeline = None
+            # False records that the pipeline can't be compiled, so that it isn't compiled again for every record
+            self._compiled_pipeline = compiled_pipeline or False
+        return self._compiled_pipeline or None
+
+    def _predict_record(self, method, record):
+        """Predicts a single record with the compiled pipeline, falling back to predicting it as a DataFrame with the
+        regular method if the pipeline can't be compiled or the compiled pipeline fails on the record."""
+        compiled_pipeline = self._get_compiled_pipeline()
+        if compiled_pipeline is not None:
+            try:
+                return getattr(compiled_pipeline, f'{method}_one')(record)
+            except Exception as e:
+                logger.debug(f"Compiled {self.name} failed to predict a record, predicting it with {method} instead: {e}")
+        X = self._record_frame(record)
+        if method == 'predict':
+            return self.predict(X).iloc[0]
+        return self.predict_proba(X).iloc[0].to_numpy()
+
+    def _record_frame(self, record):
+        """Returns a DataFrame of one row of the record, with the dtypes of the data the pipeline was fit on."""
+        columns = list(self.input_feature_names[self.component_graph[0].name])
+        if isinstance(record, dict):
+            values = [record[column] for column in columns]
+        else:
+            values = list(record)
+            if len(values) != len(columns):
+                raise ValueError(f"record must have {len(columns)} values. Received {len(values)} instead")
+        X = pd.DataFrame([values], columns=columns)
+        if self._input_dtypes is not None:
+            X = _conform_chunk(X, self._input_dtypes)
+        return X
 
     @abstractmethod
     def score(self, X, y, objectives):
@@ -260,11 +416,22 @@ class PipelineBase(ABC, metaclass=PipelineBaseMeta):
         """
         scored_successfully = OrderedDict()
         exceptions = OrderedDict()
+        # the confusion matrix of the predictions is counted once and shared by every objective computed from it
+        confusion_matrix = None
+        confusion_matrix_counted = False
         for objective in objectives:
             try:
                 if self.problem_type != objective.problem_type:
                     raise ValueError(f'Invalid objective {objective.name} specified for problem type {self.problem_type}')
-                score = self._score(X, y, y_pred_proba if objective.score_needs_proba else y_pred, objective)
+                uses_confusion_matrix = not objective.score_needs_proba and objective._can_score_from_confusion_matrix()
+                if uses_confusion_matrix and not confusion_matrix_counted:
+                    confusion_matrix = _confusion_matrix(y, y_pred)
+                    confusion_matrix_counted = True
+                if uses_confusion_matrix and confusion_matrix is not None:
+                    objective.validate_inputs(objective._standardize_input_type(y), objective._standardize_input_type(y_pred))
+                    score = objective._score_confusion_matrix(confusion_matrix)
+                else:
+                    score = self._score(X, y, y_pred_proba if objective.score_needs_proba else y_pred, objective)
                 scored_successfully.update({objective.name: score})
             except Exception as e:
                 tb = traceback.format_tb(sys.exc_info()[2])
@@ -466,6 +633,91 @@ class PipelineBase(ABC, metaclass=PipelineBaseMeta):
         with open(file_path, 'rb') as f:
             return cloudpickle.load(f)
 
+    def save_artifact(self, path):
+        """Saves the pipeline as an artifact, a directory or zip file holding the parameters and fitted state of the
+        pipeline and of each of its components as JSON, with their large arrays packed into binary files, which can be
+        loaded without pickle.
+
+        Arguments:
+            path (str): location to save the artifact. Paths ending in .zip are saved as zip files, other paths as
+                directories.
+
+        Returns:
+            None
+        """
+        with open_artifact(path, 'w') as artifact:
+            components = []
+            for position, component in enumerate(self.component_graph):
+                components.append(f"components/{position}/component.json")
+                save_object(artifact, components[-1], component)
+            state = self.__getstate__()
+            for attribute in ['component_graph', 'estimator', 'transformer_cache', 'telemetry', '_transformer_cache_keys']:
+                state.pop(attribute, None)
+            save_object(artifact, 'pipeline.json', state, pipeline_class=_pipeline_class_spec(type(self)), components=components)
+
+    @staticmethod
+    def load_artifact(path, mmap=True):
+        """Loads a pipeline saved with save_artifact.
+
+        Arguments:
+            path (str): location of the artifact.
+            mmap (bool): whether to memory map the arrays of an artifact directory, so that their data is only read from
+                disk when it is used. Arrays in zip files are always read. Defaults to True.
+
+        Returns:
+            PipelineBase object
+        """
+        with open_artifact(path) as artifact:
+            document = artifact.read_json('pipeline.json')
+            component_graph = [load_object(artifact, name, mmap=mmap) for name in document['components']]
+            pipeline_class = _load_pipeline_class(document['pipeline_class'])
+            pipeline = pipeline_class.__new__(pipeline_class)
+            pipeline.__dict__.update(load_object(artifact, 'pipeline.json', mmap=mmap, document=document))
+        pipeline.component_graph = component_graph
+        pipeline.estimator = component_graph[-1]
+        pipeline._transformer_cache_keys = None
+        return pipeline
+
+    @property
+    def hooks(self):
+        """Returns the hooks added to this pipeline, in the order they are called."""
+        return list(self._hooks)
+
+    def add_hook(self, hook):
+        """Adds a hook to be called before and after each call the pipeline makes to one of its components' fit,
+        fit_transform, transform, predict and predict_proba methods.
+
+        Arguments:
+            hook (ComponentHook): the hook to add.
+
+        Returns:
+            None
+        """
+        self._hooks = _add_hook(self._hooks, hook)
+
+    def remove_hook(self, hook):
+        """Removes a hook added to this pipeline.
+
+        Arguments:
+            hook (ComponentHook): the hook to remove.
+
+        Returns:
+            None
+        """
+        self._hooks = _remove_hook(self._hooks, hook)
+
+    def _component_hooks(self):
+        """Returns the hooks to call around each component call: the pipeline's hooks, then its telemetry if it is set."""
+        if self.telemetry is None:
+            return self._hooks
+        return self._hooks + (self.telemetry,)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop('_hooks', None)
+        state.pop('_compiled_pipeline', None)
+        return state
+
     def clone(self, random_state=0):
         """Constructs a new pipeline with the same parameters and components.
 
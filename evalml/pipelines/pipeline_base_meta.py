@@ -9,20 +9,17 @@ from evalml.utils.base_meta import BaseMeta
 class PipelineBaseMeta(BaseMeta):
     """Metaclass that overrides creating a new pipeline by wrapping methods with validators and setters"""
 
+    METHODS_TO_CHECK = BaseMeta.METHODS_TO_CHECK + ['compile', 'predict_one', 'predict_proba_one', 'predict_batches']
+
     @classmethod
     def check_for_fit(cls, method):
         """`check_for_fit` wraps a method that validates if `self._is_fitted` is `True`.
             It raises an exception if `False` and calls and returns the wrapped method if `True`.
         """
         @wraps(method)
-        def _check_for_fit(self, X=None, y=None):
+        def _check_for_fit(self, *args, **kwargs):
             klass = type(self).__name__
             if not self._is_fitted:
                 raise PipelineNotYetFittedError(f'This {klass} is not fitted yet. You must fit {klass} before calling {method.__name__}.')
-            elif X is None and y is None:
-                return method(self)
-            elif y is None:
-                return method(self, X)
-            else:
-                return method(self, X, y)
+            return method(self, *args, **kwargs)
         return _check_for_fit
@@ -0,0 +1,192 @@
+import copy
+import hashlib
+import threading
+from collections import OrderedDict, namedtuple
+
+import numpy as np
+import pandas as pd
+
+from .components.component_hooks import _call_with_hooks
+
+_FitEntry = namedtuple('_FitEntry', ['component', 'output', 'input_feature_names', 'random_state'])
+
+
+class TransformerCache:
+    """A least-recently-used cache of fitted transformers and the data they output, which can be shared between pipelines.
+
+    Pipelines with the same leading transformers, fit on the same data, produce the same fitted transformers and the
+    same transformed data. The cache reuses these instead of refitting them. This happens, for example, across the
+    pipelines of an automl search, which are all fit on the same cross-validation folds.
+
+    A fitted transformer is keyed by the classes and parameters of itself and all transformers before it in the
+    pipeline, together with a fingerprint of the training data and of the pipeline's random state before fitting.
+    The training data fingerprint covers its values and index, so each cross-validation fold gets its own entries.
+    When a transformer is reused, the pipeline's random state is moved to the state it would have had after fitting
+    the transformer. Reusing a transformer therefore gives the same results as fitting it.
+
+    The cache is safe to share between threads. Its entries are not pickled, so each process gets an empty cache.
+    """
+
+    def __init__(self, max_size=2**30):
+        """A least-recently-used cache of fitted transformers and the data they output.
+
+        Arguments:
+            max_size (int): the maximum total size of the cached data, in bytes. When it is exceeded, the least
+                recently used entries are evicted. Defaults to 1GB.
+        """
+        if max_size <= 0:
+            raise ValueError(f"max_size must be positive. Received {max_size} instead")
+        self.max_size = max_size
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_entries'] = OrderedDict()
+        state['size'] = 0
+        state['_lock'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def clear(self):
+        """Removes all entries from the cache."""
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def _get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def _put(self, key, value, size):
+        if size > self.max_size:
+            return
+        with self._lock:
+            if key in self._entries:
+                return
+            self._entries[key] = (value, size)
+            self.size += size
+            while self.size > self.max_size:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.size -= evicted_size
+
+    def fit_transform(self, components, X, y, random_state, hooks=()):
+        """Fits each transformer on the output of the one before it, reusing cached transformers where possible.
+
+        Arguments:
+            components (list(Transformer)): the transformers to fit, in pipeline order.
+            X (pd.DataFrame): the input training data of shape [n_samples, n_features]
+            y (pd.Series): the target training data of length [n_samples]
+            random_state (np.random.RandomState): the random state shared by the pipeline's components.
+            hooks (tuple(ComponentHook)): the hooks to call around the transformers which are fit instead of reused. Defaults to ().
+
+        Returns:
+            (list(Transformer), pd.DataFrame, dict, list): the fitted transformers, the transformed data, the names of
+                the input features of each transformer and the cache keys of the fitted transformers. Returns None if
+                the data can't be fingerprinted, in which case nothing was fit.
+        """
+        data_fingerprint = _fingerprint_data(X)
+        target_fingerprint = _fingerprint_data(y)
+        if data_fingerprint is None or target_fingerprint is None:
+            return None
+        key = ('fit', data_fingerprint, target_fingerprint, _fingerprint_random_state(random_state))
+        X_t = X
+        fitted_components = []
+        input_feature_names = {}
+        keys = []
+        for component in components:
+            key = (key, type(component), repr(component.parameters))
+            entry = self._get(key)
+            if entry is None:
+                input_feature_names[component.name] = list(pd.DataFrame(X_t))
+                X_t = _call_with_hooks(hooks, component, 'fit_transform', X_t, component.fit_transform, X_t, y)
+                entry = _FitEntry(copy.deepcopy(component), _copy_data(X_t), input_feature_names[component.name],
+                                  random_state.get_state())
+                self._put(key, entry, _data_size(X_t))
+            else:
+                random_state.set_state(entry.random_state)
+                component = copy.deepcopy(entry.component)
+                component.random_state = random_state
+                input_feature_names[component.name] = entry.input_feature_names
+                X_t = _copy_data(entry.output)
+            fitted_components.append(component)
+            keys.append(key)
+        return fitted_components, X_t, input_feature_names, keys
+
+    def transform(self, components, keys, X, hooks=()):
+        """Applies each fitted transformer to the output of the one before it, reusing cached outputs where possible.
+
+        Arguments:
+            components (list(Transformer)): the fitted transformers, in pipeline order.
+            keys (list): the cache keys returned by fit_transform for the transformers.
+            X (pd.DataFrame): the data to transform.
+            hooks (tuple(ComponentHook)): the hooks to call around the transforms which are computed instead of reused. Defaults to ().
+
+        Returns:
+            pd.DataFrame: the transformed data.
+        """
+        data_fingerprint = _fingerprint_data(X)
+        if data_fingerprint is None:
+            X_t = X
+            for component in components:
+                X_t = _call_with_hooks(hooks, component, 'transform', X_t, component.transform, X_t)
+            return X_t
+        X_t = X
+        for component, fit_key in zip(components, keys):
+            key = ('transform', fit_key, data_fingerprint)
+            output = self._get(key)
+            if output is None:
+                X_t = _call_with_hooks(hooks, component, 'transform', X_t, component.transform, X_t)
+                self._put(key, _copy_data(X_t), _data_size(X_t))
+            else:
+                X_t = _copy_data(output)
+        return X_t
+
+
+def _fingerprint_data(data):
+    """Returns a hash of the values, index, columns and dtypes of the data, or None if the data can't be hashed."""
+    if data is None:
+        return None
+    if not isinstance(data, (pd.DataFrame, pd.Series)):
+        data = pd.DataFrame(data) if np.ndim(data) > 1 else pd.Series(data)
+    try:
+        hashed_values = pd.util.hash_pandas_object(data, index=True).values
+    except TypeError:
+        return None
+    if isinstance(data, pd.DataFrame):
+        description = repr((list(data.columns), list(data.dtypes)))
+    else:
+        description = repr((data.name, data.dtype))
+    return hashlib.sha1(hashed_values.tobytes() + description.encode()).hexdigest()
+
+
+def _fingerprint_random_state(random_state):
+    algorithm, keys, position, has_gauss, cached_gaussian = random_state.get_state()
+    return hashlib.sha1(keys.tobytes() + repr((algorithm, position, has_gauss, cached_gaussian)).encode()).hexdigest()
+
+
+def _copy_data(data):
+    return data.copy() if hasattr(data, 'copy') else copy.deepcopy(data)
+
+
+def _data_size(data):
+    if isinstance(data, pd.DataFrame):
+        return int(data.memory_usage(index=True, deep=True).sum())
+    if isinstance(data, pd.Series):
+        return int(data.memory_usage(index=True, deep=True))
+    return int(getattr(data, 'nbytes', 0))
@@ -1,4 +1,5 @@
 import os
+import time
 from itertools import product
 from unittest.mock import MagicMock, patch
 
@@ -10,9 +11,11 @@ from sklearn.model_selection import KFold, StratifiedKFold
 
 from evalml import AutoMLSearch
 from evalml.automl import (
+    SequentialEngine,
     TrainingValidationSplit,
     get_default_primary_search_objective
 )
+from evalml.automl.automl_algorithm import IterativeAlgorithm
 from evalml.data_checks import (
     DataCheck,
     DataCheckError,
@@ -47,7 +50,7 @@ from evalml.utils.gen_utils import (
 
 @pytest.mark.parametrize("automl_type", [ProblemTypes.REGRESSION, ProblemTypes.BINARY, ProblemTypes.MULTICLASS])
 def test_search_results(X_y_regression, X_y_binary, X_y_multi, automl_type):
-    expected_cv_data_keys = {'all_objective_scores', 'score', 'binary_classification_threshold'}
+    expected_cv_data_keys = {'all_objective_scores', 'score', 'binary_classification_threshold', 'component_telemetry'}
     automl = AutoMLSearch(problem_type=automl_type, max_iterations=2)
     if automl_type == ProblemTypes.REGRESSION:
         expected_pipeline_class = RegressionPipeline
@@ -66,7 +69,7 @@ def test_search_results(X_y_regression, X_y_binary, X_y_multi, automl_type):
     for pipeline_id, results in automl.results['pipeline_results'].items():
         assert results.keys() == {'id', 'pipeline_name', 'pipeline_class', 'pipeline_summary', 'parameters', 'score', 'high_variance_cv', 'training_time',
                                   'cv_data', 'percent_better_than_baseline_all_objectives',
-                                  'percent_better_than_baseline', 'validation_score'}
+                                  'percent_better_than_baseline', 'validation_score', 'budget', 'pruned', 'component_telemetry'}
         assert results['id'] == pipeline_id
         assert isinstance(results['pipeline_name'], str)
         assert issubclass(results['pipeline_class'], expected_pipeline_class)
@@ -86,6 +89,8 @@ def test_search_results(X_y_regression, X_y_binary, X_y_multi, automl_type):
                 assert score is not None
         assert automl.get_pipeline(pipeline_id).parameters == results['parameters']
         assert results['validation_score'] == pd.Series([fold['score'] for fold in results['cv_data']])[0]
+        assert results['budget'] == 1.0
+        assert not results['pruned']
     assert isinstance(automl.rankings, pd.DataFrame)
     assert isinstance(automl.full_rankings, pd.DataFrame)
     assert np.all(automl.rankings.dtypes == pd.Series(
@@ -920,6 +925,22 @@ def test_results_getter(mock_fit, mock_score, caplog, X_y_binary):
     assert automl.results['pipeline_results'][0]['score'] == 1.0
 
 
+@patch('evalml.pipelines.BinaryClassificationPipeline.score')
+@patch('evalml.pipelines.BinaryClassificationPipeline.fit')
+def test_iteration_scores(mock_fit, mock_score, X_y_binary):
+    X, y = X_y_binary
+    automl = AutoMLSearch(problem_type='binary', max_iterations=3)
+    assert automl.iteration_scores() == []
+
+    mock_score.side_effect = [{'Log Loss Binary': score} for score in np.arange(9.0)]
+    automl.search(X, y)
+    results = automl.results
+    expected = [(id, results['pipeline_results'][id]['score']) for id in results['search_order']]
+    assert automl.iteration_scores() == expected == [(0, 1.0), (1, 4.0), (2, 7.0)]
+    assert automl.iteration_scores(2) == expected[2:]
+    assert automl.iteration_scores(3) == []
+
+
 @pytest.mark.parametrize("automl_type", [ProblemTypes.BINARY, ProblemTypes.MULTICLASS])
 @pytest.mark.parametrize("target_type", numeric_and_boolean_dtypes + categorical_dtypes)
 def test_targets_data_types_classification(automl_type, target_type):
@@ -1045,7 +1066,7 @@ def test_pipelines_in_batch_return_none(mock_evaluate, mock_next_batch, X_y_bina
         automl.search(X, y)
 
 
-@patch('evalml.automl.automl_search.train_test_split')
+@patch('evalml.automl.engine.engine_base.train_test_split')
 @patch('evalml.pipelines.BinaryClassificationPipeline.score')
 @patch('evalml.pipelines.BinaryClassificationPipeline.fit')
 def test_error_during_train_test_split(mock_fit, mock_score, mock_train_test_split, X_y_binary):
@@ -1328,3 +1349,291 @@ def test_get_default_primary_search_objective():
     assert isinstance(get_default_primary_search_objective(ProblemTypes.REGRESSION), R2)
     with pytest.raises(KeyError, match="Problem type 'auto' does not exist"):
         get_default_primary_search_objective("auto")
+
+
+@pytest.mark.parametrize("optimize_thresholds", [True, False])
+def test_compute_cv_scores_parallel_matches_serial(optimize_thresholds, X_y_binary, logistic_regression_binary_pipeline_class):
+    X, y = X_y_binary
+    X = pd.DataFrame(X)
+    y = pd.Series(y)
+    pipeline = logistic_regression_binary_pipeline_class(parameters={})
+
+    cv_results = []
+    for n_jobs in [1, 3]:
+        automl = AutoMLSearch(problem_type='binary', objective='F1', optimize_thresholds=optimize_thresholds,
+                              data_split=StratifiedKFold(3), n_jobs=n_jobs)
+        automl._set_data_split(X)
+        cv_results.append(automl._compute_cv_scores(pipeline, X, y))
+
+    serial, parallel = cv_results
+    assert len(parallel['cv_data']) == 3
+    for serial_fold, parallel_fold in zip(serial['cv_data'], parallel['cv_data']):
+        assert serial_fold['all_objective_scores'] == parallel_fold['all_objective_scores']
+        assert serial_fold['binary_classification_threshold'] == parallel_fold['binary_classification_threshold']
+    pd.testing.assert_series_equal(serial['cv_scores'], parallel['cv_scores'])
+
+
+@patch('evalml.automl.engine.engine_base.Parallel')
+def test_compute_cv_scores_n_jobs(mock_parallel, X_y_binary, dummy_binary_pipeline_class):
+    X, y = X_y_binary
+    mock_parallel.return_value.return_value = [{'score': 1.0}]
+    automl = AutoMLSearch(problem_type='binary', data_split=StratifiedKFold(3), n_jobs=2)
+    automl._compute_cv_scores(dummy_binary_pipeline_class(parameters={}), pd.DataFrame(X), pd.Series(y))
+    mock_parallel.assert_called_once_with(n_jobs=2, prefer="threads")
+
+    mock_parallel.reset_mock()
+    automl = AutoMLSearch(problem_type='binary', data_split=TrainingValidationSplit(), n_jobs=2)
+    automl._compute_cv_scores(dummy_binary_pipeline_class(parameters={}), pd.DataFrame(X), pd.Series(y))
+    mock_parallel.assert_called_once_with(n_jobs=1, prefer="threads")
+
+    mock_parallel.reset_mock()
+    automl = AutoMLSearch(problem_type='binary', data_split=StratifiedKFold(3), n_jobs=2, parallel_batches=True)
+    automl._compute_cv_scores(dummy_binary_pipeline_class(parameters={}), pd.DataFrame(X), pd.Series(y))
+    mock_parallel.assert_called_once_with(n_jobs=1, prefer="threads")
+
+
+@pytest.mark.parametrize("n_jobs,n_folds,expected_n_jobs",
+                         [(1, 3, -1), (2, 3, 4), (3, 3, 2), (-1, 3, 2), (8, 3, 2), (3, 1, -1), (2, 8, 4), (8, 8, 1)])
+@patch('evalml.automl.engine.engine_base.effective_n_jobs', side_effect=lambda n_jobs: 8 if n_jobs == -1 else n_jobs)
+@patch('evalml.automl.engine.engine_base._train_and_score_fold', return_value={'score': 1.0})
+def test_compute_cv_scores_caps_component_n_jobs(mock_train_and_score_fold, mock_effective_n_jobs, n_jobs, n_folds,
+                                                 expected_n_jobs, X_y_binary, logistic_regression_binary_pipeline_class):
+    X, y = X_y_binary
+    data_split = TrainingValidationSplit() if n_folds == 1 else StratifiedKFold(n_folds)
+    automl = AutoMLSearch(problem_type='binary', data_split=data_split, n_jobs=n_jobs)
+    pipeline = logistic_regression_binary_pipeline_class(parameters={'Logistic Regression Classifier': {'n_jobs': -1}})
+    automl._compute_cv_scores(pipeline, pd.DataFrame(X), pd.Series(y))
+    # each fold thread trains with its share of the 8 CPUs, and the pipeline reported in the results is unchanged
+    fold_pipelines = [call[0][0] for call in mock_train_and_score_fold.call_args_list]
+    assert len(fold_pipelines) == n_folds
+    assert all(fold_pipeline.parameters['Logistic Regression Classifier']['n_jobs'] == expected_n_jobs for fold_pipeline in fold_pipelines)
+    assert all(fold_pipeline.parameters['Imputer'] == pipeline.parameters['Imputer'] for fold_pipeline in fold_pipelines)
+    assert pipeline.parameters['Logistic Regression Classifier']['n_jobs'] == -1
+
+
+def test_parallel_batches_matches_serial_search(X_y_binary, logistic_regression_binary_pipeline_class):
+    X, y = X_y_binary
+    results = []
+    for parallel_batches in [False, True]:
+        start_iteration_callback = MagicMock()
+        add_result_callback = MagicMock()
+        automl = AutoMLSearch(problem_type='binary', max_iterations=8, n_jobs=2, parallel_batches=parallel_batches,
+                              allowed_pipelines=[logistic_regression_binary_pipeline_class],
+                              start_iteration_callback=start_iteration_callback,
+                              add_result_callback=add_result_callback)
+        automl.search(X, y)
+        assert len(automl.results['pipeline_results']) == 8
+        assert start_iteration_callback.call_count == 8
+        assert add_result_callback.call_count == 8
+        results.append(automl.full_rankings)
+    serial, parallel = results
+    pd.testing.assert_frame_equal(serial.drop(columns=['parameters']), parallel.drop(columns=['parameters']))
+    assert list(serial['parameters']) == list(parallel['parameters'])
+
+
+@patch('evalml.automl.engine.engine_base.train_and_score_pipeline')
+def test_evaluate_batch_skips_pipelines_after_max_time(mock_train_and_score, X_y_binary, dummy_binary_pipeline_class):
+    X, y = X_y_binary
+    mock_train_and_score.return_value = {'cv_score_mean': 1.0}
+    pipelines = [dummy_binary_pipeline_class(parameters={}), dummy_binary_pipeline_class(parameters={})]
+    automl = AutoMLSearch(problem_type='binary', max_time=10, parallel_batches=True, engine=SequentialEngine())
+
+    automl._start = time.time()
+    assert automl._evaluate_batch(pipelines, X, y) == [{'cv_score_mean': 1.0}, {'cv_score_mean': 1.0}]
+    assert mock_train_and_score.call_count == 2
+
+    mock_train_and_score.reset_mock()
+    automl._start = time.time() - 11
+    assert automl._evaluate_batch(pipelines, X, y) == [None, None]
+    mock_train_and_score.assert_not_called()
+
+
+@pytest.mark.parametrize("max_iterations,n_results,expected", [(None, 3, 5), (10, 3, 5), (6, 3, 3), (4, 4, 0)])
+def test_split_batch_for_parallel_evaluation(max_iterations, n_results, expected):
+    automl = AutoMLSearch(problem_type='binary', max_iterations=max_iterations, max_time=10, parallel_batches=True)
+    automl._results['pipeline_results'] = {i: {} for i in range(n_results)}
+    batch = list(range(5))
+    to_evaluate, remaining = automl._split_batch_for_parallel_evaluation(batch)
+    assert to_evaluate == batch[:expected]
+    assert remaining == batch[expected:]
+
+
+@pytest.mark.parametrize("when_to_interrupt,user_input,number_results",
+                         [(1, interrupt, 0),
+                          (1, dont_interrupt, 5),
+                          (3, interrupt, 1),
+                          (3, dont_interrupt_after_bad_message, 5),
+                          (5, interrupt, 1),
+                          (5, dont_interrupt, 5)])
+@patch("builtins.input")
+@patch('evalml.pipelines.BinaryClassificationPipeline.score', return_value={"F1": 1.0})
+@patch('evalml.pipelines.BinaryClassificationPipeline.fit')
+def test_catch_keyboard_interrupt_parallel_batches(mock_fit, mock_score, mock_input,
+                                                   when_to_interrupt, user_input, number_results,
+                                                   X_y_binary):
+    mock_input.side_effect = user_input
+    X, y = X_y_binary
+    callback = KeyboardInterruptOnKthPipeline(k=when_to_interrupt)
+    automl = AutoMLSearch(problem_type="binary", max_iterations=5, start_iteration_callback=callback, objective="f1",
+                          parallel_batches=True)
+    automl.search(X, y)
+
+    assert len(automl._results['pipeline_results']) == number_results
+
+
+@pytest.mark.parametrize("parallel_batches", [False, True])
+@patch('builtins.input', return_value="n")
+@patch('evalml.pipelines.BinaryClassificationPipeline.score', return_value={"F1": 1.0})
+@patch('evalml.pipelines.BinaryClassificationPipeline.fit')
+def test_catch_keyboard_interrupt_next_batch(mock_fit, mock_score, mock_input, parallel_batches, X_y_binary):
+    X, y = X_y_binary
+    automl = AutoMLSearch(problem_type="binary", max_iterations=5, objective="f1", parallel_batches=parallel_batches)
+    next_batch = IterativeAlgorithm.next_batch
+    n_calls = []
+
+    def interrupt_first_call(algorithm):
+        n_calls.append(1)
+        if len(n_calls) == 1:
+            raise KeyboardInterrupt
+        return next_batch(algorithm)
+
+    with patch.object(IterativeAlgorithm, 'next_batch', autospec=True, side_effect=interrupt_first_call):
+        automl.search(X, y)
+    assert len(automl._results['pipeline_results']) == 5
+    assert list(automl._results['search_order']) == list(range(5))
+
+
+@pytest.mark.parametrize("user_input,number_results", [(interrupt, 2), (dont_interrupt, 5)])
+@patch('builtins.input')
+@patch('evalml.pipelines.BinaryClassificationPipeline.score', return_value={"F1": 1.0})
+@patch('evalml.pipelines.BinaryClassificationPipeline.fit')
+def test_catch_keyboard_interrupt_recording_parallel_batch(mock_fit, mock_score, mock_input, user_input, number_results,
+                                                           X_y_binary):
+    mock_input.side_effect = user_input
+    X, y = X_y_binary
+    callback = KeyboardInterruptOnKthPipeline(k=2)
+    automl = AutoMLSearch(problem_type="binary", max_iterations=5, objective="f1", parallel_batches=True,
+                          add_result_callback=lambda results, pipeline, automl_obj: callback(None, None, None))
+    automl.search(X, y)
+
+    # the interrupt happens while recording the batch's first result, the batch's other results are dropped and their
+    # pipelines are evaluated again if the search continues
+    results = automl._results['pipeline_results']
+    assert len(results) == number_results
+    assert list(automl._results['search_order']) == list(range(number_results))
+    pipeline_names = [result['pipeline_name'] for result in results.values()]
+    assert len(set(pipeline_names)) == len(pipeline_names)
+
+
+@pytest.mark.parametrize("from_journal", [False, True])
+def test_automl_warm_start(from_journal, X_y_binary, logistic_regression_binary_pipeline_class, tmpdir):
+    X, y = X_y_binary
+    path = os.path.join(str(tmpdir), 'journal.jsonl')
+    previous = AutoMLSearch(problem_type='binary', objective='F1', max_iterations=7, journal=path,
+                            allowed_pipelines=[logistic_regression_binary_pipeline_class])
+    previous.search(X, y)
+
+    automl = AutoMLSearch(problem_type='binary', max_iterations=3, allowed_pipelines=[logistic_regression_binary_pipeline_class])
+    automl.warm_start(path if from_journal else previous.results)
+    # the baseline isn't allowed in the search, so its result is ignored by the automl algorithm
+    assert len(automl._warm_start_results) == 7
+    automl.search(X, y)
+    tuner = automl._automl_algorithm._tuners[logistic_regression_binary_pipeline_class.name]
+    # the previous results are scored on this search's primary objective, Log Loss Binary, which is minimized
+    expected_scores = [np.mean([fold['all_objective_scores']['Log Loss Binary'] for fold in previous.results['pipeline_results'][id]['cv_data']])
+                       for id in range(1, 7)]
+    np.testing.assert_allclose(tuner.opt.yi[:6], expected_scores)
+    assert len(tuner.opt.yi) == 6 + 2
+
+    with pytest.raises(ValueError, match="warm_start must be called before search"):
+        automl.warm_start(previous.results)
+
+
+@patch.object(AutoMLSearch, '_PROGRESSIVE_SAMPLING_GROWTH', 2)
+@patch.object(AutoMLSearch, '_LARGE_DATA_ROW_THRESHOLD', 30)
+def test_automl_progressive_sampling(X_y_binary, logistic_regression_binary_pipeline_class, caplog):
+    X, y = X_y_binary
+    automl = AutoMLSearch(problem_type='binary', max_iterations=6, progressive_sampling=True,
+                          data_split=StratifiedKFold(n_splits=3), allowed_pipelines=[logistic_regression_binary_pipeline_class])
+    assert 'Progressive Sampling: True' in str(automl)
+    automl.search(X, y)
+    results = automl.results['pipeline_results']
+    budgets = [results[id]['budget'] for id in automl.results['search_order']]
+    # the baseline is evaluated on all of the data, so that it's ranked with the pipelines promoted to all of the data
+    assert budgets == [1.0, 0.3, 0.6, 1.0, 1.0, 1.0]
+    n_training_rows = [results[id]['cv_data'][0]['all_objective_scores']['# Training'] for id in automl.results['search_order']]
+    assert n_training_rows[:4] == [66, 20, 40, 66]
+    assert automl._automl_algorithm.sample_budgets == [0.3, 0.6]
+    assert set(automl.full_rankings['id']) == set(range(6))
+    assert 0 in set(automl.rankings['id'])
+    assert automl.rankings['id'].iloc[0] in {3, 4, 5}
+    assert not np.isnan(results[3]['percent_better_than_baseline'])
+
+    caplog.clear()
+    automl.describe_pipeline(1)
+    assert "Evaluated on 30.0% of the rows" in caplog.text
+
+
+@patch.object(AutoMLSearch, '_LARGE_DATA_ROW_THRESHOLD', 30)
+@patch('evalml.pipelines.BinaryClassificationPipeline.score', return_value={"Log Loss Binary": 0.5})
+@patch('evalml.pipelines.BinaryClassificationPipeline.fit')
+def test_automl_progressive_sampling_max_batches(mock_fit, mock_score, X_y_binary):
+    X, y = X_y_binary
+    automl = AutoMLSearch(problem_type='binary', progressive_sampling=True, _max_batches=2)
+    automl.search(X, y)
+    n_families = len(automl.allowed_pipelines)
+    n_base_round = n_families + max(min(3, n_families), int(np.ceil(n_families / 2)))
+    assert automl.max_iterations == 1 + n_base_round + automl._pipelines_per_batch
+    assert len(automl.results['pipeline_results']) == automl.max_iterations
+    assert automl._automl_algorithm.batch_number == 3
+
+
+def test_automl_progressive_sampling_below_threshold(X_y_binary, logistic_regression_binary_pipeline_class):
+    X, y = X_y_binary
+    automl = AutoMLSearch(problem_type='binary', max_iterations=3, progressive_sampling=True,
+                          allowed_pipelines=[logistic_regression_binary_pipeline_class])
+    automl.search(X, y)
+    assert automl._automl_algorithm.sample_budgets == []
+    assert all(result['budget'] == 1.0 for result in automl.results['pipeline_results'].values())
+
+
+@patch.object(AutoMLSearch, '_PROGRESSIVE_SAMPLING_GROWTH', 2)
+@patch.object(AutoMLSearch, '_LARGE_DATA_ROW_THRESHOLD', 30)
+@patch('builtins.input', return_value="y")
+def test_automl_progressive_sampling_add_to_rankings(mock_input, X_y_binary, logistic_regression_binary_pipeline_class):
+    class RandomForestBinaryPipeline(BinaryClassificationPipeline):
+        component_graph = ['Imputer', 'One Hot Encoder', 'Random Forest Classifier']
+
+    X, y = X_y_binary
+    automl = AutoMLSearch(problem_type='binary', max_iterations=6, progressive_sampling=True, data_split=StratifiedKFold(n_splits=3),
+                          allowed_pipelines=[logistic_regression_binary_pipeline_class, RandomForestBinaryPipeline],
+                          start_iteration_callback=KeyboardInterruptOnKthPipeline(k=3))
+    next_batch = IterativeAlgorithm.next_batch
+    batches = []
+
+    def record_batch(algorithm):
+        batch = next_batch(algorithm)
+        batches.append(list(batch))
+        return batch
+
+    with patch.object(IterativeAlgorithm, 'next_batch', autospec=True, side_effect=record_batch):
+        automl.search(X, y)
+    # the search was stopped in the middle of the first subsample
+    assert [result['budget'] for result in automl.results['pipeline_results'].values()] == [1.0, 0.3]
+    automl.add_to_rankings(batches[-1][1], X, y)
+    result = automl.results['pipeline_results'][2]
+    assert result['budget'] == 1.0
+    assert result['cv_data'][0]['all_objective_scores']['# Training'] == 66
+    assert 2 in set(automl.rankings['id'])
+
+
+def test_automl_progressive_sampling_algorithm():
+    with pytest.raises(ValueError, match="progressive_sampling can only be used with the 'iterative' automl_algorithm"):
+        AutoMLSearch(problem_type='binary', automl_algorithm='hyperband', progressive_sampling=True)
+
+
+def test_training_validation_split_positions():
+    X = pd.DataFrame({'col_0': range(20)}, index=range(100, 120))
+    [(train, test)] = TrainingValidationSplit(test_size=0.25).split(X)
+    assert sorted(np.concatenate([train, test])) == list(range(20))
+    assert len(test) == 5
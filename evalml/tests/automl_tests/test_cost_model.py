@@ -0,0 +1,132 @@
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from evalml.automl import AutoMLSearch, RuntimeCostModel
+from evalml.automl.automl_algorithm import IterativeAlgorithm
+from evalml.automl.engine import train_and_score_pipeline
+from evalml.model_family import ModelFamily
+
+
+def test_cost_model_init():
+    assert RuntimeCostModel().time_limit_factor == 5
+    with pytest.raises(ValueError, match="time_limit_factor must be greater than 1"):
+        RuntimeCostModel(time_limit_factor=1)
+
+
+def test_cost_model_predict():
+    cost_model = RuntimeCostModel()
+    assert cost_model.predict(ModelFamily.LINEAR_MODEL, 100, 10) is None
+    cost_model.add(ModelFamily.LINEAR_MODEL, 100, 10, 1.0)
+    assert cost_model.predict(ModelFamily.LINEAR_MODEL, 100, 10) == pytest.approx(1.0)
+    assert cost_model.predict(ModelFamily.LINEAR_MODEL, 200, 20) == pytest.approx(4.0)
+    assert cost_model.predict(ModelFamily.RANDOM_FOREST, 100, 10) is None
+
+    # the median rate is used, so a single outlier doesn't change the prediction
+    cost_model.add(ModelFamily.LINEAR_MODEL, 100, 10, 1.0)
+    cost_model.add(ModelFamily.LINEAR_MODEL, 100, 10, 100.0)
+    assert cost_model.predict(ModelFamily.LINEAR_MODEL, 100, 10) == pytest.approx(1.0)
+
+    cost_model.add(ModelFamily.RANDOM_FOREST, 0, 10, 1.0)
+    cost_model.add(ModelFamily.RANDOM_FOREST, 100, 10, np.nan)
+    assert cost_model.predict(ModelFamily.RANDOM_FOREST, 100, 10) is None
+    cost_model.add(ModelFamily.RANDOM_FOREST, 100, 0, 2.0)
+    assert cost_model.predict(ModelFamily.RANDOM_FOREST, 50, 0) == pytest.approx(1.0)
+
+
+def test_train_and_score_pipeline_time_limit(X_y_binary, logistic_regression_binary_pipeline_class):
+    X, y = X_y_binary
+    X, y = pd.DataFrame(X), pd.Series(y)
+    automl = AutoMLSearch(problem_type='binary')
+    automl._set_data_split(X)
+    pipeline = logistic_regression_binary_pipeline_class({})
+    automl_config = automl._get_automl_config()._replace(time_limit=1e6)
+    results = train_and_score_pipeline(pipeline, automl_config, X, y)
+    assert not results['pruned']
+    assert len(results['cv_data']) == 3
+
+    automl_config = automl_config._replace(time_limit=0)
+    results = train_and_score_pipeline(pipeline, automl_config, X, y)
+    assert results['pruned']
+    assert len(results['cv_data']) == 1
+
+
+def test_automl_invalid_cost_model():
+    with pytest.raises(ValueError, match="Not a valid cost model"):
+        AutoMLSearch(problem_type='binary', cost_model='linear')
+
+
+def test_automl_cost_model_learns(X_y_binary, logistic_regression_binary_pipeline_class):
+    X, y = X_y_binary
+    cost_model = RuntimeCostModel()
+    automl = AutoMLSearch(problem_type='binary', max_iterations=3, cost_model=cost_model,
+                          allowed_pipelines=[logistic_regression_binary_pipeline_class])
+    assert 'Cost Model: RuntimeCostModel' in str(automl)
+    automl.search(X, y)
+    assert len(cost_model._rates[ModelFamily.BASELINE]) == 1
+    assert len(cost_model._rates[ModelFamily.LINEAR_MODEL]) == 2
+    results = automl.results['pipeline_results']
+    assert all(results[id]['budget'] == 1.0 for id in automl.results['search_order'])
+
+
+@pytest.mark.parametrize("parallel_batches", [False, True])
+def test_automl_cost_model_downsizes_and_skips(parallel_batches, X_y_binary, logistic_regression_binary_pipeline_class, caplog):
+    X, y = X_y_binary
+    automl = AutoMLSearch(problem_type='binary', max_iterations=10, max_time=10000, cost_model=RuntimeCostModel(),
+                          allowed_pipelines=[logistic_regression_binary_pipeline_class], parallel_batches=parallel_batches)
+    # the first pipeline fits in the remaining time, the second only fits on about half of the rows and the rest don't fit at all
+    pipeline_ids = []
+
+    def predict_training_time(pipeline, n_rows, n_features):
+        if pipeline.model_family == ModelFamily.BASELINE:
+            return None
+        if id(pipeline) not in pipeline_ids:
+            pipeline_ids.append(id(pipeline))
+        return [10, 20000][pipeline_ids.index(id(pipeline))] * n_rows / len(X) if len(pipeline_ids) <= 2 else 1e6
+
+    with patch.object(AutoMLSearch, '_predict_training_time', side_effect=predict_training_time), \
+            patch.object(IterativeAlgorithm, 'add_result', autospec=True, side_effect=IterativeAlgorithm.add_result) as mock_add_result:
+        automl.search(X, y)
+    results = automl.results['pipeline_results']
+    budgets = [results[id]['budget'] for id in automl.results['search_order']]
+    assert len(budgets) == 3
+    # the algorithm is told the downsized pipeline was only evaluated on a subsample, so it isn't tuned on its score
+    assert [call[0][3] for call in mock_add_result.call_args_list] == budgets[1:]
+    assert len(automl._automl_algorithm._tuners[logistic_regression_binary_pipeline_class.name].opt.yi) == 1
+    assert budgets[:2] == [1.0, 1.0]
+    assert budgets[2] == pytest.approx(0.5, abs=0.01)
+    assert 'of the rows: predicted to take 20000.0 seconds' in caplog.text
+    assert 'Skipping Logistic Regression Binary Pipeline: predicted to take' in caplog.text
+    assert 'Every pipeline in the batch was predicted to run past max_time, ending' in caplog.text
+    n_training_rows = [results[id]['cv_data'][0]['all_objective_scores']['# Training'] for id in automl.results['search_order']]
+    assert n_training_rows[2] < n_training_rows[1]
+    assert set(automl.rankings['id']) == {0, 1}
+
+
+def test_automl_cost_model_downsized_budget_dropped(X_y_binary, logistic_regression_binary_pipeline_class):
+    X, y = X_y_binary
+    automl = AutoMLSearch(problem_type='binary', max_iterations=3, max_time=10000, cost_model=RuntimeCostModel(),
+                          allowed_pipelines=[logistic_regression_binary_pipeline_class])
+    pipelines = []
+
+    def predict_training_time(pipeline, n_rows, n_features):
+        if pipeline.model_family == ModelFamily.BASELINE:
+            return None
+        if not any(pipeline is p for p in pipelines):
+            pipelines.append(pipeline)
+        return [10, 20000][[p is pipeline for p in pipelines].index(True)] * n_rows / len(X)
+
+    with patch.object(AutoMLSearch, '_predict_training_time', side_effect=predict_training_time):
+        automl.search(X, y)
+    # the search ends right after the downsized pipeline, whose budget is dropped with the search
+    results = automl.results['pipeline_results']
+    assert results[2]['budget'] == pytest.approx(0.5, abs=0.01)
+    assert automl._get_budget(pipelines[1]) == 1.0
+
+    # pipelines added to the rankings are evaluated on all of the data
+    automl.add_to_rankings(logistic_regression_binary_pipeline_class(parameters={'Logistic Regression Classifier': {'C': 0.5}}), X, y)
+    assert results[1]['cv_data'][0]['all_objective_scores']['# Training'] == \
+        automl.results['pipeline_results'][3]['cv_data'][0]['all_objective_scores']['# Training']
+    assert automl.results['pipeline_results'][3]['budget'] == 1.0
@@ -0,0 +1,279 @@
+import os
+import queue
+import threading
+import time
+from collections import OrderedDict
+from unittest.mock import patch
+
+import cloudpickle
+import numpy as np
+import pandas as pd
+import pytest
+
+from evalml.automl import (
+    AutoMLSearch,
+    EngineBase,
+    ProcessPoolEngine,
+    QueueEngine,
+    SequentialEngine,
+    ThreadPoolEngine,
+    TrainingValidationSplit
+)
+from evalml.automl.engine import queue_worker
+from evalml.automl.engine.pool_engines import PoolEngine
+from evalml.exceptions import EngineJobError
+from evalml.model_family import ModelFamily
+from evalml.pipelines import BinaryClassificationPipeline
+from evalml.pipelines.components import Estimator
+from evalml.problem_types import ProblemTypes
+
+
+def _add(a, b=0):
+    return a + b
+
+
+def _raise_value_error():
+    raise ValueError("job failed")
+
+
+@pytest.fixture
+def all_engines():
+    engines = [SequentialEngine(), ThreadPoolEngine(n_workers=2), ProcessPoolEngine(n_workers=2), QueueEngine(n_workers=2)]
+    yield engines
+    for engine in engines:
+        engine.close()
+
+
+def test_engines_submit(all_engines):
+    for engine in all_engines:
+        computations = [engine.submit(_add, i, b=10) for i in range(5)]
+        assert [computation.get_result() for computation in computations] == [10, 11, 12, 13, 14]
+        assert all(computation.done() for computation in computations)
+
+
+def test_engines_submit_raises(all_engines):
+    for engine in all_engines:
+        computation = engine.submit(_raise_value_error)
+        with pytest.raises(ValueError, match="job failed"):
+            computation.get_result()
+
+
+def test_engines_submit_closure(all_engines):
+    offset = 5
+
+    def add_offset(a):
+        return a + offset
+
+    for engine in all_engines:
+        assert engine.submit(add_offset, 1).get_result() == 6
+
+
+def test_sequential_engine_runs_lazily():
+    calls = []
+    engine = SequentialEngine()
+    computation = engine.submit(calls.append, 1)
+    assert not computation.done()
+    assert calls == []
+    computation.get_result()
+    assert computation.done()
+    assert calls == [1]
+    assert not computation.cancel()
+
+    computation = engine.submit(calls.append, 2)
+    assert computation.cancel()
+    with pytest.raises(RuntimeError, match="cancelled computation"):
+        computation.get_result()
+    assert calls == [1]
+
+
+def test_engines_can_be_pickled(all_engines):
+    for engine in all_engines:
+        engine.submit(_add, 1).get_result()
+        unpickled_engine = cloudpickle.loads(cloudpickle.dumps(engine))
+        assert unpickled_engine.submit(_add, 2, b=1).get_result() == 3
+        unpickled_engine.close()
+
+
+def test_queue_engine_with_external_queues():
+    task_queue = queue.Queue()
+    result_queue = queue.Queue()
+    worker = threading.Thread(target=queue_worker, args=(task_queue, result_queue))
+    worker.start()
+    engine = QueueEngine(task_queue=task_queue, result_queue=result_queue)
+    computations = [engine.submit(_add, i, b=1) for i in range(3)]
+    assert [computation.get_result() for computation in reversed(computations)] == [3, 2, 1]
+    assert not computations[0].cancel()
+    engine.close()
+    task_queue.put(None)
+    worker.join()
+
+    with pytest.raises(ValueError, match="must either both be provided"):
+        QueueEngine(task_queue=task_queue)
+
+
+def test_automl_invalid_engine():
+    with pytest.raises(ValueError, match="Not a valid engine"):
+        AutoMLSearch(problem_type='binary', engine='sequential')
+
+
+def test_automl_default_engine():
+    automl = AutoMLSearch(problem_type='binary')
+    assert isinstance(automl.engine, SequentialEngine)
+    automl = AutoMLSearch(problem_type='binary', n_jobs=3, parallel_batches=True)
+    assert isinstance(automl.engine, ThreadPoolEngine)
+    assert automl.engine.n_workers == 3
+    assert 'Engine: ThreadPoolEngine' in str(automl)
+
+
+@pytest.mark.parametrize("engine_class", [ThreadPoolEngine, ProcessPoolEngine, QueueEngine])
+def test_automl_engines_match_sequential_search(engine_class, X_y_binary, logistic_regression_binary_pipeline_class):
+    X, y = X_y_binary
+    rankings = []
+    for engine in [SequentialEngine(), engine_class(n_workers=2)]:
+        automl = AutoMLSearch(problem_type='binary', max_iterations=7, engine=engine, parallel_batches=True,
+                              optimize_thresholds=True, objective='F1',
+                              allowed_pipelines=[logistic_regression_binary_pipeline_class])
+        automl.search(X, y)
+        engine.close()
+        assert isinstance(automl.engine, EngineBase)
+        rankings.append(automl.full_rankings)
+    pd.testing.assert_frame_equal(rankings[0].drop(columns=['parameters']), rankings[1].drop(columns=['parameters']))
+
+
+def _exit_worker():
+    os._exit(3)
+
+
+def test_pool_engine_make_executor_is_abstract():
+    with pytest.raises(TypeError, match="abstract"):
+        PoolEngine()
+
+
+def test_queue_engine_worker_exits():
+    engine = QueueEngine(n_workers=1)
+    with patch.object(QueueEngine, '_POLL_INTERVAL', 0.1):
+        computations = [engine.submit(_exit_worker), engine.submit(_add, 1, b=2)]
+        with pytest.raises(EngineJobError, match="The worker running job 0 exited unexpectedly with exit code 3"):
+            computations[0].get_result()
+        # the worker was replaced, so the jobs left on the queue are still run
+        assert computations[1].get_result() == 3
+    assert len(engine._workers) == 1 and engine._workers[0][0].is_alive()
+    engine.close()
+
+
+def _take_job_and_exit(task_queue, result_queue, current_job):
+    task_queue.get()
+    os._exit(3)
+
+
+def test_queue_engine_worker_exits_before_running_job():
+    engine = QueueEngine(n_workers=1)
+    with patch.object(QueueEngine, '_POLL_INTERVAL', 0.1):
+        # the first worker exits after taking the job from the queue, before it records which job it's running
+        with patch('evalml.automl.engine.queue_engine.queue_worker', _take_job_and_exit):
+            computation = engine.submit(_add, 1)
+        with pytest.raises(EngineJobError, match="Job 0 was lost: it was taken from the task queue but no worker is running it"):
+            computation.get_result()
+        assert engine.submit(_add, 1, b=2).get_result() == 3
+    assert engine._pending == set()
+    engine.close()
+
+
+def test_queue_engine_cancel():
+    engine = QueueEngine(n_workers=1)
+    computations = [engine.submit(time.sleep, 0.5), engine.submit(_add, 1), engine.submit(_add, 2)]
+    # only one job per worker is put on the task queue, the others can be cancelled until a worker is free
+    assert not computations[0].cancel()
+    assert computations[2].cancel()
+    assert computations[2].done()
+    with pytest.raises(RuntimeError, match="cancelled computation"):
+        computations[2].get_result()
+    assert computations[1].get_result() == 1
+    assert not computations[1].cancel()
+    assert computations[0].done()
+    assert engine._backlog == OrderedDict() and engine._pending == set()
+    engine.close()
+
+
+@pytest.mark.parametrize("engine_class", [SequentialEngine, ThreadPoolEngine, QueueEngine])
+def test_automl_max_time_cancels_queued_jobs(engine_class, X_y_binary, dummy_binary_pipeline_class):
+    X, y = X_y_binary
+    X, y = pd.DataFrame(X), pd.Series(y)
+    engine = engine_class() if engine_class is SequentialEngine else engine_class(n_workers=1)
+    automl = AutoMLSearch(problem_type='binary', max_time=1, engine=engine, data_split=TrainingValidationSplit())
+    automl._set_data_split(X)
+    pipelines = [dummy_binary_pipeline_class(parameters={}) for _ in range(3)]
+
+    def slow_fit(self, X, y):
+        time.sleep(1)
+        return self
+
+    with patch('evalml.pipelines.BinaryClassificationPipeline.fit', slow_fit), \
+            patch('evalml.pipelines.BinaryClassificationPipeline.score', return_value={"Log Loss Binary": 0.5}):
+        automl._start = time.time()
+        batch_results = automl._evaluate_batch(pipelines, X, y)
+    engine.close()
+    # max_time elapses while the first pipeline is evaluated, so the pipelines which no worker has started are cancelled
+    assert batch_results[0]['cv_score_mean'] == 0.5
+    assert batch_results[2] is None
+
+
+def test_queue_engine_timeout():
+    with pytest.raises(ValueError, match="timeout must be positive. Received 0 instead"):
+        QueueEngine(timeout=0)
+
+    engine = QueueEngine(n_workers=1, timeout=1)
+    computation = engine.submit(time.sleep, 60)
+    with pytest.raises(EngineJobError, match="Job 0 didn't finish within the timeout of 1 seconds"):
+        computation.get_result()
+    assert engine.submit(_add, 2).get_result() == 2
+    engine.close()
+
+    # workers on other machines can't be replaced, and results arriving after the timeout are dropped
+    task_queue = queue.Queue()
+    result_queue = queue.Queue()
+    engine = QueueEngine(task_queue=task_queue, result_queue=result_queue, timeout=0.1)
+    with pytest.raises(EngineJobError, match="Job 0 didn't finish within the timeout of 0.1 seconds"):
+        engine.submit(_add, 1).get_result()
+    worker = threading.Thread(target=queue_worker, args=(task_queue, result_queue))
+    worker.start()
+    assert engine.submit(_add, 2).get_result() == 2
+    assert engine._results == {} and engine._abandoned == set()
+    task_queue.put(None)
+    worker.join()
+
+
+@pytest.mark.parametrize("parallel_batches", [False, True])
+def test_automl_queue_engine_worker_exits(parallel_batches, X_y_binary, logistic_regression_binary_pipeline_class):
+    class ExitingEstimator(Estimator):
+        name = "Exiting Classifier"
+        model_family = ModelFamily.NONE
+        supported_problem_types = [ProblemTypes.BINARY]
+        hyperparameter_ranges = {}
+
+        def __init__(self, random_state=0):
+            super().__init__(parameters={}, component_obj=None, random_state=random_state)
+
+        def fit(self, X, y=None):
+            _exit_worker()
+
+    class ExitingPipeline(BinaryClassificationPipeline):
+        component_graph = [ExitingEstimator]
+
+    X, y = X_y_binary
+    engine = QueueEngine(n_workers=2)
+    automl = AutoMLSearch(problem_type='binary', max_iterations=3, engine=engine, parallel_batches=parallel_batches,
+                          allowed_pipelines=[logistic_regression_binary_pipeline_class, ExitingPipeline])
+    with patch.object(QueueEngine, '_POLL_INTERVAL', 0.1):
+        automl.search(X, y)
+    # the pipeline whose worker exited is recorded as failed, and the search carries on
+    results = automl.results['pipeline_results']
+    pipeline_names = ['Mode Baseline Binary Classification Pipeline', 'Logistic Regression Binary Pipeline', 'Exiting Pipeline']
+    assert [results[id]['pipeline_name'] for id in range(3)] == pipeline_names
+    assert not np.isnan(results[1]['score'])
+    assert np.isnan(results[2]['score'])
+    assert all(np.isnan(fold['score']) for fold in results[2]['cv_data'])
+    assert len(results[2]['cv_data']) == 3
+    assert set(automl.rankings['id']) == {0, 1, 2}
+    assert len(engine._workers) == 2 and all(process.is_alive() for process, _ in engine._workers)
+    engine.close()
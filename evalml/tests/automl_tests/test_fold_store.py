@@ -0,0 +1,91 @@
+import pickle
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.model_selection import KFold, StratifiedKFold
+
+from evalml.automl import AutoMLSearch
+from evalml.automl.fold_store import FoldStore
+from evalml.pipelines import BinaryClassificationPipeline
+from evalml.problem_types import ProblemTypes
+
+
+def test_fold_store(X_y_regression):
+    X, y = X_y_regression
+    X, y = pd.DataFrame(X), pd.Series(y)
+    data_split = KFold(n_splits=3)
+    fold_store = FoldStore(data_split, X, y, ProblemTypes.REGRESSION)
+    expected_folds = list(data_split.split(X, y))
+    assert len(fold_store.folds) == 3
+    for i, (train, test) in enumerate(expected_folds):
+        np.testing.assert_array_equal(fold_store.folds[i][0], train)
+        np.testing.assert_array_equal(fold_store.folds[i][1], test)
+        X_train, X_test, y_train, y_test = fold_store.get_fold(i, X, y)
+        pd.testing.assert_frame_equal(X_train, X.iloc[train])
+        pd.testing.assert_frame_equal(X_test, X.iloc[test])
+        pd.testing.assert_series_equal(y_train, y.iloc[train])
+        pd.testing.assert_series_equal(y_test, y.iloc[test])
+        # every caller gets its own copy of the rows, even the contiguous test rows
+        assert not any(a is b for a, b in zip(fold_store.get_fold(i, X, y), (X_train, X_test, y_train, y_test)))
+        assert not np.shares_memory(X_test.values, X.values)
+
+
+def test_fold_store_pickle(X_y_binary):
+    X, y = X_y_binary
+    X, y = pd.DataFrame(X), pd.Series(y)
+    fold_store = FoldStore(StratifiedKFold(n_splits=3), X, y, ProblemTypes.BINARY)
+    unpickled = pickle.loads(pickle.dumps(fold_store))
+    assert list(vars(unpickled)) == ['folds']
+    np.testing.assert_array_equal(unpickled.folds[1][0], fold_store.folds[1][0])
+    pd.testing.assert_frame_equal(unpickled.get_fold(0, X, y)[0], fold_store.get_fold(0, X, y)[0])
+
+
+def test_fold_store_datetime_pipeline():
+    class DateTimePipeline(BinaryClassificationPipeline):
+        component_graph = ['DateTime Featurization Component', 'One Hot Encoder', 'Logistic Regression Classifier']
+
+    X = pd.DataFrame({'date': pd.date_range('2020-01-01', periods=90, freq='D'), 'cat': ['a', 'b', 'c'] * 30,
+                      'num': np.arange(90)})
+    y = pd.Series([0, 1] * 45)
+    X_expected = X.copy()
+    automl = AutoMLSearch(problem_type='binary', max_iterations=3, allowed_pipelines=[DateTimePipeline],
+                          data_split=KFold(n_splits=3))
+    folds = []
+    original_get_fold = FoldStore.get_fold
+
+    def get_fold(fold_store, i, X, y):
+        fold = original_get_fold(fold_store, i, X, y)
+        folds.append(fold)
+        return fold
+
+    with patch.object(FoldStore, 'get_fold', autospec=True, side_effect=get_fold):
+        automl.search(X, y)
+    pd.testing.assert_frame_equal(X, X_expected)
+    # no pipeline sees the rows or columns another pipeline modified
+    assert len(folds) == 9
+    for X_train, X_test, _, _ in folds:
+        assert list(X_train.columns) == list(X_test.columns) == ['date', 'cat', 'num']
+        pd.testing.assert_frame_equal(X_train, X_expected.iloc[X_train.index])
+
+
+def test_fold_store_class_coverage(X_y_binary):
+    X, y = X_y_binary
+    X, y = pd.DataFrame(X), pd.Series(y)
+    y[:] = 0
+    y[0] = 1
+    with pytest.raises(Exception, match="Missing target values in the training set after data split"):
+        FoldStore(StratifiedKFold(n_splits=3), X, y, ProblemTypes.BINARY)
+    FoldStore(KFold(n_splits=3), X, y, ProblemTypes.REGRESSION)
+
+
+def test_automl_splits_data_once(X_y_binary, logistic_regression_binary_pipeline_class):
+    X, y = X_y_binary
+    automl = AutoMLSearch(problem_type='binary', max_iterations=3, allowed_pipelines=[logistic_regression_binary_pipeline_class])
+    with patch.object(StratifiedKFold, 'split', autospec=True, side_effect=StratifiedKFold.split) as mock_split, \
+            patch.object(FoldStore, 'get_fold', autospec=True, side_effect=FoldStore.get_fold) as mock_get_fold:
+        automl.search(X, y)
+    assert mock_split.call_count == 1
+    assert mock_get_fold.call_count == 9
+    assert automl._fold_store is None
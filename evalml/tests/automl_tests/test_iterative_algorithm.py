@@ -1,3 +1,6 @@
+import gc
+import weakref
+
 import numpy as np
 import pytest
 
@@ -110,3 +113,104 @@ def test_iterative_algorithm_results(dummy_binary_pipeline_classes):
         for score, pipeline in zip(scores, next_batch):
             algo.add_result(score, pipeline)
     assert any([p != dummy_binary_pipeline_classes[0]({}).parameters for p in all_parameters])
+
+
+def test_iterative_algorithm_warm_start(dummy_binary_pipeline_classes):
+    algo = IterativeAlgorithm(allowed_pipelines=dummy_binary_pipeline_classes)
+    name = dummy_binary_pipeline_classes[0].name
+    previous_results = [(name, {'Mock Classifier': {'dummy_parameter': 'other'}}, 0.1),
+                        (name, {'Mock Classifier': {'dummy_parameter': 'default'}}, np.nan),
+                        (name, {'Mock Classifier': {'dummy_parameter': 'removed'}}, 0.2),
+                        (name, {'Other Component': {}}, 0.3),
+                        ('Unknown Pipeline', {'Mock Classifier': {'dummy_parameter': 'other'}}, 0.4)]
+    assert algo.warm_start(previous_results) == 1
+    assert algo._tuners[name].opt.Xi == [['other']]
+    assert algo._tuners[name].opt.yi == [0.1]
+    assert algo._tuners[dummy_binary_pipeline_classes[1].name].opt.Xi == []
+    assert algo.pipeline_number == 0
+    assert algo.batch_number == 0
+
+
+def test_iterative_algorithm_sample_budgets_validation():
+    with pytest.raises(ValueError, match="sample_budgets must be increasing fractions"):
+        IterativeAlgorithm(sample_budgets=[0.5, 0.1])
+    with pytest.raises(ValueError, match="sample_budgets must be increasing fractions"):
+        IterativeAlgorithm(sample_budgets=[0.1, 1.0])
+    with pytest.raises(ValueError, match="n_promoted must be positive"):
+        IterativeAlgorithm(sample_budgets=[0.1], n_promoted=0)
+
+
+def test_iterative_algorithm_sample_budgets(dummy_binary_pipeline_classes):
+    algo = IterativeAlgorithm(allowed_pipelines=dummy_binary_pipeline_classes, sample_budgets=[0.01, 0.1], n_promoted=1)
+    next_batch = algo.next_batch()
+    assert [p.__class__ for p in next_batch] == dummy_binary_pipeline_classes
+    assert [algo.get_budget(p) for p in next_batch] == [0.01] * 3
+    for score, pipeline in zip([2, np.nan, 1], next_batch):
+        algo.add_result(score, pipeline)
+    # subsample results don't reach the tuners
+    assert all(tuner.opt.yi == [] for tuner in algo._tuners.values())
+
+    next_batch = algo.next_batch()
+    assert [p.__class__ for p in next_batch] == [dummy_binary_pipeline_classes[2], dummy_binary_pipeline_classes[0]]
+    assert [algo.get_budget(p) for p in next_batch] == [0.1] * 2
+    for score, pipeline in zip([3, 0], next_batch):
+        algo.add_result(score, pipeline)
+
+    next_batch = algo.next_batch()
+    assert [p.__class__ for p in next_batch] == [dummy_binary_pipeline_classes[0]]
+    assert [algo.get_budget(p) for p in next_batch] == [1.0]
+    algo.add_result(0.5, next_batch[0])
+    assert algo._tuners[dummy_binary_pipeline_classes[0].name].opt.yi == [0.5]
+    assert algo.pipeline_number == 6
+    assert algo.batch_number == 3
+
+    # only the pipelines evaluated on all of the data are tuned
+    for _ in range(2):
+        next_batch = algo.next_batch()
+        assert [p.__class__ for p in next_batch] == [dummy_binary_pipeline_classes[0]] * algo.pipelines_per_batch
+        assert all(algo.get_budget(p) == 1.0 for p in next_batch)
+        for pipeline in next_batch:
+            algo.add_result(0, pipeline)
+
+
+def test_iterative_algorithm_budgets_of_latest_batch(dummy_binary_pipeline_classes):
+    algo = IterativeAlgorithm(allowed_pipelines=dummy_binary_pipeline_classes, sample_budgets=[0.1])
+    next_batch = algo.next_batch()
+    assert algo.get_budget(next_batch[0]) == 0.1
+    # only the pipelines proposed in the latest batch have a budget, not other pipelines with the same parameters
+    assert algo.get_budget(next_batch[0].__class__(parameters=next_batch[0].parameters)) == 1.0
+    # the pipelines are kept alive while their budgets are recorded, so that pipelines created later can't reuse their ids
+    pipeline_ref = weakref.ref(next_batch[0])
+    del next_batch
+    gc.collect()
+    assert pipeline_ref() is not None
+    assert algo.get_budget(pipeline_ref()) == 0.1
+    algo.clear_budgets()
+    assert algo.get_budget(pipeline_ref()) == 1.0
+    gc.collect()
+    assert pipeline_ref() is None
+
+
+def test_iterative_algorithm_downsized_results(dummy_binary_pipeline_classes):
+    algo = IterativeAlgorithm(allowed_pipelines=dummy_binary_pipeline_classes, sample_budgets=[0.1], n_promoted=1)
+    next_batch = algo.next_batch()
+    # results on fewer rows than the batch was evaluated on are ranked after the rest of the batch
+    for score, pipeline, budget in zip([0, 2, 1], next_batch, [0.01, 0.1, 0.1]):
+        algo.add_result(score, pipeline, budget)
+    next_batch = algo.next_batch()
+    assert [p.__class__ for p in next_batch] == [dummy_binary_pipeline_classes[2], dummy_binary_pipeline_classes[1]]
+
+    # downsized results on the full data batch don't reach the tuners and are tuned last
+    for score, pipeline, budget in zip([0, 1], next_batch, [0.5, 1.0]):
+        algo.add_result(score, pipeline, budget)
+    assert algo._tuners[dummy_binary_pipeline_classes[2].name].opt.yi == []
+    assert algo._tuners[dummy_binary_pipeline_classes[1].name].opt.yi == [1]
+    assert all(p.__class__ == dummy_binary_pipeline_classes[1] for p in algo.next_batch())
+    assert all(p.__class__ == dummy_binary_pipeline_classes[2] for p in algo.next_batch())
+
+
+def test_iterative_algorithm_sample_budgets_no_results(dummy_binary_pipeline_classes):
+    algo = IterativeAlgorithm(allowed_pipelines=dummy_binary_pipeline_classes, sample_budgets=[0.1])
+    algo.next_batch()
+    with pytest.raises(AutoMLAlgorithmException, match='No results were reported from the previous batch'):
+        algo.next_batch()
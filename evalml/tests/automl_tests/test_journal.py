@@ -0,0 +1,139 @@
+import os
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from evalml.automl import AutoMLSearch, RuntimeCostModel
+from evalml.automl.engine import SequentialEngine
+from evalml.automl.journal import ReplayedComputation, ResultsJournal
+
+
+def test_results_journal(tmpdir):
+    journal = ResultsJournal(os.path.join(str(tmpdir), 'journal.jsonl'))
+    assert not journal.exists()
+    journal.write_header({'n_rows': 10})
+    assert journal.exists()
+    cv_data = [{'all_objective_scores': {'F1': np.float64(0.5), '# Training': 6}, 'score': np.nan,
+                'binary_classification_threshold': None}]
+    journal.append_result(0, 'Pipeline', {'Estimator': {'n': np.int64(3), 'shape': (1, 2)}}, 1.5, cv_data, 0.5, False)
+    journal.append_skip(1, 'Pipeline', {})
+    header, records = journal.read()
+    assert header == {'n_rows': 10}
+    assert set(records) == {0, 1}
+    assert records[0]['parameters'] == {'Estimator': {'n': 3, 'shape': [1, 2]}}
+    assert records[0]['parameters'] == ResultsJournal.normalize({'Estimator': {'n': np.int64(3), 'shape': (1, 2)}})
+    assert records[1]['skipped']
+
+    result = ReplayedComputation(records[0]).get_result()
+    assert list(result['cv_data'][0]['all_objective_scores'].items()) == [('F1', 0.5), ('# Training', 6)]
+    assert result['training_time'] == 1.5
+    assert np.isnan(result['cv_score_mean'])
+    assert not result['pruned']
+
+    with pytest.raises(TypeError, match="Object of type object can't be written to a journal"):
+        journal.append_skip(2, 'Pipeline', {'Estimator': {'n': object()}})
+
+
+def test_results_journal_truncated(tmpdir):
+    path = os.path.join(str(tmpdir), 'journal.jsonl')
+    journal = ResultsJournal(path)
+    journal.write_header({})
+    journal.append_skip(1, 'Pipeline', {})
+    with open(path, 'a') as f:
+        f.write('{"position": 2, "pipeline_na')
+    _, records = journal.read()
+    assert set(records) == {1}
+
+    with open(path, 'a') as f:
+        f.write('\n{"position": 3}\n')
+    with pytest.raises(ValueError, match="Line 3 of journal .* is corrupted"):
+        journal.read()
+
+    with open(path, 'w') as f:
+        f.write('{"position": 1}\n')
+    with pytest.raises(ValueError, match="is missing its header"):
+        journal.read()
+
+
+def _search_summary(automl):
+    results = automl.results['pipeline_results']
+    return [(results[id]['pipeline_name'], results[id]['parameters'], results[id]['score'])
+            for id in automl.results['search_order']]
+
+
+@pytest.mark.parametrize("automl_algorithm", ['iterative', 'successive_halving'])
+def test_automl_resume(automl_algorithm, X_y_binary, logistic_regression_binary_pipeline_class, tmpdir):
+    X, y = X_y_binary
+    path = os.path.join(str(tmpdir), 'journal.jsonl')
+    search_kwargs = {'problem_type': 'binary', 'automl_algorithm': automl_algorithm,
+                     'allowed_pipelines': [logistic_regression_binary_pipeline_class]}
+    automl = AutoMLSearch(max_iterations=9, **search_kwargs)
+    automl.search(X, y)
+    expected = _search_summary(automl)
+
+    interrupted = AutoMLSearch(max_iterations=4, journal=path, **search_kwargs)
+    interrupted.search(X, y)
+    _, records = ResultsJournal(path).read()
+    assert sorted(records) == [0, 1, 2, 3]
+
+    resumed = AutoMLSearch(max_iterations=9, **search_kwargs)
+    resumed.resume(path)
+    with patch.object(SequentialEngine, 'submit_evaluation_job', autospec=True,
+                      side_effect=SequentialEngine.submit_evaluation_job) as mock_submit:
+        resumed.search(X, y)
+    assert mock_submit.call_count == 5
+    assert _search_summary(resumed) == expected
+    _, records = ResultsJournal(path).read()
+    assert sorted(records) == list(range(9))
+    assert [records[position]['budget'] for position in range(9)] == [resumed.results['pipeline_results'][id]['budget'] for id in range(9)]
+
+
+def test_automl_resume_mismatch(X_y_binary, logistic_regression_binary_pipeline_class, tmpdir):
+    X, y = X_y_binary
+    path = os.path.join(str(tmpdir), 'journal.jsonl')
+    automl = AutoMLSearch(problem_type='binary', max_iterations=3, journal=path,
+                          allowed_pipelines=[logistic_regression_binary_pipeline_class])
+    automl.search(X, y)
+
+    with pytest.raises(ValueError, match="already holds the results of a search"):
+        AutoMLSearch(problem_type='binary', max_iterations=3, journal=path).search(X, y)
+    with pytest.raises(ValueError, match="resume must be called before search"):
+        automl.resume(path)
+
+    resumed = AutoMLSearch(problem_type='binary', max_iterations=3, allowed_pipelines=[logistic_regression_binary_pipeline_class])
+    resumed.resume(path)
+    with pytest.raises(ValueError, match="was written by a search with different settings or data"):
+        resumed.search(X[:50], y[:50])
+
+    resumed = AutoMLSearch(problem_type='binary', max_iterations=3, random_state=1,
+                           allowed_pipelines=[logistic_regression_binary_pipeline_class])
+    resumed.resume(path)
+    with pytest.raises(ValueError, match="does not match this search: pipeline 2 was Logistic Regression Binary Pipeline"):
+        resumed.search(X, y)
+
+
+def test_automl_resume_replays_skips(X_y_binary, logistic_regression_binary_pipeline_class, tmpdir):
+    X, y = X_y_binary
+    path = os.path.join(str(tmpdir), 'journal.jsonl')
+    search_kwargs = {'problem_type': 'binary', 'max_iterations': 4, 'max_time': 1000, 'cost_model': RuntimeCostModel(),
+                     'allowed_pipelines': [logistic_regression_binary_pipeline_class]}
+    automl = AutoMLSearch(journal=path, **search_kwargs)
+    # the first pipeline has to be downsized, the next two are skipped and the rest can't be predicted
+    predictions = {1: 2000, 2: 1e6, 3: 1e6}
+    with patch.object(AutoMLSearch, '_predict_training_time', autospec=True,
+                      side_effect=lambda self, pipeline, n_rows, n_features: predictions.get(self._search_positions.get(id(pipeline)))):
+        automl.search(X, y)
+    _, records = ResultsJournal(path).read()
+    assert records[1]['budget'] < 1
+    assert records[2]['skipped'] and records[3]['skipped']
+    assert sorted(records) == [0, 1, 2, 3, 4, 5]
+
+    resumed = AutoMLSearch(**search_kwargs)
+    resumed.resume(path)
+    with patch.object(AutoMLSearch, '_predict_training_time', return_value=1e6), \
+            patch.object(SequentialEngine, 'submit_evaluation_job') as mock_submit:
+        resumed.search(X, y)
+    mock_submit.assert_not_called()
+    assert _search_summary(resumed) == _search_summary(automl)
+    assert resumed.results['pipeline_results'][1]['budget'] == records[1]['budget']
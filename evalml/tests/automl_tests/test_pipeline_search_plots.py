@@ -35,6 +35,9 @@ def test_search_iteration_plot_class():
                 'score': [0.75, 0.60, 0.50]
             })
 
+        def iteration_scores(self, start=0):
+            return [(id, self.results['pipeline_results'][id]['score']) for id in self.results['search_order'][start:]]
+
     mock_data = MockResults()
     plot = SearchIterationPlot(mock_data)
 
@@ -0,0 +1,116 @@
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from evalml.automl import (
+    AutoMLSearch,
+    MedianPruningPolicy,
+    PruningPolicyBase,
+    VarianceBoundPruningPolicy
+)
+from evalml.automl.automl_algorithm import IterativeAlgorithm
+from evalml.automl.engine import train_and_score_pipeline
+
+
+def test_pruning_policy_init():
+    with pytest.raises(ValueError, match="min_folds must be positive"):
+        MedianPruningPolicy(min_folds=0)
+    with pytest.raises(ValueError, match="min_pipelines must be positive"):
+        VarianceBoundPruningPolicy(min_pipelines=0)
+    with pytest.raises(ValueError, match="margin must be non-negative"):
+        MedianPruningPolicy(margin=-1)
+    with pytest.raises(ValueError, match="margin must be non-negative"):
+        VarianceBoundPruningPolicy(margin=-1)
+    with pytest.raises(ValueError, match="n_std must be non-negative"):
+        VarianceBoundPruningPolicy(n_std=-1)
+
+
+def test_median_pruning_policy():
+    reference = [[1, 3, 2], [2, 2, 2], [3, 1, 2], [np.nan, 1, 1]]
+    policy = MedianPruningPolicy(min_pipelines=3)
+    # the median over the first fold is 2 and over the first two folds is 2
+    assert not policy.should_prune([2], reference)
+    assert policy.should_prune([2.1], reference)
+    assert not policy.should_prune([1, 3], reference)
+    assert policy.should_prune([3, 2], reference)
+    assert policy.should_prune([np.nan], reference)
+    # the reference pipeline with nan scores is ignored
+    assert not MedianPruningPolicy(min_pipelines=4).should_prune([10], reference)
+    assert not MedianPruningPolicy(min_pipelines=3, min_folds=2).should_prune([10], reference)
+    assert not MedianPruningPolicy(min_pipelines=3, margin=0.5).should_prune([2.9], reference)
+    assert MedianPruningPolicy(min_pipelines=3, margin=0.5).should_prune([3.1], reference)
+
+
+def test_variance_bound_pruning_policy():
+    reference = [[1, 2, 3], [4, 4, 4]]
+    # the best reference pipeline has a mean of 2 and a standard deviation of 1
+    policy = VarianceBoundPruningPolicy(n_std=2)
+    assert not policy.should_prune([4], reference)
+    assert policy.should_prune([4.1], reference)
+    assert not policy.should_prune([3, 3.5], reference)
+    assert policy.should_prune([4, 4], reference)
+    assert not VarianceBoundPruningPolicy(n_std=0, margin=1).should_prune([4], reference)
+    assert VarianceBoundPruningPolicy(n_std=0, margin=1).should_prune([4.1], reference)
+    assert not policy.should_prune([100], [])
+
+
+def test_pruning_policy_penalize():
+    reference = [[1, 2, 3], [4, 4, 4], [np.nan, 1, 1]]
+    assert PruningPolicyBase.penalize(1, reference) == 4
+    assert PruningPolicyBase.penalize(5, reference) == 5
+    assert PruningPolicyBase.penalize(1, []) == 1
+    assert np.isnan(PruningPolicyBase.penalize(np.nan, reference))
+
+
+@pytest.mark.parametrize("greater_is_better", [True, False])
+def test_train_and_score_pipeline_pruned(greater_is_better, X_y_binary, logistic_regression_binary_pipeline_class):
+    X, y = X_y_binary
+    X, y = pd.DataFrame(X), pd.Series(y)
+    automl = AutoMLSearch(problem_type='binary', objective='F1' if greater_is_better else 'Log Loss Binary')
+    automl._set_data_split(X)
+    policy = MedianPruningPolicy(min_pipelines=1)
+    pipeline = logistic_regression_binary_pipeline_class({})
+    # the scores passed to the policy are converted so that lower is better
+    automl_config = automl._get_automl_config()._replace(pruning_policy=policy, pruning_reference=[[10] * 3])
+    with patch.object(policy, 'should_prune', wraps=policy.should_prune) as mock_should_prune:
+        results = train_and_score_pipeline(pipeline, automl_config, X, y)
+        assert mock_should_prune.call_count == 2
+        fold_scores = mock_should_prune.call_args[0][0]
+        assert fold_scores == [(-1 if greater_is_better else 1) * fold['score'] for fold in results['cv_data'][:2]]
+    assert not results['pruned']
+    assert len(results['cv_data']) == 3
+
+    automl_config = automl_config._replace(pruning_reference=[[-10] * 3])
+    results = train_and_score_pipeline(pipeline, automl_config, X, y)
+    assert results['pruned']
+    assert len(results['cv_data']) == 1
+    assert results['cv_score_mean'] == results['cv_data'][0]['score']
+
+
+def test_automl_invalid_pruning_policy():
+    with pytest.raises(ValueError, match="Not a valid pruning policy"):
+        AutoMLSearch(problem_type='binary', pruning_policy='median')
+
+
+@patch('evalml.automl.engine.engine_base.Parallel')
+def test_automl_pruning(mock_parallel, X_y_binary, logistic_regression_binary_pipeline_class):
+    X, y = X_y_binary
+    policy = MedianPruningPolicy(min_pipelines=2)
+    automl = AutoMLSearch(problem_type='binary', max_iterations=6, pruning_policy=policy,
+                          allowed_pipelines=[logistic_regression_binary_pipeline_class])
+    assert 'Pruning Policy: MedianPruningPolicy' in str(automl)
+    with patch.object(MedianPruningPolicy, 'penalize', return_value=100) as mock_penalize, \
+            patch.object(MedianPruningPolicy, '_should_prune', side_effect=lambda partial_score, n_folds, reference: n_folds == 1), \
+            patch.object(IterativeAlgorithm, 'add_result', autospec=True, side_effect=IterativeAlgorithm.add_result) as mock_add_result:
+        automl.search(X, y)
+    assert mock_penalize.call_count == 4
+    assert [call[0][1] for call in mock_add_result.call_args_list][1:] == [100] * 4
+    mock_parallel.assert_not_called()
+
+    results = automl.results['pipeline_results']
+    assert [results[id]['pruned'] for id in automl.results['search_order']] == [False, False, True, True, True, True]
+    assert [len(results[id]['cv_data']) for id in automl.results['search_order']] == [3, 3, 1, 1, 1, 1]
+    assert set(automl.rankings['id']) == {0, 1}
+    assert len(automl.full_rankings) == 6
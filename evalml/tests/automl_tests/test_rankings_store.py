@@ -0,0 +1,115 @@
+import time
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from evalml.automl import AutoMLSearch
+from evalml.automl.rankings_store import RankingsStore
+
+
+def _pipeline_results(id, pipeline_name, score, parameters=None):
+    return {"id": id, "pipeline_name": pipeline_name, "score": score, "validation_score": score,
+            "percent_better_than_baseline": 0, "high_variance_cv": False, "parameters": parameters or {}}
+
+
+def _expected_rankings(pipeline_results, fully_evaluated, greater_is_better):
+    full_rankings = pd.DataFrame(pipeline_results)[RankingsStore.columns]
+    full_rankings.sort_values("score", ascending=not greater_is_better, inplace=True, kind="mergesort", na_position="last")
+    full_rankings.reset_index(drop=True, inplace=True)
+    rankings = full_rankings[full_rankings["id"].isin(np.flatnonzero(fully_evaluated))]
+    return full_rankings, rankings.drop_duplicates(subset="pipeline_name", keep="first")
+
+
+@pytest.mark.parametrize("greater_is_better", [True, False])
+def test_rankings_store(greater_is_better):
+    store = RankingsStore(greater_is_better)
+    assert len(store) == 0
+    assert store.best_id is None
+    assert list(store.full_rankings.columns) == RankingsStore.columns
+    assert store.full_rankings.empty and store.rankings.empty
+
+    rng = np.random.RandomState(0)
+    pipeline_results = []
+    fully_evaluated = []
+    for id in range(200):
+        score = np.nan if id % 37 == 5 else float(rng.randint(0, 20))
+        pipeline_results.append(_pipeline_results(id, f"Pipeline {rng.randint(0, 6)}", score, {"id": id}))
+        fully_evaluated.append(id % 7 != 3)
+        store.add(pipeline_results[-1], fully_evaluated[-1])
+
+        if id % 40 == 0 or id == 199:
+            full_rankings, rankings = _expected_rankings(pipeline_results, fully_evaluated, greater_is_better)
+            pd.testing.assert_frame_equal(store.full_rankings, full_rankings)
+            pd.testing.assert_frame_equal(store.rankings, rankings)
+            assert store.best_id == rankings["id"].iloc[0]
+    assert len(store) == 200
+    assert store.contains("Pipeline 3", {"id": [result["id"] for result in pipeline_results
+                                                if result["pipeline_name"] == "Pipeline 3"][0]})
+    assert not store.contains("Pipeline 3", {"id": -1})
+    assert not store.contains("Pipeline 9", {})
+
+
+def test_rankings_store_copies():
+    store = RankingsStore(True)
+    store.add(_pipeline_results(0, "Pipeline", 0.5))
+    store.full_rankings.drop(0, inplace=True)
+    store.rankings["score"] = 0
+    assert len(store.full_rankings) == 1
+    assert store.rankings["score"].iloc[0] == 0.5
+
+    store.add(_pipeline_results(1, "Pipeline", 0.6), fully_evaluated=False)
+    assert store.best_id == 0
+    assert list(store.full_rankings["id"]) == [1, 0]
+    assert list(store.rankings.index) == [1]
+
+
+def test_rankings_store_builds_frames_when_read():
+    store = RankingsStore(True)
+    store.add(_pipeline_results(0, "Pipeline", 0.5))
+    store.add(_pipeline_results(1, "Pipeline", 0.6))
+    assert store._full_rankings is None and store._rankings is None
+    full_rankings = store._get_full_rankings()
+    store.rankings
+    assert store._get_full_rankings() is full_rankings
+
+    store.add(_pipeline_results(2, "Pipeline", 0.4))
+    assert store._full_rankings is None and store._rankings is None
+    assert list(store.full_rankings["id"]) == [1, 0, 2]
+
+
+def test_automl_search_does_not_build_rankings(X_y_binary, logistic_regression_binary_pipeline_class):
+    X, y = X_y_binary
+    automl = AutoMLSearch(problem_type='binary', max_iterations=3, allowed_pipelines=[logistic_regression_binary_pipeline_class])
+    with patch('evalml.automl.rankings_store.RankingsStore._get_full_rankings') as mock_get_full_rankings:
+        automl.search(X, y)
+    mock_get_full_rankings.assert_not_called()
+    assert len(automl.full_rankings) == 3
+
+
+def test_automl_rankings_incremental(X_y_binary, logistic_regression_binary_pipeline_class):
+    X, y = X_y_binary
+    automl = AutoMLSearch(problem_type='binary', max_iterations=6, automl_algorithm='successive_halving',
+                          allowed_pipelines=[logistic_regression_binary_pipeline_class])
+    automl.search(X, y)
+    results = automl.results['pipeline_results']
+    pipeline_results = [results[id] for id in automl.results['search_order']]
+    fully_evaluated = [automl._is_fully_evaluated(result) for result in pipeline_results]
+    full_rankings, rankings = _expected_rankings(pipeline_results, fully_evaluated, automl.objective.greater_is_better)
+    pd.testing.assert_frame_equal(automl.full_rankings, full_rankings)
+    pd.testing.assert_frame_equal(automl.rankings, rankings)
+    assert automl.best_pipeline.parameters == results[rankings["id"].iloc[0]]["parameters"]
+
+
+def test_early_stopping_incremental(caplog):
+    automl = AutoMLSearch(problem_type='binary', objective='AUC', max_iterations=10, patience=2, tolerance=0.05)
+    scores = [0.95, 0.84, 1.0, 0.97, 0.96]
+    for id, score in enumerate(scores):
+        automl._results['pipeline_results'][id] = {'score': score, 'budget': 0.5 if id == 1 else 1.0}
+        automl._results['search_order'].append(id)
+        should_continue = automl._check_stopping_condition(time.time())
+        assert automl._n_early_stopping_results == id + 1
+        assert should_continue == (id < 4)
+    assert automl._early_stopping_best_score == 1.0
+    assert "2 iterations without improvement. Stopping search early." in caplog.text
@@ -0,0 +1,211 @@
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from evalml.automl import AutoMLSearch
+from evalml.automl.automl_algorithm import (
+    AutoMLAlgorithmException,
+    SuccessiveHalvingAlgorithm
+)
+from evalml.model_family import ModelFamily
+from evalml.pipelines import BinaryClassificationPipeline
+from evalml.pipelines.components import Estimator
+from evalml.problem_types import ProblemTypes
+
+
+@pytest.fixture
+def dummy_binary_pipeline_classes():
+    class MockEstimator(Estimator):
+        name = "Mock Classifier"
+        model_family = ModelFamily.NONE
+        supported_problem_types = [ProblemTypes.BINARY, ProblemTypes.MULTICLASS]
+        hyperparameter_ranges = {'dummy_parameter': ['default', 'other']}
+
+        def __init__(self, dummy_parameter='default', random_state=0):
+            super().__init__(parameters={'dummy_parameter': dummy_parameter}, component_obj=None, random_state=random_state)
+
+    class MockBinaryClassificationPipeline1(BinaryClassificationPipeline):
+        component_graph = [MockEstimator]
+
+    class MockBinaryClassificationPipeline2(BinaryClassificationPipeline):
+        component_graph = [MockEstimator]
+
+    return [MockBinaryClassificationPipeline1, MockBinaryClassificationPipeline2]
+
+
+def test_successive_halving_algorithm_init():
+    algo = SuccessiveHalvingAlgorithm()
+    assert algo.pipeline_number == 0
+    assert algo.batch_number == 0
+    assert algo.allowed_pipelines == []
+    assert algo.eta == 3
+    assert algo.hyperband is False
+
+    with pytest.raises(ValueError, match="eta must be greater than 1"):
+        SuccessiveHalvingAlgorithm(eta=1)
+    with pytest.raises(ValueError, match="min_budget must be greater than 0 and at most 1"):
+        SuccessiveHalvingAlgorithm(min_budget=0)
+    with pytest.raises(ValueError, match="min_budget must be greater than 0 and at most 1"):
+        SuccessiveHalvingAlgorithm(min_budget=1.5)
+
+
+def test_successive_halving_algorithm_brackets(dummy_binary_pipeline_classes):
+    algo = SuccessiveHalvingAlgorithm(allowed_pipelines=dummy_binary_pipeline_classes)
+    for bracket in range(2):
+        batch = algo.next_batch()
+        assert len(batch) == 9
+        assert [algo.get_budget(pipeline) for pipeline in batch] == [1 / 9] * 9
+        if bracket == 0:
+            assert [pipeline.__class__ for pipeline in batch[:2]] == dummy_binary_pipeline_classes
+            assert all(pipeline.parameters == {'Mock Classifier': {'dummy_parameter': 'default'}} for pipeline in batch[:2])
+        scores = np.arange(9.0)
+        scores[0] = np.nan
+        for score, pipeline in zip(scores, batch):
+            algo.add_result(score, pipeline)
+
+        promoted = algo.next_batch()
+        assert len(promoted) == 3
+        assert [algo.get_budget(pipeline) for pipeline in promoted] == [1 / 3] * 3
+        assert [pipeline.parameters for pipeline in promoted] == [pipeline.parameters for pipeline in batch[1:4]]
+        assert [pipeline.__class__ for pipeline in promoted] == [pipeline.__class__ for pipeline in batch[1:4]]
+        for score, pipeline in zip([3, 1, 2], promoted):
+            algo.add_result(score, pipeline)
+
+        final = algo.next_batch()
+        assert len(final) == 1
+        assert algo.get_budget(final[0]) == 1.0
+        assert final[0].parameters == promoted[1].parameters
+        algo.add_result(0, final[0])
+    assert algo.batch_number == 6
+    assert algo.pipeline_number == 26
+
+
+def test_successive_halving_algorithm_hyperband(dummy_binary_pipeline_classes):
+    algo = SuccessiveHalvingAlgorithm(allowed_pipelines=dummy_binary_pipeline_classes, hyperband=True)
+    batch_budgets = []
+    for _ in range(6):
+        batch = algo.next_batch()
+        batch_budgets.append((len(batch), algo.get_budget(batch[0])))
+        for pipeline in batch:
+            algo.add_result(0, pipeline)
+    assert batch_budgets == [(9, 1 / 9), (3, 1 / 3), (1, 1.0), (5, 1 / 3), (1, 1.0), (3, 1.0)]
+
+
+def test_successive_halving_algorithm_only_full_budget_results_reach_tuners(dummy_binary_pipeline_classes):
+    algo = SuccessiveHalvingAlgorithm(allowed_pipelines=dummy_binary_pipeline_classes, min_budget=0.5, eta=2)
+    batch = algo.next_batch()
+    assert algo.get_budget(batch[0]) == 0.5
+    with patch.object(algo._tuners[batch[0].name], 'add') as mock_add:
+        algo.add_result(1, batch[0])
+        mock_add.assert_not_called()
+        final = algo.next_batch()
+        algo.add_result(1, final[0])
+        mock_add.assert_called_once_with(final[0].parameters, 1)
+
+
+def test_successive_halving_algorithm_downsized_results(dummy_binary_pipeline_classes):
+    algo = SuccessiveHalvingAlgorithm(allowed_pipelines=dummy_binary_pipeline_classes, min_budget=0.25, eta=2)
+    batch = algo.next_batch()
+    assert len(batch) == 4
+    # the best score was only computed on a fraction of the rows the batch was evaluated on, so it's ranked last
+    algo.add_result(0, batch[0], budget=0.1)
+    for score, pipeline in zip([3, 1, 2], batch[1:]):
+        algo.add_result(score, pipeline)
+    promoted = algo.next_batch()
+    assert [pipeline.parameters for pipeline in promoted] == [batch[2].parameters, batch[3].parameters]
+    assert [pipeline.__class__ for pipeline in promoted] == [batch[2].__class__, batch[3].__class__]
+    for pipeline in promoted:
+        algo.add_result(0, pipeline)
+
+    batch = algo.next_batch()
+    with patch.object(algo._tuners[batch[0].name], 'add') as mock_add:
+        algo.add_result(0, batch[0], budget=0.5)
+        mock_add.assert_not_called()
+        algo.add_result(0, batch[0], budget=1.0)
+        mock_add.assert_called_once_with(batch[0].parameters, 0)
+
+
+def test_successive_halving_algorithm_budgets_of_latest_batch(dummy_binary_pipeline_classes):
+    algo = SuccessiveHalvingAlgorithm(allowed_pipelines=dummy_binary_pipeline_classes)
+    batch = algo.next_batch()
+    assert algo.get_budget(batch[0]) == 1 / 9
+    # only the pipelines proposed in the latest batch have a budget, not other pipelines with the same parameters
+    assert algo.get_budget(batch[0].__class__(parameters=batch[0].parameters)) == 1.0
+    algo.clear_budgets()
+    assert [algo.get_budget(pipeline) for pipeline in batch] == [1.0] * 9
+
+
+def test_successive_halving_algorithm_no_results(dummy_binary_pipeline_classes):
+    algo = SuccessiveHalvingAlgorithm(allowed_pipelines=dummy_binary_pipeline_classes)
+    algo.next_batch()
+    with pytest.raises(AutoMLAlgorithmException, match='No results were reported from the previous batch'):
+        algo.next_batch()
+
+
+@pytest.mark.parametrize("automl_algorithm", ['successive_halving', 'hyperband'])
+def test_automl_successive_halving(automl_algorithm, X_y_binary, logistic_regression_binary_pipeline_class):
+    X, y = X_y_binary
+    automl = AutoMLSearch(problem_type='binary', max_iterations=14, automl_algorithm=automl_algorithm,
+                          allowed_pipelines=[logistic_regression_binary_pipeline_class])
+    assert f'AutoML Algorithm: {automl_algorithm}' in str(automl)
+    automl.search(X, y)
+    assert isinstance(automl._automl_algorithm, SuccessiveHalvingAlgorithm)
+    results = automl.results['pipeline_results']
+    budgets = [results[id]['budget'] for id in automl.results['search_order']]
+    assert budgets[:14] == [1.0] + [1 / 9] * 9 + [1 / 3] * 3 + [1.0]
+    n_training_rows = [results[id]['cv_data'][0]['all_objective_scores']['# Training'] for id in automl.results['search_order']]
+    assert n_training_rows[1] == int(np.ceil(len(X) / 9)) * 2 // 3
+    assert n_training_rows[13] == n_training_rows[0]
+    assert set(automl.rankings['id']) == {0, 13}
+    assert len(automl.full_rankings) == 14
+    assert automl.best_pipeline.parameters == automl.get_pipeline(automl.rankings['id'].iloc[0]).parameters
+
+
+def test_automl_successive_halving_add_to_rankings(X_y_binary, logistic_regression_binary_pipeline_class):
+    X, y = X_y_binary
+    automl = AutoMLSearch(problem_type='binary', max_iterations=4, automl_algorithm='successive_halving',
+                          allowed_pipelines=[logistic_regression_binary_pipeline_class])
+    next_batch = SuccessiveHalvingAlgorithm.next_batch
+    batches = []
+
+    def record_batch(algorithm):
+        batch = next_batch(algorithm)
+        batches.append(list(batch))
+        return batch
+
+    with patch.object(SuccessiveHalvingAlgorithm, 'next_batch', autospec=True, side_effect=record_batch):
+        automl.search(X, y)
+    # the search stopped in the middle of a bracket evaluated on 1/9 of the rows
+    assert [result['budget'] for result in automl.results['pipeline_results'].values()] == [1.0] + [1 / 9] * 3
+    # pipelines added to the rankings are evaluated on all of the data, even those proposed in the interrupted bracket,
+    # which can also happen to pipelines created later when the id of a proposed pipeline is reused
+    for pipeline in batches[-1][3:5] + [logistic_regression_binary_pipeline_class(parameters={'Logistic Regression Classifier': {'C': 0.5}})]:
+        automl.add_to_rankings(pipeline, X, y)
+    results = automl.results['pipeline_results']
+    n_training_rows = results[0]['cv_data'][0]['all_objective_scores']['# Training']
+    for id in range(4, 7):
+        assert results[id]['budget'] == 1.0
+        assert results[id]['cv_data'][0]['all_objective_scores']['# Training'] == n_training_rows
+    assert len(automl.rankings) == 2
+    assert set(automl.rankings['id']) - {0} <= set(range(4, 7))
+
+
+def test_automl_invalid_automl_algorithm():
+    with pytest.raises(ValueError, match="automl_algorithm must be one of"):
+        AutoMLSearch(problem_type='binary', automl_algorithm='random')
+
+
+def test_automl_subsample_stratified(X_y_multi):
+    X, y = X_y_multi
+    X, y = pd.DataFrame(X), pd.Series(y)
+    automl = AutoMLSearch(problem_type='multiclass', automl_algorithm='successive_halving')
+    automl._subsample_seed = 0
+    X_sample, y_sample = automl._subsample(X, y, 0.1)
+    assert len(X_sample) == len(y_sample) == int(np.ceil(len(X) * 0.1))
+    assert set(y_sample) == set(y)
+    pd.testing.assert_frame_equal(X_sample, X.loc[y_sample.index])
+    X_resample, _ = automl._subsample(X, y, 0.1)
+    pd.testing.assert_frame_equal(X_sample, X_resample)
+    assert automl._subsample(X, y, 1.0)[0] is X
@@ -0,0 +1,155 @@
+import copy
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from evalml.pipelines import (
+    BinaryClassificationPipeline,
+    ComponentTelemetry,
+    TransformerCache
+)
+from evalml.pipelines.components import (
+    ComponentHook,
+    Imputer,
+    LogisticRegressionClassifier,
+    OneHotEncoder
+)
+
+
+class RecordingHook(ComponentHook):
+    def __init__(self):
+        self.calls = []
+
+    def before_call(self, component, method, input_shape):
+        self.calls.append(('before', component.name, method, input_shape))
+
+    def after_call(self, component, method, input_shape, wall_time, cpu_time):
+        assert wall_time >= 0 and cpu_time >= 0
+        self.calls.append(('after', component.name, method, input_shape))
+
+
+class LogisticRegressionPipeline(BinaryClassificationPipeline):
+    component_graph = ['Imputer', 'One Hot Encoder', 'Logistic Regression Classifier']
+
+
+@pytest.fixture
+def X_y_categorical_binary():
+    X = pd.DataFrame({'num': np.arange(100) % 7,
+                      'cat': ['a', 'b', 'c', 'd', 'e'] * 20})
+    X.loc[::9, 'num'] = np.nan
+    y = pd.Series([0, 1] * 50)
+    return X, y
+
+
+def test_component_hooks(X_y_categorical_binary):
+    X, y = X_y_categorical_binary
+    hook = RecordingHook()
+    imputer = Imputer()
+    imputer.add_hook(hook)
+    assert imputer.hooks == [hook]
+
+    imputer.fit(X, y)
+    imputer.transform(X)
+    # fit_transform calls fit and transform, which don't call the hooks again
+    X_t = imputer.fit_transform(X, y)
+    assert hook.calls == [('before', 'Imputer', 'fit', (100, 2)), ('after', 'Imputer', 'fit', (100, 2)),
+                          ('before', 'Imputer', 'transform', (100, 2)), ('after', 'Imputer', 'transform', (100, 2)),
+                          ('before', 'Imputer', 'fit_transform', (100, 2)), ('after', 'Imputer', 'fit_transform', (100, 2))]
+
+    X_t = OneHotEncoder().fit_transform(X_t)
+    estimator = LogisticRegressionClassifier()
+    estimator.add_hook(hook)
+    estimator.fit(X_t, y)
+    estimator.predict(X_t)
+    estimator.predict_proba(X_t)
+    assert [call[2] for call in hook.calls[6:]] == ['fit', 'fit', 'predict', 'predict', 'predict_proba', 'predict_proba']
+
+    imputer.remove_hook(hook)
+    assert imputer.hooks == []
+    imputer.transform(X)
+    assert len(hook.calls) == 12
+
+
+def test_component_hooks_after_exception():
+    hook = RecordingHook()
+    encoder = OneHotEncoder()
+    encoder.add_hook(hook)
+    with pytest.raises(ValueError):
+        encoder.fit(pd.DataFrame({'cat': ['a', np.nan]}))
+    assert [call[0] for call in hook.calls] == ['before', 'after']
+    assert not encoder._in_hook_call
+
+
+def test_component_hooks_errors():
+    imputer = Imputer()
+    with pytest.raises(ValueError, match="hook must be a ComponentHook. Received str instead"):
+        imputer.add_hook('hook')
+    with pytest.raises(ValueError, match="hook was not added"):
+        imputer.remove_hook(ComponentHook())
+
+    pipeline = LogisticRegressionPipeline({})
+    with pytest.raises(ValueError, match="hook must be a ComponentHook. Received function instead"):
+        pipeline.add_hook(lambda component: None)
+    with pytest.raises(ValueError, match="hook was not added"):
+        pipeline.remove_hook(ComponentHook())
+
+
+def test_hooks_not_copied(X_y_categorical_binary):
+    X, y = X_y_categorical_binary
+    imputer = Imputer()
+    imputer.add_hook(RecordingHook())
+    assert copy.deepcopy(imputer).hooks == []
+    assert pickle.loads(pickle.dumps(imputer)).hooks == []
+    assert imputer.clone().hooks == []
+    assert len(imputer.hooks) == 1
+
+    pipeline = LogisticRegressionPipeline({})
+    pipeline.add_hook(RecordingHook())
+    assert copy.deepcopy(pipeline).hooks == []
+    assert pickle.loads(pickle.dumps(pipeline)).hooks == []
+    assert pipeline.clone().hooks == []
+    assert len(pipeline.hooks) == 1
+
+
+@pytest.mark.parametrize("use_cache", [False, True])
+def test_pipeline_hooks(use_cache, X_y_categorical_binary):
+    X, y = X_y_categorical_binary
+    hook = RecordingHook()
+    telemetry = ComponentTelemetry()
+    pipeline = LogisticRegressionPipeline({})
+    pipeline.add_hook(hook)
+    pipeline.add_hook(telemetry)
+    if use_cache:
+        pipeline.transformer_cache = TransformerCache()
+    pipeline.fit(X, y)
+    pipeline.predict_proba(X)
+    assert [call[:3] for call in hook.calls] == [
+        ('before', 'Imputer', 'fit_transform'), ('after', 'Imputer', 'fit_transform'),
+        ('before', 'One Hot Encoder', 'fit_transform'), ('after', 'One Hot Encoder', 'fit_transform'),
+        ('before', 'Logistic Regression Classifier', 'fit'), ('after', 'Logistic Regression Classifier', 'fit'),
+        ('before', 'Imputer', 'transform'), ('after', 'Imputer', 'transform'),
+        ('before', 'One Hot Encoder', 'transform'), ('after', 'One Hot Encoder', 'transform'),
+        ('before', 'Logistic Regression Classifier', 'predict_proba'), ('after', 'Logistic Regression Classifier', 'predict_proba')]
+    assert hook.calls[0][3] == (100, 2)
+    assert [(record['component'], record['method']) for record in telemetry.to_records()] == [
+        ('Imputer', 'fit_transform'), ('One Hot Encoder', 'fit_transform'), ('Logistic Regression Classifier', 'fit'),
+        ('Imputer', 'transform'), ('One Hot Encoder', 'transform'), ('Logistic Regression Classifier', 'predict_proba')]
+
+    pipeline.remove_hook(hook)
+    pipeline.remove_hook(telemetry)
+    pipeline.predict(X)
+    assert len(hook.calls) == 12
+
+
+def test_pipeline_and_component_hooks(X_y_categorical_binary):
+    X, y = X_y_categorical_binary
+    pipeline_hook = RecordingHook()
+    component_hook = RecordingHook()
+    pipeline = LogisticRegressionPipeline({})
+    pipeline.add_hook(pipeline_hook)
+    pipeline.estimator.add_hook(component_hook)
+    pipeline.fit(X, y)
+    assert len(pipeline_hook.calls) == 6
+    assert component_hook.calls == [call for call in pipeline_hook.calls if call[1] == 'Logistic Regression Classifier']
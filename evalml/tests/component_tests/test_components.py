@@ -820,6 +820,40 @@ def test_serialization(X_y_binary, tmpdir):
                 assert (component.feature_importance == loaded_component.feature_importance).all()
 
 
+def _comparable(parameters):
+    # pipelines made by make_pipeline_from_components are defined in a function, so loading them makes their class again
+    if 'input_pipelines' in parameters:
+        parameters = dict(parameters, input_pipelines=[(p.name, p.parameters) for p in parameters['input_pipelines']])
+    return parameters
+
+
+@pytest.mark.parametrize("extension", ['', '.zip'])
+def test_serialization_artifact(extension, X_y_binary, tmpdir):
+    X, y = X_y_binary
+    path = os.path.join(str(tmpdir), 'component' + extension)
+    for component_class in all_components():
+        try:
+            component = component_class()
+        except EnsembleMissingPipelinesError:
+            if (component_class == StackedEnsembleClassifier):
+                component = component_class(input_pipelines=[make_pipeline_from_components([RandomForestClassifier()], ProblemTypes.BINARY)])
+            elif (component_class == StackedEnsembleRegressor):
+                component = component_class(input_pipelines=[make_pipeline_from_components([RandomForestRegressor()], ProblemTypes.REGRESSION)])
+        component.fit(X, y)
+
+        component.save_artifact(path)
+        loaded_component = ComponentBase.load_artifact(path)
+        assert type(loaded_component) == component_class
+        assert _comparable(component.parameters) == _comparable(loaded_component.parameters)
+        description, loaded_description = component.describe(return_dict=True), loaded_component.describe(return_dict=True)
+        assert _comparable(description.pop('parameters')) == _comparable(loaded_description.pop('parameters'))
+        assert description == loaded_description
+        if isinstance(component, Estimator):
+            np.testing.assert_array_equal(component.predict(X), loaded_component.predict(X))
+        else:
+            pd.testing.assert_frame_equal(component.transform(X, y), loaded_component.transform(X, y))
+
+
 @patch('cloudpickle.dump')
 def test_serialization_protocol(mock_cloudpickle_dump, tmpdir):
     path = os.path.join(str(tmpdir), 'pipe.pkl')
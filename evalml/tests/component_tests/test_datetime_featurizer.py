@@ -80,3 +80,11 @@ def test_datetime_featurizer_numpy_array_input():
     X = np.array(['2007-02-03', '2016-06-07', '2020-05-19'], dtype='datetime64')
     datetime_transformer.fit(X)
     assert list(datetime_transformer.transform(X).columns) == ["0_year", "0_month", "0_day_of_week", "0_hour"]
+
+
+def test_datetime_featurizer_does_not_modify_input():
+    X = pd.DataFrame({"date col": pd.date_range('2020-02-24', periods=20, freq='D'), "numerical": range(20)})
+    X_expected = X.copy()
+    datetime_transformer = DateTimeFeaturizer(features_to_extract=["year", "month"])
+    datetime_transformer.fit_transform(X)
+    pd.testing.assert_frame_equal(X, X_expected)
@@ -428,3 +428,12 @@ def test_ohe_features_to_encode_no_col_names():
     col_names = set(X_t.columns)
     assert (col_names == expected_col_names)
     assert ([X_t[col].dtype == "uint8" for col in X_t])
+
+
+def test_does_not_modify_input():
+    X = pd.DataFrame({"col_1": ["a", "b", np.nan, "a"], "col_2": [1, 2, 3, 4]})
+    X_expected = X.copy()
+    encoder = OneHotEncoder(handle_missing='as_category')
+    encoder.fit(X)
+    encoder.transform(X)
+    pd.testing.assert_frame_equal(X, X_expected)
@@ -1,3 +1,4 @@
+import copy
 import warnings
 from unittest.mock import patch
 
@@ -26,7 +27,7 @@ from evalml.model_understanding.graphs import (
     precision_recall_curve,
     roc_curve
 )
-from evalml.objectives import CostBenefitMatrix
+from evalml.objectives import CostBenefitMatrix, FraudCost, get_objective
 from evalml.pipelines import (
     BinaryClassificationPipeline,
     MulticlassClassificationPipeline,
@@ -626,21 +627,38 @@ def test_binary_objective_vs_threshold(X_y_binary, logistic_regression_binary_pi
     assert not results_df.isnull().all().all()
 
 
-@patch('evalml.pipelines.BinaryClassificationPipeline.score')
-def test_binary_objective_vs_threshold_steps(mock_score,
+@patch('evalml.pipelines.BinaryClassificationPipeline.predict_proba')
+def test_binary_objective_vs_threshold_steps(mock_predict_proba,
                                              X_y_binary, logistic_regression_binary_pipeline_class):
     X, y = X_y_binary
     cbm = CostBenefitMatrix(true_positive=1, true_negative=-1,
                             false_positive=-7, false_negative=-2)
     pipeline = logistic_regression_binary_pipeline_class(parameters={})
     pipeline.fit(X, y)
-    mock_score.return_value = {"Cost Benefit Matrix": 0.2}
+    mock_predict_proba.return_value = pd.DataFrame({0: 1 - np.linspace(0, 1, len(y)), 1: np.linspace(0, 1, len(y))})
     cost_benefit_df = binary_objective_vs_threshold(pipeline, X, y, cbm, steps=234)
-    mock_score.assert_called()
+    mock_predict_proba.assert_called_once()
     assert list(cost_benefit_df.columns) == ['threshold', 'score']
     assert cost_benefit_df.shape == (235, 2)
 
 
+@pytest.mark.parametrize("objective", ['f1', 'MCC Binary', 'Precision', 'Balanced Accuracy Binary',
+                                       CostBenefitMatrix(true_positive=1, true_negative=-1, false_positive=-7, false_negative=-2),
+                                       FraudCost(amount_col=0)])
+def test_binary_objective_vs_threshold_matches_score(objective, X_y_binary, logistic_regression_binary_pipeline_class):
+    X, y = X_y_binary
+    X = pd.DataFrame(X)
+    y = pd.Series(y).map({0: 'no', 1: 'yes'})
+    pipeline = logistic_regression_binary_pipeline_class(parameters={})
+    pipeline.fit(X, y)
+    results_df = binary_objective_vs_threshold(pipeline, X, y, objective, steps=20)
+    objective = get_objective(objective, return_instance=True)
+    pipeline_tmp = copy.copy(pipeline)
+    for threshold, score in zip(results_df['threshold'], results_df['score']):
+        pipeline_tmp.threshold = threshold
+        assert score == pytest.approx(pipeline_tmp.score(X, y, [objective])[objective.name])
+
+
 @patch('evalml.model_understanding.graphs.binary_objective_vs_threshold')
 def test_graph_binary_objective_vs_threshold(mock_cb_thresholds, X_y_binary, logistic_regression_binary_pipeline_class):
     go = pytest.importorskip('plotly.graph_objects', reason='Skipping plotting test because plotly not installed')
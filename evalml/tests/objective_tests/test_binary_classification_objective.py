@@ -1,7 +1,19 @@
+from unittest.mock import patch
+
 import numpy as np
 import pandas as pd
 import pytest
 
+from evalml.objectives import (
+    AccuracyBinary,
+    BalancedAccuracyBinary,
+    CostBenefitMatrix,
+    FraudCost,
+    LeadScoring,
+    MCCBinary,
+    Precision,
+    Recall
+)
 from evalml.objectives.standard_metrics import AUC, F1
 
 
@@ -48,3 +60,62 @@ def test_decision_function_neg():
     pd.testing.assert_series_equal(obj.decision_function(ypred_proba.tolist()), y_true)
     pd.testing.assert_series_equal(obj.decision_function(ypred_proba), y_true)
     pd.testing.assert_series_equal(obj.decision_function(pd.Series(ypred_proba, dtype=float)), y_true)
+
+
+@pytest.mark.parametrize("objective", [F1(), Precision(), Recall(), MCCBinary(), AccuracyBinary(), BalancedAccuracyBinary(),
+                                       CostBenefitMatrix(true_positive=1, true_negative=0.5, false_positive=-2, false_negative=-1),
+                                       LeadScoring(true_positives=10, false_positives=-1)])
+def test_optimize_threshold_exactly(objective):
+    rng = np.random.RandomState(0)
+    sign = 1 if objective.greater_is_better else -1
+    for _ in range(20):
+        n = rng.randint(2, 50)
+        ypred_proba = np.round(rng.rand(n), 1)
+        y_true = np.array([0, 1] + list(rng.randint(0, 2, n - 2)))
+        with patch('evalml.objectives.binary_classification_objective.minimize_scalar') as mock_minimize:
+            threshold = objective.optimize_threshold(ypred_proba, y_true)
+        mock_minimize.assert_not_called()
+        score = objective.objective_function(y_true, objective.decision_function(ypred_proba, threshold))
+        candidates = np.concatenate([np.unique(ypred_proba), np.unique(ypred_proba) - 1e-9])
+        best_score = max(sign * objective.objective_function(y_true, objective.decision_function(ypred_proba, candidate))
+                         for candidate in candidates)
+        assert sign * score == pytest.approx(best_score)
+
+
+def test_optimize_threshold_exactly_ties_and_nans():
+    obj = AccuracyBinary()
+    # every threshold between 0.2 and 0.8 is best, so the one closest to 0.5 is picked
+    assert obj.optimize_threshold(np.array([0.2, 0.8]), np.array([0, 1])) == 0.5
+    threshold = obj.optimize_threshold(np.array([0.1, 0.3]), np.array([1, 1]))
+    assert threshold < 0.1
+    threshold = obj.optimize_threshold(np.array([0.7, 0.9]), np.array([0, 0]))
+    assert threshold >= 0.9
+
+    ypred_proba = np.array([np.nan, 0.3, 0.6, np.nan])
+    y_true = np.array([0, 0, 1, 1])
+    threshold = obj.optimize_threshold(ypred_proba, y_true)
+    assert 0.3 <= threshold < 0.6
+    assert obj.optimize_threshold(np.array([np.nan, np.nan]), np.array([0, 1])) == 0.5
+
+
+def test_optimize_threshold_falls_back_to_search():
+    ypred_proba = np.array([0.2, 0.4, 0.6])
+    with patch('evalml.objectives.binary_classification_objective.minimize_scalar') as mock_minimize:
+        F1().optimize_threshold(ypred_proba, np.array(['a', 'b', 'b']))
+    mock_minimize.assert_called_once()
+
+    X = pd.DataFrame({'amount': [10, 20, 30]})
+    with patch('evalml.objectives.binary_classification_objective.minimize_scalar') as mock_minimize:
+        FraudCost(amount_col='amount').optimize_threshold(ypred_proba, np.array([0, 1, 1]), X=X)
+    mock_minimize.assert_called_once()
+
+
+def test_score_thresholds():
+    obj = F1()
+    ypred_proba = np.array([0.1, 0.4, np.nan, 0.6, 0.9, 0.4])
+    y_true = np.array([0, 1, 1, 0, 1, 0])
+    thresholds = np.linspace(0, 1, 11)
+    assert obj._can_score_from_confusion_matrix()
+    expected = [obj.score(y_true, obj.decision_function(ypred_proba, threshold)) for threshold in thresholds]
+    np.testing.assert_allclose(obj._score_thresholds(ypred_proba, y_true, thresholds), expected)
+    assert not FraudCost()._can_score_from_confusion_matrix()
@@ -1,3 +1,5 @@
+import gc
+
 import numpy as np
 import pandas as pd
 import pytest
@@ -16,7 +18,7 @@ from evalml.objectives import (
 )
 from evalml.objectives.objective_base import ObjectiveBase
 from evalml.problem_types import ProblemTypes
-from evalml.utils.gen_utils import _get_subclasses
+from evalml.utils.gen_utils import _clear_subclass_caches, _get_subclasses
 
 
 def test_create_custom_objective():
@@ -45,6 +47,29 @@ def test_get_objective_works_for_names_of_defined_objectives(obj):
     assert isinstance(get_objective(obj(*args)), obj)
 
 
+def test_get_objective_finds_new_objectives():
+    assert "mock objective" not in get_all_objective_names()
+
+    class MockObjective(BinaryClassificationObjective):
+        __module__ = 'evalml.objectives.mock'
+        name = "Mock Objective"
+        greater_is_better = True
+        score_needs_proba = False
+        perfect_score = 1
+
+        def objective_function(self, y_true, y_predicted, X=None):
+            return 1
+
+    try:
+        assert get_objective("Mock Objective") is MockObjective
+        assert "mock objective" in get_all_objective_names()
+    finally:
+        del MockObjective
+        _clear_subclass_caches()
+        gc.collect()
+    assert "mock objective" not in get_all_objective_names()
+
+
 def test_get_objective_does_raises_error_for_incorrect_name_or_random_class():
 
     class InvalidObjective:
@@ -17,6 +17,8 @@ from evalml.objectives import (
     F1Macro,
     F1Micro,
     F1Weighted,
+    FraudCost,
+    LeadScoring,
     LogLossBinary,
     MCCBinary,
     MCCMulticlass,
@@ -32,10 +34,12 @@ from evalml.objectives import (
     RootMeanSquaredError,
     RootMeanSquaredLogError
 )
+from evalml.objectives.objective_base import _confusion_matrix
 from evalml.objectives.utils import (
     _all_objectives_dict,
     get_non_core_objectives
 )
+from evalml.problem_types import ProblemTypes
 
 EPS = 1e-5
 all_automl_objectives = _all_objectives_dict()
@@ -452,3 +456,36 @@ def test_calculate_percent_difference_negative_and_equal_numbers():
     assert LogLossBinary.calculate_percent_difference(score=-10, baseline_score=-5) == 100
     assert LogLossBinary.calculate_percent_difference(score=-5, baseline_score=10) == 150
     assert LogLossBinary.calculate_percent_difference(score=10, baseline_score=-5) == -300
+
+
+@pytest.mark.parametrize("objective_class", [objective_class for objective_class in _all_objectives_dict().values()
+                                             if objective_class not in [CostBenefitMatrix, FraudCost, LeadScoring]])
+def test_score_confusion_matrix(objective_class):
+    objective = objective_class()
+    if objective.score_needs_proba or objective.problem_type == ProblemTypes.REGRESSION:
+        assert not objective._can_score_from_confusion_matrix()
+        return
+    assert objective._can_score_from_confusion_matrix()
+    rng = np.random.RandomState(0)
+    n_classes = 2 if objective.problem_type == ProblemTypes.BINARY else 4
+    for _ in range(20):
+        y_true = rng.randint(0, n_classes, 30)
+        # some classes are never predicted
+        y_predicted = rng.randint(0, n_classes - 1, 30)
+        confusion_matrix = _confusion_matrix(y_true, y_predicted)
+        assert objective._score_confusion_matrix(confusion_matrix) == pytest.approx(objective.score(y_true, y_predicted))
+        confusion_matrix = _confusion_matrix(y_true, y_true)
+        assert objective._score_confusion_matrix(confusion_matrix) == pytest.approx(objective.perfect_score)
+
+
+def test_confusion_matrix_counts():
+    np.testing.assert_array_equal(_confusion_matrix(np.array([0, 1, 1, 2]), np.array([0, 2, 1, 2])),
+                                  [[1, 0, 0], [0, 1, 1], [0, 0, 1]])
+    np.testing.assert_array_equal(_confusion_matrix(pd.Series([0, 0]), pd.Series([False, False])), [[2, 0], [0, 0]])
+    np.testing.assert_array_equal(_confusion_matrix(np.array([1.0, 0.0]), np.array([1, 1])), [[0, 1], [0, 1]])
+    assert _confusion_matrix(np.array([0, -1]), np.array([0, 1])) is None
+    assert _confusion_matrix(np.array([0, 1.5]), np.array([0, 1])) is None
+    assert _confusion_matrix(np.array([0, np.nan]), np.array([0, 1])) is None
+    assert _confusion_matrix(np.array(['a', 'b']), np.array([0, 1])) is None
+    assert _confusion_matrix(np.array([0, 1]), np.array([0, 1, 1])) is None
+    assert _confusion_matrix(np.array([0, 5000]), np.array([0, 1])) is None
@@ -0,0 +1,106 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from evalml.exceptions import PipelineNotYetFittedError
+from evalml.pipelines import BinaryClassificationPipeline, RegressionPipeline
+
+
+class BinaryPipeline(BinaryClassificationPipeline):
+    component_graph = ['Imputer', 'DateTime Featurization Component', 'One Hot Encoder', 'Logistic Regression Classifier']
+
+
+class LinearRegressionPipeline(RegressionPipeline):
+    component_graph = ['Imputer', 'One Hot Encoder', 'Linear Regressor']
+
+
+@pytest.fixture
+def X_y_mixed():
+    X = pd.DataFrame({'num': np.arange(300) % 13,
+                      'float': np.linspace(-1, 1, 300),
+                      'cat': pd.Series(['a', 'b', 'c', 'd', 'e'] * 60, dtype='category'),
+                      'date': pd.date_range('2020-01-01', periods=300, freq='D')})
+    X['num'] = X['num'].astype(float)
+    X.loc[::7, 'num'] = np.nan
+    y = pd.Series(['no', 'yes', 'yes'] * 100)
+    return X, y
+
+
+def _chunks(X, chunk_rows):
+    for start in range(0, len(X), chunk_rows):
+        yield X.iloc[start:start + chunk_rows]
+
+
+@pytest.mark.parametrize("prefetch", [False, True])
+def test_predict_batches_csv(prefetch, X_y_mixed, tmpdir):
+    X, y = X_y_mixed
+    pipeline = BinaryPipeline({}).fit(X, y)
+    source = str(tmpdir.join('data.csv'))
+    X.assign(unused=1).to_csv(source, index=False)
+
+    output = str(tmpdir.join('predictions.csv'))
+    assert pipeline.predict_batches(source, output, chunk_rows=70, prefetch=prefetch) == 300
+    predictions = pd.read_csv(output)
+    assert list(predictions.columns) == ['prediction']
+    # chunks of rows 0 to 6 of the num column have no missing values and are read as integers
+    pd.testing.assert_series_equal(predictions['prediction'], pipeline.predict(X), check_names=False)
+
+    output = str(tmpdir.join('probabilities.csv'))
+    assert pipeline.predict_batches(source, output, chunk_rows=7, method='predict_proba', prefetch=prefetch) == 300
+    pd.testing.assert_frame_equal(pd.read_csv(output), pipeline.predict_proba(X))
+
+
+def test_predict_batches_iterable(X_y_mixed):
+    X, y = X_y_mixed
+    X = X.set_index(np.arange(300) * 2)
+    pipeline = LinearRegressionPipeline({}).fit(X.drop(columns=['date']), np.arange(300))
+    written = []
+    assert pipeline.predict_batches(_chunks(X, 128), written.append, prefetch=True) == 300
+    assert [len(predictions) for predictions in written] == [128, 128, 44]
+    predictions = pd.concat(written)
+    pd.testing.assert_index_equal(predictions.index, X.index)
+    np.testing.assert_allclose(predictions['prediction'], pipeline.predict(X.drop(columns=['date'])))
+
+
+def test_predict_batches_conforms_dtypes(X_y_mixed):
+    X, y = X_y_mixed
+    pipeline = BinaryPipeline({}).fit(X, y)
+    chunk = pd.DataFrame({'date': X['date'].astype(str), 'cat': X['cat'].astype(str),
+                          'num': X['num'].fillna(0).astype(int), 'float': X['float']})
+    written = []
+    pipeline.predict_batches([chunk], written.append, method='predict_proba')
+    X_expected = X.assign(num=X['num'].fillna(0))
+    pd.testing.assert_frame_equal(written[0], pipeline.predict_proba(X_expected))
+
+
+def test_predict_batches_errors(X_y_mixed, tmpdir):
+    X, y = X_y_mixed
+    pipeline = BinaryPipeline({})
+    with pytest.raises(PipelineNotYetFittedError):
+        pipeline.predict_batches([X], print)
+    pipeline.fit(X, y)
+    with pytest.raises(ValueError, match="method must be 'predict' or 'predict_proba'. Received transform instead"):
+        pipeline.predict_batches([X], print, method='transform')
+    with pytest.raises(ValueError, match="chunk_rows must be a positive integer. Received 0 instead"):
+        pipeline.predict_batches([X], print, chunk_rows=0)
+    with pytest.raises(ValueError, match="source must be a .csv or .parquet file or an iterable of DataFrames"):
+        pipeline.predict_batches('data.json', print)
+    with pytest.raises(ValueError, match="output must be a .csv or .parquet file or a callable"):
+        pipeline.predict_batches([X], 'predictions.json')
+    with pytest.raises(ValueError, match=r"Chunk is missing columns the pipeline was fit on: \['cat'\]"):
+        pipeline.predict_batches([X.drop(columns=['cat'])], print)
+
+    regression_pipeline = LinearRegressionPipeline({}).fit(X.drop(columns=['date']), np.arange(300))
+    with pytest.raises(ValueError, match="Probability estimates are only available for classification pipelines"):
+        regression_pipeline.predict_batches([X], print, method='predict_proba')
+
+
+def test_predict_batches_parquet(X_y_mixed, tmpdir):
+    pytest.importorskip('pyarrow', reason='Skipping test because pyarrow not installed')
+    X, y = X_y_mixed
+    pipeline = BinaryPipeline({}).fit(X, y)
+    source = str(tmpdir.join('data.parquet'))
+    X.to_parquet(source)
+    output = str(tmpdir.join('probabilities.parquet'))
+    assert pipeline.predict_batches(source, output, chunk_rows=50, method='predict_proba') == 300
+    pd.testing.assert_frame_equal(pd.read_parquet(output), pipeline.predict_proba(X))
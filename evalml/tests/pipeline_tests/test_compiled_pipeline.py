@@ -0,0 +1,227 @@
+import pickle
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from evalml.exceptions import PipelineNotYetFittedError
+from evalml.pipelines import (
+    BinaryClassificationPipeline,
+    CatBoostRegressor,
+    CompiledPipeline,
+    MulticlassClassificationPipeline,
+    RegressionPipeline
+)
+from evalml.pipelines.utils import get_estimators, make_pipeline
+from evalml.problem_types import ProblemTypes
+
+
+@pytest.fixture
+def X_mixed():
+    X = pd.DataFrame({'num': np.arange(200) % 13,
+                      'float': np.linspace(-1, 1, 200),
+                      'cat': ['a', 'b', 'c', 'd', 'e'] * 40,
+                      'category': pd.Series(['x', 'y'] * 100, dtype='category'),
+                      'null': [np.nan] * 200,
+                      'datetime': pd.date_range('2020-01-01', periods=200, freq='D')})
+    X.loc[::7, 'num'] = np.nan
+    X.loc[::11, 'cat'] = np.nan
+    return X
+
+
+class BinaryPipeline(BinaryClassificationPipeline):
+    component_graph = ['Drop Columns Transformer', 'Imputer', 'One Hot Encoder', 'Standard Scaler', 'Logistic Regression Classifier']
+
+
+class MulticlassPipeline(MulticlassClassificationPipeline):
+    component_graph = ['Drop Null Columns Transformer', 'One Hot Encoder', 'RF Classifier Select From Model', 'Random Forest Classifier']
+
+
+class RegressionImputerPipeline(RegressionPipeline):
+    component_graph = ['Select Columns Transformer', 'Per Column Imputer', 'Simple Imputer', 'One Hot Encoder', 'Elastic Net Regressor']
+
+
+class FallbackPipeline(BinaryClassificationPipeline):
+    component_graph = ['Imputer', 'DateTime Featurization Component', 'One Hot Encoder', 'XGBoost Classifier']
+
+
+def _fit_pipelines(X):
+    X_numeric_dates = X.drop(columns=['datetime'])
+    y_binary = pd.Series(['no', 'yes'] * 100)
+    y_multiclass = pd.Series([0, 1, 2, 3] * 50)
+    y_regression = pd.Series(np.arange(200) * 0.5)
+    return [
+        (BinaryPipeline({'Drop Columns Transformer': {'columns': ['datetime']}}).fit(X, y_binary), X,
+         ['Drop Columns Transformer', 'Imputer', 'One Hot Encoder', 'Standard Scaler', 'Logistic Regression Classifier']),
+        (MulticlassPipeline({'Drop Null Columns Transformer': {'pct_null_threshold': 0.1},
+                            'One Hot Encoder': {'handle_missing': 'as_category', 'top_n': 3}}).fit(X_numeric_dates, y_multiclass), X_numeric_dates,
+         ['Drop Null Columns Transformer', 'One Hot Encoder', 'RF Classifier Select From Model', 'Random Forest Classifier']),
+        (RegressionImputerPipeline({'Select Columns Transformer': {'columns': ['num', 'float', 'cat', 'category']},
+                                    'Per Column Imputer': {'impute_strategies': {'num': {'impute_strategy': 'median'}}}}).fit(X, y_regression), X,
+         ['Select Columns Transformer', 'Per Column Imputer', 'Simple Imputer', 'One Hot Encoder', 'Elastic Net Regressor']),
+        (FallbackPipeline({}).fit(X, y_binary), X, ['Imputer', 'One Hot Encoder', 'XGBoost Classifier']),
+    ]
+
+
+def test_compiled_pipeline_predictions(X_mixed):
+    for pipeline, X_fit, compiled_components in _fit_pipelines(X_mixed):
+        X_new = X_fit.iloc[::-3].reset_index(drop=True)
+        # categories not seen during fit are encoded as zeros
+        X_new.loc[X_new.index[::4], 'cat'] = 'unseen'
+        compiled = pipeline.compile()
+        assert isinstance(compiled, CompiledPipeline)
+        assert compiled.compiled_components == compiled_components
+        assert compiled.input_columns == list(X_fit.columns)
+        for X in [X_fit, X_new, X_new.iloc[:1]]:
+            if pipeline.problem_type == ProblemTypes.REGRESSION:
+                np.testing.assert_allclose(compiled.predict(X), pipeline.predict(X).to_numpy())
+            else:
+                np.testing.assert_array_equal(compiled.predict(X), pipeline.predict(X).to_numpy())
+                np.testing.assert_allclose(compiled.predict_proba(X), pipeline.predict_proba(X).to_numpy())
+
+
+@pytest.mark.parametrize("problem_type,estimator_class", [(problem_type, estimator_class) for problem_type in ProblemTypes
+                                                          for estimator_class in get_estimators(problem_type)])
+def test_compiled_pipeline_every_estimator(problem_type, estimator_class, X_mixed):
+    X = X_mixed.drop(columns=['null', 'datetime'])
+    y = {ProblemTypes.BINARY: pd.Series(['no', 'yes'] * 100), ProblemTypes.MULTICLASS: pd.Series([0, 1, 2, 3] * 50),
+         ProblemTypes.REGRESSION: pd.Series(np.arange(200) * 0.5)}[problem_type]
+    pipeline = make_pipeline(X, y, estimator_class, problem_type)({}).fit(X, y)
+    compiled = pipeline.compile()
+    X_new = X.iloc[::-3].reset_index(drop=True)
+    if problem_type == ProblemTypes.REGRESSION:
+        np.testing.assert_allclose(compiled.predict(X_new), pipeline.predict(X_new).to_numpy())
+    else:
+        np.testing.assert_array_equal(compiled.predict(X_new), pipeline.predict(X_new).to_numpy())
+        np.testing.assert_allclose(compiled.predict_proba(X_new), pipeline.predict_proba(X_new).to_numpy(), rtol=1e-6)
+
+
+def test_compiled_pipeline_numpy_input(X_mixed):
+    X_mixed = X_mixed.drop(columns=['datetime'])
+    y = pd.Series([0, 1] * 100)
+    pipeline = BinaryPipeline({}).fit(X_mixed, y)
+    compiled = pipeline.compile()
+    np.testing.assert_allclose(compiled.predict_proba(X_mixed.to_numpy()), pipeline.predict_proba(X_mixed).to_numpy())
+    with pytest.raises(ValueError, match=r"X must have shape \[n_samples, 5\]. Received \(200, 4\) instead"):
+        compiled.predict(X_mixed.to_numpy()[:, :4])
+    with pytest.raises(KeyError):
+        compiled.predict(X_mixed.drop(columns=['cat']))
+
+
+def test_compiled_pipeline_threshold(X_mixed):
+    y = pd.Series(['no', 'yes'] * 100)
+    pipeline = BinaryPipeline({'Drop Columns Transformer': {'columns': ['datetime']}}).fit(X_mixed, y)
+    pipeline.threshold = 0.8
+    compiled = pipeline.compile()
+    pipeline.threshold = None
+    np.testing.assert_array_equal(compiled.predict(X_mixed), np.where(compiled.predict_proba(X_mixed)[:, 1] > 0.8, 'yes', 'no'))
+    np.testing.assert_array_equal(pipeline.compile().predict(X_mixed), pipeline.predict(X_mixed).to_numpy())
+
+
+def test_compiled_pipeline_errors(X_mixed):
+    X = X_mixed.drop(columns=['datetime', 'null'])
+    with pytest.raises(PipelineNotYetFittedError):
+        BinaryPipeline({}).compile()
+
+    pipeline = RegressionImputerPipeline({'Select Columns Transformer': {'columns': ['num', 'float', 'cat']}})
+    compiled = pipeline.fit(X, pd.Series(np.arange(200))).compile()
+    with pytest.raises(ValueError, match="Probability estimates are only available for classification pipelines"):
+        compiled.predict_proba(X)
+
+    class EncoderPipeline(BinaryClassificationPipeline):
+        component_graph = ['One Hot Encoder', 'Logistic Regression Classifier']
+
+    compiled = EncoderPipeline({}).fit(X.dropna(), pd.Series([0, 1] * 100)[X.dropna().index]).compile()
+    with pytest.raises(ValueError, match="Input contains NaN"):
+        compiled.predict(X)
+
+
+def test_predict_one(X_mixed):
+    for pipeline, X_fit, _ in _fit_pipelines(X_mixed):
+        predictions = pipeline.predict(X_fit).to_numpy()
+        for index in [0, 7, 11, 50]:
+            record = X_fit.iloc[index].to_dict()
+            if pipeline.problem_type == ProblemTypes.REGRESSION:
+                np.testing.assert_allclose(pipeline.predict_one(record), predictions[index])
+                np.testing.assert_allclose(pipeline.predict_one(tuple(record.values())), predictions[index])
+            else:
+                assert pipeline.predict_one(record) == predictions[index]
+                assert pipeline.predict_one(tuple(record.values())) == predictions[index]
+                np.testing.assert_allclose(pipeline.predict_proba_one(record), pipeline.predict_proba(X_fit.iloc[[index]]).iloc[0])
+
+
+@pytest.mark.parametrize("estimator", ['XGBoost Classifier', 'LightGBM Classifier'])
+def test_predict_one_compiled_estimators(estimator, X_mixed):
+    class GradientBoostingPipeline(BinaryClassificationPipeline):
+        component_graph = ['Drop Columns Transformer', 'Imputer', 'One Hot Encoder', estimator]
+
+    y = pd.Series([0, 1] * 100)
+    pipeline = GradientBoostingPipeline({'Drop Columns Transformer': {'columns': ['datetime']}}).fit(X_mixed, y)
+    assert pipeline.compile().compiled_components == ['Drop Columns Transformer', 'Imputer', 'One Hot Encoder', estimator]
+    record = X_mixed.iloc[3].to_dict()
+    assert pipeline.predict_one(record) == pipeline.predict(X_mixed.iloc[[3]]).iloc[0]
+    np.testing.assert_allclose(pipeline.predict_proba_one(record), pipeline.predict_proba(X_mixed.iloc[[3]]).iloc[0], rtol=1e-6)
+
+
+def test_predict_one_compiled_pipeline_reused(X_mixed):
+    y = pd.Series(['no', 'yes'] * 100)
+    pipeline = BinaryPipeline({'Drop Columns Transformer': {'columns': ['datetime']}}).fit(X_mixed, y)
+    record = X_mixed.iloc[0].to_dict()
+    pipeline.predict_one(record)
+    compiled = pipeline._compiled_pipeline
+    pipeline.predict_proba_one(record)
+    assert pipeline._compiled_pipeline is compiled
+    assert pickle.loads(pickle.dumps(pipeline))._compiled_pipeline is None
+
+    pipeline.threshold = 0.99
+    assert pipeline._compiled_pipeline is None
+    assert pipeline.predict_one(record) == pipeline.predict(X_mixed.iloc[[0]]).iloc[0] == 'no'
+    pipeline.fit(X_mixed, y)
+    assert pipeline._compiled_pipeline is None
+
+
+def test_predict_one_errors(X_mixed):
+    pipeline = BinaryPipeline({'Drop Columns Transformer': {'columns': ['datetime']}})
+    with pytest.raises(PipelineNotYetFittedError):
+        pipeline.predict_one({})
+    with pytest.raises(PipelineNotYetFittedError):
+        pipeline.predict_proba_one({})
+    pipeline.fit(X_mixed, pd.Series([0, 1] * 100))
+    with pytest.raises(ValueError, match="record must have 6 values. Received 2 instead"):
+        pipeline.predict_one((1, 2))
+    with pytest.raises(KeyError):
+        pipeline.predict_one({'num': 1})
+
+
+@pytest.mark.parametrize("failure", ['compile_raises', 'compile_returns_none', 'compiled_predict_raises'])
+def test_predict_one_falls_back_to_predict(failure, X_mixed):
+    y = pd.Series(['no', 'yes'] * 100)
+    pipeline = BinaryPipeline({'Drop Columns Transformer': {'columns': ['datetime']}}).fit(X_mixed, y)
+    if failure == 'compile_raises':
+        patched = patch.object(BinaryPipeline, 'compile', side_effect=ValueError("Unable to compile"))
+    elif failure == 'compile_returns_none':
+        patched = patch.object(BinaryPipeline, 'compile', return_value=None)
+    else:
+        patched = patch.multiple(CompiledPipeline, predict_one=MagicMock(side_effect=ValueError("could not convert string to float")),
+                                 predict_proba_one=MagicMock(side_effect=ValueError("could not convert string to float")))
+    with patched as mocked:
+        for index in [0, 7, 11]:
+            record = X_mixed.iloc[index].to_dict()
+            assert pipeline.predict_one(record) == pipeline.predict(X_mixed.iloc[[index]]).iloc[0]
+            assert pipeline.predict_one(tuple(record.values())) == pipeline.predict(X_mixed.iloc[[index]]).iloc[0]
+            np.testing.assert_allclose(pipeline.predict_proba_one(record), pipeline.predict_proba(X_mixed.iloc[[index]]).iloc[0])
+        if failure != 'compiled_predict_raises':
+            mocked.assert_called_once()
+        with pytest.raises(ValueError, match="record must have 6 values. Received 2 instead"):
+            pipeline.predict_one((1, 2))
+        with pytest.raises(KeyError):
+            pipeline.predict_one({'num': 1})
+
+
+def test_predict_one_catboost_categoricals():
+    X = pd.DataFrame({'num': np.linspace(0, 1, 100), 'cat': ['a', 'b', 'c', 'd'] * 25})
+    y = pd.Series(np.arange(100) * 0.5)
+    pipeline = make_pipeline(X, y, CatBoostRegressor, ProblemTypes.REGRESSION)({}).fit(X, y)
+    np.testing.assert_allclose(pipeline.predict_one({'num': 0.1, 'cat': 'a'}),
+                               pipeline.predict(pd.DataFrame({'num': [0.1], 'cat': ['a']})).iloc[0])
@@ -0,0 +1,168 @@
+import pickle
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from evalml.automl import AutoMLSearch
+from evalml.pipelines import (
+    BinaryClassificationPipeline,
+    ComponentTelemetry,
+    TransformerCache
+)
+
+
+class LogisticRegressionPipeline(BinaryClassificationPipeline):
+    component_graph = ['Imputer', 'One Hot Encoder', 'Logistic Regression Classifier']
+
+
+@pytest.fixture
+def X_y_categorical_binary():
+    X = pd.DataFrame({'num': np.arange(100) % 7,
+                      'cat': ['a', 'b', 'c', 'd', 'e'] * 20})
+    X.loc[::9, 'num'] = np.nan
+    y = pd.Series([0, 1] * 50)
+    return X, y
+
+
+def _records_by_call(telemetry):
+    return {(record['component'], record['method']): record for record in telemetry.to_records()}
+
+
+def test_component_telemetry_measure():
+    class Component:
+        name = 'Component'
+
+    telemetry = ComponentTelemetry()
+    for _ in range(2):
+        with telemetry.measure(Component(), 'fit'):
+            sum(range(1000))
+    with pytest.raises(ValueError):
+        with telemetry.measure(Component(), 'transform'):
+            raise ValueError()
+    records = telemetry.to_records()
+    assert [(record['component'], record['method'], record['calls']) for record in records] == [('Component', 'fit', 2), ('Component', 'transform', 1)]
+    assert all(list(record) == ComponentTelemetry.columns for record in records)
+    assert all(record['wall_time'] >= 0 and record['cpu_time'] >= 0 for record in records)
+    assert all(record['peak_memory'] is None and record['rss'] is None for record in records)
+
+    telemetry = pickle.loads(pickle.dumps(telemetry))
+    with telemetry.measure(Component(), 'fit'):
+        pass
+    assert telemetry.to_records()[0]['calls'] == 3
+
+
+def test_component_telemetry_track_memory():
+    class Component:
+        name = 'Component'
+
+    telemetry = ComponentTelemetry(track_memory=True)
+    with telemetry.measure(Component(), 'fit'):
+        pass
+    assert telemetry.to_records()[0]['peak_memory'] is None
+
+    tracemalloc.start()
+    try:
+        with telemetry.measure(Component(), 'fit'):
+            data = np.ones(10 ** 6)
+            del data
+    finally:
+        tracemalloc.stop()
+    record = telemetry.to_records()[0]
+    assert record['calls'] == 2
+    assert record['peak_memory'] >= 8 * 10 ** 6
+    assert record['rss'] > 0
+
+
+def test_component_telemetry_keeps_user_traces(X_y_categorical_binary):
+    X, y = X_y_categorical_binary
+    pipeline = LogisticRegressionPipeline({})
+    pipeline.telemetry = ComponentTelemetry(track_memory=True)
+    tracemalloc.start()
+    try:
+        data = np.ones(10 ** 5)
+        pipeline.fit(X, y)
+        assert tracemalloc.get_object_traceback(data) is not None
+        records = pipeline.telemetry.to_records()
+    finally:
+        tracemalloc.stop()
+    assert all(record['peak_memory'] >= 0 for record in records)
+
+
+def test_component_telemetry_combine():
+    folds = [[{'component': 'A', 'method': 'fit', 'calls': 1, 'wall_time': 1.0, 'cpu_time': 0.5, 'peak_memory': None, 'rss': None}],
+             [{'component': 'B', 'method': 'fit', 'calls': 1, 'wall_time': 3.0, 'cpu_time': 2.0, 'peak_memory': 10, 'rss': 100},
+              {'component': 'A', 'method': 'fit', 'calls': 2, 'wall_time': 2.0, 'cpu_time': 1.5, 'peak_memory': 5, 'rss': 50}]]
+    assert ComponentTelemetry.combine(folds) == [
+        {'component': 'A', 'method': 'fit', 'calls': 3, 'wall_time': 3.0, 'cpu_time': 2.0, 'peak_memory': 5, 'rss': 50},
+        {'component': 'B', 'method': 'fit', 'calls': 1, 'wall_time': 3.0, 'cpu_time': 2.0, 'peak_memory': 10, 'rss': 100}]
+    assert ComponentTelemetry.combine([]) == []
+
+
+@pytest.mark.parametrize("use_cache", [False, True])
+def test_pipeline_telemetry(use_cache, X_y_categorical_binary):
+    X, y = X_y_categorical_binary
+    pipeline = LogisticRegressionPipeline({})
+    pipeline.telemetry = ComponentTelemetry()
+    if use_cache:
+        pipeline.transformer_cache = TransformerCache()
+    pipeline.fit(X, y)
+    pipeline.predict(X)
+    pipeline.predict_proba(X)
+    records = _records_by_call(pipeline.telemetry)
+    assert list(records) == [('Imputer', 'fit_transform'), ('One Hot Encoder', 'fit_transform'), ('Logistic Regression Classifier', 'fit'),
+                             ('Imputer', 'transform'), ('One Hot Encoder', 'transform'),
+                             ('Logistic Regression Classifier', 'predict'), ('Logistic Regression Classifier', 'predict_proba')]
+    # the cache reuses the transformed data the second time
+    assert records[('Imputer', 'transform')]['calls'] == (1 if use_cache else 2)
+
+    pipeline.threshold = 0.5
+    pipeline.predict(X)
+    assert _records_by_call(pipeline.telemetry)[('Logistic Regression Classifier', 'predict_proba')]['calls'] == 2
+
+
+def test_pipeline_without_telemetry(X_y_categorical_binary):
+    X, y = X_y_categorical_binary
+    pipeline = LogisticRegressionPipeline({})
+    assert pipeline.telemetry is None
+    pipeline.fit(X, y)
+    pipeline.predict(X)
+
+
+@pytest.mark.parametrize("track_memory", [False, True])
+def test_automl_component_telemetry(track_memory, X_y_categorical_binary, caplog):
+    X, y = X_y_categorical_binary
+    automl = AutoMLSearch(problem_type='binary', max_iterations=2, allowed_pipelines=[LogisticRegressionPipeline],
+                          n_jobs=1, track_memory=track_memory)
+    automl.search(X, y)
+    assert not tracemalloc.is_tracing()
+    results = automl.results['pipeline_results'][1]
+    for fold in results['cv_data']:
+        fold_records = {(record['component'], record['method']): record for record in fold['component_telemetry']}
+        assert fold_records[('One Hot Encoder', 'fit_transform')]['calls'] == 1
+        assert fold_records[('Logistic Regression Classifier', 'fit')]['calls'] == 1
+        assert (fold_records[('One Hot Encoder', 'fit_transform')]['peak_memory'] is not None) == track_memory
+    records = {(record['component'], record['method']): record for record in results['component_telemetry']}
+    assert records[('One Hot Encoder', 'fit_transform')]['calls'] == len(results['cv_data'])
+    assert records[('Logistic Regression Classifier', 'fit')]['wall_time'] == pytest.approx(
+        sum(fold['component_telemetry'][2]['wall_time'] for fold in results['cv_data']))
+    assert (records[('Logistic Regression Classifier', 'fit')]['rss'] is not None) == track_memory
+
+    caplog.clear()
+    assert automl.describe_pipeline(1, return_dict=True)['component_telemetry'] == results['component_telemetry']
+    assert "Component Telemetry" in caplog.text
+    assert "One Hot Encoder" in caplog.text
+
+
+def test_automl_component_telemetry_keeps_tracemalloc(X_y_categorical_binary):
+    X, y = X_y_categorical_binary
+    automl = AutoMLSearch(problem_type='binary', max_iterations=1, track_memory=True)
+    tracemalloc.start()
+    try:
+        data = np.ones(10 ** 5)
+        automl.search(X, y)
+        assert tracemalloc.is_tracing()
+        assert tracemalloc.get_object_traceback(data) is not None
+    finally:
+        tracemalloc.stop()
@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from evalml.exceptions import PipelineNotYetFittedError
+from evalml.pipelines import (
+    BinaryClassificationPipeline,
+    ParallelPredictor,
+    RegressionPipeline
+)
+
+
+class BinaryPipeline(BinaryClassificationPipeline):
+    component_graph = ['Imputer', 'One Hot Encoder', 'Logistic Regression Classifier']
+
+
+class LinearRegressionPipeline(RegressionPipeline):
+    component_graph = ['Imputer', 'One Hot Encoder', 'Linear Regressor']
+
+
+@pytest.fixture
+def X_y_categorical():
+    X = pd.DataFrame({'num': np.arange(500) % 13,
+                      'float': np.linspace(-1, 1, 500),
+                      'cat': ['a', 'b', 'c', 'd', 'e'] * 100},
+                     index=np.arange(500) * 3)
+    X.loc[::21, 'num'] = np.nan
+    y = pd.Series(['no', 'yes', 'yes', 'no', 'no'] * 100, index=X.index)
+    return X, y
+
+
+def test_parallel_predictor(X_y_categorical):
+    X, y = X_y_categorical
+    pipeline = BinaryPipeline({}).fit(X, y)
+    with ParallelPredictor(pipeline, n_workers=2, min_shard_rows=100) as predictor:
+        assert predictor.n_workers == 2
+        pd.testing.assert_series_equal(predictor.predict(X), pipeline.predict(X))
+        pd.testing.assert_frame_equal(predictor.predict_proba(X), pipeline.predict_proba(X))
+        pd.testing.assert_series_equal(predictor.predict(X, 'log loss binary'), pipeline.predict(X, 'log loss binary'))
+        # fewer rows than min_shard_rows are predicted by one worker
+        pd.testing.assert_series_equal(predictor.predict(X.iloc[:10]), pipeline.predict(X.iloc[:10]))
+    assert predictor._executor is None
+
+
+def test_parallel_predictor_saved_pipeline(X_y_categorical, tmpdir):
+    X, y = X_y_categorical
+    pipeline = LinearRegressionPipeline({}).fit(X, np.arange(500))
+    path = str(tmpdir.join('pipeline.pkl'))
+    pipeline.save(path)
+    predictor = ParallelPredictor(path, n_workers=2, min_shard_rows=100)
+    try:
+        pd.testing.assert_series_equal(predictor.predict(X), pipeline.predict(X))
+        with pytest.raises(ValueError, match="Probability estimates are only available for classification pipelines"):
+            predictor.predict_proba(X)
+    finally:
+        predictor.close()
+
+
+@pytest.mark.parametrize("name", ['pipeline', 'pipeline.zip'])
+def test_parallel_predictor_artifact(name, X_y_categorical, tmpdir):
+    X, y = X_y_categorical
+    pipeline = BinaryPipeline({}).fit(X, y)
+    path = str(tmpdir.join(name))
+    pipeline.save_artifact(path)
+    with ParallelPredictor(path, n_workers=2, min_shard_rows=100) as predictor:
+        pd.testing.assert_frame_equal(predictor.predict_proba(X), pipeline.predict_proba(X))
+
+
+def test_parallel_predictor_errors(X_y_categorical):
+    with pytest.raises(PipelineNotYetFittedError):
+        ParallelPredictor(BinaryPipeline({}))
+    with pytest.raises(ValueError, match="pipeline must be a PipelineBase or a path. Received int instead"):
+        ParallelPredictor(1)
+    X, y = X_y_categorical
+    pipeline = BinaryPipeline({}).fit(X, y)
+    with pytest.raises(ValueError, match="min_shard_rows must be a positive integer. Received 0 instead"):
+        ParallelPredictor(pipeline, min_shard_rows=0)
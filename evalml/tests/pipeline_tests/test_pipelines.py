@@ -15,7 +15,8 @@ from evalml.exceptions import (
     PipelineScoreError
 )
 from evalml.model_family import ModelFamily
-from evalml.objectives import FraudCost, Precision
+from evalml.objectives import FraudCost, Precision, get_core_objectives
+from evalml.objectives.objective_base import _confusion_matrix
 from evalml.pipelines import (
     BinaryClassificationPipeline,
     MulticlassClassificationPipeline,
@@ -341,6 +342,48 @@ def test_serialization(X_y_binary, tmpdir, logistic_regression_binary_pipeline_c
     assert pipeline.score(X, y, ['precision']) == PipelineBase.load(path).score(X, y, ['precision'])
 
 
+@pytest.mark.parametrize("extension", ['', '.zip'])
+def test_serialization_artifact(extension, X_y_binary, X_y_regression, tmpdir, logistic_regression_binary_pipeline_class, linear_regression_pipeline_class):
+    path = os.path.join(str(tmpdir), 'pipe' + extension)
+    X, y = X_y_binary
+    pipeline = logistic_regression_binary_pipeline_class(parameters={'Logistic Regression Classifier': {'C': 0.5}})
+    pipeline.fit(X, y)
+    pipeline.threshold = 0.3
+    pipeline.save_artifact(path)
+    loaded = PipelineBase.load_artifact(path)
+    # pipeline classes defined in functions are made again from their name, problem type and component graph
+    assert type(loaded) != type(pipeline)
+    assert type(loaded).name == pipeline.name
+    assert [type(component) for component in loaded.component_graph] == [type(component) for component in pipeline.component_graph]
+    assert loaded.parameters == pipeline.parameters
+    assert loaded.threshold == 0.3
+    pd.testing.assert_series_equal(loaded.predict(X), pipeline.predict(X))
+    pd.testing.assert_frame_equal(loaded.predict_proba(X), pipeline.predict_proba(X))
+    assert pipeline.score(X, y, ['precision']) == loaded.score(X, y, ['precision'])
+
+    X, y = X_y_regression
+    pipeline = linear_regression_pipeline_class(parameters={}).fit(X, y)
+    pipeline.save_artifact(path)
+    loaded = PipelineBase.load_artifact(path, mmap=False)
+    assert isinstance(loaded, RegressionPipeline)
+    pd.testing.assert_series_equal(loaded.predict(X), pipeline.predict(X))
+
+
+class ArtifactPipeline(BinaryClassificationPipeline):
+    custom_name = 'Artifact Pipeline'
+    component_graph = ['Imputer', 'One Hot Encoder', 'Random Forest Classifier']
+
+
+def test_serialization_artifact_importable_class(X_y_binary, tmpdir):
+    X, y = X_y_binary
+    path = str(tmpdir.join('pipe'))
+    pipeline = ArtifactPipeline({'Random Forest Classifier': {'n_estimators': 20}}).fit(X, y)
+    pipeline.save_artifact(path)
+    loaded = PipelineBase.load_artifact(path)
+    assert loaded == pipeline
+    pd.testing.assert_frame_equal(loaded.predict_proba(X), pipeline.predict_proba(X))
+
+
 @patch('cloudpickle.dump')
 def test_serialization_protocol(mock_cloudpickle_dump, tmpdir, logistic_regression_binary_pipeline_class):
     path = os.path.join(str(tmpdir), 'pipe.pkl')
@@ -780,6 +823,30 @@ def test_score_multiclass_objective_error(mock_predict, mock_fit, mock_objective
         assert "F1 Micro" in e.exceptions
 
 
+@pytest.mark.parametrize("problem_type", ['binary', 'multiclass'])
+def test_score_shares_confusion_matrix(problem_type, X_y_binary, X_y_multi, logistic_regression_binary_pipeline_class,
+                                       logistic_regression_multiclass_pipeline_class):
+    if problem_type == 'binary':
+        X, y = X_y_binary
+        pipeline = logistic_regression_binary_pipeline_class(parameters={})
+    else:
+        X, y = X_y_multi
+        pipeline = logistic_regression_multiclass_pipeline_class(parameters={})
+    pipeline.fit(X, y)
+    objectives = get_core_objectives(problem_type)
+    y_encoded = pipeline._encode_targets(pd.Series(y))
+    y_predicted = pipeline._encode_targets(pipeline.predict(X))
+    y_predicted_proba = pipeline.predict_proba(X)
+    if problem_type == 'binary':
+        y_predicted_proba = y_predicted_proba.iloc[:, 1]
+    expected = {objective.name: objective.score(y_encoded, y_predicted_proba if objective.score_needs_proba else y_predicted)
+                for objective in objectives}
+    with patch('evalml.pipelines.pipeline_base._confusion_matrix', wraps=_confusion_matrix) as mock_confusion_matrix:
+        scores = pipeline.score(X, y, objectives)
+    mock_confusion_matrix.assert_called_once()
+    assert scores == pytest.approx(expected)
+
+
 def test_no_default_parameters():
     class MockComponent(Transformer):
         name = "Mock Component"
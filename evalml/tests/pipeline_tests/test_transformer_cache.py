@@ -0,0 +1,145 @@
+import pickle
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from evalml.automl import AutoMLSearch
+from evalml.pipelines import (
+    BinaryClassificationPipeline,
+    OneHotEncoder,
+    TransformerCache
+)
+
+
+@pytest.fixture
+def X_y_categorical_binary():
+    X = pd.DataFrame({'num': np.arange(100) % 7,
+                      'cat': ['a', 'b', 'c', 'd', 'e'] * 20,
+                      'cat2': ['x', 'y', 'z', 'x'] * 25})
+    X.loc[::9, 'num'] = np.nan
+    y = pd.Series([0, 1] * 50)
+    return X, y
+
+
+class LogisticRegressionPipeline(BinaryClassificationPipeline):
+    component_graph = ['Imputer', 'One Hot Encoder', 'Logistic Regression Classifier']
+
+
+class RandomForestPipeline(BinaryClassificationPipeline):
+    component_graph = ['Imputer', 'One Hot Encoder', 'Random Forest Classifier']
+
+
+def test_transformer_cache_invalid_size():
+    with pytest.raises(ValueError, match="max_size must be positive"):
+        TransformerCache(max_size=0)
+
+
+def test_transformer_cache_reused_across_pipelines(X_y_categorical_binary):
+    X, y = X_y_categorical_binary
+    expected = RandomForestPipeline({}).fit(X, y).predict_proba(X)
+
+    cache = TransformerCache()
+    pipeline = LogisticRegressionPipeline({})
+    pipeline.transformer_cache = cache
+    pipeline.fit(X, y)
+    pipeline.predict_proba(X)
+    assert (cache.hits, cache.misses) == (0, 4)
+
+    pipeline = RandomForestPipeline({})
+    pipeline.transformer_cache = cache
+    with patch.object(OneHotEncoder, 'fit') as mock_fit:
+        pipeline.fit(X, y)
+        mock_fit.assert_not_called()
+    pd.testing.assert_frame_equal(pipeline.predict_proba(X), expected)
+    assert (cache.hits, cache.misses) == (4, 4)
+    assert list(pipeline.input_feature_names.keys()) == ['Imputer', 'One Hot Encoder', 'Random Forest Classifier']
+    assert pipeline.input_feature_names['Imputer'] == ['num', 'cat', 'cat2']
+
+
+def test_transformer_cache_restores_random_state(X_y_categorical_binary):
+    X, y = X_y_categorical_binary
+    parameters = {'One Hot Encoder': {'top_n': 2}}
+    pipeline = LogisticRegressionPipeline(parameters)
+    pipeline.fit(X, y)
+    expected_state = pipeline.random_state.get_state()
+
+    cache = TransformerCache()
+    for _ in range(2):
+        pipeline = LogisticRegressionPipeline(parameters)
+        pipeline.transformer_cache = cache
+        pipeline.fit(X, y)
+        np.testing.assert_equal(pipeline.random_state.get_state(), expected_state)
+        assert pipeline[1].random_state is pipeline.random_state
+    assert cache.hits == 2
+
+
+def test_transformer_cache_keys(X_y_categorical_binary):
+    X, y = X_y_categorical_binary
+    cache = TransformerCache()
+    fits = [({}, 0, X, y),
+            ({'One Hot Encoder': {'top_n': 1}}, 0, X, y),
+            ({}, 1, X, y),
+            ({}, 0, X.iloc[:50], y.iloc[:50])]
+    for parameters, random_state, X_fold, y_fold in fits:
+        pipeline = LogisticRegressionPipeline(parameters, random_state=random_state)
+        pipeline.transformer_cache = cache
+        pipeline.fit(X_fold, y_fold)
+    # only the imputer's parameters and data are the same in the first two fits
+    assert cache.hits == 1
+
+
+def test_transformer_cache_evicts_least_recently_used(X_y_categorical_binary):
+    X, y = X_y_categorical_binary
+    pipeline = LogisticRegressionPipeline({})
+    pipeline.transformer_cache = TransformerCache()
+    pipeline.fit(X, y)
+    sizes = [size for _, size in pipeline.transformer_cache._entries.values()]
+
+    cache = TransformerCache(max_size=max(sizes))
+    pipeline = LogisticRegressionPipeline({})
+    pipeline.transformer_cache = cache
+    pipeline.fit(X, y)
+    assert len(cache) == 1
+    assert cache.size == sizes[-1]
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.size == 0
+
+
+def test_transformer_cache_unhashable_data():
+    X = pd.DataFrame({'col': [[1], [2], [3], [4]] * 5})
+    y = pd.Series([0, 1] * 10)
+    cache = TransformerCache()
+    assert cache.fit_transform([], X, y, np.random.RandomState(0)) is None
+    assert cache.transform([], [], X) is X
+    assert len(cache) == 0
+
+
+def test_transformer_cache_pickle_drops_entries(X_y_categorical_binary):
+    X, y = X_y_categorical_binary
+    pipeline = LogisticRegressionPipeline({})
+    pipeline.transformer_cache = TransformerCache(max_size=10**8)
+    pipeline.fit(X, y)
+    assert len(pipeline.transformer_cache) == 2
+
+    unpickled_pipeline = pickle.loads(pickle.dumps(pipeline))
+    assert len(unpickled_pipeline.transformer_cache) == 0
+    assert unpickled_pipeline.transformer_cache.max_size == 10**8
+    pd.testing.assert_frame_equal(unpickled_pipeline.predict_proba(X), pipeline.predict_proba(X))
+
+
+def test_automl_transformer_cache(X_y_categorical_binary):
+    X, y = X_y_categorical_binary
+    with pytest.raises(ValueError, match="transformer_cache_size must be None or positive"):
+        AutoMLSearch(problem_type='binary', transformer_cache_size=-1)
+
+    rankings = []
+    for transformer_cache_size in [None, 10**8]:
+        automl = AutoMLSearch(problem_type='binary', max_iterations=4, transformer_cache_size=transformer_cache_size,
+                              allowed_pipelines=[LogisticRegressionPipeline, RandomForestPipeline])
+        automl.search(X, y)
+        rankings.append(automl.full_rankings)
+    assert automl.transformer_cache.hits > 0
+    pd.testing.assert_frame_equal(rankings[0].drop(columns=['parameters']), rankings[1].drop(columns=['parameters']))
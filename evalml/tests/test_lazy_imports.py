@@ -0,0 +1,49 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import evalml
+from evalml.pipelines import BinaryClassificationPipeline
+
+# modules which import slowly and aren't needed to load a pipeline and predict with it
+_LAZY_MODULES = ['shap', 'plotly', 'featuretools', 'catboost', 'xgboost', 'lightgbm', 'matplotlib',
+                 'evalml.automl', 'evalml.demos', 'evalml.model_understanding', 'evalml.tuners']
+
+
+def _imported_lazy_modules(code):
+    """Runs the code in a new python process and returns the lazy modules it imported."""
+    code += f"\nimport sys\nprint([module for module in {_LAZY_MODULES} if module in sys.modules])"
+    root = os.path.dirname(os.path.dirname(evalml.__file__))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([root, os.environ.get('PYTHONPATH', '')]))
+    output = subprocess.run([sys.executable, '-c', code], env=env, stdout=subprocess.PIPE, check=True).stdout
+    return output.decode().strip().splitlines()[-1]
+
+
+def test_import_evalml_is_lazy():
+    assert _imported_lazy_modules("import evalml") == '[]'
+
+
+@pytest.mark.parametrize("save_method", ['save', 'save_artifact'])
+def test_load_and_predict_is_lazy(save_method, X_y_binary, tmpdir):
+    class LogisticRegressionPipeline(BinaryClassificationPipeline):
+        component_graph = ['Imputer', 'One Hot Encoder', 'Standard Scaler', 'Logistic Regression Classifier']
+
+    X, y = X_y_binary
+    path = str(tmpdir.join('pipeline'))
+    getattr(LogisticRegressionPipeline({}).fit(X, y), save_method)(path)
+    load_method = 'load' if save_method == 'save' else 'load_artifact'
+    code = (f"import numpy as np\nfrom evalml.pipelines import PipelineBase\n"
+            f"pipeline = PipelineBase.{load_method}({path!r})\n"
+            f"pipeline.predict(np.ones((5, {X.shape[1]})))\npipeline.score(np.ones((5, {X.shape[1]})), np.arange(5) % 2, ['Log Loss Binary'])")
+    assert _imported_lazy_modules(code) == '[]'
+
+
+def test_lazy_attributes():
+    from evalml.automl import AutoMLSearch
+    assert evalml.AutoMLSearch is AutoMLSearch
+    assert evalml.demos.load_breast_cancer is not None
+    assert {'automl', 'demos', 'model_understanding', 'tuners', 'AutoMLSearch'}.issubset(dir(evalml))
+    with pytest.raises(AttributeError, match="module 'evalml' has no attribute 'missing'"):
+        evalml.missing
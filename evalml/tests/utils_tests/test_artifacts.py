@@ -0,0 +1,189 @@
+import collections
+import json
+import os
+import sys
+import types
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.tree import DecisionTreeClassifier
+
+from evalml.model_family import ModelFamily
+from evalml.utils.artifacts import load_object, open_artifact, save_object
+
+
+def _saved_values():
+    return {
+        'none': None, 'bool': True, 'int': 3, 'float': float('nan'), 'string': 'a',
+        'numpy scalars': [np.int64(2), np.float32(0.5), np.datetime64('2020-01-01')],
+        'arrays': [np.arange(5), np.linspace(0, 1, 1000).reshape(100, 10), np.array(['a', 'bc']),
+                   np.array(['x', None, 1.5], dtype=object), np.array([np.datetime64('2020-01-01')] * 100),
+                   np.array(2.5), np.zeros((0, 3)), np.asfortranarray(np.arange(200.).reshape(20, 10))],
+        'containers': [(1, 'a'), {1, 2}, frozenset(['a']), {1: 'int key', '__marker__': 'reserved key'},
+                       collections.OrderedDict([('b', 1), ('a', 2)])],
+        'defaultdict': collections.defaultdict(list, {'a': [1]}),
+        'bytes': [b'\x00\x01', bytearray(b'abc')],
+        'dtypes': [np.dtype('float64'), np.dtype([('a', '<i8'), ('b', '<f4')]), pd.CategoricalDtype(),
+                   pd.DatetimeTZDtype(tz='UTC')],
+        'pandas': [pd.Index(['a', 'b'], name='letters'), pd.Series([1.5, np.nan], index=['x', 'y'], name='values'),
+                   pd.Series(['a', 'b', 'a'], dtype='category')],
+        'random state': np.random.RandomState(5),
+        'enum': ModelFamily.RANDOM_FOREST,
+        'classes': [np.float64, str, collections.OrderedDict],
+    }
+
+
+def _assert_equal(value, loaded):
+    assert type(value) == type(loaded) or isinstance(value, np.ndarray)
+    if isinstance(value, dict):
+        assert list(value.keys()) == list(loaded.keys())
+        for key in value:
+            _assert_equal(value[key], loaded[key])
+    elif isinstance(value, (list, tuple)):
+        assert len(value) == len(loaded)
+        for item, loaded_item in zip(value, loaded):
+            _assert_equal(item, loaded_item)
+    elif isinstance(value, np.ndarray):
+        assert value.dtype == loaded.dtype
+        np.testing.assert_array_equal(value, loaded)
+    elif isinstance(value, pd.Index):
+        pd.testing.assert_index_equal(value, loaded)
+    elif isinstance(value, pd.Series):
+        pd.testing.assert_series_equal(value, loaded)
+    elif isinstance(value, np.random.RandomState):
+        assert value.randint(1000) == loaded.randint(1000)
+    elif isinstance(value, float) and np.isnan(value):
+        assert np.isnan(loaded)
+    else:
+        assert value == loaded
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+@pytest.mark.parametrize("extension", ['', '.zip'])
+def test_artifact_values(extension, mmap, tmpdir):
+    path = os.path.join(str(tmpdir), 'artifact' + extension)
+    values = _saved_values()
+    with open_artifact(path, 'w') as artifact:
+        save_object(artifact, 'values.json', values, extra={'a': 1})
+    with open_artifact(path) as artifact:
+        document = artifact.read_json('values.json')
+        assert document['extra'] == {'a': 1}
+        assert document['versions']['artifact_format'] == 1
+        loaded = load_object(artifact, 'values.json', mmap=mmap)
+    _assert_equal(_saved_values(), loaded)
+    # large arrays are packed into the binary file, and stay writable when memory mapped
+    assert 'offset' in json.dumps(document['object']['arrays'][1])
+    loaded['arrays'][1][0, 0] = 5
+    with open_artifact(path) as artifact:
+        assert load_object(artifact, 'values.json', mmap=mmap)['arrays'][1][0, 0] == 0
+
+
+def test_artifact_objects(tmpdir):
+    path = str(tmpdir.join('artifact'))
+    X = np.random.RandomState(0).rand(100, 3)
+    tree = DecisionTreeClassifier(random_state=0).fit(X, np.arange(100) % 3)
+    with open_artifact(path, 'w') as artifact:
+        save_object(artifact, 'tree.json', tree)
+    with open_artifact(path) as artifact:
+        loaded = load_object(artifact, 'tree.json')
+    np.testing.assert_array_equal(loaded.predict_proba(X), tree.predict_proba(X))
+    with open(os.path.join(path, 'tree.json')) as f:
+        assert '"__reduce__": "sklearn.tree._tree:Tree"' in f.read()
+
+
+def test_artifact_errors(tmpdir):
+    with pytest.raises(ValueError, match="mode must be 'r' or 'w'. Received a instead"):
+        open_artifact(str(tmpdir), 'a')
+    with pytest.raises(ValueError, match="is not an artifact directory or zip file"):
+        open_artifact(str(tmpdir.join('missing')))
+
+    with open_artifact(str(tmpdir), 'w') as artifact:
+        with pytest.raises(ValueError, match="Unable to save SimpleNamespace in an artifact"):
+            save_object(artifact, 'object.json', types.SimpleNamespace())
+        with pytest.raises(ValueError, match="which can only refer to classes"):
+            save_object(artifact, 'object.json', lambda x: x)
+        with pytest.raises(ValueError, match="which can only refer to classes"):
+            save_object(artifact, 'object.json', np.mean)
+        with pytest.raises(ValueError, match="can't be saved in an artifact because it can't be imported by name"):
+            save_object(artifact, 'object.json', type('Local', (), {}))
+
+        artifact.write_json('object.json', {'object': {'__object__': 'os:system', 'state': {}}})
+        with pytest.raises(ValueError, match="Artifacts can't refer to os:system"):
+            load_object(artifact, 'object.json')
+        artifact.write_json('object.json', {'object': {'__global__': 'evalml:missing'}})
+        with pytest.raises(ValueError, match="Unable to import evalml:missing from the artifact"):
+            load_object(artifact, 'object.json')
+        artifact.write_json('object.json', {'object': {'__unknown__': 1}})
+        with pytest.raises(ValueError, match="Unable to load __unknown__ from the artifact"):
+            load_object(artifact, 'object.json')
+
+
+@pytest.mark.parametrize("document", [
+    {'__reduce__': 'builtins:eval', 'args': {'__tuple__': ["open('pwned', 'w')"]}},
+    {'__reduce__': 'os:system', 'args': {'__tuple__': ['touch pwned']}},
+    {'__reduce__': 'subprocess:check_call', 'args': {'__tuple__': [['touch', 'pwned']]}},
+    {'__reduce__': 'subprocess:Popen', 'args': {'__tuple__': [['touch', 'pwned']]}},
+    {'__reduce__': 'numpy:load', 'args': {'__tuple__': ['pwned']}},
+    {'__reduce__': 'sklearn.tree._tree:Tree.__init__', 'args': {'__tuple__': []}},
+    {'__object__': 'builtins:eval', 'state': {}},
+    {'__object__': 'os:system', 'state': {}},
+    {'__object__': 'subprocess:Popen', 'state': {}},
+    {'__global__': 'builtins:eval'},
+    {'__global__': 'builtins:__import__'},
+    {'__global__': 'numpy:load'},
+    {'__global__': 'subprocess:run'},
+    {'__dict__': [], 'type': 'os:system'},
+    {'__dict__': [], 'type': 'sklearn.utils:Bunch', 'default_factory': {'__global__': 'numpy:load'}},
+    {'__enum__': 'subprocess:Popen', 'name': 'a'},
+    {'__pipeline__': {'path': 'os:system'}, 'state': {}},
+    {'__pipeline__': {'class_name': 'P', 'custom_name': 'P', 'problem_type': 'binary', 'component_graph': ['subprocess:Popen']},
+     'state': {}},
+])
+def test_artifact_untrusted_references(document, tmpdir):
+    with open_artifact(str(tmpdir), 'w') as artifact:
+        artifact.write_json('object.json', {'object': document})
+        with pytest.raises(ValueError, match="Artifacts can't refer to|Artifacts can only|Unable to import"):
+            load_object(artifact, 'object.json')
+    assert not tmpdir.join('pwned').exists()
+    assert not os.path.exists('pwned')
+
+
+def test_artifact_does_not_import_modules(tmpdir):
+    assert 'antigravity' not in sys.modules
+    with open_artifact(str(tmpdir), 'w') as artifact:
+        for document in [{'__global__': 'antigravity:webbrowser'}, {'__object__': 'antigravity:Component', 'state': {}},
+                         {'__reduce__': 'antigravity:geohash', 'args': {'__tuple__': []}}]:
+            artifact.write_json('object.json', {'object': document})
+            with pytest.raises(ValueError, match="Artifacts can't refer to antigravity"):
+                load_object(artifact, 'object.json')
+    assert 'antigravity' not in sys.modules
+    # modules of custom components are used if they're imported already, but only for components and pipelines
+    with open_artifact(str(tmpdir), 'w') as artifact:
+        artifact.write_json('object.json', {'object': {'__global__': 'types:SimpleNamespace'}})
+        with pytest.raises(ValueError, match="Artifacts can't refer to types:SimpleNamespace"):
+            load_object(artifact, 'object.json')
+
+
+def test_artifact_custom_component_module(tmpdir):
+    from evalml.pipelines.components import Transformer, ComponentBase
+
+    module = types.ModuleType('custom_components')
+
+    class CustomTransformer(Transformer):
+        name = "Custom Transformer"
+
+        def transform(self, X, y=None):
+            return X
+
+    CustomTransformer.__module__ = module.__name__
+    CustomTransformer.__qualname__ = 'CustomTransformer'
+    module.CustomTransformer = CustomTransformer
+    sys.modules[module.__name__] = module
+    try:
+        CustomTransformer().save_artifact(str(tmpdir))
+        assert type(ComponentBase.load_artifact(str(tmpdir))) is CustomTransformer
+    finally:
+        del sys.modules[module.__name__]
+    with pytest.raises(ValueError, match="Artifacts can't refer to custom_components:CustomTransformer"):
+        ComponentBase.load_artifact(str(tmpdir))
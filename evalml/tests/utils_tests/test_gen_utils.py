@@ -1,12 +1,15 @@
+import gc
 import inspect
 from unittest.mock import patch
 
 import numpy as np
 import pytest
 
-from evalml.pipelines.components import ComponentBase
+from evalml.pipelines.components import ComponentBase, Transformer
+from evalml.pipelines.components.utils import handle_component_class
 from evalml.utils.gen_utils import (
     SEED_BOUNDS,
+    _clear_subclass_caches,
     check_random_state_equality,
     classproperty,
     convert_to_seconds,
@@ -175,6 +178,26 @@ def test_get_importable_subclasses_wont_get_custom_classes():
     assert ChildClass not in get_importable_subclasses(ComponentBase)
 
 
+def test_get_importable_subclasses_cached_until_new_subclass():
+    transformers = get_importable_subclasses(Transformer, used_in_automl=False)
+    with patch('evalml.utils.gen_utils._is_importable') as mock_is_importable:
+        assert get_importable_subclasses(Transformer, used_in_automl=False) == transformers
+        mock_is_importable.assert_not_called()
+
+    class MockTransformer(Transformer):
+        __module__ = 'evalml.pipelines.components.transformers.mock'
+        name = "Mock Transformer"
+
+    try:
+        assert set(get_importable_subclasses(Transformer, used_in_automl=False)) == set(transformers + [MockTransformer])
+        assert handle_component_class("Mock Transformer") is MockTransformer
+    finally:
+        del MockTransformer
+        _clear_subclass_caches()
+        gc.collect()
+    assert get_importable_subclasses(Transformer, used_in_automl=False) == transformers
+
+
 @patch('importlib.import_module')
 def test_import_or_warn_errors(dummy_importlib):
     def _mock_import_function(library_str):
@@ -0,0 +1,502 @@
+"""Pickle-free artifacts for fitted components and pipelines.
+
+An artifact is a directory, or a zip file of the same layout, holding the state of each object as JSON, with the large
+numeric arrays in the state packed into a binary file next to it. The JSON records the offset, dtype and shape of each
+array, so the binary file of an artifact directory is memory mapped when it is loaded and the data of each array is only
+read from disk when it is first used.
+
+Objects are saved as the path of their class and their state, the same as pickle saves them, but an artifact can only
+refer to classes, never to functions. Loading one only imports modules from evalml and its dependencies, only uses
+modules of custom components and pipelines which are already imported, and only calls the constructors of the few
+extension types listed in _REDUCE_CLASSES. Other objects are made without calling their class, then given their state.
+"""
+import collections
+import enum
+import importlib
+import json
+import os
+import sys
+import zipfile
+
+import numpy as np
+import pandas as pd
+
+ARTIFACT_FORMAT_VERSION = 1
+
+# the packages whose classes can be referred to by an artifact. Classes from other modules can only be components or
+# pipelines, from modules which are imported before the artifact is loaded
+_TRUSTED_PACKAGES = ['numpy', 'pandas', 'scipy', 'sklearn', 'evalml', 'xgboost', 'lightgbm', 'catboost', '_catboost',
+                     'featuretools', 'nlp_primitives']
+# the classes from the standard library which can be referred to by an artifact
+_TRUSTED_BUILTINS = ['builtins:bool', 'builtins:int', 'builtins:float', 'builtins:complex', 'builtins:str', 'builtins:bytes',
+                     'builtins:bytearray', 'builtins:list', 'builtins:tuple', 'builtins:dict', 'builtins:set',
+                     'builtins:frozenset', 'builtins:object', 'collections:OrderedDict', 'collections:defaultdict']
+# the extension types which are saved with the arguments returned by their __reduce__, and so called when loaded
+_REDUCE_CLASSES = ['sklearn.tree._tree:Tree'] + [f'sklearn.linear_model._sgd_fast:{loss}' for loss in [
+    'EpsilonInsensitive', 'Hinge', 'Huber', 'Log', 'ModifiedHuber', 'SquaredEpsilonInsensitive', 'SquaredHinge',
+    'SquaredLoss']]
+# arrays with at most this many values are saved in the JSON instead of in their own .npy file
+_MAX_INLINE_ARRAY_SIZE = 64
+
+
+def open_artifact(path, mode='r'):
+    """Opens an artifact directory or zip file to read or write files in it.
+
+    Arguments:
+        path (str): the path of the artifact. Paths ending in .zip are zip files, other paths are directories.
+        mode (str): 'r' to read or 'w' to write. Defaults to 'r'.
+
+    Returns:
+        The artifact, to use as a context manager.
+    """
+    if mode not in ['r', 'w']:
+        raise ValueError(f"mode must be 'r' or 'w'. Received {mode} instead")
+    if path.endswith('.zip'):
+        return _ZipArtifact(path, mode)
+    return _DirectoryArtifact(path, mode)
+
+
+class _DirectoryArtifact:
+    def __init__(self, path, mode):
+        if mode == 'w':
+            os.makedirs(path, exist_ok=True)
+        elif not os.path.isdir(path):
+            raise ValueError(f"{path} is not an artifact directory or zip file")
+        self.path = path
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+    def write_json(self, name, document):
+        path = os.path.join(self.path, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(document, f)
+
+    def read_json(self, name):
+        with open(os.path.join(self.path, name)) as f:
+            return json.load(f)
+
+    def open_binary(self, name):
+        path = os.path.join(self.path, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        return open(path, 'wb')
+
+    def read_binary(self, name, mmap):
+        path = os.path.join(self.path, name)
+        if not mmap or os.path.getsize(path) == 0:
+            return np.fromfile(path, dtype=np.uint8)
+        # copy-on-write mappings can be written to without changing the file, for objects which modify their arrays
+        return np.memmap(path, dtype=np.uint8, mode='c')
+
+
+class _ZipArtifact:
+    def __init__(self, path, mode):
+        # arrays are stored uncompressed, so saving and loading them costs no more than reading and writing the bytes
+        self._zipfile = zipfile.ZipFile(path, mode, compression=zipfile.ZIP_STORED)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._zipfile.close()
+
+    def write_json(self, name, document):
+        self._zipfile.writestr(name, json.dumps(document))
+
+    def read_json(self, name):
+        return json.loads(self._zipfile.read(name))
+
+    def open_binary(self, name):
+        return self._zipfile.open(name, 'w', force_zip64=True)
+
+    def read_binary(self, name, mmap):
+        # files in zip files can't be memory mapped, so they are read when the artifact is loaded
+        return np.frombuffer(bytearray(self._zipfile.read(name)), dtype=np.uint8)
+
+
+def _global_path(value):
+    """Returns the module and qualified name of a class, after checking it can be imported from them."""
+    if not isinstance(value, type):
+        raise ValueError(f"Unable to save {value} in an artifact, which can only refer to classes")
+    module = getattr(value, '__module__', None)
+    qualname = getattr(value, '__qualname__', None)
+    if module is None or qualname is None or '<locals>' in qualname or _resolve(importlib.import_module, module, qualname) is not value:
+        raise ValueError(f"{value} can't be saved in an artifact because it can't be imported by name")
+    return f"{module}:{qualname}"
+
+
+def _resolve(import_module, module_name, qualname):
+    try:
+        value = import_module(module_name)
+        for name in qualname.split('.'):
+            value = getattr(value, name)
+    except (ImportError, KeyError, AttributeError):
+        return None
+    return value
+
+
+def _import_global(path, base_class=None, reduce=False):
+    """Imports the class at the path returned by _global_path, after checking that the artifact can refer to it.
+
+    Arguments:
+        path (str): the module and qualified name of the class.
+        base_class (type): the class the class must be a subclass of, if any.
+        reduce (bool): whether the class is called with arguments from the artifact, which only _REDUCE_CLASSES can be.
+    """
+    from evalml.pipelines import PipelineBase
+    from evalml.pipelines.components import ComponentBase
+
+    error = f"Artifacts can't refer to {path}, which is not a component, pipeline or class from evalml or its dependencies"
+    module_name, _, qualname = str(path).partition(':')
+    if reduce:
+        trusted = path in _REDUCE_CLASSES
+    else:
+        trusted = module_name.split('.')[0] in _TRUSTED_PACKAGES or path in _TRUSTED_BUILTINS
+    if not trusted and (reduce or module_name not in sys.modules):
+        raise ValueError(error)
+    # modules outside of evalml and its dependencies are never imported by loading an artifact
+    value = _resolve(importlib.import_module if trusted else sys.modules.__getitem__, module_name, qualname)
+    if value is None:
+        raise ValueError(f"Unable to import {path} from the artifact")
+    if not isinstance(value, type):
+        raise ValueError(error)
+    if not trusted and not issubclass(value, (ComponentBase, PipelineBase)):
+        raise ValueError(error)
+    if base_class is not None and not issubclass(value, base_class):
+        raise ValueError(f"Artifacts can only refer to a subclass of {base_class.__name__} in place of {path}")
+    return value
+
+
+class ArtifactEncoder:
+    """Converts objects to JSON, packing their large arrays into a binary file of an artifact."""
+
+    def __init__(self, artifact, name):
+        """Converts objects to JSON, packing their large arrays into a binary file of an artifact. Use as a context
+        manager, to close the binary file when done.
+
+        Arguments:
+            artifact: the artifact opened with open_artifact to save arrays in.
+            name (str): the path of the binary file in the artifact, which is only created if there are arrays to save.
+        """
+        self._artifact = artifact
+        self._name = name
+        self._file = None
+        self._size = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self._file is not None:
+            self._file.close()
+
+    def encode(self, value):
+        """Returns the value converted to JSON.
+
+        Arguments:
+            value: the object to convert.
+
+        Returns:
+            The JSON value, made of dicts, lists, strings, numbers, booleans and None.
+        """
+        if value is None or isinstance(value, (bool, str)):
+            return value
+        if isinstance(value, np.generic):
+            return {'__scalar__': self._encode_array(np.asarray(value))}
+        if isinstance(value, enum.Enum):
+            return {'__enum__': _global_path(type(value)), 'name': value.name}
+        if isinstance(value, (int, float)):
+            return value
+        if isinstance(value, np.ndarray):
+            return self._encode_array(value)
+        if type(value) is list:
+            return [self.encode(item) for item in value]
+        if type(value) is tuple:
+            return {'__tuple__': [self.encode(item) for item in value]}
+        if isinstance(value, (set, frozenset)):
+            return {'__set__': [self.encode(item) for item in value], 'frozen': isinstance(value, frozenset)}
+        if isinstance(value, dict):
+            return self._encode_dict(value)
+        if isinstance(value, (bytes, bytearray)):
+            return {'__bytes__': self._write(np.frombuffer(value, dtype=np.uint8)), 'size': len(value),
+                    'mutable': isinstance(value, bytearray)}
+        if isinstance(value, np.dtype):
+            return {'__dtype__': np.lib.format.dtype_to_descr(value)}
+        if isinstance(value, pd.api.extensions.ExtensionDtype):
+            return {'__pandas_dtype__': str(value)}
+        if isinstance(value, pd.Index):
+            return {'__index__': self.encode(value.to_numpy()), 'dtype': self.encode(value.dtype), 'name': self.encode(value.name)}
+        if isinstance(value, pd.Series):
+            return {'__series__': self.encode(value.to_numpy()), 'dtype': self.encode(value.dtype),
+                    'index': self.encode(value.index), 'name': self.encode(value.name)}
+        if isinstance(value, np.random.RandomState):
+            return {'__random_state__': self.encode(value.get_state())}
+        if isinstance(value, type) or callable(value) and hasattr(value, '__qualname__'):
+            # _global_path raises for functions, since loading an artifact must not give back code to call
+            return {'__global__': _global_path(value)}
+        return self._encode_object(value)
+
+    def _encode_dict(self, value):
+        if type(value) is dict and all(isinstance(key, str) and not key.startswith('__') for key in value):
+            return {key: self.encode(item) for key, item in value.items()}
+        encoded = {'__dict__': [[self.encode(key), self.encode(item)] for key, item in value.items()]}
+        if type(value) is not dict:
+            encoded['type'] = _global_path(type(value))
+        if isinstance(value, collections.defaultdict):
+            encoded['default_factory'] = self.encode(value.default_factory)
+        return encoded
+
+    def _encode_array(self, value):
+        if value.dtype.kind == 'O':
+            return {'__object_array__': [self.encode(item) for item in value.ravel()], 'shape': list(value.shape)}
+        if value.dtype.kind in 'biufU' and value.size <= _MAX_INLINE_ARRAY_SIZE:
+            return {'__ndarray__': value.tolist(), 'dtype': value.dtype.str, 'shape': list(value.shape)}
+        return {'__ndarray__': None, 'offset': self._write(np.ascontiguousarray(value).reshape(-1).view(np.uint8)),
+                'dtype': np.lib.format.dtype_to_descr(value.dtype), 'shape': list(value.shape)}
+
+    def _write(self, data):
+        """Writes an array of bytes to the binary file and returns its offset."""
+        if self._file is None:
+            self._file = self._artifact.open_binary(self._name)
+        # each array starts at a multiple of 64 bytes, so that arrays read from a memory mapped file are aligned
+        padding = -self._size % 64
+        self._file.write(b'\0' * padding)
+        self._file.write(data.data)
+        offset = self._size + padding
+        self._size = offset + len(data)
+        return offset
+
+    def _encode_object(self, value):
+        module = type(value).__module__.split('.')[0]
+        if module not in _TRUSTED_PACKAGES and not _is_component_or_pipeline(value):
+            raise ValueError(f"Unable to save {type(value).__name__} in an artifact")
+        if hasattr(value, '__dict__'):
+            state = value.__getstate__() if hasattr(value, '__getstate__') else value.__dict__
+            if _is_pipeline(value):
+                return {'__pipeline__': _pipeline_class_spec(type(value)), 'state': self.encode(state)}
+            return {'__object__': _global_path(type(value)), 'state': self.encode(state)}
+        # extension types, such as scikit-learn's trees, are rebuilt from the arguments and state returned by __reduce__
+        reduced = value.__reduce__()
+        path = _global_path(type(value))
+        if not isinstance(reduced, tuple) or reduced[0] is not type(value) or path not in _REDUCE_CLASSES:
+            raise ValueError(f"Unable to save {type(value).__name__} in an artifact")
+        encoded = {'__reduce__': path, 'args': self.encode(reduced[1])}
+        if len(reduced) > 2 and reduced[2] is not None:
+            encoded['state'] = self.encode(reduced[2])
+        return encoded
+
+
+class ArtifactDecoder:
+    """Converts JSON written by an ArtifactEncoder back to objects, loading their arrays from the artifact."""
+
+    def __init__(self, artifact, name, mmap=True):
+        """Converts JSON written by an ArtifactEncoder back to objects, loading their arrays from the artifact.
+
+        Arguments:
+            artifact: the artifact opened with open_artifact to load arrays from.
+            name (str): the path of the binary file the ArtifactEncoder packed the arrays into.
+            mmap (bool): whether to memory map the binary file instead of reading it. Only artifact directories can be
+                memory mapped. Defaults to True.
+        """
+        self._artifact = artifact
+        self._name = name
+        self._mmap = mmap
+        self._binary = None
+
+    def _read(self, offset, size):
+        if self._binary is None:
+            self._binary = self._artifact.read_binary(self._name, self._mmap)
+        return self._binary[offset:offset + size]
+
+    def decode(self, value):
+        """Returns the object which was converted to the JSON value.
+
+        Arguments:
+            value: the JSON value returned by ArtifactEncoder.encode.
+
+        Returns:
+            The object.
+        """
+        if isinstance(value, list):
+            return [self.decode(item) for item in value]
+        if not isinstance(value, dict):
+            return value
+        marker = next((key for key in value if key.startswith('__')), None)
+        if marker is None:
+            return {key: self.decode(item) for key, item in value.items()}
+        decode = getattr(self, f"_decode_{marker.strip('_')}", None)
+        if decode is None:
+            raise ValueError(f"Unable to load {marker} from the artifact")
+        return decode(value)
+
+    def _decode_scalar(self, value):
+        return self.decode(value['__scalar__'])[()]
+
+    def _decode_enum(self, value):
+        return _import_global(value['__enum__'], base_class=enum.Enum)[value['name']]
+
+    def _decode_ndarray(self, value):
+        if 'offset' not in value:
+            return np.array(value['__ndarray__'], dtype=value['dtype']).reshape(value['shape'])
+        dtype = np.lib.format.descr_to_dtype(value['dtype'])
+        size = dtype.itemsize * int(np.prod(value['shape']))
+        return self._read(value['offset'], size).view(dtype).reshape(value['shape'])
+
+    def _decode_object_array(self, value):
+        items = value['__object_array__']
+        array = np.empty(len(items), dtype=object)
+        for position, item in enumerate(items):
+            array[position] = self.decode(item)
+        return array.reshape(value['shape'])
+
+    def _decode_tuple(self, value):
+        return tuple(self.decode(item) for item in value['__tuple__'])
+
+    def _decode_set(self, value):
+        items = [self.decode(item) for item in value['__set__']]
+        return frozenset(items) if value['frozen'] else set(items)
+
+    def _decode_dict(self, value):
+        items = [(self.decode(key), self.decode(item)) for key, item in value['__dict__']]
+        if 'default_factory' in value:
+            default_factory = self.decode(value['default_factory'])
+            if default_factory is not None and not isinstance(default_factory, type):
+                raise ValueError("Artifacts can only use a class or None as the default_factory of a defaultdict")
+            return collections.defaultdict(default_factory, items)
+        if 'type' not in value:
+            return dict(items)
+        # subclasses of dict like sklearn's Bunch don't all take the items in their constructor
+        result = _import_global(value['type'], base_class=dict)()
+        result.update(items)
+        return result
+
+    def _decode_bytes(self, value):
+        data = self._read(value['__bytes__'], value['size']).tobytes()
+        return bytearray(data) if value['mutable'] else data
+
+    def _decode_dtype(self, value):
+        return np.lib.format.descr_to_dtype(value['__dtype__'])
+
+    def _decode_pandas_dtype(self, value):
+        return pd.api.types.pandas_dtype(value['__pandas_dtype__'])
+
+    def _decode_index(self, value):
+        return pd.Index(self.decode(value['__index__']), dtype=self.decode(value['dtype']), name=self.decode(value['name']))
+
+    def _decode_series(self, value):
+        return pd.Series(self.decode(value['__series__']), dtype=self.decode(value['dtype']), index=self.decode(value['index']),
+                         name=self.decode(value['name']))
+
+    def _decode_random_state(self, value):
+        random_state = np.random.RandomState()
+        random_state.set_state(self.decode(value['__random_state__']))
+        return random_state
+
+    def _decode_global(self, value):
+        return _import_global(value['__global__'])
+
+    def _decode_object(self, value, cls=None):
+        cls = cls or _import_global(value['__object__'])
+        obj = cls.__new__(cls)
+        state = self.decode(value['state'])
+        if hasattr(obj, '__setstate__'):
+            obj.__setstate__(state)
+        elif state is not None:
+            obj.__dict__.update(state)
+        return obj
+
+    def _decode_pipeline(self, value):
+        return self._decode_object(value, cls=_load_pipeline_class(value['__pipeline__']))
+
+    def _decode_reduce(self, value):
+        obj = _import_global(value['__reduce__'], reduce=True)(*self.decode(value['args']))
+        if 'state' in value:
+            obj.__setstate__(self.decode(value['state']))
+        return obj
+
+
+def _is_component_or_pipeline(value):
+    from evalml.pipelines.components import ComponentBase
+    return isinstance(value, ComponentBase) or _is_pipeline(value)
+
+
+def _is_pipeline(value):
+    from evalml.pipelines import PipelineBase
+    return isinstance(value, PipelineBase)
+
+
+def _pipeline_class_spec(pipeline_class):
+    """Returns JSON describing how to get a pipeline class when loading an artifact."""
+    from evalml.pipelines.components.utils import handle_component_class
+    try:
+        return {'path': _global_path(pipeline_class)}
+    except ValueError:
+        # pipeline classes defined in functions, such as those made by AutoMLSearch, are made again when loaded
+        return {'class_name': pipeline_class.__name__, 'custom_name': pipeline_class.name,
+                'problem_type': pipeline_class.problem_type.value,
+                'component_graph': [_global_path(handle_component_class(component)) for component in pipeline_class.component_graph]}
+
+
+def _load_pipeline_class(spec):
+    """Returns the pipeline class described by _pipeline_class_spec."""
+    from evalml.pipelines.utils import _get_pipeline_base_class
+    from evalml.problem_types import handle_problem_types
+    from evalml.pipelines import PipelineBase
+    from evalml.pipelines.components import ComponentBase
+    if 'path' in spec:
+        return _import_global(spec['path'], base_class=PipelineBase)
+    base_class = _get_pipeline_base_class(handle_problem_types(spec['problem_type']))
+    component_graph = [_import_global(path, base_class=ComponentBase) for path in spec['component_graph']]
+    return type(spec['class_name'], (base_class,), {'custom_name': spec['custom_name'], 'component_graph': component_graph})
+
+
+def save_object(artifact, name, obj, **metadata):
+    """Saves an object to a JSON file in an artifact, with its large arrays packed into a binary file next to it.
+
+    Arguments:
+        artifact: the artifact opened with open_artifact to save the object in.
+        name (str): the path of the JSON file in the artifact, ending in .json.
+        obj: the object to save.
+        metadata: other values to save in the JSON file, which must be JSON.
+    """
+    with ArtifactEncoder(artifact, _binary_name(name)) as encoder:
+        encoded = encoder.encode(obj)
+    artifact.write_json(name, {'versions': artifact_versions(), **metadata, 'object': encoded})
+
+
+def load_object(artifact, name, mmap=True, document=None):
+    """Loads an object saved with save_object.
+
+    Arguments:
+        artifact: the artifact opened with open_artifact to load the object from.
+        name (str): the path of the JSON file in the artifact.
+        mmap (bool): whether to memory map the object's arrays instead of reading them. Defaults to True.
+        document (dict): the contents of the JSON file, if already read.
+
+    Returns:
+        The object.
+    """
+    if document is None:
+        document = artifact.read_json(name)
+    return ArtifactDecoder(artifact, _binary_name(name), mmap).decode(document['object'])
+
+
+def _binary_name(name):
+    return name[:-len('.json')] + '.bin'
+
+
+def artifact_versions():
+    """Returns the versions of evalml and the libraries whose objects are saved in artifacts, recorded in each artifact to
+    help tell why an artifact saved by one environment can't be loaded by another."""
+    import evalml
+    versions = {'evalml': evalml.__version__, 'artifact_format': ARTIFACT_FORMAT_VERSION}
+    for library in ['numpy', 'pandas', 'sklearn', 'xgboost', 'lightgbm', 'catboost']:
+        try:
+            versions[library] = importlib.import_module(library).__version__
+        except ImportError:
+            pass
+    return versions
@@ -1,5 +1,7 @@
+import functools
 import importlib
 import warnings
+import weakref
 from collections import namedtuple
 
 import numpy as np
@@ -175,10 +177,48 @@ _not_used_in_automl = {'BaselineClassifier', 'BaselineRegressor',
                        'BaselineRegressionPipeline', 'ModeBaselineMulticlassPipeline', 'BaselineMulticlassPipeline'}
 
 
+# functions decorated with _cache_until_new_subclass, whose cached results are cleared when a new class is defined
+_subclass_caches = []
+
+
+def _cache_until_new_subclass(function):
+    """Caches the results of a function which looks through the subclasses of components or objectives, until a new
+    component or objective class is defined."""
+    cached_function = functools.lru_cache(maxsize=None)(function)
+    _subclass_caches.append(cached_function)
+    return cached_function
+
+
+def _clear_subclass_caches():
+    """Clears the results cached by _cache_until_new_subclass. Called when a new component or objective class is defined."""
+    for cached_function in _subclass_caches:
+        cached_function.cache_clear()
+
+
+# whether each class could be instantiated, so that each class's optional dependencies are only imported once
+_importable_classes = weakref.WeakKeyDictionary()
+
+
+def _is_importable(cls):
+    if cls not in _importable_classes:
+        try:
+            cls()
+            _importable_classes[cls] = True
+        except (ImportError, MissingComponentError, TypeError):
+            logger.debug(f'Could not import class {cls.__name__} in get_importable_subclasses')
+            _importable_classes[cls] = False
+        except EnsembleMissingPipelinesError:
+            _importable_classes[cls] = True
+    return _importable_classes[cls]
+
+
 def get_importable_subclasses(base_class, used_in_automl=True):
     """Get importable subclasses of a base class. Used to list all of our
     estimators, transformers, components and pipelines dynamically.
 
+    The subclasses are found once, and again after a new component or objective class is defined. Whether a class can
+    be imported is only checked the first time it's found.
+
     Arguments:
         base_class (abc.ABCMeta): Base class to find all of the subclasses for.
         args (list): Args used to instantiate the subclass. [{}] for a pipeline, and [] for
@@ -190,23 +230,15 @@ def get_importable_subclasses(base_class, used_in_automl=True):
     Returns:
         List of subclasses.
     """
-    all_classes = _get_subclasses(base_class)
+    return list(_importable_subclasses(base_class, used_in_automl))
 
-    classes = []
-    for cls in all_classes:
-        if 'evalml.pipelines' not in cls.__module__:
-            continue
-        try:
-            cls()
-            classes.append(cls)
-        except (ImportError, MissingComponentError, TypeError):
-            logger.debug(f'Could not import class {cls.__name__} in get_importable_subclasses')
-        except EnsembleMissingPipelinesError:
-            classes.append(cls)
+
+@_cache_until_new_subclass
+def _importable_subclasses(base_class, used_in_automl):
+    classes = [cls for cls in _get_subclasses(base_class) if 'evalml.pipelines' in cls.__module__ and _is_importable(cls)]
     if used_in_automl:
         classes = [cls for cls in classes if cls.__name__ not in _not_used_in_automl]
-
-    return classes
+    return tuple(classes)
 
 
 def _rename_column_names_to_numeric(X):
@@ -14,7 +14,7 @@ setup(
     url='https://github.com/alteryx/evalml/',
     install_requires=open('core-requirements.txt').readlines() + open('requirements.txt').readlines()[1:],
     tests_require=open('test-requirements.txt').readlines(),
-    packages=find_packages(),
+    packages=find_packages(exclude=['benchmarks', 'benchmarks.*']),
     include_package_data=True,
     entry_points={
         'console_scripts': [